@@ -698,12 +698,26 @@ export type AutomationConditionEvaluationNode = {
   expandedLabel: Array<Scalars['String']['output']>;
   isPartitioned: Scalars['Boolean']['output'];
   numCandidates: Maybe<Scalars['Int']['output']>;
+  numRowsFetched: Maybe<Scalars['Int']['output']>;
+  numStorageQueries: Maybe<Scalars['Int']['output']>;
   numTrue: Scalars['Int']['output'];
   startTimestamp: Maybe<Scalars['Float']['output']>;
   uniqueId: Scalars['String']['output'];
   userLabel: Maybe<Scalars['String']['output']>;
 };
 
+export type AutomationConditionNodeProfile = {
+  __typename: 'AutomationConditionNodeProfile';
+  assetKey: Maybe<AssetKey>;
+  duration: Scalars['Float']['output'];
+  label: Scalars['String']['output'];
+  numCandidates: Maybe<Scalars['Int']['output']>;
+  numRowsFetched: Maybe<Scalars['Int']['output']>;
+  numStorageQueries: Maybe<Scalars['Int']['output']>;
+  numTrue: Scalars['Int']['output'];
+  uniqueId: Scalars['String']['output'];
+};
+
 export type BackfillNotFoundError = Error & {
   __typename: 'BackfillNotFoundError';
   backfillId: Scalars['String']['output'];
@@ -3744,6 +3758,7 @@ export type Query = {
   isPipelineConfigValid: PipelineConfigValidationResult;
   locationStatusesOrError: WorkspaceLocationStatusEntriesOrError;
   logsForRun: EventConnectionOrError;
+  mostExpensiveAutomationConditionNodes: Array<AutomationConditionNodeProfile>;
   partitionBackfillOrError: PartitionBackfillOrError;
   partitionBackfillsOrError: PartitionBackfillsOrError;
   partitionSetOrError: PartitionSetOrError;
@@ -3905,6 +3920,11 @@ export type QueryLogsForRunArgs = {
   runId: Scalars['ID']['input'];
 };
 
+export type QueryMostExpensiveAutomationConditionNodesArgs = {
+  evaluationId: Scalars['ID']['input'];
+  limit?: InputMaybe<Scalars['Int']['input']>;
+};
+
 export type QueryPartitionBackfillOrErrorArgs = {
   backfillId: Scalars['String']['input'];
 };
@@ -7055,6 +7075,12 @@ export const buildAutomationConditionEvaluationNode = (
       overrides && overrides.hasOwnProperty('isPartitioned') ? overrides.isPartitioned! : true,
     numCandidates:
       overrides && overrides.hasOwnProperty('numCandidates') ? overrides.numCandidates! : 6123,
+    numRowsFetched:
+      overrides && overrides.hasOwnProperty('numRowsFetched') ? overrides.numRowsFetched! : 2861,
+    numStorageQueries:
+      overrides && overrides.hasOwnProperty('numStorageQueries')
+        ? overrides.numStorageQueries!
+        : 7431,
     numTrue: overrides && overrides.hasOwnProperty('numTrue') ? overrides.numTrue! : 5212,
     startTimestamp:
       overrides && overrides.hasOwnProperty('startTimestamp') ? overrides.startTimestamp! : 5.42,
@@ -7064,6 +7090,35 @@ export const buildAutomationConditionEvaluationNode = (
   };
 };
 
+export const buildAutomationConditionNodeProfile = (
+  overrides?: Partial<AutomationConditionNodeProfile>,
+  _relationshipsToOmit: Set<string> = new Set(),
+): {__typename: 'AutomationConditionNodeProfile'} & AutomationConditionNodeProfile => {
+  const relationshipsToOmit: Set<string> = new Set(_relationshipsToOmit);
+  relationshipsToOmit.add('AutomationConditionNodeProfile');
+  return {
+    __typename: 'AutomationConditionNodeProfile',
+    assetKey:
+      overrides && overrides.hasOwnProperty('assetKey')
+        ? overrides.assetKey!
+        : relationshipsToOmit.has('AssetKey')
+          ? ({} as AssetKey)
+          : buildAssetKey({}, relationshipsToOmit),
+    duration: overrides && overrides.hasOwnProperty('duration') ? overrides.duration! : 1.37,
+    label: overrides && overrides.hasOwnProperty('label') ? overrides.label! : 'voluptas',
+    numCandidates:
+      overrides && overrides.hasOwnProperty('numCandidates') ? overrides.numCandidates! : 4102,
+    numRowsFetched:
+      overrides && overrides.hasOwnProperty('numRowsFetched') ? overrides.numRowsFetched! : 9184,
+    numStorageQueries:
+      overrides && overrides.hasOwnProperty('numStorageQueries')
+        ? overrides.numStorageQueries!
+        : 3356,
+    numTrue: overrides && overrides.hasOwnProperty('numTrue') ? overrides.numTrue! : 8247,
+    uniqueId: overrides && overrides.hasOwnProperty('uniqueId') ? overrides.uniqueId! : 'quibusdam',
+  };
+};
+
 export const buildBackfillNotFoundError = (
   overrides?: Partial<BackfillNotFoundError>,
   _relationshipsToOmit: Set<string> = new Set(),
@@ -12161,6 +12216,10 @@ export const buildQuery = (
         : relationshipsToOmit.has('EventConnection')
           ? ({} as EventConnection)
           : buildEventConnection({}, relationshipsToOmit),
+    mostExpensiveAutomationConditionNodes:
+      overrides && overrides.hasOwnProperty('mostExpensiveAutomationConditionNodes')
+        ? overrides.mostExpensiveAutomationConditionNodes!
+        : [],
     partitionBackfillOrError:
       overrides && overrides.hasOwnProperty('partitionBackfillOrError')
         ? overrides.partitionBackfillOrError!
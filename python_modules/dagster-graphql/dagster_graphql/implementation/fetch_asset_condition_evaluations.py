@@ -2,6 +2,9 @@
 
 import dagster._check as check
 from dagster import AssetKey
+from dagster._core.definitions.declarative_automation.automation_condition_profile import (
+    get_most_expensive_condition_nodes,
+)
 from dagster._core.scheduler.instigation import AutoMaterializeAssetEvaluationRecord
 
 from dagster_graphql.schema.asset_condition_evaluations import (
@@ -9,6 +12,7 @@
     GrapheneAssetConditionEvaluationRecord,
     GrapheneAssetConditionEvaluationRecords,
     GrapheneAssetConditionEvaluationRecordsOrError,
+    GrapheneAutomationConditionNodeProfile,
 )
 from dagster_graphql.schema.auto_materialize_asset_evaluations import (
     GrapheneAutoMaterializeAssetEvaluationNeedsMigrationError,
@@ -141,3 +145,23 @@ def fetch_asset_condition_evaluation_records_for_evaluation_id(
             evaluation_id=evaluation_id
         ),
     )
+
+
+def fetch_most_expensive_condition_nodes_for_evaluation_id(
+    graphene_info: "ResolveInfo",
+    evaluation_id: int,
+    limit: int,
+) -> Sequence[GrapheneAutomationConditionNodeProfile]:
+    if _get_migration_error(graphene_info):
+        return []
+
+    schedule_storage = check.not_none(graphene_info.context.instance.schedule_storage)
+    records = schedule_storage.get_auto_materialize_evaluations_for_evaluation_id(
+        evaluation_id=evaluation_id
+    )
+    return [
+        GrapheneAutomationConditionNodeProfile(profile)
+        for profile in get_most_expensive_condition_nodes(
+            [record.get_evaluation_with_run_ids().evaluation for record in records], limit=limit
+        )
+    ]
@@ -4,6 +4,10 @@
 
 import graphene
 from dagster._core.asset_graph_view.serializable_entity_subset import SerializableEntitySubset
+from dagster._core.definitions.asset_key import AssetKey
+from dagster._core.definitions.declarative_automation.automation_condition_profile import (
+    AutomationConditionNodeProfile,
+)
 from dagster._core.definitions.declarative_automation.serialized_objects import (
     AutomationConditionEvaluation,
     AutomationConditionSnapshot,
@@ -219,6 +223,9 @@ class GrapheneAutomationConditionEvaluationNode(graphene.ObjectType):
     numTrue = graphene.NonNull(graphene.Int)
     numCandidates = graphene.Field(graphene.Int)
 
+    numStorageQueries = graphene.Field(graphene.Int)
+    numRowsFetched = graphene.Field(graphene.Int)
+
     isPartitioned = graphene.NonNull(graphene.Boolean)
 
     childUniqueIds = non_null_list(graphene.String)
@@ -238,6 +245,8 @@ def __init__(self, evaluation: AutomationConditionEvaluation):
             numCandidates=evaluation.candidate_subset.size
             if isinstance(evaluation.candidate_subset, SerializableEntitySubset)
             else None,
+            numStorageQueries=evaluation.num_storage_queries,
+            numRowsFetched=evaluation.num_rows_fetched,
             isPartitioned=evaluation.true_subset.is_partitioned,
             childUniqueIds=[
                 child.condition_snapshot.unique_id for child in evaluation.child_evaluations
@@ -301,6 +310,36 @@ def __init__(
         )
 
 
+class GrapheneAutomationConditionNodeProfile(graphene.ObjectType):
+    assetKey = graphene.Field(GrapheneAssetKey)
+    uniqueId = graphene.NonNull(graphene.String)
+    label = graphene.NonNull(graphene.String)
+
+    duration = graphene.NonNull(graphene.Float)
+    numStorageQueries = graphene.Field(graphene.Int)
+    numRowsFetched = graphene.Field(graphene.Int)
+
+    numTrue = graphene.NonNull(graphene.Int)
+    numCandidates = graphene.Field(graphene.Int)
+
+    class Meta:
+        name = "AutomationConditionNodeProfile"
+
+    def __init__(self, profile: AutomationConditionNodeProfile):
+        super().__init__(
+            assetKey=GrapheneAssetKey(path=profile.key.path)
+            if isinstance(profile.key, AssetKey)
+            else None,
+            uniqueId=profile.unique_id,
+            label=profile.label,
+            duration=profile.duration,
+            numStorageQueries=profile.num_storage_queries,
+            numRowsFetched=profile.num_rows_fetched,
+            numTrue=profile.true_subset_size,
+            numCandidates=profile.candidate_subset_size,
+        )
+
+
 class GrapheneAssetConditionEvaluationRecords(graphene.ObjectType):
     records = non_null_list(GrapheneAssetConditionEvaluationRecord)
 
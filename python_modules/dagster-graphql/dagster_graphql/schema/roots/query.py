@@ -36,6 +36,7 @@
     fetch_asset_condition_evaluation_record_for_partition,
     fetch_asset_condition_evaluation_records_for_asset_key,
     fetch_asset_condition_evaluation_records_for_evaluation_id,
+    fetch_most_expensive_condition_nodes_for_evaluation_id,
     fetch_true_partitions_for_evaluation_node,
 )
 from dagster_graphql.implementation.fetch_assets import (
@@ -101,6 +102,7 @@
 from dagster_graphql.schema.asset_condition_evaluations import (
     GrapheneAssetConditionEvaluation,
     GrapheneAssetConditionEvaluationRecordsOrError,
+    GrapheneAutomationConditionNodeProfile,
 )
 from dagster_graphql.schema.asset_graph import (
     GrapheneAssetKey,
@@ -614,6 +616,16 @@ class Meta:
         description=("Retrieve the condition evaluation records for a given evaluation ID."),
     )
 
+    mostExpensiveAutomationConditionNodes = graphene.Field(
+        non_null_list(GrapheneAutomationConditionNodeProfile),
+        evaluationId=graphene.Argument(graphene.NonNull(graphene.ID)),
+        limit=graphene.Argument(graphene.Int, default_value=10),
+        description=(
+            "Retrieve the condition evaluation nodes that took the longest to evaluate for a given"
+            " evaluation ID."
+        ),
+    )
+
     autoMaterializeTicks = graphene.Field(
         non_null_list(GrapheneInstigationTick),
         dayRange=graphene.Int(),
@@ -1315,6 +1327,13 @@ def resolve_assetConditionEvaluationsForEvaluationId(
             graphene_info=graphene_info, evaluation_id=evaluationId
         )
 
+    def resolve_mostExpensiveAutomationConditionNodes(
+        self, graphene_info: ResolveInfo, evaluationId: str, limit: int
+    ):
+        return fetch_most_expensive_condition_nodes_for_evaluation_id(
+            graphene_info=graphene_info, evaluation_id=int(evaluationId), limit=limit
+        )
+
     def resolve_autoMaterializeTicks(
         self,
         graphene_info,
@@ -332,6 +332,7 @@ def test_get_tick_range(self, graphql_context):
                     startTimestamp
                     endTimestamp
                     numTrue
+                    numStorageQueries
                     uniqueId
                     childUniqueIds
                 }
@@ -347,6 +348,21 @@ def test_get_tick_range(self, graphql_context):
 }
 """
 
+MOST_EXPENSIVE_NODES_QUERY = """
+query GetMostExpensiveNodes($evaluationId: ID!, $limit: Int) {
+    mostExpensiveAutomationConditionNodes(evaluationId: $evaluationId, limit: $limit) {
+        assetKey {
+            path
+        }
+        uniqueId
+        label
+        duration
+        numStorageQueries
+        numTrue
+    }
+}
+"""
+
 
 class TestAssetConditionEvaluations(ExecutingGraphQLContextTestMatrix):
     def test_auto_materialize_sensor(self, graphql_context: WorkspaceRequestContext):
@@ -691,6 +707,7 @@ def A() -> None: ...
             "(NOT (in_progress))",
         ]
         assert rootNode["numTrue"] == 0
+        assert rootNode["numStorageQueries"] is not None
         assert len(rootNode["childUniqueIds"]) == 5
 
         def _get_node(id):
@@ -738,3 +755,15 @@ def _get_node(id):
             "c",
             "d",
         }
+
+        results = execute_dagster_graphql(
+            graphql_context,
+            MOST_EXPENSIVE_NODES_QUERY,
+            variables={"evaluationId": evaluationId, "limit": 3},
+        )
+        nodes = results.data["mostExpensiveAutomationConditionNodes"]
+        assert len(nodes) == 3
+        assert all(node["assetKey"] == {"path": ["A"]} for node in nodes)
+        assert all(node["numStorageQueries"] is not None for node in nodes)
+        durations = [node["duration"] for node in nodes]
+        assert durations == sorted(durations, reverse=True)
@@ -0,0 +1,187 @@
+# ruff: noqa: T201
+import argparse
+from typing import Sequence
+
+from dagster import AssetExecutionContext, Definitions, MaterializeResult, asset
+from dagster._core.definitions.assets import AssetsDefinition
+from dagster._core.events.log import EventLogEntry
+from dagster._core.instance_for_test import instance_for_test
+from dagster._core.remote_representation.external_data import RepositorySnap, RepositorySnapPieces
+from dagster._core.snap import JobSnap
+from dagster._serdes.serdes import (
+    _WHITELIST_MAP,
+    deserialize_value,
+    serialize_value,
+    serialize_value_binary,
+)
+
+from dagster_test.utils.benchmark import ProfilingSession
+
+DESC = """
+Analyze execution time when serializing and deserializing representative payloads with
+`dagster._serdes`: the event log entries of a run, the job snapshot of an asset job and the
+repository snapshot of the definitions that contain it. The definitions hold a layered graph of
+assets, each of which reports a handful of metadata entries when materialized.
+
+The number of assets is configurable via the `--num-assets` arg and each payload is serialized and
+deserialized `--iterations` times. Passing `--no-compiled-codecs` swaps the compiled per-class
+codecs for the generic pack/unpack implementations so the two can be compared. The repository
+snapshot is additionally serialized and deserialized with the binary format, whose size relative to
+JSON is reported in the experiment settings, and split into content-addressed pieces to measure
+resolving it on a client that already holds every piece, as happens on a code location reload that
+changed nothing.
+"""
+
+parser = argparse.ArgumentParser(
+    prog="serdes",
+    description=DESC,
+)
+
+parser.add_argument(
+    "--num-assets",
+    type=int,
+    default=200,
+    help="Set the number of assets in the definitions.",
+)
+
+parser.add_argument(
+    "--iterations",
+    type=int,
+    default=20,
+    help="Set the number of times each payload is serialized and deserialized.",
+)
+
+parser.add_argument(
+    "--compiled-codecs",
+    action=argparse.BooleanOptionalAction,
+    default=True,
+    help="Use the compiled per-class serdes codecs instead of the generic implementations.",
+)
+
+# ########################
+# ##### DEFINITIONS
+# ########################
+
+
+def get_assets(num_assets: int) -> Sequence[AssetsDefinition]:
+    assets = []
+    for i in range(num_assets):
+        # each asset depends on up to two assets of the previous layer of ten
+        layer_start = (i // 10 - 1) * 10
+        deps = [f"asset_{j}" for j in (layer_start + i % 10, layer_start + (i + 1) % 10)]
+
+        @asset(
+            name=f"asset_{i}",
+            deps=deps if layer_start >= 0 else [],
+            group_name=f"group_{i // 10}",
+            description=f"Asset number {i}.",
+            metadata={"owner_team": "data", "index": i},
+        )
+        def _asset(context: AssetExecutionContext) -> MaterializeResult:
+            return MaterializeResult(
+                metadata={
+                    "row_count": 100,
+                    "path": f"/tmp/{context.asset_key.to_user_string()}",
+                    "preview": {"rows": [{"a": 1, "b": "x"}] * 5},
+                }
+            )
+
+        assets.append(_asset)
+    return assets
+
+
+def disable_compiled_codecs() -> None:
+    for serializer in _WHITELIST_MAP.object_serializers.values():
+        serializer.__dict__["_pack_items_codec"] = serializer._pack_items_generic  # noqa: SLF001
+        serializer.__dict__["_unpack_codec"] = serializer._unpack_generic  # noqa: SLF001
+
+
+# ########################
+# ##### MAIN
+# ########################
+
+
+def main(num_assets: int, iterations: int, compiled_codecs: bool) -> None:
+    if not compiled_codecs:
+        disable_compiled_codecs()
+
+    defs = Definitions(assets=get_assets(num_assets))
+    job_def = defs.get_implicit_global_asset_job_def()
+
+    with instance_for_test() as instance:
+        result = job_def.execute_in_process(instance=instance)
+        assert result.success
+        event_entries = [
+            record.event_log_entry for record in instance.get_records_for_run(result.run_id).records
+        ]
+
+    job_snap = JobSnap.from_job_def(job_def)
+    repository_snap = RepositorySnap.from_def(defs.get_repository_def())
+
+    session = ProfilingSession(
+        name="Serdes",
+        experiment_settings={
+            "num_assets": num_assets,
+            "iterations": iterations,
+            "compiled_codecs": compiled_codecs,
+            "num_events": len(event_entries),
+            "repository_snap_json_bytes": len(serialize_value(repository_snap).encode("utf-8")),
+            "repository_snap_binary_bytes": len(serialize_value_binary(repository_snap)),
+        },
+    ).start()
+
+    session.log_start_message()
+
+    with session.logged_execution_time("Serialize EventLogEntry payloads"):
+        for _ in range(iterations):
+            serialized_entries = [serialize_value(entry) for entry in event_entries]
+
+    with session.logged_execution_time("Deserialize EventLogEntry payloads"):
+        for _ in range(iterations):
+            for serialized_entry in serialized_entries:
+                deserialize_value(serialized_entry, EventLogEntry)
+
+    with session.logged_execution_time("Serialize JobSnap"):
+        for _ in range(iterations):
+            serialized_job_snap = serialize_value(job_snap)
+
+    with session.logged_execution_time("Deserialize JobSnap"):
+        for _ in range(iterations):
+            assert deserialize_value(serialized_job_snap, JobSnap) == job_snap
+
+    with session.logged_execution_time("Serialize RepositorySnap"):
+        for _ in range(iterations):
+            serialized_repository_snap = serialize_value(repository_snap)
+
+    with session.logged_execution_time("Deserialize RepositorySnap"):
+        for _ in range(iterations):
+            deserialize_value(serialized_repository_snap, RepositorySnap)
+
+    with session.logged_execution_time("Serialize RepositorySnap (binary)"):
+        for _ in range(iterations):
+            binary_repository_snap = serialize_value_binary(repository_snap)
+
+    with session.logged_execution_time("Deserialize RepositorySnap (binary)"):
+        for _ in range(iterations):
+            deserialize_value(binary_repository_snap, RepositorySnap)
+
+    with session.logged_execution_time("Split RepositorySnap into pieces"):
+        for _ in range(iterations):
+            repository_snap_pieces = RepositorySnapPieces.from_repository_snap(repository_snap)
+
+    known_pieces = repository_snap_pieces.get_pieces({})
+    serialized_unchanged_pieces = serialize_value(
+        repository_snap_pieces.without_pieces(set(known_pieces))
+    )
+    with session.logged_execution_time("Deserialize and resolve unchanged RepositorySnapPieces"):
+        for _ in range(iterations):
+            deserialize_value(serialized_unchanged_pieces, RepositorySnapPieces).resolve(
+                known_pieces
+            )
+
+    session.log_result_summary()
+
+
+if __name__ == "__main__":
+    args = parser.parse_args()
+    main(args.num_assets, args.iterations, args.compiled_codecs)
@@ -1,41 +1,167 @@
-from typing import TYPE_CHECKING, Mapping
+import logging
+import os
+import tempfile
+import threading
+from typing import TYPE_CHECKING, Any, Dict, Mapping, Optional, Sequence, Union
 
 import dagster._check as check
 from dagster._core.errors import DagsterUserCodeProcessError
-from dagster._core.remote_representation.external_data import RepositoryErrorSnap, RepositorySnap
-from dagster._serdes import deserialize_value
+from dagster._core.remote_representation.external_data import (
+    RepositoryErrorSnap,
+    RepositorySnap,
+    RepositorySnapPieces,
+)
+from dagster._serdes import deserialize_value, serialize_value_binary
 
 if TYPE_CHECKING:
     from dagster._core.remote_representation import CodeLocation
     from dagster._grpc.client import DagsterGrpcClient
 
+REPOSITORY_SNAP_PIECE_CACHE_DIR_ENV_VAR = "DAGSTER_REPOSITORY_SNAP_PIECE_CACHE_DIR"
+
+
+class RepositorySnapPieceCache:
+    """Holds the content-addressed pieces of the repository snapshots loaded by this process, keyed
+    by the id of the repository origin, so that reloading a code location only fetches the pieces
+    that changed. Only the pieces of the most recently loaded snapshot of each repository are kept.
+
+    When `cache_dir` is set, the pieces are also written to disk so that they survive process
+    restarts.
+    """
+
+    def __init__(self, cache_dir: Optional[str] = None):
+        self._cache_dir = check.opt_str_param(cache_dir, "cache_dir")
+        self._lock = threading.Lock()
+        self._pieces_by_origin_id: Dict[str, Mapping[str, Any]] = {}
+
+    def _get_cache_path(self, origin_id: str) -> str:
+        return os.path.join(check.not_none(self._cache_dir), f"{origin_id}.snap")
+
+    def get_pieces(self, origin_id: str) -> Mapping[str, Any]:
+        with self._lock:
+            if origin_id in self._pieces_by_origin_id:
+                return self._pieces_by_origin_id[origin_id]
+
+        if not self._cache_dir or not os.path.exists(self._get_cache_path(origin_id)):
+            return {}
+
+        try:
+            with open(self._get_cache_path(origin_id), "rb") as f:
+                pieces = deserialize_value(f.read())
+        except Exception:
+            logging.getLogger("dagster").warning(
+                f"Could not read cached repository snapshot pieces for {origin_id}, ignoring",
+                exc_info=True,
+            )
+            return {}
+
+        if not isinstance(pieces, dict):
+            return {}
+
+        with self._lock:
+            return self._pieces_by_origin_id.setdefault(origin_id, pieces)
+
+    def set_pieces(self, origin_id: str, pieces: Mapping[str, Any]) -> None:
+        with self._lock:
+            previous_pieces = self._pieces_by_origin_id.get(origin_id)
+            self._pieces_by_origin_id[origin_id] = pieces
+
+        if not self._cache_dir or (
+            previous_pieces is not None and previous_pieces.keys() == pieces.keys()
+        ):
+            return
+
+        try:
+            os.makedirs(self._cache_dir, exist_ok=True)
+            # write to a temporary file first so that concurrent readers never see a partial file
+            with tempfile.NamedTemporaryFile(
+                "wb", dir=self._cache_dir, suffix=".tmp", delete=False
+            ) as f:
+                f.write(serialize_value_binary(dict(pieces)))
+            os.replace(f.name, self._get_cache_path(origin_id))
+        except Exception:
+            logging.getLogger("dagster").warning(
+                f"Could not write cached repository snapshot pieces for {origin_id}, ignoring",
+                exc_info=True,
+            )
+
+
+def create_repository_snap_piece_cache() -> RepositorySnapPieceCache:
+    """Creates a cache for the code locations of a workspace, which persists the pieces on disk if
+    the cache directory environment variable is set.
+    """
+    return RepositorySnapPieceCache(os.getenv(REPOSITORY_SNAP_PIECE_CACHE_DIR_ENV_VAR))
+
+
+def _deserialize_external_repository_chunks(
+    external_repository_chunks: Sequence[Mapping[str, Any]],
+) -> Union[RepositorySnap, RepositoryErrorSnap, RepositorySnapPieces]:
+    # servers that predate the binary serdes format ignore the request for it and stream JSON
+    # string chunks instead, so fall back to those when no binary chunk was received
+    if any(
+        chunk.get("serialized_external_repository_binary_chunk")
+        for chunk in external_repository_chunks
+    ):
+        serialized_external_repository_data: Union[str, bytes] = b"".join(
+            chunk["serialized_external_repository_binary_chunk"]
+            for chunk in external_repository_chunks
+        )
+    else:
+        serialized_external_repository_data = "".join(
+            chunk["serialized_external_repository_chunk"] for chunk in external_repository_chunks
+        )
+
+    return deserialize_value(
+        serialized_external_repository_data,
+        (RepositorySnap, RepositoryErrorSnap, RepositorySnapPieces),  # type: ignore
+    )
+
+
+def _resolve_repository_snap_pieces(
+    result: Union[RepositorySnap, RepositoryErrorSnap, RepositorySnapPieces],
+    piece_cache: RepositorySnapPieceCache,
+    origin_id: str,
+    known_pieces: Mapping[str, Any],
+) -> Union[RepositorySnap, RepositoryErrorSnap]:
+    # servers that predate snapshot pieces ignore the request for them and send the whole snapshot
+    if not isinstance(result, RepositorySnapPieces):
+        return result
+
+    pieces = result.get_pieces(known_pieces)
+    piece_cache.set_pieces(origin_id, pieces)
+    return result.resolve(pieces)
+
 
 def sync_get_streaming_external_repositories_data_grpc(
-    api_client: "DagsterGrpcClient", code_location: "CodeLocation"
+    api_client: "DagsterGrpcClient",
+    code_location: "CodeLocation",
+    piece_cache: Optional[RepositorySnapPieceCache] = None,
 ) -> Mapping[str, RepositorySnap]:
     from dagster._core.remote_representation import CodeLocation, RemoteRepositoryOrigin
 
     check.inst_param(code_location, "code_location", CodeLocation)
+    piece_cache = check.opt_inst_param(
+        piece_cache, "piece_cache", RepositorySnapPieceCache, create_repository_snap_piece_cache()
+    )
 
     repo_datas = {}
     for repository_name in code_location.repository_names:  # type: ignore
+        remote_repository_origin = RemoteRepositoryOrigin(code_location.origin, repository_name)
+        origin_id = remote_repository_origin.get_id()
+        known_pieces = piece_cache.get_pieces(origin_id)
         external_repository_chunks = list(
             api_client.streaming_external_repository(
-                remote_repository_origin=RemoteRepositoryOrigin(
-                    code_location.origin,
-                    repository_name,
-                )
+                remote_repository_origin=remote_repository_origin,
+                accepts_binary_serdes=True,
+                known_snapshot_piece_digests=list(known_pieces),
             )
         )
 
-        result = deserialize_value(
-            "".join(
-                [
-                    chunk["serialized_external_repository_chunk"]
-                    for chunk in external_repository_chunks
-                ]
-            ),
-            (RepositorySnap, RepositoryErrorSnap),
+        result = _resolve_repository_snap_pieces(
+            _deserialize_external_repository_chunks(external_repository_chunks),
+            piece_cache,
+            origin_id,
+            known_pieces,
         )
 
         if isinstance(result, RepositoryErrorSnap):
@@ -46,32 +172,36 @@ def sync_get_streaming_external_repositories_data_grpc(
 
 
 async def gen_streaming_external_repositories_data_grpc(
-    api_client: "DagsterGrpcClient", code_location: "CodeLocation"
+    api_client: "DagsterGrpcClient",
+    code_location: "CodeLocation",
+    piece_cache: Optional[RepositorySnapPieceCache] = None,
 ) -> Mapping[str, RepositorySnap]:
     from dagster._core.remote_representation import CodeLocation, RemoteRepositoryOrigin
 
     check.inst_param(code_location, "code_location", CodeLocation)
+    piece_cache = check.opt_inst_param(
+        piece_cache, "piece_cache", RepositorySnapPieceCache, create_repository_snap_piece_cache()
+    )
 
     repo_datas = {}
     for repository_name in code_location.repository_names:  # type: ignore
+        remote_repository_origin = RemoteRepositoryOrigin(code_location.origin, repository_name)
+        origin_id = remote_repository_origin.get_id()
+        known_pieces = piece_cache.get_pieces(origin_id)
         external_repository_chunks = [
             chunk
             async for chunk in api_client.gen_streaming_external_repository(
-                remote_repository_origin=RemoteRepositoryOrigin(
-                    code_location.origin,
-                    repository_name,
-                )
+                remote_repository_origin=remote_repository_origin,
+                accepts_binary_serdes=True,
+                known_snapshot_piece_digests=list(known_pieces),
             )
         ]
 
-        result = deserialize_value(
-            "".join(
-                [
-                    chunk["serialized_external_repository_chunk"]
-                    for chunk in external_repository_chunks
-                ]
-            ),
-            (RepositorySnap, RepositoryErrorSnap),
+        result = _resolve_repository_snap_pieces(
+            _deserialize_external_repository_chunks(external_repository_chunks),
+            piece_cache,
+            origin_id,
+            known_pieces,
         )
 
         if isinstance(result, RepositoryErrorSnap):
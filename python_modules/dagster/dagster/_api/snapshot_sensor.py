@@ -1,4 +1,4 @@
-from typing import TYPE_CHECKING, Optional, Sequence
+from typing import TYPE_CHECKING, Iterator, Optional, Sequence, Tuple, Union
 
 import dagster._check as check
 from dagster._core.definitions.sensor_definition import SensorExecutionData
@@ -6,7 +6,7 @@
 from dagster._core.remote_representation.external_data import SensorExecutionErrorSnap
 from dagster._core.remote_representation.handle import RepositoryHandle
 from dagster._grpc.client import DEFAULT_GRPC_TIMEOUT
-from dagster._grpc.types import SensorExecutionArgs
+from dagster._grpc.types import SensorExecutionArgs, SensorExecutionBatchArgs
 from dagster._serdes import deserialize_value
 
 if TYPE_CHECKING:
@@ -87,3 +87,22 @@ def sync_get_external_sensor_execution_data_grpc(
         raise DagsterUserCodeProcessError.from_error_info(result.error)
 
     return result
+
+
+def sync_get_external_sensor_execution_data_batch_grpc(
+    api_client: "DagsterGrpcClient",
+    sensor_execution_args: Sequence[SensorExecutionArgs],
+    timeout: Optional[int] = None,
+) -> Iterator[Tuple[SensorExecutionArgs, Union[SensorExecutionData, SensorExecutionErrorSnap]]]:
+    check.sequence_param(
+        sensor_execution_args, "sensor_execution_args", of_type=SensorExecutionArgs
+    )
+
+    for sensor_index, serialized_result in api_client.external_sensor_execution_batch(
+        SensorExecutionBatchArgs(sensor_execution_args=sensor_execution_args),
+        timeout=timeout,
+    ):
+        yield (
+            sensor_execution_args[sensor_index],
+            deserialize_value(serialized_result, (SensorExecutionData, SensorExecutionErrorSnap)),
+        )
@@ -700,6 +700,43 @@ def _execute_step_command_body(
     help="[INTERNAL] Retrieves current utilization metrics from GRPC server.",
     envvar="DAGSTER_ENABLE_SERVER_METRICS",
 )
+@click.option(
+    "--definitions-cache-dir",
+    type=click.Path(file_okay=False),
+    required=False,
+    help=(
+        "Directory in which to cache the definitions of the code location between restarts. When"
+        " the code location is unchanged since the cache was written, the server starts answering"
+        " requests for its definitions from the cache while it loads the code in the background."
+        " Only the python files of the code location, the env vars passed with"
+        " --definitions-cache-env-var and the files under --definitions-cache-path are checked for"
+        " changes."
+    ),
+    envvar="DAGSTER_DEFINITIONS_CACHE_DIR",
+)
+@click.option(
+    "--definitions-cache-env-var",
+    "definitions_cache_env_vars",
+    type=click.STRING,
+    multiple=True,
+    help=(
+        "Name of an env var that the definitions depend on. A change to its value invalidates the"
+        " definitions cache. Can be passed multiple times."
+    ),
+    envvar="DAGSTER_DEFINITIONS_CACHE_ENV_VARS",
+)
+@click.option(
+    "--definitions-cache-path",
+    "definitions_cache_paths",
+    type=click.Path(),
+    multiple=True,
+    help=(
+        "Path to a file or directory that the definitions depend on, in addition to the python"
+        " files of the code location. A change to any file under it invalidates the definitions"
+        " cache. Can be passed multiple times."
+    ),
+    envvar="DAGSTER_DEFINITIONS_CACHE_PATHS",
+)
 def grpc_command(
     port: Optional[int],
     socket: Optional[str],
@@ -718,6 +755,9 @@ def grpc_command(
     instance_ref=None,
     inject_env_vars_from_instance: bool = False,
     enable_metrics: bool = False,
+    definitions_cache_dir: Optional[str] = None,
+    definitions_cache_env_vars: Sequence[str] = (),
+    definitions_cache_paths: Sequence[str] = (),
     **kwargs: Any,
 ) -> None:
     check.invariant(heartbeat_timeout > 0, "heartbeat_timeout must be greater than 0")
@@ -812,6 +852,9 @@ def grpc_command(
         location_name=location_name,
         enable_metrics=enable_metrics,
         server_threadpool_executor=threadpool_executor,
+        definitions_cache_dir=definitions_cache_dir,
+        definitions_cache_env_vars=definitions_cache_env_vars,
+        definitions_cache_paths=definitions_cache_paths,
     )
 
     server = DagsterGrpcServer(
@@ -835,6 +878,9 @@ def grpc_command(
     finally:
         logger.info("Shutting down %s", server_desc)
 
+    if api_servicer.stopped_on_load_error:
+        sys.exit(1)
+
 
 @api_cli.command(name="grpc-health-check", help="Check the status of a dagster GRPC server")
 @click.option(
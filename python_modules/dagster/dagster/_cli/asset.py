@@ -270,3 +270,48 @@ def asset_wipe_cache_command(key, **cli_args):
             click.echo("Cleared the partitions status cache")
         else:
             click.echo("Exiting without wiping the partitions status cache")
+
+
+@asset_cli.command(name="automation-profile")
+@click.option(
+    "--evaluation-id",
+    type=click.INT,
+    required=True,
+    help="The evaluation id of the automation tick to profile",
+)
+@click.option(
+    "--limit",
+    type=click.INT,
+    default=10,
+    show_default=True,
+    help="The number of condition evaluations to list",
+)
+def asset_automation_profile_command(evaluation_id, limit):
+    r"""List the automation condition evaluations that took the longest on an automation tick,
+    along with the number of storage queries they issued and the sizes of their subsets.
+
+    \b
+    Usage:
+      dagster asset automation-profile --evaluation-id <evaluation_id>
+    """
+    from dagster._core.definitions.declarative_automation.automation_condition_profile import (
+        format_condition_node_profiles,
+        get_most_expensive_condition_nodes,
+    )
+
+    with get_instance_for_cli() as instance:
+        schedule_storage = check.not_none(instance.schedule_storage)
+        records = schedule_storage.get_auto_materialize_evaluations_for_evaluation_id(evaluation_id)
+        if not records:
+            raise click.UsageError(
+                f"Error, no automation condition evaluations found for evaluation id {evaluation_id}."
+            )
+
+        profiles = get_most_expensive_condition_nodes(
+            [record.get_evaluation_with_run_ids().evaluation for record in records], limit=limit
+        )
+        click.echo(
+            f"Most expensive of the condition evaluations of {len(records)} entities on "
+            f"evaluation {evaluation_id}:"
+        )
+        click.echo(format_condition_node_profiles(profiles))
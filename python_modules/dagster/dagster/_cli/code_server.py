@@ -64,6 +64,19 @@ def code_server_cli():
     help="Maximum number of (threaded) workers to use in the code server",
     envvar="DAGSTER_CODE_SERVER_MAX_WORKERS",
 )
+@click.option(
+    "--num-processes",
+    type=click.INT,
+    required=False,
+    default=1,
+    show_default=True,
+    help=(
+        "Number of code server processes to load the code in. Sensor, schedule and partition "
+        "evaluations are routed to the least busy process, while all other requests are served "
+        "by the first one."
+    ),
+    envvar="DAGSTER_CODE_SERVER_NUM_PROCESSES",
+)
 @python_origin_target_argument
 @click.option(
     "--use-python-environment-entry-point",
@@ -156,6 +169,7 @@ def start_command(
     socket: Optional[str] = None,
     host: str = "localhost",
     max_workers: Optional[int] = None,
+    num_processes: int = 1,
     fixed_server_id: Optional[str] = None,
     log_level: str = "INFO",
     log_format: str = "colored",
@@ -177,6 +191,8 @@ def start_command(
         )
     if not (port or socket and not (port and socket)):
         raise click.UsageError("You must pass one and only one of --port/-p or --socket/-s.")
+    if num_processes < 1:
+        raise click.UsageError("--num-processes must be at least 1.")
 
     setup_interrupt_handlers()
 
@@ -231,6 +247,7 @@ def start_command(
         instance_ref=deserialize_value(instance_ref, InstanceRef) if instance_ref else None,
         server_termination_event=server_termination_event,
         logger=logger,
+        num_processes=num_processes,
     )
     server = DagsterGrpcServer(
         server_termination_event=server_termination_event,
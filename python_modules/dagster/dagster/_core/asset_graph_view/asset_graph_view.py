@@ -421,9 +421,55 @@ async def _compute_run_in_progress_asset_subset(self, key: AssetKey) -> EntitySu
                 if cache_value
                 else self.get_empty_subset(key=key)
             )
-        value = self._queryer.get_in_progress_asset_subset(asset_key=key).value
+        value = await self._compute_unpartitioned_asset_is_in_progress(key)
         return EntitySubset(self, key=key, value=_ValidatedEntitySubsetValue(value))
 
+    async def _get_latest_planned_materialization_run_record(
+        self, key: AssetKey
+    ) -> Optional["RunRecord"]:
+        """Returns the record of the run that most recently planned to materialize the given asset.
+        Records requested concurrently for different assets are fetched in a single batch.
+        """
+        from dagster._core.storage.dagster_run import RunRecord
+        from dagster._core.storage.event_log.base import AssetRecord
+
+        if self.instance.event_log_storage.asset_records_have_last_planned_materialization_storage_id:
+            asset_record = await AssetRecord.gen(self, key)
+            run_id = (
+                asset_record.asset_entry.last_planned_materialization_run_id
+                if asset_record
+                else None
+            )
+        else:
+            run_id = self._queryer.get_latest_planned_materialization_run_id(asset_key=key)
+        return await RunRecord.gen(self, run_id) if run_id else None
+
+    async def _compute_unpartitioned_asset_is_in_progress(self, key: AssetKey) -> bool:
+        from dagster._core.storage.dagster_run import IN_PROGRESS_RUN_STATUSES, DagsterRunStatus
+        from dagster._core.storage.event_log.base import AssetRecord
+
+        # NOTE: this computation is not correct in all cases for unpartitioned assets, see
+        # CachingInstanceQueryer.get_in_progress_asset_subset
+        run_record = await self._get_latest_planned_materialization_run_record(key)
+        if run_record is None:
+            return False
+        asset_record = await AssetRecord.gen(self, key)
+        last_materialization_record = (
+            asset_record.asset_entry.last_materialization_record if asset_record else None
+        )
+        # if the latest materialization happened in the same run as the latest planned
+        # materialization, it's no longer in progress
+        if (
+            last_materialization_record
+            and last_materialization_record.run_id == run_record.dagster_run.run_id
+        ):
+            return False
+        return run_record.dagster_run.status in [
+            *IN_PROGRESS_RUN_STATUSES,
+            # queued runs have planned work that has not yet completed
+            DagsterRunStatus.QUEUED,
+        ]
+
     async def _compute_backfill_in_progress_asset_subset(
         self, key: AssetKey
     ) -> EntitySubset[AssetKey]:
@@ -435,6 +481,7 @@ async def _compute_backfill_in_progress_asset_subset(
         return EntitySubset(self, key=key, value=_ValidatedEntitySubsetValue(value))
 
     async def _compute_execution_failed_asset_subset(self, key: AssetKey) -> EntitySubset[AssetKey]:
+        from dagster._core.storage.dagster_run import DagsterRunStatus
         from dagster._core.storage.partition_status_cache import AssetStatusCacheValue
 
         partitions_def = self._get_partitions_def(key)
@@ -445,7 +492,9 @@ async def _compute_execution_failed_asset_subset(self, key: AssetKey) -> EntityS
                 if cache_value
                 else self.get_empty_subset(key=key)
             )
-        value = self._queryer.get_failed_asset_subset(asset_key=key).value
+        # ideally, unpartitioned assets would also be handled by the asset status cache
+        run_record = await self._get_latest_planned_materialization_run_record(key)
+        value = run_record is not None and run_record.dagster_run.status == DagsterRunStatus.FAILURE
         return EntitySubset(self, key=key, value=_ValidatedEntitySubsetValue(value))
 
     async def _compute_missing_asset_subset(
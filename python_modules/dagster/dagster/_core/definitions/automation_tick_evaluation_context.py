@@ -28,16 +28,23 @@
 from dagster._core.definitions.base_asset_graph import BaseAssetGraph
 from dagster._core.definitions.declarative_automation.automation_condition import (
     AutomationCondition,
-    AutomationResult,
 )
 from dagster._core.definitions.declarative_automation.automation_condition_evaluator import (
     AutomationConditionEvaluator,
+    get_updated_evaluations,
+)
+from dagster._core.definitions.declarative_automation.automation_condition_sharding import (
+    can_evaluate_shards_in_processes,
+    evaluate_shards_in_processes,
+    get_automation_condition_shards,
 )
 from dagster._core.definitions.declarative_automation.serialized_objects import (
+    AutomationConditionCursor,
     AutomationConditionEvaluation,
 )
 from dagster._core.definitions.events import AssetKey, AssetKeyPartitionKey
 from dagster._core.definitions.partition import PartitionsDefinition
+from dagster._core.definitions.remote_asset_graph import RemoteAssetGraph
 from dagster._core.definitions.run_request import RunRequest
 from dagster._core.instance import DynamicPartitionsStore
 from dagster._core.storage.tags import (
@@ -83,7 +90,10 @@ def __init__(
             cursor=cursor,
             evaluation_time=evaluation_time,
             logger=logger,
+            evaluate_incrementally=instance.auto_materialize_incremental_evaluation,
         )
+        self._instance = instance
+        self._num_evaluation_processes = instance.auto_materialize_num_evaluation_processes
         self._materialize_run_tags = materialize_run_tags
         self._observe_run_tags = observe_run_tags
         self._auto_observe_asset_keys = auto_observe_asset_keys or set()
@@ -146,11 +156,13 @@ def _build_run_requests(self, entity_subsets: Sequence[EntitySubset]) -> Sequenc
         )
 
     def _get_updated_cursor(
-        self, results: Iterable[AutomationResult], observe_run_requests: Iterable[RunRequest]
+        self,
+        condition_cursors: Sequence[AutomationConditionCursor],
+        observe_run_requests: Iterable[RunRequest],
     ) -> AssetDaemonCursor:
         return self.cursor.with_updates(
             evaluation_id=self._evaluation_id,
-            condition_cursors=[result.get_new_cursor() for result in results],
+            condition_cursors=condition_cursors,
             newly_observe_requested_asset_keys=[
                 asset_key
                 for run_request in observe_run_requests
@@ -162,20 +174,59 @@ def _get_updated_cursor(
             evaluation_timestamp=self._evaluator.evaluation_time.timestamp(),
         )
 
-    def _get_updated_evaluations(
-        self, results: Iterable[AutomationResult]
-    ) -> Sequence[AutomationConditionEvaluation[EntityKey]]:
-        # only record evaluation results where something changed
-        updated_evaluations = []
-        for result in results:
-            previous_cursor = self.cursor.get_previous_condition_cursor(result.key)
-            if (
-                previous_cursor is None
-                or previous_cursor.result_value_hash != result.value_hash
-                or not result.true_subset.is_empty
-            ):
-                updated_evaluations.append(result.serializable_evaluation)
-        return updated_evaluations
+    def _get_shards(self) -> Sequence[AbstractSet[EntityKey]]:
+        entity_keys = self._evaluator.entity_keys
+        if self._num_evaluation_processes <= 1:
+            return [entity_keys]
+        if not can_evaluate_shards_in_processes(
+            self._instance, self.asset_graph, self._evaluator.default_condition
+        ):
+            self._evaluator.logger.debug(
+                "Evaluating automation conditions in a single process, as evaluating them in "
+                "multiple processes requires a persistent instance and serializable definitions."
+            )
+            return [entity_keys]
+        return get_automation_condition_shards(
+            self.asset_graph, entity_keys, self._num_evaluation_processes
+        )
+
+    def _evaluate_shards(
+        self, shards: Sequence[AbstractSet[EntityKey]]
+    ) -> Tuple[
+        Sequence[AutomationConditionCursor],
+        Sequence[AutomationConditionEvaluation[EntityKey]],
+        Sequence[EntitySubset],
+    ]:
+        evaluator = self._evaluator
+        evaluator.logger.info(
+            f"Evaluating {self.total_keys} assets/checks in {len(shards)} independent shards."
+        )
+        shard_results = evaluate_shards_in_processes(
+            instance=self._instance,
+            asset_graph=cast(RemoteAssetGraph, self.asset_graph),
+            shards=shards,
+            cursor=self.cursor,
+            emit_backfills=evaluator.emit_backfills,
+            default_condition=evaluator.default_condition,
+            evaluation_time=evaluator.evaluation_time,
+            evaluate_incrementally=evaluator.evaluate_incrementally,
+        )
+
+        condition_cursors = []
+        evaluations = []
+        entity_subsets = []
+        for shard_result in shard_results:
+            condition_cursors.extend(shard_result.condition_cursors)
+            evaluations.extend(shard_result.updated_evaluations)
+            for serializable_subset in shard_result.requested_subsets:
+                entity_subsets.append(
+                    check.not_none(
+                        evaluator.asset_graph_view.get_subset_from_serializable_subset(
+                            serializable_subset
+                        )
+                    )
+                )
+        return condition_cursors, evaluations, entity_subsets
 
     def evaluate(
         self,
@@ -183,12 +234,18 @@ def evaluate(
         Sequence[RunRequest], AssetDaemonCursor, Sequence[AutomationConditionEvaluation[EntityKey]]
     ]:
         observe_run_requests = self._legacy_build_auto_observe_run_requests()
-        results, entity_subsets = self._evaluator.evaluate()
+        shards = self._get_shards()
+        if len(shards) > 1:
+            condition_cursors, evaluations, entity_subsets = self._evaluate_shards(shards)
+        else:
+            results, entity_subsets = self._evaluator.evaluate()
+            condition_cursors = [result.get_new_cursor() for result in results]
+            evaluations = get_updated_evaluations(self.cursor, results)
 
         return (
             [*self._build_run_requests(entity_subsets), *observe_run_requests],
-            self._get_updated_cursor(results, observe_run_requests),
-            self._get_updated_evaluations(results),
+            self._get_updated_cursor(condition_cursors, observe_run_requests),
+            evaluations,
         )
 
 
@@ -15,6 +15,9 @@
     CoercibleToAssetKey,
     T_EntityKey,
 )
+from dagster._core.definitions.declarative_automation.automation_condition_profile import (
+    StorageQueryCounter,
+)
 from dagster._core.definitions.declarative_automation.serialized_objects import (
     AssetSubsetWithMetadata,
     AutomationConditionCursor,
@@ -87,6 +90,15 @@ def requires_cursor(self) -> bool:
     def children(self) -> Sequence["AutomationCondition"]:
         return []
 
+    @property
+    def depends_on_root_context(self) -> bool:
+        """Whether evaluating this node (not including its children) depends on the root of the
+        condition tree it is evaluated within, such as the root entity or its cursor, rather than
+        only on the entity it is evaluated over and the time of the previous evaluation. Results of
+        nodes that do not depend on the root context may be shared across condition trees.
+        """
+        return True
+
     @property
     def description(self) -> str:
         """Human-readable description of when this condition is true."""
@@ -151,6 +163,18 @@ def has_rule_condition(self) -> bool:
             return True
         return any(child.has_rule_condition for child in self.children)
 
+    def get_next_time_dependent_change(
+        self, previous_evaluation_time: datetime.datetime
+    ) -> Optional[datetime.datetime]:
+        """Returns the earliest time at or after `previous_evaluation_time` at which the result of
+        this condition may change even if no new events have been recorded for the entities it is
+        evaluated over, or None if its result only changes in response to new events.
+
+        Conditions that are not provided by the framework may depend on anything, and so are
+        assumed to change at any time.
+        """
+        return previous_evaluation_time
+
     @property
     def is_serializable(self) -> bool:
         if not is_whitelisted_for_serdes_object(self):
@@ -652,6 +676,27 @@ class BuiltinAutomationCondition(AutomationCondition[T_EntityKey]):
     def get_label(self) -> Optional[str]:
         return self.label
 
+    @property
+    def depends_on_root_context(self) -> bool:
+        # nodes that store a cursor read the cursor of the root entity
+        return self.requires_cursor
+
+    def get_next_time_dependent_change(
+        self, previous_evaluation_time: datetime.datetime
+    ) -> Optional[datetime.datetime]:
+        # builtin conditions only depend on the current time through their children, unless they
+        # override this method
+        return min(
+            filter(
+                None,
+                (
+                    child.get_next_time_dependent_change(previous_evaluation_time)
+                    for child in self.children
+                ),
+            ),
+            default=None,
+        )
+
     @public
     def with_label(self, label: Optional[str]) -> Self:
         """Returns a copy of this AutomationCondition with a human-readable label."""
@@ -703,6 +748,8 @@ def __init__(
 
         # used to enable the evaluator class to modify the evaluation in some edge cases
         self._serializable_subset_override: Optional[SerializableEntitySubset] = None
+        self._settled_fingerprint: Optional[str] = None
+        self._storage_query_counter: Optional[StorageQueryCounter] = None
 
     @property
     def key(self) -> T_EntityKey:
@@ -777,6 +824,12 @@ def serializable_evaluation(self) -> AutomationConditionEvaluation:
             child_evaluations=[
                 child_result.serializable_evaluation for child_result in self._child_results
             ],
+            num_storage_queries=self._storage_query_counter.num_queries
+            if self._storage_query_counter
+            else None,
+            num_rows_fetched=self._storage_query_counter.num_rows_fetched
+            if self._storage_query_counter
+            else None,
         )
 
     def set_internal_serializable_subset_override(self, override: SerializableEntitySubset) -> None:
@@ -785,6 +838,16 @@ def set_internal_serializable_subset_override(self, override: SerializableEntity
         """
         self._serializable_subset_override = override
 
+    def set_internal_settled_fingerprint(self, fingerprint: Optional[str]) -> None:
+        """Internal method for marking this result as settled, allowing the evaluator to skip
+        re-evaluating it on subsequent ticks.
+        """
+        self._settled_fingerprint = fingerprint
+
+    def set_internal_storage_query_counter(self, counter: StorageQueryCounter) -> None:
+        """Internal method for recording the storage queries issued while evaluating this node."""
+        self._storage_query_counter = counter
+
     def get_child_node_cursors(self) -> Mapping[str, AutomationConditionNodeCursor]:
         node_cursors = {self.condition_unique_id: self.node_cursor} if self.node_cursor else {}
         for child_result in self._child_results:
@@ -798,6 +861,7 @@ def get_new_cursor(self) -> AutomationConditionCursor:
             last_event_id=self._context.max_storage_id,
             node_cursors_by_unique_id=self.get_child_node_cursors(),
             result_value_hash=self.value_hash,
+            settled_fingerprint=self._settled_fingerprint,
         )
 
     def get_serializable_subset(self) -> SerializableEntitySubset:
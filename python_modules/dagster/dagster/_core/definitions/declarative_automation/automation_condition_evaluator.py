@@ -2,8 +2,19 @@
 import datetime
 import logging
 from collections import defaultdict
-from typing import TYPE_CHECKING, AbstractSet, Dict, Mapping, Optional, Sequence, Tuple
+from typing import (
+    TYPE_CHECKING,
+    AbstractSet,
+    Dict,
+    Iterable,
+    Mapping,
+    Optional,
+    Sequence,
+    Set,
+    Tuple,
+)
 
+import dagster._check as check
 from dagster._core.asset_graph_view.asset_graph_view import AssetGraphView, TemporalContext
 from dagster._core.asset_graph_view.entity_subset import EntitySubset
 from dagster._core.definitions.asset_daemon_cursor import AssetDaemonCursor
@@ -14,10 +25,27 @@
     AutomationCondition,
     AutomationResult,
 )
+from dagster._core.definitions.declarative_automation.automation_condition_profile import (
+    format_condition_node_profiles,
+    get_most_expensive_condition_nodes,
+    profile_storage_queries,
+)
 from dagster._core.definitions.declarative_automation.automation_context import AutomationContext
-from dagster._core.definitions.events import AssetKey
+from dagster._core.definitions.declarative_automation.automation_result_cache import (
+    AutomationResultCache,
+)
+from dagster._core.definitions.declarative_automation.serialized_objects import (
+    AutomationConditionCursor,
+    AutomationConditionEvaluation,
+)
+from dagster._core.definitions.events import AssetKey, AssetKeyPartitionKey
+from dagster._core.definitions.multi_dimensional_partitions import MultiPartitionsDefinition
+from dagster._core.definitions.partition import DynamicPartitionsDefinition, PartitionsDefinition
+from dagster._core.definitions.time_window_partitions import get_time_partitions_def
 from dagster._core.instance import DagsterInstance
 from dagster._time import get_current_datetime
+from dagster._utils.cached_method import cached_method
+from dagster._utils.security import non_secure_md5_hash_str
 
 if TYPE_CHECKING:
     from dagster._utils.caching_instance_queryer import CachingInstanceQueryer
@@ -35,6 +63,7 @@ def __init__(
         default_condition: Optional[AutomationCondition] = None,
         evaluation_time: Optional[datetime.datetime] = None,
         logger: logging.Logger = logging.getLogger("dagster.automation"),
+        evaluate_incrementally: bool = False,
     ):
         self.entity_keys = entity_keys
         self.asset_graph_view = AssetGraphView(
@@ -66,6 +95,12 @@ def __init__(
         self.legacy_data_time_resolver = CachingDataTimeResolver(self.instance_queryer)
 
         self.request_subsets_by_key: Dict[EntityKey, EntitySubset] = {}
+        self.result_cache = AutomationResultCache()
+
+        # when evaluating incrementally, the conditions of assets whose results are settled are
+        # only evaluated if something they depend on has changed since their previous evaluation
+        self.evaluate_incrementally = evaluate_incrementally
+        self.skipped_entity_keys: Set[EntityKey] = set()
 
     @property
     def instance_queryer(self) -> "CachingInstanceQueryer":
@@ -103,7 +138,8 @@ def prefetch(self) -> None:
         self.logger.info("Done prefetching asset records.")
 
     def evaluate(self) -> Tuple[Sequence[AutomationResult], Sequence[EntitySubset[EntityKey]]]:
-        return asyncio.run(self.async_evaluate())
+        with profile_storage_queries(self.asset_graph_view.instance):
+            return asyncio.run(self.async_evaluate())
 
     async def async_evaluate(
         self,
@@ -138,14 +174,42 @@ async def _evaluate_entity_async(entity_key: EntityKey, offset: int):
             )
 
         for topo_level in self.asset_graph.toposorted_entity_keys_by_level:
+            # entities are skipped based on the requests of their parents, so this must be decided
+            # after all previous levels have been evaluated
+            entity_keys = []
+            for entity_key in topo_level:
+                if entity_key not in self.entity_keys:
+                    continue
+                if self._can_skip_entity(entity_key):
+                    self.skipped_entity_keys.add(entity_key)
+                    num_evaluated += 1
+                else:
+                    entity_keys.append(entity_key)
+
             coroutines = [
                 _evaluate_entity_async(entity_key, offset)
-                for offset, entity_key in enumerate(topo_level)
-                if entity_key in self.entity_keys
+                for offset, entity_key in enumerate(entity_keys)
             ]
             await asyncio.gather(*coroutines)
             num_evaluated += len(coroutines)
 
+        self.logger.info(self.result_cache.get_report())
+        if self.logger.isEnabledFor(logging.DEBUG):
+            most_expensive_nodes = get_most_expensive_condition_nodes(
+                [result.serializable_evaluation for result in self.current_results_by_key.values()],
+                limit=5,
+            )
+            if most_expensive_nodes:
+                self.logger.debug(
+                    "Most expensive condition evaluations:\n"
+                    + format_condition_node_profiles(most_expensive_nodes)
+                )
+        if self.evaluate_incrementally:
+            self.logger.info(
+                f"Skipped evaluating {len(self.skipped_entity_keys)} of {num_conditions} conditions "
+                "whose results can not have changed since the previous evaluation."
+            )
+
         return list(self.current_results_by_key.values()), [
             v for v in self.request_subsets_by_key.values() if not v.is_empty
         ]
@@ -163,6 +227,174 @@ async def evaluate_entity(self, key: EntityKey) -> None:
             # handle cases where an entity must be materialized with others
             self._handle_execution_set(result)
 
+            if self.evaluate_incrementally and self._is_settled(result):
+                result.set_internal_settled_fingerprint(self._get_settled_fingerprint(key=key))
+
+    @cached_method
+    def _get_settled_fingerprint(self, *, key: AssetKey) -> Optional[str]:
+        """Returns a fingerprint of the definitions that the condition of the given asset is
+        evaluated against and of the latest events of the asset and its parents, or None if its
+        result may change in ways that are not tracked when evaluating incrementally.
+        """
+        node = self.asset_graph.get(key)
+        condition = node.automation_condition or self.default_condition
+        if (
+            condition is None
+            or condition.has_rule_condition
+            # other entities in the execution set may request this asset after it was evaluated
+            or len(node.execution_set_entity_keys) > 1
+        ):
+            return None
+
+        parts = [condition.get_unique_id(), str(node.code_version)]
+        for asset_key in [key, *sorted(node.parent_keys, key=lambda k: k.path)]:
+            parts.append(asset_key.to_user_string())
+            # wiping an asset removes its latest storage ids rather than adding newer ones
+            parts.append(str(self._get_latest_storage_ids(asset_key)))
+            if not self.asset_graph.has(asset_key):
+                continue
+            asset_node = self.asset_graph.get(asset_key)
+            if _has_dynamic_partitions(asset_node.partitions_def):
+                # new dynamic partitions are not tracked by the asset records
+                return None
+            parts.append(
+                asset_node.partitions_def.get_serializable_unique_identifier()
+                if asset_node.partitions_def
+                else ""
+            )
+            parts.append(str(asset_node.group_name))
+            if asset_key != key:
+                parts.append(repr(self.asset_graph.get_partition_mapping(key, asset_key)))
+
+        return non_secure_md5_hash_str("".join(parts).encode())
+
+    @cached_method
+    def _get_active_backfill_asset_keys(self) -> AbstractSet[AssetKey]:
+        return self.instance_queryer.get_active_backfill_in_progress_asset_graph_subset().asset_keys
+
+    @cached_method
+    def _get_latest_planned_storage_id(self, *, key: AssetKey) -> Optional[int]:
+        if self.instance_queryer.instance.event_log_storage.asset_records_have_last_planned_materialization_storage_id:
+            asset_record = self.instance_queryer.get_asset_record(key)
+            return (
+                asset_record.asset_entry.last_planned_materialization_storage_id
+                if asset_record
+                else None
+            )
+
+        planned_materialization_info = self.instance_queryer.instance.event_log_storage.get_latest_planned_materialization_info(
+            key
+        )
+        return planned_materialization_info.storage_id if planned_materialization_info else None
+
+    def _get_latest_storage_ids(self, key: AssetKey) -> Tuple[Optional[int], Optional[int]]:
+        """Returns the storage ids of the latest materialization or observation and the latest
+        planned materialization of the given asset.
+        """
+        asset_record = self.instance_queryer.get_asset_record(key)
+        planned_storage_id = self._get_latest_planned_storage_id(key=key)
+        if self.asset_graph.has(key) and self.asset_graph.get(key).is_observable:
+            # observations are not reliably tracked by the asset record
+            return (
+                self.instance_queryer.get_latest_materialization_or_observation_storage_id(
+                    AssetKeyPartitionKey(key)
+                ),
+                planned_storage_id,
+            )
+
+        materialization_record = (
+            asset_record.asset_entry.last_materialization_record if asset_record else None
+        )
+        return (
+            materialization_record.storage_id if materialization_record else None,
+            planned_storage_id,
+        )
+
+    def _is_unchanged_since(self, key: AssetKey, cursor: AutomationConditionCursor) -> bool:
+        """Returns True if nothing that the condition of the given asset depends on has changed
+        since the evaluation that produced the given cursor, other than the requests of its parents
+        on this tick.
+        """
+        if not cursor.previous_requested_subset.is_empty:
+            # newly requested subsets change on the tick after a request
+            return False
+
+        condition = check.not_none(
+            self.asset_graph.get(key).automation_condition or self.default_condition
+        )
+        previous_evaluation_time = cursor.temporal_context.effective_dt
+        next_time_dependent_change = condition.get_next_time_dependent_change(
+            previous_evaluation_time
+        )
+        if (
+            next_time_dependent_change is not None
+            and next_time_dependent_change.timestamp() <= self.evaluation_time.timestamp()
+        ):
+            return False
+
+        for asset_key in {key, *self.asset_graph.get(key).parent_keys}:
+            if asset_key in self._get_active_backfill_asset_keys():
+                return False
+
+            if self.asset_graph.has(asset_key):
+                time_partitions_def = get_time_partitions_def(
+                    self.asset_graph.get(asset_key).partitions_def
+                )
+                if time_partitions_def and time_partitions_def.get_last_partition_window(
+                    previous_evaluation_time
+                ) != time_partitions_def.get_last_partition_window(self.evaluation_time):
+                    return False
+
+            storage_id, planned_storage_id = self._get_latest_storage_ids(asset_key)
+            if any(
+                new_storage_id is not None
+                and (cursor.last_event_id is None or new_storage_id > cursor.last_event_id)
+                for new_storage_id in (storage_id, planned_storage_id)
+            ):
+                return False
+            if planned_storage_id is not None and (
+                storage_id is None or planned_storage_id > storage_id
+            ):
+                # the planned run may have completed or failed without a new event for this asset
+                return False
+
+        return True
+
+    def _has_requested_parents(self, key: AssetKey) -> bool:
+        return any(
+            not self.request_subsets_by_key[parent_key].is_empty
+            for parent_key in self.asset_graph.get(key).parent_keys
+            if parent_key in self.request_subsets_by_key
+        )
+
+    def _is_settled(self, result: AutomationResult[AssetKey]) -> bool:
+        """A result is settled if re-evaluating the condition will produce the same result for as
+        long as nothing it depends on changes. This is the case if nothing changed since the
+        previous evaluation and the previous evaluation produced the same result, as stateful
+        conditions (e.g. `newly_true`) then carry over the same state.
+        """
+        previous_cursor = self.cursor.get_previous_condition_cursor(result.key)
+        return (
+            previous_cursor is not None
+            and result.true_subset.is_empty
+            and result.value_hash == previous_cursor.result_value_hash
+            and not self._has_requested_parents(result.key)
+            and self._is_unchanged_since(result.key, previous_cursor)
+        )
+
+    def _can_skip_entity(self, key: EntityKey) -> bool:
+        if not self.evaluate_incrementally or not isinstance(key, AssetKey):
+            return False
+
+        previous_cursor = self.cursor.get_previous_condition_cursor(key)
+        return (
+            previous_cursor is not None
+            and previous_cursor.settled_fingerprint is not None
+            and previous_cursor.settled_fingerprint == self._get_settled_fingerprint(key=key)
+            and not self._has_requested_parents(key)
+            and self._is_unchanged_since(key, previous_cursor)
+        )
+
     def _add_request_subset(self, subset: EntitySubset) -> None:
         """Adds the provided subset to the dictionary tracking what we will request on this tick."""
         if subset.key not in self.request_subsets_by_key:
@@ -200,3 +432,28 @@ def _handle_execution_set(self, result: AutomationResult[AssetKey]) -> None:
                     )
 
                 self._add_request_subset(neighbor_true_subset)
+
+
+def get_updated_evaluations(
+    cursor: AssetDaemonCursor, results: Iterable[AutomationResult]
+) -> Sequence[AutomationConditionEvaluation[EntityKey]]:
+    # only record evaluation results where something changed
+    updated_evaluations = []
+    for result in results:
+        previous_cursor = cursor.get_previous_condition_cursor(result.key)
+        if (
+            previous_cursor is None
+            or previous_cursor.result_value_hash != result.value_hash
+            or not result.true_subset.is_empty
+        ):
+            updated_evaluations.append(result.serializable_evaluation)
+    return updated_evaluations
+
+
+def _has_dynamic_partitions(partitions_def: Optional[PartitionsDefinition]) -> bool:
+    if isinstance(partitions_def, MultiPartitionsDefinition):
+        return any(
+            isinstance(dimension.partitions_def, DynamicPartitionsDefinition)
+            for dimension in partitions_def.partitions_defs
+        )
+    return isinstance(partitions_def, DynamicPartitionsDefinition)
@@ -0,0 +1,243 @@
+import heapq
+import os
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import (
+    TYPE_CHECKING,
+    AbstractSet,
+    Callable,
+    Iterator,
+    NamedTuple,
+    Optional,
+    Sequence,
+    Tuple,
+)
+
+from dagster._core.asset_graph_view.serializable_entity_subset import SerializableEntitySubset
+from dagster._core.definitions.asset_key import EntityKey
+from dagster._core.definitions.declarative_automation.serialized_objects import (
+    AutomationConditionEvaluation,
+)
+from dagster._core.definitions.partition import AllPartitionsSubset
+
+if TYPE_CHECKING:
+    from sqlalchemy.engine import Engine
+
+    from dagster._core.instance import DagsterInstance
+
+
+class StorageQueryCounter:
+    """Counts the storage queries issued while it is active. Queries issued while a nested counter
+    is active are only counted by the nested counter.
+    """
+
+    def __init__(self, is_enabled: bool = True):
+        self._is_enabled = is_enabled
+        self._num_queries = 0
+        self._num_rows_fetched = 0
+        self._all_row_counts_reported = True
+
+    @property
+    def num_queries(self) -> Optional[int]:
+        """The number of queries issued, or None if storage queries were not being profiled."""
+        return self._num_queries if self._is_enabled else None
+
+    @property
+    def num_rows_fetched(self) -> Optional[int]:
+        """The number of rows returned by select statements, or None if storage queries were not
+        being profiled or the storage driver did not report the row count of some of them.
+        """
+        return (
+            self._num_rows_fetched if self._is_enabled and self._all_row_counts_reported else None
+        )
+
+    def record_query(self, statement: str, rowcount: int) -> None:
+        self._num_queries += 1
+        if statement.lstrip()[:6].upper() == "SELECT":
+            if rowcount >= 0:
+                self._num_rows_fetched += rowcount
+            else:
+                self._all_row_counts_reported = False
+
+
+_current_storage_query_counter: ContextVar[Optional[StorageQueryCounter]] = ContextVar(
+    "_current_storage_query_counter", default=None
+)
+_current_storage_query_listener: ContextVar[Optional[Callable[..., None]]] = ContextVar(
+    "_current_storage_query_listener", default=None
+)
+
+
+def _get_storage_engines_and_sqlite_dirs(
+    instance: "DagsterInstance",
+) -> Tuple[Sequence["Engine"], AbstractSet[str]]:
+    """Returns the engines held by the storages of the instance, and the directories of the
+    databases of its sqlite storages, which create a new engine for each connection.
+    """
+    import sqlalchemy as db
+
+    engines = []
+    sqlite_dirs = set()
+    for storage in (instance.run_storage, instance.event_log_storage, instance.schedule_storage):
+        engine = getattr(storage, "_engine", None)
+        conn_string = getattr(storage, "_conn_string", None)
+        base_dir = getattr(storage, "_base_dir", None)
+        if isinstance(engine, db.engine.Engine):
+            engines.append(engine)
+        elif isinstance(conn_string, str) and conn_string.startswith("sqlite"):
+            database = db.engine.make_url(conn_string).database
+            if database:
+                sqlite_dirs.add(os.path.dirname(os.path.abspath(database)))
+        elif isinstance(base_dir, str):
+            sqlite_dirs.add(os.path.abspath(base_dir))
+    return engines, sqlite_dirs
+
+
+@contextmanager
+def profile_storage_queries(instance: "DagsterInstance") -> Iterator[None]:
+    """Enables counting the SQL statements executed by the storages of the given instance within
+    `count_storage_queries` contexts entered in this context. The query listener is attached to
+    the engines of those storages and removed on exit, so queries of other instances and of other
+    threads are never counted.
+    """
+    import sqlalchemy as db
+
+    engines, sqlite_dirs = _get_storage_engines_and_sqlite_dirs(instance)
+
+    def _record_storage_query(conn, cursor, statement, parameters, context, executemany) -> None:
+        if _current_storage_query_listener.get() is not _record_storage_query:
+            return
+        counter = _current_storage_query_counter.get()
+        if counter is None:
+            return
+        if sqlite_dirs and conn.engine not in engines:
+            database = conn.engine.url.database
+            if not database or os.path.dirname(os.path.abspath(database)) not in sqlite_dirs:
+                return
+        counter.record_query(statement, cursor.rowcount)
+
+    # sqlite storages create an engine for each connection, so their queries can only be observed
+    # by listening on all engines
+    targets = [*engines, *([db.engine.Engine] if sqlite_dirs else [])]
+    for target in targets:
+        db.event.listen(target, "after_cursor_execute", _record_storage_query)
+    token = _current_storage_query_listener.set(_record_storage_query)
+    try:
+        yield
+    finally:
+        _current_storage_query_listener.reset(token)
+        for target in targets:
+            db.event.remove(target, "after_cursor_execute", _record_storage_query)
+
+
+@contextmanager
+def count_storage_queries() -> Iterator[StorageQueryCounter]:
+    """Counts the SQL statements executed by the storages being profiled within this context.
+    Counting is scoped to the current asyncio task, so concurrently evaluated entities do not count
+    each other's queries. A query batched across several tasks is counted by the task which
+    triggered it.
+    """
+    counter = StorageQueryCounter(is_enabled=_current_storage_query_listener.get() is not None)
+    token = _current_storage_query_counter.set(counter)
+    try:
+        yield counter
+    finally:
+        _current_storage_query_counter.reset(token)
+
+
+class AutomationConditionNodeProfile(NamedTuple):
+    """The cost of evaluating a single node of the condition tree of an entity, excluding the cost
+    of evaluating its children.
+    """
+
+    key: EntityKey
+    unique_id: str
+    label: str
+    duration: float
+    num_storage_queries: Optional[int]
+    num_rows_fetched: Optional[int]
+    true_subset_size: int
+    candidate_subset_size: Optional[int]
+
+
+def _get_duration(evaluation: AutomationConditionEvaluation) -> float:
+    if evaluation.start_timestamp is None or evaluation.end_timestamp is None:
+        return 0.0
+    return evaluation.end_timestamp - evaluation.start_timestamp
+
+
+def _get_subset_size(subset: SerializableEntitySubset) -> int:
+    # avoid building every partition key of the partitions definition just to count them
+    if subset.is_partitioned and isinstance(subset.subset_value, AllPartitionsSubset):
+        all_subset = subset.subset_value
+        return all_subset.partitions_def.get_num_partitions(
+            all_subset.current_time, all_subset.dynamic_partitions_store
+        )
+    return subset.size
+
+
+def _iter_node_costs(
+    evaluation: AutomationConditionEvaluation,
+) -> Iterator[Tuple[float, int, AutomationConditionEvaluation]]:
+    """Yields the duration, excluding that of its children, and number of storage queries of every
+    node of the given evaluation tree.
+    """
+    # children evaluate concurrently with other entities, or may have been shared with another
+    # entity, so their wall time can exceed that of their parent
+    child_duration = sum(_get_duration(child) for child in evaluation.child_evaluations)
+    yield (
+        max(_get_duration(evaluation) - child_duration, 0.0),
+        evaluation.num_storage_queries or 0,
+        evaluation,
+    )
+    for child in evaluation.child_evaluations:
+        yield from _iter_node_costs(child)
+
+
+def _get_node_profile(
+    evaluation: AutomationConditionEvaluation, duration: float
+) -> AutomationConditionNodeProfile:
+    snapshot = evaluation.condition_snapshot
+    return AutomationConditionNodeProfile(
+        key=evaluation.key,
+        unique_id=snapshot.unique_id,
+        label=snapshot.label or snapshot.name or snapshot.class_name,
+        duration=duration,
+        num_storage_queries=evaluation.num_storage_queries,
+        num_rows_fetched=evaluation.num_rows_fetched,
+        true_subset_size=_get_subset_size(evaluation.true_subset),
+        candidate_subset_size=_get_subset_size(evaluation.candidate_subset)
+        if isinstance(evaluation.candidate_subset, SerializableEntitySubset)
+        else None,
+    )
+
+
+def get_most_expensive_condition_nodes(
+    evaluations: Sequence[AutomationConditionEvaluation], limit: int
+) -> Sequence[AutomationConditionNodeProfile]:
+    """Returns the condition nodes that took the longest to evaluate across the given root
+    evaluations, breaking ties by the number of storage queries they issued.
+    """
+    most_expensive = heapq.nlargest(
+        limit,
+        (cost for evaluation in evaluations for cost in _iter_node_costs(evaluation)),
+        key=lambda cost: (cost[0], cost[1]),
+    )
+    # subset sizes can be expensive to compute, so only compute them for the reported nodes
+    return [_get_node_profile(evaluation, duration) for duration, _, evaluation in most_expensive]
+
+
+def format_condition_node_profiles(profiles: Sequence[AutomationConditionNodeProfile]) -> str:
+    lines = []
+    for profile in profiles:
+        num_queries = "?" if profile.num_storage_queries is None else profile.num_storage_queries
+        num_rows = "?" if profile.num_rows_fetched is None else profile.num_rows_fetched
+        num_candidates = (
+            "?" if profile.candidate_subset_size is None else profile.candidate_subset_size
+        )
+        lines.append(
+            f"{profile.duration:.3f}s, {num_queries} queries, {num_rows} rows, "
+            f"{profile.true_subset_size}/{num_candidates} true: "
+            f"{profile.key.to_user_string()} {profile.label}"
+        )
+    return "\n".join(lines)
@@ -0,0 +1,258 @@
+import datetime
+import logging
+import multiprocessing
+from concurrent.futures import ProcessPoolExecutor
+from typing import AbstractSet, Dict, List, Optional, Sequence, Set, Union, cast
+
+import dagster._check as check
+from dagster._core.asset_graph_view.serializable_entity_subset import SerializableEntitySubset
+from dagster._core.definitions.asset_daemon_cursor import AssetDaemonCursor
+from dagster._core.definitions.asset_key import AssetCheckKey, AssetKey, EntityKey
+from dagster._core.definitions.base_asset_graph import BaseAssetGraph
+from dagster._core.definitions.declarative_automation.automation_condition import (
+    AutomationCondition,
+)
+from dagster._core.definitions.declarative_automation.automation_condition_evaluator import (
+    AutomationConditionEvaluator,
+    get_updated_evaluations,
+)
+from dagster._core.definitions.declarative_automation.serialized_objects import (
+    AutomationConditionCursor,
+    AutomationConditionEvaluation,
+)
+from dagster._core.definitions.remote_asset_graph import (
+    RemoteAssetCheckNode,
+    RemoteAssetGraph,
+    RemoteAssetNode,
+    RemoteRepositoryAssetGraph,
+    RemoteRepositoryAssetNode,
+    RemoteWorkspaceAssetGraph,
+    RemoteWorkspaceAssetNode,
+)
+from dagster._core.instance import DagsterInstance, InstanceRef
+from dagster._record import record
+from dagster._serdes import deserialize_value, serialize_value, whitelist_for_serdes
+from dagster._time import datetime_from_timestamp
+
+
+def get_automation_condition_shards(
+    asset_graph: BaseAssetGraph, entity_keys: AbstractSet[EntityKey], max_num_shards: int
+) -> Sequence[AbstractSet[EntityKey]]:
+    """Splits the given entities into at most `max_num_shards` shards whose conditions can be
+    evaluated independently of each other.
+
+    The condition of an entity only depends on the results of other entities through the
+    requests of its parents, of its checks and of the other entities in its execution set, so
+    each weakly connected component of the graph formed by those dependencies is kept within a
+    single shard. Parents that are neither evaluated nor in the execution set of an evaluated
+    entity can never be requested, so they do not connect their children.
+    """
+    requestable_keys: Set[EntityKey] = set(entity_keys)
+    for key in entity_keys:
+        requestable_keys |= asset_graph.get(key).execution_set_entity_keys
+
+    # union-find over the requestable entities
+    parents: Dict[EntityKey, EntityKey] = {key: key for key in requestable_keys}
+
+    def _find(key: EntityKey) -> EntityKey:
+        while parents[key] != key:
+            parents[key] = parents[parents[key]]
+            key = parents[key]
+        return key
+
+    def _union(a: EntityKey, b: EntityKey) -> None:
+        parents[_find(a)] = _find(b)
+
+    for key in entity_keys:
+        node = asset_graph.get(key)
+        connected_keys = set(node.parent_entity_keys) | node.execution_set_entity_keys
+        if isinstance(key, AssetKey):
+            connected_keys |= node.check_keys
+        for connected_key in connected_keys:
+            if connected_key in requestable_keys:
+                _union(key, connected_key)
+
+    components: Dict[EntityKey, Set[EntityKey]] = {}
+    for key in entity_keys:
+        components.setdefault(_find(key), set()).add(key)
+
+    # assign the largest components first, each to the currently smallest shard
+    shards: List[Set[EntityKey]] = [set() for _ in range(max(max_num_shards, 1))]
+    for component in sorted(components.values(), key=len, reverse=True):
+        min(shards, key=len).update(component)
+    return [shard for shard in shards if shard]
+
+
+@whitelist_for_serdes
+@record
+class AutomationConditionShardAssetGraphSnap:
+    """The nodes of a remote asset graph, from which each shard process rebuilds the graph that the
+    conditions of its shard are evaluated against.
+    """
+
+    asset_nodes: Sequence[RemoteAssetNode]
+    asset_check_nodes: Sequence[RemoteAssetCheckNode]
+
+    @staticmethod
+    def from_asset_graph(asset_graph: RemoteAssetGraph) -> "AutomationConditionShardAssetGraphSnap":
+        return AutomationConditionShardAssetGraphSnap(
+            asset_nodes=list(asset_graph.remote_asset_nodes_by_key.values()),
+            asset_check_nodes=list(asset_graph.remote_asset_check_nodes_by_key.values()),
+        )
+
+    def to_asset_graph(self) -> RemoteAssetGraph:
+        asset_check_nodes_by_key = {node.asset_check.key: node for node in self.asset_check_nodes}
+        if all(isinstance(node, RemoteRepositoryAssetNode) for node in self.asset_nodes):
+            return RemoteRepositoryAssetGraph(
+                remote_asset_nodes_by_key={
+                    node.key: cast(RemoteRepositoryAssetNode, node) for node in self.asset_nodes
+                },
+                remote_asset_check_nodes_by_key=asset_check_nodes_by_key,
+            )
+        return RemoteWorkspaceAssetGraph(
+            remote_asset_nodes_by_key={
+                node.key: cast(RemoteWorkspaceAssetNode, node) for node in self.asset_nodes
+            },
+            remote_asset_check_nodes_by_key=asset_check_nodes_by_key,
+        )
+
+
+@whitelist_for_serdes
+@record
+class AutomationConditionShardArgs:
+    """The inputs for evaluating the conditions of a single shard, as sent to its process. The
+    cursor only contains the condition cursors of the entities of the shard.
+    """
+
+    instance_ref: InstanceRef
+    entity_keys: AbstractSet[Union[AssetKey, AssetCheckKey]]
+    cursor: AssetDaemonCursor
+    emit_backfills: bool
+    default_condition: Optional[AutomationCondition]
+    evaluation_timestamp: float
+    evaluate_incrementally: bool
+
+
+@whitelist_for_serdes
+@record
+class AutomationConditionShardResult:
+    """The results of evaluating the conditions of a single shard, as sent back to the process
+    that evaluates the tick.
+    """
+
+    condition_cursors: Sequence[AutomationConditionCursor]
+    updated_evaluations: Sequence[AutomationConditionEvaluation]
+    requested_subsets: Sequence[SerializableEntitySubset]
+
+
+def _get_shard_cursor(
+    cursor: AssetDaemonCursor, entity_keys: AbstractSet[EntityKey]
+) -> AssetDaemonCursor:
+    return AssetDaemonCursor(
+        evaluation_id=cursor.evaluation_id,
+        last_observe_request_timestamp_by_asset_key={},
+        previous_evaluation_state=None,
+        previous_condition_cursors=[
+            condition_cursor
+            for key, condition_cursor in cursor.previous_condition_cursors_by_key.items()
+            if key in entity_keys
+        ],
+    )
+
+
+def _evaluate_shard(serialized_asset_graph_snap: str, serialized_args: str) -> str:
+    asset_graph = deserialize_value(
+        serialized_asset_graph_snap, AutomationConditionShardAssetGraphSnap
+    ).to_asset_graph()
+    args = deserialize_value(serialized_args, AutomationConditionShardArgs)
+
+    # the shard process opens its own connections to the storage of the instance, and closes them
+    # once the shard has been evaluated
+    with DagsterInstance.from_ref(args.instance_ref) as instance:
+        evaluator = AutomationConditionEvaluator(
+            entity_keys=args.entity_keys,
+            instance=instance,
+            asset_graph=asset_graph,
+            cursor=args.cursor,
+            emit_backfills=args.emit_backfills,
+            default_condition=args.default_condition,
+            evaluation_time=datetime_from_timestamp(args.evaluation_timestamp),
+            logger=logging.getLogger("dagster.automation"),
+            evaluate_incrementally=args.evaluate_incrementally,
+        )
+        results, requested_subsets = evaluator.evaluate()
+        return serialize_value(
+            AutomationConditionShardResult(
+                condition_cursors=[result.get_new_cursor() for result in results],
+                updated_evaluations=get_updated_evaluations(args.cursor, results),
+                requested_subsets=[
+                    subset.convert_to_serializable_subset() for subset in requested_subsets
+                ],
+            )
+        )
+
+
+def can_evaluate_shards_in_processes(
+    instance: DagsterInstance,
+    asset_graph: BaseAssetGraph,
+    default_condition: Optional[AutomationCondition],
+) -> bool:
+    """Shard processes are spawned rather than forked, as the evaluating process may be running
+    other threads, so every input of a shard must be serializable. This is the case for the
+    persistent instances and the remote asset graphs evaluated by the daemon, but not for the
+    definitions evaluated within a code server, whose conditions are evaluated in-process.
+    """
+    return (
+        instance.is_persistent
+        and isinstance(asset_graph, RemoteAssetGraph)
+        and (default_condition is None or default_condition.is_serializable)
+    )
+
+
+def evaluate_shards_in_processes(
+    *,
+    instance: DagsterInstance,
+    asset_graph: RemoteAssetGraph,
+    shards: Sequence[AbstractSet[EntityKey]],
+    cursor: AssetDaemonCursor,
+    emit_backfills: bool,
+    default_condition: Optional[AutomationCondition],
+    evaluation_time: datetime.datetime,
+    evaluate_incrementally: bool,
+) -> Sequence[AutomationConditionShardResult]:
+    """Evaluates the conditions of each shard in a separate spawned process, and returns the
+    results in the order of the given shards.
+    """
+    serialized_asset_graph_snap = serialize_value(
+        AutomationConditionShardAssetGraphSnap.from_asset_graph(asset_graph)
+    )
+    instance_ref = check.not_none(instance.get_ref())
+    serialized_args = [
+        serialize_value(
+            AutomationConditionShardArgs(
+                instance_ref=instance_ref,
+                entity_keys=shard,
+                cursor=_get_shard_cursor(cursor, shard),
+                emit_backfills=emit_backfills,
+                default_condition=default_condition,
+                evaluation_timestamp=evaluation_time.timestamp(),
+                evaluate_incrementally=evaluate_incrementally,
+            )
+        )
+        for shard in shards
+    ]
+    with ProcessPoolExecutor(
+        max_workers=len(shards), mp_context=multiprocessing.get_context("spawn")
+    ) as executor:
+        serialized_results = list(
+            executor.map(
+                _evaluate_shard,
+                [serialized_asset_graph_snap] * len(shards),
+                serialized_args,
+            )
+        )
+
+    return [
+        deserialize_value(serialized_result, AutomationConditionShardResult)
+        for serialized_result in serialized_results
+    ]
@@ -12,6 +12,12 @@
     AutomationCondition,
     AutomationResult,
 )
+from dagster._core.definitions.declarative_automation.automation_condition_profile import (
+    count_storage_queries,
+)
+from dagster._core.definitions.declarative_automation.automation_result_cache import (
+    AutomationResultCache,
+)
 from dagster._core.definitions.declarative_automation.legacy.legacy_context import (
     LegacyRuleEvaluationContext,
 )
@@ -59,6 +65,7 @@ class AutomationContext(Generic[T_EntityKey]):
 
     _cursor: Optional[AutomationConditionCursor]
     _legacy_context: Optional[LegacyRuleEvaluationContext]
+    _result_cache: Optional[AutomationResultCache]
 
     _root_log: logging.Logger
 
@@ -82,6 +89,7 @@ def create(key: EntityKey, evaluator: "AutomationConditionEvaluator") -> "Automa
             _legacy_context=LegacyRuleEvaluationContext.create(key, evaluator)
             if condition.has_rule_condition and isinstance(key, AssetKey)
             else None,
+            _result_cache=evaluator.result_cache,
             _root_log=evaluator.logger,
         )
 
@@ -108,13 +116,32 @@ def for_child_condition(
             )
             if self._legacy_context
             else None,
+            _result_cache=self._result_cache,
             _root_log=self._root_log,
         )
 
     async def evaluate_async(self) -> AutomationResult[T_EntityKey]:
-        if inspect.iscoroutinefunction(self.condition.evaluate):
-            return await self.condition.evaluate(self)
-        return self.condition.evaluate(self)
+        # legacy evaluations use a different storage id cursoring scheme, so are never shared
+        cache_key = (
+            self._result_cache.get_cache_key(self)
+            if self._result_cache is not None and self._legacy_context is None
+            else None
+        )
+        if cache_key is not None:
+            cached_result = check.not_none(self._result_cache).get(cache_key)
+            if cached_result is not None:
+                return cached_result
+
+        with count_storage_queries() as storage_query_counter:
+            if inspect.iscoroutinefunction(self.condition.evaluate):
+                result = await self.condition.evaluate(self)
+            else:
+                result = self.condition.evaluate(self)
+        result.set_internal_storage_query_counter(storage_query_counter)
+
+        if cache_key is not None:
+            check.not_none(self._result_cache).set(cache_key, result)
+        return result
 
     @property
     def log(self) -> logging.Logger:
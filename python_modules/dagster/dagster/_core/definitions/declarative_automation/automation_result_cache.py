@@ -0,0 +1,135 @@
+from collections import Counter
+from typing import TYPE_CHECKING, Dict, Hashable, List, Optional, Tuple
+
+from dagster._core.definitions.declarative_automation.automation_condition import (
+    AutomationCondition,
+    AutomationResult,
+    BuiltinAutomationCondition,
+)
+from dagster._core.definitions.partition import AllPartitionsSubset
+from dagster._serdes import serialize_value
+from dagster._serdes.errors import SerializationError
+from dagster._utils.security import non_secure_md5_hash_str
+
+if TYPE_CHECKING:
+    from dagster._core.asset_graph_view.entity_subset import EntitySubset
+    from dagster._core.definitions.declarative_automation.automation_context import (
+        AutomationContext,
+    )
+
+AutomationResultCacheKey = Tuple[Hashable, ...]
+
+
+class AutomationResultCache:
+    """Shares the results of identical condition subtrees across the condition trees of all
+    entities evaluated on a tick.
+
+    Many entities share the same conditions (e.g. `eager()`), and the dependency operators of a
+    fan-out graph evaluate the same operands over the same parent once per child. A subtree's
+    result can be shared if none of its nodes depend on the root of the condition tree it is
+    evaluated within, in which case it is fully determined by the structure of the subtree, its
+    position in the tree, its candidate subset and the time of the previous evaluation.
+
+    Condition nodes are hash-consed: each node is mapped to an id of its structure, which is
+    computed once per node object from everything that ends up in its serialized evaluation (its
+    name, label and description) and the ids of its children.
+    """
+
+    def __init__(self):
+        self._subtree_ids_by_object_id: Dict[int, Optional[str]] = {}
+        # holds a reference to every condition in the mapping above, so that the object ids can
+        # not be reused while they are in it
+        self._conditions: List[AutomationCondition] = []
+        self._results: Dict[AutomationResultCacheKey, AutomationResult] = {}
+        self._hits_by_name: Counter[str] = Counter()
+        self._num_lookups = 0
+
+    def _get_subtree_id(self, condition: AutomationCondition) -> Optional[str]:
+        """Returns an id for the structure of the given condition subtree, or None if its results
+        can not be shared.
+        """
+        object_id = id(condition)
+        if object_id in self._subtree_ids_by_object_id:
+            return self._subtree_ids_by_object_id[object_id]
+
+        child_ids = [self._get_subtree_id(child) for child in condition.children]
+        if (
+            # only builtin conditions are guaranteed to be identified by their name
+            isinstance(condition, BuiltinAutomationCondition)
+            and not condition.depends_on_root_context
+            and all(child_id is not None for child_id in child_ids)
+        ):
+            parts = [
+                condition.__class__.__name__,
+                condition.name,
+                str(condition.get_label()),
+                condition.description,
+                *filter(None, child_ids),
+            ]
+            subtree_id = non_secure_md5_hash_str("".join(parts).encode())
+        else:
+            subtree_id = None
+
+        self._conditions.append(condition)
+        self._subtree_ids_by_object_id[object_id] = subtree_id
+        return subtree_id
+
+    def get_cache_key(self, context: "AutomationContext") -> Optional[AutomationResultCacheKey]:
+        subtree_id = self._get_subtree_id(context.condition)
+        if subtree_id is None:
+            return None
+        candidate_key = _get_subset_cache_key(context.candidate_subset)
+        if candidate_key is None:
+            return None
+        previous_temporal_context = context.previous_temporal_context
+        return (
+            subtree_id,
+            context.condition_unique_id,
+            context.key,
+            candidate_key,
+            (previous_temporal_context.effective_dt, previous_temporal_context.last_event_id)
+            if previous_temporal_context
+            else None,
+        )
+
+    def get(self, key: AutomationResultCacheKey) -> Optional[AutomationResult]:
+        self._num_lookups += 1
+        result = self._results.get(key)
+        if result is not None:
+            self._hits_by_name[result.condition.name] += 1
+        return result
+
+    def set(self, key: AutomationResultCacheKey, result: AutomationResult) -> None:
+        self._results[key] = result
+
+    @property
+    def num_lookups(self) -> int:
+        return self._num_lookups
+
+    @property
+    def num_hits(self) -> int:
+        return sum(self._hits_by_name.values())
+
+    def get_report(self, limit: int = 5) -> str:
+        report = (
+            f"Shared {self.num_hits} of {self.num_lookups} shareable condition evaluations "
+            "across entities."
+        )
+        if self._hits_by_name:
+            top_hits = ", ".join(
+                f"{name} ({count})" for name, count in self._hits_by_name.most_common(limit)
+            )
+            report += f" Most shared: {top_hits}."
+        return report
+
+
+def _get_subset_cache_key(subset: "EntitySubset") -> Optional[Hashable]:
+    value = subset.get_internal_value()
+    if isinstance(value, bool):
+        return value
+    if isinstance(value, AllPartitionsSubset):
+        return AllPartitionsSubset.__name__
+    try:
+        return serialize_value(value)
+    except SerializationError:
+        return None
@@ -1,3 +1,4 @@
+import datetime
 from typing import TYPE_CHECKING, Optional
 
 from dagster._core.definitions.asset_key import AssetKey
@@ -33,6 +34,12 @@ def get_node_unique_id(self, *, parent_unique_id: Optional[str], index: Optional
     def description(self) -> str:
         return self.rule.description
 
+    def get_next_time_dependent_change(
+        self, previous_evaluation_time: datetime.datetime
+    ) -> Optional[datetime.datetime]:
+        # legacy rules may depend on the current time in arbitrary ways
+        return previous_evaluation_time
+
     def evaluate(self, context: "AutomationContext[AssetKey]") -> AutomationResult[AssetKey]:
         context.log.debug(f"Evaluating rule: {self.rule.to_snapshot()}")
         # Allow for access to legacy context in legacy rule evaluation
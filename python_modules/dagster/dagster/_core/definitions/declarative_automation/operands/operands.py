@@ -14,7 +14,7 @@
 from dagster._core.definitions.declarative_automation.utils import SerializableTimeDelta
 from dagster._record import record
 from dagster._serdes.serdes import whitelist_for_serdes
-from dagster._utils.schedules import reverse_cron_string_iterator
+from dagster._utils.schedules import cron_string_iterator, reverse_cron_string_iterator
 
 
 @whitelist_for_serdes
@@ -110,6 +110,10 @@ def description(self) -> str:
     def name(self) -> str:
         return "will_be_requested"
 
+    @property
+    def depends_on_root_context(self) -> bool:
+        return True
+
     def _executable_with_root_context_key(self, context: AutomationContext) -> bool:
         # TODO: once we can launch backfills via the asset daemon, this can be removed
         from dagster._core.definitions.asset_graph import executable_in_same_run
@@ -136,6 +140,10 @@ class NewlyRequestedCondition(SubsetAutomationCondition):
     def name(self) -> str:
         return "newly_requested"
 
+    @property
+    def depends_on_root_context(self) -> bool:
+        return True
+
     def compute_subset(self, context: AutomationContext) -> EntitySubset:
         return context.previous_requested_subset or context.get_empty_subset()
 
@@ -147,6 +155,10 @@ class LatestRunExecutedWithRootTargetCondition(SubsetAutomationCondition):
     def name(self) -> str:
         return "executed_with_root_target"
 
+    @property
+    def depends_on_root_context(self) -> bool:
+        return True
+
     async def compute_subset(self, context: AutomationContext) -> EntitySubset:
         return await context.asset_graph_view.compute_latest_run_executed_with_subset(
             from_subset=context.candidate_subset, target=context.root_context.key
@@ -187,6 +199,17 @@ def _get_previous_cron_tick(self, effective_dt: datetime.datetime) -> datetime.d
         )
         return next(previous_ticks)
 
+    def get_next_time_dependent_change(
+        self, previous_evaluation_time: datetime.datetime
+    ) -> Optional[datetime.datetime]:
+        return next(
+            cron_string_iterator(
+                start_timestamp=previous_evaluation_time.timestamp(),
+                cron_string=self.cron_schedule,
+                execution_timezone=self.cron_timezone,
+            )
+        )
+
     def compute_subset(self, context: AutomationContext) -> EntitySubset:
         previous_cron_tick = self._get_previous_cron_tick(context.evaluation_time)
         if (
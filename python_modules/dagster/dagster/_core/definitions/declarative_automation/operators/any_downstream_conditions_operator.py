@@ -1,4 +1,5 @@
-from typing import AbstractSet, Mapping, Sequence
+import datetime
+from typing import AbstractSet, Mapping, Optional, Sequence
 
 from dagster._core.definitions.asset_key import AssetKey
 from dagster._core.definitions.declarative_automation.automation_condition import (
@@ -33,6 +34,10 @@ def children(self) -> Sequence[AutomationCondition]:
     def requires_cursor(self) -> bool:
         return False
 
+    @property
+    def depends_on_root_context(self) -> bool:
+        return True
+
     async def evaluate(self, context: AutomationContext[AssetKey]) -> AutomationResult[AssetKey]:
         child_result = await context.for_child_condition(
             child_condition=self.operand,
@@ -60,6 +65,17 @@ def name(self) -> str:
     def requires_cursor(self) -> bool:
         return False
 
+    @property
+    def depends_on_root_context(self) -> bool:
+        # the conditions that are expanded depend on the evaluation hierarchy
+        return True
+
+    def get_next_time_dependent_change(
+        self, previous_evaluation_time: datetime.datetime
+    ) -> Optional[datetime.datetime]:
+        # the conditions of downstream assets may change without any change to this asset
+        return previous_evaluation_time
+
     def _get_ignored_conditions(
         self, context: AutomationContext[AssetKey]
     ) -> AbstractSet[AutomationCondition]:
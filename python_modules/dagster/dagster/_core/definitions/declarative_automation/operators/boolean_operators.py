@@ -119,6 +119,10 @@ def description(self) -> str:
     def name(self) -> str:
         return "NOT"
 
+    @property
+    def depends_on_root_context(self) -> bool:
+        return False
+
     @property
     def children(self) -> Sequence[AutomationCondition[T_EntityKey]]:
         return [self.operand]
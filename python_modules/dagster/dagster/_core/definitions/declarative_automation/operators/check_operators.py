@@ -1,6 +1,7 @@
 import asyncio
+import datetime
 from abc import abstractmethod
-from typing import AbstractSet
+from typing import AbstractSet, Optional
 
 from dagster._core.definitions.asset_key import AssetCheckKey, AssetKey
 from dagster._core.definitions.base_asset_graph import BaseAssetGraph, BaseAssetNode
@@ -38,6 +39,12 @@ def name(self) -> str:
     def requires_cursor(self) -> bool:
         return False
 
+    def get_next_time_dependent_change(
+        self, previous_evaluation_time: datetime.datetime
+    ) -> Optional[datetime.datetime]:
+        # check evaluations are not reflected in the asset records of the checked asset
+        return previous_evaluation_time
+
     def _get_check_keys(
         self, key: AssetKey, asset_graph: BaseAssetGraph[BaseAssetNode]
     ) -> AbstractSet[AssetCheckKey]:
@@ -30,6 +30,10 @@ class EntityMatchesCondition(
     def name(self) -> str:
         return self.key.to_user_string()
 
+    @property
+    def depends_on_root_context(self) -> bool:
+        return False
+
     async def evaluate(
         self, context: AutomationContext[T_EntityKey]
     ) -> AutomationResult[T_EntityKey]:
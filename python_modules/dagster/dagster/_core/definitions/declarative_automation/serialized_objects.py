@@ -104,6 +104,10 @@ class AutomationConditionEvaluation(Generic[T_EntityKey]):
 
     child_evaluations: Sequence["AutomationConditionEvaluation"]
 
+    # storage queries issued while evaluating this node, excluding those of its children
+    num_storage_queries: Optional[int] = None
+    num_rows_fetched: Optional[int] = None
+
     @property
     def key(self) -> T_EntityKey:
         return self.true_subset.key
@@ -180,6 +184,10 @@ class AutomationConditionCursor(Generic[T_EntityKey]):
             tree to any incremental state calculated for it.
         result_hash: A unique hash of the result for this tick. Used to determine if anything
             has changed since the last time this was evaluated.
+        settled_fingerprint: If re-evaluating the condition is guaranteed to produce this same
+            result until a new event is recorded or a time-dependent change occurs, a fingerprint
+            of the definitions it was evaluated against. Used to skip evaluations when evaluating
+            incrementally.
     """
 
     previous_requested_subset: SerializableEntitySubset
@@ -188,6 +196,7 @@ class AutomationConditionCursor(Generic[T_EntityKey]):
 
     node_cursors_by_unique_id: Mapping[str, AutomationConditionNodeCursor]
     result_value_hash: str
+    settled_fingerprint: Optional[str] = None
 
     @staticmethod
     def backcompat_from_evaluation_state(
@@ -337,6 +337,7 @@ def _core_multiprocess_executor_creation(config: ExecutorConfig) -> "Multiproces
         retries=RetryMode.from_config(check.dict_elem(config, "retries")),  # type: ignore
         start_method=start_method,
         explicit_forkserver_preload=check.opt_list_elem(start_cfg, "preload_modules", of_type=str),
+        worker_pool=check.bool_param(config.get("worker_pool", False), "worker_pool"),
     )
 
 
@@ -390,6 +391,15 @@ def _core_multiprocess_executor_creation(config: ExecutorConfig) -> "Multiproces
             ),
         ),
         "retries": get_retries_config(),
+        "worker_pool": Field(
+            bool,
+            is_required=False,
+            description=(
+                "Execute steps in a pool of up to `max_concurrent` long-lived worker processes,"
+                " instead of starting a new process for each step. Each worker process loads the"
+                " job definition once and reuses it for every step that it executes."
+            ),
+        ),
     },
     description="Execute each step in an individual process.",
 )
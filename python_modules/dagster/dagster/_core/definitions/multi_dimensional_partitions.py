@@ -19,6 +19,7 @@
 import dagster._check as check
 from dagster._annotations import public
 from dagster._core.definitions.partition import (
+    BitmapPartitionsSubset,
     DefaultPartitionsSubset,
     DynamicPartitionsDefinition,
     PartitionsDefinition,
@@ -219,6 +220,12 @@ def __init__(self, partitions_defs: Mapping[str, PartitionsDefinition]):
 
     @property
     def partitions_subset_class(self) -> Type["PartitionsSubset"]:
+        # subsets can be represented as bitmaps over the keys of a static dimension
+        if any(
+            isinstance(dim_def.partitions_def, StaticPartitionsDefinition)
+            for dim_def in self._partitions_defs
+        ):
+            return BitmapPartitionsSubset
         return DefaultPartitionsSubset
 
     def get_partition_keys_in_range(
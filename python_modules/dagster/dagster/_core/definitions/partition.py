@@ -1,10 +1,13 @@
+import base64
 import copy
 import hashlib
 import json
+import zlib
 from abc import ABC, abstractmethod
 from collections import defaultdict
 from datetime import datetime
 from enum import Enum
+from functools import cached_property
 from typing import (
     AbstractSet,
     Any,
@@ -12,10 +15,13 @@
     Dict,
     Generic,
     Iterable,
+    Iterator,
+    List,
     Mapping,
     NamedTuple,
     Optional,
     Sequence,
+    Tuple,
     Type,
     Union,
     cast,
@@ -41,6 +47,7 @@
 from dagster._core.instance import DagsterInstance, DynamicPartitionsStore
 from dagster._core.storage.tags import PARTITION_NAME_TAG, PARTITION_SET_TAG
 from dagster._serdes import whitelist_for_serdes
+from dagster._serdes.serdes import NamedTupleSerializer
 from dagster._utils import xor
 from dagster._utils.cached_method import cached_method
 from dagster._utils.tags import normalize_tags
@@ -338,6 +345,24 @@ def __init__(self, partition_keys: Sequence[str]):
 
         self._partition_keys = partition_keys
 
+    @property
+    def partitions_subset_class(self) -> Type["PartitionsSubset"]:
+        return BitmapPartitionsSubset
+
+    @cached_property
+    def partition_key_ordinals(self) -> Mapping[str, int]:
+        """The position of each partition key within the partitions definition. Used to represent
+        subsets of the partitions as bitmaps.
+        """
+        return {partition_key: i for i, partition_key in enumerate(self._partition_keys)}
+
+    @cached_property
+    def partition_keys_fingerprint(self) -> str:
+        """A hash of the partition keys, in order. Used to check that a serialized bitmap subset
+        was built against the same partition keys.
+        """
+        return hashlib.sha1(json.dumps(list(self._partition_keys)).encode("utf-8")).hexdigest()
+
     @public
     def get_partition_keys(
         self,
@@ -1200,6 +1225,8 @@ def can_deserialize(
         )
 
     def __eq__(self, other: object) -> bool:
+        if isinstance(other, BitmapPartitionsSubset):
+            return other == self
         return isinstance(other, DefaultPartitionsSubset) and self.subset == other.subset
 
     def __len__(self) -> int:
@@ -1218,6 +1245,424 @@ def empty_subset(
         return cls()
 
 
+class _PartitionsBitmapLayout(NamedTuple):
+    """Describes how the partition keys of a partitions definition map onto the bits of a
+    BitmapPartitionsSubset. Each partition key is split into the key of a static partitions
+    dimension, whose position in the static partitions definition selects a bit, and the key of
+    the other dimension, if any, which selects a bitmap.
+    """
+
+    static_partitions_def: StaticPartitionsDefinition
+    # None for a StaticPartitionsDefinition, otherwise the dimension names of the
+    # MultiPartitionsDefinition, in the order their keys appear in a multi-partition key
+    dimension_names: Optional[Sequence[str]]
+    static_dimension_index: int
+
+    def get_bitmap_key_and_ordinal(self, partition_key: object) -> Optional[Tuple[str, int]]:
+        """Returns the bitmap key and the bit that represent the given partition key, or None if the
+        partition key does not belong to the partitions definition.
+        """
+        if not isinstance(partition_key, str):
+            return None
+        ordinals = self.static_partitions_def.partition_key_ordinals
+        if self.dimension_names is None:
+            ordinal = ordinals.get(partition_key)
+            return None if ordinal is None else ("", ordinal)
+
+        from dagster._core.definitions.multi_dimensional_partitions import (
+            MULTIPARTITION_KEY_DELIMITER,
+        )
+
+        dimension_keys = partition_key.split(MULTIPARTITION_KEY_DELIMITER)
+        if len(dimension_keys) != 2:
+            return None
+        ordinal = ordinals.get(dimension_keys[self.static_dimension_index])
+        if ordinal is None:
+            return None
+        return dimension_keys[1 - self.static_dimension_index], ordinal
+
+    def get_partition_keys(self, bitmap_key: str, bitmap: int) -> Iterator[str]:
+        static_partition_keys = self.static_partitions_def.get_partition_keys()
+        if self.dimension_names is None:
+            for ordinal in _iter_set_bits(bitmap):
+                yield static_partition_keys[ordinal]
+            return
+
+        from dagster._core.definitions.multi_dimensional_partitions import MultiPartitionKey
+
+        static_dimension_name = self.dimension_names[self.static_dimension_index]
+        other_dimension_name = self.dimension_names[1 - self.static_dimension_index]
+        for ordinal in _iter_set_bits(bitmap):
+            yield MultiPartitionKey(
+                {
+                    static_dimension_name: static_partition_keys[ordinal],
+                    other_dimension_name: bitmap_key,
+                }
+            )
+
+    def get_fingerprint(self) -> str:
+        # Bitmaps are only meaningful for the exact sequence of static partition keys that they
+        # were built against, so serialized bitmaps are tagged with a hash of the layout
+        return hashlib.sha1(
+            json.dumps(
+                {
+                    "dimension_names": self.dimension_names,
+                    "static_dimension_index": self.static_dimension_index,
+                    "partition_keys": self.static_partitions_def.partition_keys_fingerprint,
+                }
+            ).encode("utf-8")
+        ).hexdigest()
+
+
+def _get_partitions_bitmap_layout(
+    partitions_def: Optional[PartitionsDefinition],
+) -> Optional[_PartitionsBitmapLayout]:
+    from dagster._core.definitions.multi_dimensional_partitions import MultiPartitionsDefinition
+
+    if isinstance(partitions_def, StaticPartitionsDefinition):
+        return _PartitionsBitmapLayout(partitions_def, None, 0)
+    if isinstance(partitions_def, MultiPartitionsDefinition):
+        static_dimension_indices = [
+            i
+            for i, dimension in enumerate(partitions_def.partitions_defs)
+            if isinstance(dimension.partitions_def, StaticPartitionsDefinition)
+        ]
+        if not static_dimension_indices:
+            return None
+        # index the bits by the largest static dimension, so that there are as few bitmaps as
+        # possible
+        static_dimension_index = max(
+            static_dimension_indices,
+            key=lambda i: len(
+                partitions_def.partitions_defs[i].partitions_def.get_partition_keys()
+            ),
+        )
+        return _PartitionsBitmapLayout(
+            cast(
+                StaticPartitionsDefinition,
+                partitions_def.partitions_defs[static_dimension_index].partitions_def,
+            ),
+            partitions_def.partition_dimension_names,
+            static_dimension_index,
+        )
+    return None
+
+
+def _iter_set_bits(bitmap: int) -> Iterator[int]:
+    while bitmap:
+        lowest_bit = bitmap & -bitmap
+        yield lowest_bit.bit_length() - 1
+        bitmap ^= lowest_bit
+
+
+def _bitmap_from_ordinals(ordinals: Sequence[int]) -> int:
+    # setting bits in a bytearray and converting once avoids allocating a new int for every bit
+    bitmap_bytes = bytearray(max(ordinals) // 8 + 1)
+    for ordinal in ordinals:
+        bitmap_bytes[ordinal >> 3] |= 1 << (ordinal & 7)
+    return int.from_bytes(bitmap_bytes, "little")
+
+
+class BitmapPartitionsSubsetSerializer(NamedTupleSerializer):
+    # BitmapPartitionsSubsets are only meaningful alongside their partitions definition, so they
+    # are stored as the equivalent DefaultPartitionsSubset
+    def pack_items(self, value, whitelist_map, object_handler, descent_path):
+        serializable_subset = value.to_serializable_subset()
+        return whitelist_map.object_serializers[type(serializable_subset).__name__].pack_items(
+            serializable_subset, whitelist_map, object_handler, descent_path
+        )
+
+
+@whitelist_for_serdes(serializer=BitmapPartitionsSubsetSerializer)
+class BitmapPartitionsSubset(
+    PartitionsSubset,
+    NamedTuple(
+        "_BitmapPartitionsSubset",
+        [("partitions_def", PartitionsDefinition), ("bitmaps", Mapping[str, int])],
+    ),
+):
+    """A subset of the partitions of a StaticPartitionsDefinition, or of a
+    MultiPartitionsDefinition with a static dimension, which represents the included partitions as
+    bitmaps over the positions of the static partition keys. Subsets of a
+    StaticPartitionsDefinition have a single bitmap, and subsets of a MultiPartitionsDefinition
+    have one bitmap for each partition key of the other dimension.
+
+    Unions, intersections and differences of subsets of the same partitions definition are computed
+    with bitwise operations, without materializing any partition keys. The subset is stored as the
+    equivalent DefaultPartitionsSubset, both by serdes and by serialize(). A compressed encoding
+    of the bitmaps produced by serialize_bitmaps() can be read back as well.
+    """
+
+    # Every time we change the serialization format, we should increment the version number.
+    # Version 1 is the DefaultPartitionsSubset format, which is the format that is written.
+    SERIALIZATION_VERSION = 2
+
+    def __new__(cls, partitions_def: PartitionsDefinition, bitmaps: Mapping[str, int]):
+        return super().__new__(
+            cls,
+            partitions_def=partitions_def,
+            bitmaps={bitmap_key: bitmap for bitmap_key, bitmap in bitmaps.items() if bitmap},
+        )
+
+    @cached_property
+    def _layout(self) -> _PartitionsBitmapLayout:
+        return check.not_none(_get_partitions_bitmap_layout(self.partitions_def))
+
+    def _get_bitmaps_for_partition_keys(
+        self, partition_keys: Iterable[str]
+    ) -> Tuple[Mapping[str, int], Sequence[str]]:
+        """Returns the bitmaps representing the given partition keys, along with any partition keys
+        that do not belong to the partitions definition.
+        """
+        ordinals_by_bitmap_key: Dict[str, List[int]] = defaultdict(list)
+        unknown_partition_keys = []
+        for partition_key in partition_keys:
+            bitmap_key_and_ordinal = self._layout.get_bitmap_key_and_ordinal(partition_key)
+            if bitmap_key_and_ordinal is None:
+                unknown_partition_keys.append(partition_key)
+            else:
+                ordinals_by_bitmap_key[bitmap_key_and_ordinal[0]].append(bitmap_key_and_ordinal[1])
+        return (
+            {
+                bitmap_key: _bitmap_from_ordinals(ordinals)
+                for bitmap_key, ordinals in ordinals_by_bitmap_key.items()
+            },
+            unknown_partition_keys,
+        )
+
+    def _get_other_bitmaps(self, other: PartitionsSubset) -> Mapping[str, int]:
+        if isinstance(other, BitmapPartitionsSubset) and (
+            other.partitions_def is self.partitions_def
+            or other.partitions_def == self.partitions_def
+        ):
+            return other.bitmaps
+        # partition keys of the other subset that do not belong to this partitions definition
+        # cannot be in the result of an intersection or difference
+        bitmaps, _ = self._get_bitmaps_for_partition_keys(other.get_partition_keys())
+        return bitmaps
+
+    @property
+    def is_empty(self) -> bool:
+        return not self.bitmaps
+
+    def get_partition_keys_not_in_subset(
+        self,
+        partitions_def: PartitionsDefinition,
+        current_time: Optional[datetime] = None,
+        dynamic_partitions_store: Optional[DynamicPartitionsStore] = None,
+    ) -> Iterable[str]:
+        return {
+            partition_key
+            for partition_key in partitions_def.get_partition_keys(
+                current_time=current_time, dynamic_partitions_store=dynamic_partitions_store
+            )
+            if partition_key not in self
+        }
+
+    def get_partition_keys(self) -> AbstractSet[str]:
+        return {
+            partition_key
+            for bitmap_key, bitmap in self.bitmaps.items()
+            for partition_key in self._layout.get_partition_keys(bitmap_key, bitmap)
+        }
+
+    def get_partition_key_ranges(
+        self,
+        partitions_def: PartitionsDefinition,
+        current_time: Optional[datetime] = None,
+        dynamic_partitions_store: Optional[DynamicPartitionsStore] = None,
+    ) -> Sequence[PartitionKeyRange]:
+        partition_keys = partitions_def.get_partition_keys(
+            current_time, dynamic_partitions_store=dynamic_partitions_store
+        )
+        cur_range_start = None
+        cur_range_end = None
+        result = []
+        for partition_key in partition_keys:
+            if partition_key in self:
+                if cur_range_start is None:
+                    cur_range_start = partition_key
+                cur_range_end = partition_key
+            else:
+                if cur_range_start is not None and cur_range_end is not None:
+                    result.append(PartitionKeyRange(cur_range_start, cur_range_end))
+                cur_range_start = cur_range_end = None
+
+        if cur_range_start is not None and cur_range_end is not None:
+            result.append(PartitionKeyRange(cur_range_start, cur_range_end))
+
+        return result
+
+    def with_partition_keys(self, partition_keys: Iterable[str]) -> PartitionsSubset:
+        new_bitmaps, unknown_partition_keys = self._get_bitmaps_for_partition_keys(partition_keys)
+        if unknown_partition_keys:
+            # keys that are not part of the partitions definition cannot be represented as bits
+            return DefaultPartitionsSubset(
+                set(self.get_partition_keys()) | set(unknown_partition_keys)
+            ).with_partition_keys(
+                partition_key
+                for bitmap_key, bitmap in new_bitmaps.items()
+                for partition_key in self._layout.get_partition_keys(bitmap_key, bitmap)
+            )
+        if not new_bitmaps:
+            return self
+        bitmaps = dict(self.bitmaps)
+        for bitmap_key, bitmap in new_bitmaps.items():
+            bitmaps[bitmap_key] = bitmaps.get(bitmap_key, 0) | bitmap
+        return BitmapPartitionsSubset(self.partitions_def, bitmaps)
+
+    def __or__(self, other: PartitionsSubset) -> PartitionsSubset:
+        if self is other or other.is_empty:
+            return self
+        if isinstance(other, AllPartitionsSubset):
+            return other
+        if isinstance(other, BitmapPartitionsSubset) and (
+            other.partitions_def is self.partitions_def
+            or other.partitions_def == self.partitions_def
+        ):
+            bitmaps = dict(self.bitmaps)
+            for bitmap_key, bitmap in other.bitmaps.items():
+                bitmaps[bitmap_key] = bitmaps.get(bitmap_key, 0) | bitmap
+            return BitmapPartitionsSubset(self.partitions_def, bitmaps)
+        return self.with_partition_keys(other.get_partition_keys())
+
+    def __and__(self, other: PartitionsSubset) -> PartitionsSubset:
+        if self is other or isinstance(other, AllPartitionsSubset):
+            return self
+        other_bitmaps = self._get_other_bitmaps(other)
+        return BitmapPartitionsSubset(
+            self.partitions_def,
+            {
+                bitmap_key: bitmap & other_bitmaps[bitmap_key]
+                for bitmap_key, bitmap in self.bitmaps.items()
+                if bitmap_key in other_bitmaps
+            },
+        )
+
+    def __sub__(self, other: PartitionsSubset) -> PartitionsSubset:
+        if self is other or isinstance(other, AllPartitionsSubset):
+            return BitmapPartitionsSubset(self.partitions_def, {})
+        if other.is_empty:
+            return self
+        other_bitmaps = self._get_other_bitmaps(other)
+        return BitmapPartitionsSubset(
+            self.partitions_def,
+            {
+                bitmap_key: bitmap & ~other_bitmaps.get(bitmap_key, 0)
+                for bitmap_key, bitmap in self.bitmaps.items()
+            },
+        )
+
+    def serialize(self) -> str:
+        # written in the DefaultPartitionsSubset format, so that processes running older versions
+        # of dagster which share the same storage can still read it
+        return self.to_serializable_subset().serialize()
+
+    def serialize_bitmaps(self) -> str:
+        """Serializes the subset as a compressed encoding of its bitmaps. from_serialized and
+        can_deserialize accept this format, but it is not yet written to storage.
+        """
+        encoded_bitmaps = json.dumps(
+            # sort to ensure that equivalent partition subsets have identical serialized forms
+            {bitmap_key: format(bitmap, "x") for bitmap_key, bitmap in sorted(self.bitmaps.items())}
+        ).encode("utf-8")
+        return json.dumps(
+            {
+                "version": self.SERIALIZATION_VERSION,
+                "fingerprint": self._layout.get_fingerprint(),
+                "bitmaps": base64.b64encode(zlib.compress(encoded_bitmaps)).decode("utf-8"),
+            }
+        )
+
+    @classmethod
+    def from_serialized(
+        cls, partitions_def: PartitionsDefinition, serialized: str
+    ) -> PartitionsSubset:
+        data = json.loads(serialized)
+        empty_subset = cls.empty_subset(partitions_def)
+
+        if isinstance(data, list):
+            # backwards compatibility
+            return empty_subset.with_partition_keys(data)
+        elif data.get("version") == DefaultPartitionsSubset.SERIALIZATION_VERSION:
+            return empty_subset.with_partition_keys(data.get("subset"))
+        elif data.get("version") != cls.SERIALIZATION_VERSION:
+            raise DagsterInvalidDeserializationVersionError(
+                f"Attempted to deserialize partition subset with version {data.get('version')},"
+                f" but only versions {DefaultPartitionsSubset.SERIALIZATION_VERSION} and"
+                f" {cls.SERIALIZATION_VERSION} are supported."
+            )
+
+        layout = check.not_none(_get_partitions_bitmap_layout(partitions_def))
+        if data.get("fingerprint") != layout.get_fingerprint():
+            raise DagsterInvalidDeserializationVersionError(
+                "Attempted to deserialize a partitions subset that was serialized for different"
+                " partition keys than those of the partitions definition."
+            )
+        encoded_bitmaps = json.loads(zlib.decompress(base64.b64decode(data["bitmaps"])))
+        return cls(
+            partitions_def,
+            {bitmap_key: int(bitmap, 16) for bitmap_key, bitmap in encoded_bitmaps.items()},
+        )
+
+    @classmethod
+    def can_deserialize(
+        cls,
+        partitions_def: PartitionsDefinition,
+        serialized: str,
+        serialized_partitions_def_unique_id: Optional[str],
+        serialized_partitions_def_class_name: Optional[str],
+    ) -> bool:
+        data = json.loads(serialized)
+        if isinstance(data, dict) and data.get("version") == cls.SERIALIZATION_VERSION:
+            layout = _get_partitions_bitmap_layout(partitions_def)
+            return layout is not None and data.get("fingerprint") == layout.get_fingerprint()
+
+        return DefaultPartitionsSubset.can_deserialize(
+            partitions_def,
+            serialized,
+            serialized_partitions_def_unique_id,
+            serialized_partitions_def_class_name,
+        )
+
+    def __eq__(self, other: object) -> bool:
+        if isinstance(other, BitmapPartitionsSubset) and (
+            other.partitions_def is self.partitions_def
+            or other.partitions_def == self.partitions_def
+        ):
+            return self.bitmaps == other.bitmaps
+        return isinstance(
+            other, (BitmapPartitionsSubset, DefaultPartitionsSubset)
+        ) and self.get_partition_keys() == set(other.get_partition_keys())
+
+    def __len__(self) -> int:
+        return sum(bin(bitmap).count("1") for bitmap in self.bitmaps.values())
+
+    def __contains__(self, value) -> bool:
+        bitmap_key_and_ordinal = self._layout.get_bitmap_key_and_ordinal(value)
+        if bitmap_key_and_ordinal is None:
+            return False
+        bitmap_key, ordinal = bitmap_key_and_ordinal
+        return bool(self.bitmaps.get(bitmap_key, 0) >> ordinal & 1)
+
+    def __repr__(self) -> str:
+        return f"BitmapPartitionsSubset(subset={self.get_partition_keys()})"
+
+    @classmethod
+    def empty_subset(
+        cls, partitions_def: Optional[PartitionsDefinition] = None
+    ) -> "BitmapPartitionsSubset":
+        if _get_partitions_bitmap_layout(partitions_def) is None:
+            check.failed(
+                "Partitions definition must be a StaticPartitionsDefinition or a"
+                " MultiPartitionsDefinition with a static dimension"
+            )
+        return cls(cast(PartitionsDefinition, partitions_def), {})
+
+    def to_serializable_subset(self) -> PartitionsSubset:
+        return DefaultPartitionsSubset(set(self.get_partition_keys()))
+
+
 class AllPartitionsSubset(
     NamedTuple(
         "_AllPartitionsSubset",
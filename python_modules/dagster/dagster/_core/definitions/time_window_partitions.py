@@ -1,6 +1,8 @@
 import functools
 import hashlib
 import json
+import math
+import operator
 import re
 from datetime import date, datetime, timedelta
 from enum import Enum
@@ -141,6 +143,43 @@ def dst_safe_strptime(date_string: str, tz: str, fmt: str) -> datetime:
         )
 
 
+# zero-padded numeric strftime directives, and the datetime attributes they format
+_NUMERIC_STRFTIME_DIRECTIVES = {
+    "%Y": ("%04d", "year"),
+    "%m": ("%02d", "month"),
+    "%d": ("%02d", "day"),
+    "%H": ("%02d", "hour"),
+    "%M": ("%02d", "minute"),
+    "%S": ("%02d", "second"),
+}
+
+
+@functools.lru_cache(maxsize=None)
+def _get_strftime_template(fmt: str) -> Optional[Tuple[str, Callable[[datetime], Tuple[int, ...]]]]:
+    """Translates a datetime format that only contains zero-padded numeric directives into an
+    equivalent printf-style template and a function that extracts its arguments from a datetime,
+    which together are considerably faster to apply than strftime. Returns None for formats that
+    contain any other directives.
+    """
+    template_parts = []
+    attributes = []
+    for part in re.split(r"(%.)", fmt):
+        if part.startswith("%"):
+            if part not in _NUMERIC_STRFTIME_DIRECTIVES:
+                return None
+            template_part, attribute = _NUMERIC_STRFTIME_DIRECTIVES[part]
+            template_parts.append(template_part)
+            attributes.append(attribute)
+        else:
+            template_parts.append(part.replace("%", "%%"))
+    if not attributes:
+        return None
+    get_attributes = operator.attrgetter(*attributes)
+    if len(attributes) == 1:
+        return "".join(template_parts), lambda dt: (get_attributes(dt),)
+    return "".join(template_parts), get_attributes
+
+
 class TimeWindow(NamedTuple):
     """An interval that is closed at the start and open at the end.
 
@@ -376,6 +415,101 @@ def _get_current_timestamp(self, current_time: Optional[datetime]) -> float:
 
         return current_time.timestamp()
 
+    @cached_property
+    def _fixed_interval_seconds(self) -> Optional[int]:
+        """The number of seconds between the starts of consecutive partitions, if it is the same for
+        every pair of consecutive partitions. For such partitions definitions, partition keys can be
+        mapped to and from their position in the partitions definition with arithmetic instead of
+        iterating over the cron schedule.
+        """
+        fixed_minute_interval = get_fixed_minute_interval(self.cron_schedule)
+        if fixed_minute_interval:
+            return fixed_minute_interval * 60
+
+        # without DST transitions, hourly, daily and weekly ticks are equally spaced
+        if self.timezone.upper() == "UTC":
+            if self.schedule_type == ScheduleType.HOURLY:
+                return 60 * 60
+            elif self.schedule_type == ScheduleType.DAILY:
+                return 24 * 60 * 60
+            elif self.schedule_type == ScheduleType.WEEKLY:
+                return 7 * 24 * 60 * 60
+
+        return None
+
+    @cached_property
+    def _first_partition_start_timestamp(self) -> float:
+        return next(iter(self._iterate_time_windows(self.start.timestamp()))).start.timestamp()
+
+    def _get_partition_index_for_timestamp(self, timestamp: float) -> int:
+        """Returns the index of the first partition that starts at or after the given timestamp.
+        Only valid for partitions definitions with a fixed interval.
+        """
+        interval = check.not_none(self._fixed_interval_seconds)
+        return math.ceil((timestamp - self._first_partition_start_timestamp) / interval)
+
+    def _get_time_window_for_partition_index(self, idx: int) -> TimeWindow:
+        interval = check.not_none(self._fixed_interval_seconds)
+        start_timestamp = self._first_partition_start_timestamp + idx * interval
+        tz = get_timezone(self.timezone)
+        return TimeWindow(
+            datetime.fromtimestamp(start_timestamp, tz=tz),
+            datetime.fromtimestamp(start_timestamp + interval, tz=tz),
+        )
+
+    def _get_partition_keys_for_indexes(self, start_idx: int, end_idx: int) -> List[str]:
+        """Formats the partition keys of the partitions between the given indexes, for a partitions
+        definition with a fixed interval. Start index is inclusive, end index is exclusive.
+        """
+        interval = check.not_none(self._fixed_interval_seconds)
+        first_partition_start_timestamp = self._first_partition_start_timestamp
+        tz = get_timezone(self.timezone)
+        fmt = self.fmt
+        # equivalent to calling dst_safe_strftime for each key, but only checks once whether
+        # ambiguous times may need a UTC offset appended
+        may_be_ambiguous = (
+            self.timezone.upper() != "UTC"
+            and "%z" not in fmt
+            and cron_string_repeats_every_hour(self.cron_schedule)
+        )
+        strftime_template = _get_strftime_template(fmt)
+
+        partition_keys = []
+        for idx in range(start_idx, end_idx):
+            dt = datetime.fromtimestamp(first_partition_start_timestamp + idx * interval, tz=tz)
+            if may_be_ambiguous and is_second_ambiguous_time(dt, self.timezone):
+                partition_keys.append(dt.strftime(dst_safe_fmt(fmt)))
+            elif strftime_template is not None and dt.year >= 1000:
+                template, get_template_args = strftime_template
+                partition_keys.append(template % get_template_args(dt))
+            else:
+                partition_keys.append(dt.strftime(fmt))
+        return partition_keys
+
+    def _get_num_partitions_for_fixed_interval(self, current_timestamp: float) -> int:
+        """Returns the number of partitions that get_partition_keys would return, for a partitions
+        definition with a fixed interval.
+        """
+        interval = check.not_none(self._fixed_interval_seconds)
+        first_partition_start_timestamp = self._first_partition_start_timestamp
+
+        # partitions that have ended by the current time, plus any partitions after them that are
+        # included due to a positive end offset
+        num_partitions = max(
+            math.floor((current_timestamp - first_partition_start_timestamp) / interval), 0
+        ) + max(self.end_offset, 0)
+        if self.end:
+            num_partitions = min(
+                num_partitions,
+                max(
+                    math.floor((self.end.timestamp() - first_partition_start_timestamp) / interval),
+                    0,
+                ),
+            )
+        if self.end_offset < 0:
+            num_partitions = max(num_partitions + self.end_offset, 0)
+        return num_partitions
+
     def get_num_partitions_in_window(self, time_window: TimeWindow) -> int:
         if self.is_basic_daily:
             return (
@@ -422,6 +556,12 @@ def get_partition_keys_between_indexes(
         # partition keys included within the indices.
         current_timestamp = self._get_current_timestamp(current_time=current_time)
 
+        if self._fixed_interval_seconds:
+            num_partitions = self._get_num_partitions_for_fixed_interval(current_timestamp)
+            return self._get_partition_keys_for_indexes(
+                max(start_idx, 0), max(min(end_idx, num_partitions), start_idx, 0)
+            )
+
         partitions_past_current_time = 0
         partition_keys = []
         reached_end = False
@@ -460,6 +600,11 @@ def get_partition_keys(
     ) -> Sequence[str]:
         current_timestamp = self._get_current_timestamp(current_time=current_time)
 
+        if self._fixed_interval_seconds:
+            return self._get_partition_keys_for_indexes(
+                0, self._get_num_partitions_for_fixed_interval(current_timestamp)
+            )
+
         partitions_past_current_time = 0
         partition_keys: List[str] = []
         for time_window in self._iterate_time_windows(self.start.timestamp()):
@@ -514,6 +659,10 @@ def __hash__(self):
     @functools.lru_cache(maxsize=100)
     def time_window_for_partition_key(self, partition_key: str) -> TimeWindow:
         partition_key_dt = dst_safe_strptime(partition_key, self.timezone, self.fmt)
+        if self._fixed_interval_seconds:
+            return self._get_time_window_for_partition_index(
+                self._get_partition_index_for_timestamp(partition_key_dt.timestamp())
+            )
         return next(iter(self._iterate_time_windows(partition_key_dt.timestamp())))
 
     @functools.lru_cache(maxsize=5)
@@ -525,6 +674,41 @@ def time_windows_for_partition_keys(
         if len(partition_keys) == 0:
             return []
 
+        if self._fixed_interval_seconds:
+            partition_key_time_windows = [
+                self._get_time_window_for_partition_index(idx)
+                for idx in sorted(
+                    self._get_partition_index_for_timestamp(
+                        dst_safe_strptime(partition_key, self.timezone, self.fmt).timestamp()
+                    )
+                    for partition_key in partition_keys
+                )
+            ]
+        else:
+            partition_key_time_windows = self._time_windows_for_sorted_partition_keys(
+                partition_keys
+            )
+
+        if validate:
+            start_time_window = self.get_first_partition_window()
+            end_time_window = self.get_last_partition_window()
+
+            if start_time_window is None or end_time_window is None:
+                check.failed("No partitions in the PartitionsDefinition")
+
+            start_timestamp = start_time_window.start.timestamp()
+            end_timestamp = end_time_window.end.timestamp()
+
+            partition_key_time_windows = [
+                tw
+                for tw in partition_key_time_windows
+                if tw.start.timestamp() >= start_timestamp and tw.end.timestamp() <= end_timestamp
+            ]
+        return partition_key_time_windows
+
+    def _time_windows_for_sorted_partition_keys(
+        self, partition_keys: FrozenSet[str]
+    ) -> List[TimeWindow]:
         sorted_pks = sorted(
             partition_keys,
             key=lambda pk: dst_safe_strptime(pk, self.timezone, self.fmt).timestamp(),
@@ -550,21 +734,6 @@ def time_windows_for_partition_keys(
                 )
                 partition_key_time_windows.append(next(cur_windows_iterator))
 
-        if validate:
-            start_time_window = self.get_first_partition_window()
-            end_time_window = self.get_last_partition_window()
-
-            if start_time_window is None or end_time_window is None:
-                check.failed("No partitions in the PartitionsDefinition")
-
-            start_timestamp = start_time_window.start.timestamp()
-            end_timestamp = end_time_window.end.timestamp()
-
-            partition_key_time_windows = [
-                tw
-                for tw in partition_key_time_windows
-                if tw.start.timestamp() >= start_timestamp and tw.end.timestamp() <= end_timestamp
-            ]
         return partition_key_time_windows
 
     def start_time_for_partition_key(self, partition_key: str) -> datetime:
@@ -714,6 +883,11 @@ def end_time_for_partition_key(self, partition_key: str) -> datetime:
 
     @functools.lru_cache(maxsize=5)
     def get_partition_keys_in_time_window(self, time_window: TimeWindow) -> Sequence[str]:
+        if self._fixed_interval_seconds:
+            start_idx = self._get_partition_index_for_timestamp(time_window.start.timestamp())
+            end_idx = self._get_partition_index_for_timestamp(time_window.end.timestamp())
+            return self._get_partition_keys_for_indexes(start_idx, max(end_idx, start_idx))
+
         result: List[str] = []
         time_window_end_timestamp = time_window.end.timestamp()
         for partition_time_window in self._iterate_time_windows(time_window.start.timestamp()):
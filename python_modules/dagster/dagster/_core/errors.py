@@ -17,12 +17,13 @@
 
 import sys
 from contextlib import contextmanager
-from typing import TYPE_CHECKING, Any, Callable, Iterator, Optional, Type
+from typing import TYPE_CHECKING, Any, Callable, Iterator, Optional, Sequence, Type
 
 import dagster._check as check
 from dagster._utils.interrupts import raise_interrupts_as
 
 if TYPE_CHECKING:
+    from dagster._core.events.log import EventLogEntry
     from dagster._core.log_manager import DagsterLogManager
 
 
@@ -604,6 +605,16 @@ def __init__(self, run_id):
         )
 
 
+class DagsterEventBatchPartiallyStoredError(DagsterError):
+    """Raised when storing a batch of events fails after some of its events were stored, so that
+    retrying does not store those events again.
+    """
+
+    def __init__(self, *args, unstored_events: Sequence["EventLogEntry"], **kwargs):
+        self.unstored_events = unstored_events
+        super(DagsterEventBatchPartiallyStoredError, self).__init__(*args, **kwargs)
+
+
 class ScheduleExecutionError(DagsterUserCodeExecutionError):
     """Errors raised in a user process during the execution of schedule."""
 
@@ -1,7 +1,19 @@
 import base64
 from datetime import datetime
 from enum import Enum
-from typing import Callable, Literal, Mapping, NamedTuple, Optional, Sequence, Tuple, Union
+from functools import cached_property
+from typing import (
+    Any,
+    Callable,
+    Iterator,
+    Literal,
+    Mapping,
+    NamedTuple,
+    Optional,
+    Sequence,
+    Tuple,
+    Union,
+)
 
 from typing_extensions import TypeAlias
 
@@ -10,7 +22,14 @@
 from dagster._core.definitions.events import AssetKey, AssetMaterialization, AssetObservation
 from dagster._core.events import EVENT_TYPE_TO_PIPELINE_RUN_STATUS, DagsterEventType
 from dagster._core.events.log import EventLogEntry
-from dagster._serdes import whitelist_for_serdes
+from dagster._serdes import deserialize_value, whitelist_for_serdes
+from dagster._serdes.errors import DeserializationError
+from dagster._serdes.serdes import (
+    NamedTupleSerializer,
+    deserialize_packed_value,
+    get_class_for_storage_name,
+    whitelist_subclass_for_serdes,
+)
 from dagster._seven import json
 
 EventHandlerFn: TypeAlias = Callable[[EventLogEntry, str], None]
@@ -90,7 +109,14 @@ class RunShardedEventsCursor(NamedTuple):
 EventCursor: TypeAlias = Union[int, RunShardedEventsCursor]
 
 
-@whitelist_for_serdes
+class EventLogRecordSerializer(NamedTupleSerializer["EventLogRecord"]):
+    def object_as_mapping(self, value: "EventLogRecord") -> Mapping[str, Any]:
+        # read the fields through the record rather than off the tuple, since LazyEventLogRecord
+        # holds the serialized entry in place of the deserialized one
+        return value._asdict()
+
+
+@whitelist_for_serdes(serializer=EventLogRecordSerializer)
 class EventLogRecord(NamedTuple):
     """Internal representation of an event record, as stored in a
     :py:class:`~dagster._core.storage.event_log.EventLogStorage`.
@@ -137,6 +163,10 @@ def asset_observation(self) -> Optional[AssetObservation]:
     def asset_event(self) -> Optional[Union[AssetMaterialization, AssetObservation]]:
         return self.asset_materialization or self.asset_observation
 
+    @property
+    def step_key(self) -> Optional[str]:
+        return self.event_log_entry.step_key
+
     @property
     def event_type(self) -> DagsterEventType:
         return check.not_none(
@@ -145,6 +175,113 @@ def event_type(self) -> DagsterEventType:
         ).event_type
 
 
+_EVENT_TYPES_BY_VALUE: Mapping[str, DagsterEventType] = {
+    event_type.value: event_type for event_type in DagsterEventType
+}
+
+
+@whitelist_subclass_for_serdes
+class LazyEventLogRecord(EventLogRecord):
+    """An event record whose EventLogEntry is only deserialized when it is first accessed.
+
+    The serialized entry is parsed into its JSON representation up front, which is cheap, and the
+    envelope fields (run id, timestamp, step key and event type) are read from it directly. The
+    EventLogEntry itself, along with its DagsterEvent, event specific data and metadata, is only
+    constructed from that JSON representation when `event_log_entry` (or a property derived from
+    it) is accessed, so the serialized entry is parsed only once.
+
+    Behaves like an EventLogRecord of the deserialized entry for equality, iteration, pickling and
+    serialization.
+    """
+
+    _envelope: Tuple[str, float, Optional[str], Optional[DagsterEventType]]
+    _packed: Mapping[str, Any]
+
+    def __new__(cls, storage_id: int, serialized_event_log_entry: str):
+        packed = json.loads(serialized_event_log_entry)
+        if not (
+            isinstance(packed, dict)
+            and get_class_for_storage_name(packed.get("__class__")) is EventLogEntry
+        ):
+            raise DeserializationError(
+                f"Serialized value for storage id {storage_id} is not an EventLogEntry"
+            )
+
+        # event type values that are not members of DagsterEventType were written by older
+        # versions and are migrated on deserialization, so those are resolved from the entry
+        dagster_event = packed.get("dagster_event")
+        event_type = (
+            _EVENT_TYPES_BY_VALUE.get(dagster_event.get("event_type_value"))
+            if isinstance(dagster_event, dict)
+            else None
+        )
+
+        record = super().__new__(cls, storage_id, serialized_event_log_entry)  # type: ignore
+        record.__dict__["_envelope"] = (
+            packed["run_id"],
+            packed["timestamp"],
+            packed.get("step_key"),
+            event_type,
+        )
+        record.__dict__["_packed"] = packed
+        return record
+
+    @cached_property
+    def event_log_entry(self) -> EventLogEntry:  # type: ignore  # (shadows the tuple field)
+        # the JSON representation is only needed until the entry is built
+        packed = self.__dict__.pop("_packed", None)
+        if packed is None:
+            # another thread took the JSON representation to build the entry concurrently
+            return deserialize_value(tuple.__getitem__(self, 1), EventLogEntry)
+
+        return deserialize_packed_value(packed, EventLogEntry)
+
+    @property
+    def run_id(self) -> str:
+        return self._envelope[0]
+
+    @property
+    def timestamp(self) -> float:
+        return self._envelope[1]
+
+    @property
+    def step_key(self) -> Optional[str]:
+        return self._envelope[2]
+
+    @property
+    def event_type(self) -> DagsterEventType:
+        return self._envelope[3] or super().event_type
+
+    def __iter__(self) -> Iterator[Any]:
+        yield self.storage_id
+        yield self.event_log_entry
+
+    def __getitem__(self, index):
+        return tuple(self)[index]
+
+    def __getnewargs__(self) -> Tuple[int, str]:
+        return (self.storage_id, tuple.__getitem__(self, 1))
+
+    def __eq__(self, other: object) -> bool:
+        if not isinstance(other, EventLogRecord):
+            return NotImplemented
+        return tuple(self) == tuple(other)
+
+    def __ne__(self, other: object) -> bool:
+        if not isinstance(other, EventLogRecord):
+            return NotImplemented
+        return tuple(self) != tuple(other)
+
+    def __hash__(self) -> int:
+        return hash(tuple(self))
+
+    def __repr__(self) -> str:
+        return f"LazyEventLogRecord(storage_id={self.storage_id!r}, event_log_entry={self.event_log_entry!r})"
+
+    def _replace(self, **kwargs: Any) -> EventLogRecord:
+        return EventLogRecord(*self)._replace(**kwargs)
+
+
 class EventRecordsResult(NamedTuple):
     """Return value for a query fetching event records from the instance.  Contains a list of event
     records, a cursor string, and a boolean indicating whether there are more records to fetch.
@@ -237,10 +237,15 @@ class DagsterEventType(str, Enum):
 
 PIPELINE_RUN_STATUS_TO_EVENT_TYPE = {v: k for k, v in EVENT_TYPE_TO_PIPELINE_RUN_STATUS.items()}
 
-# These are the only events currently supported in `EventLogStorage.store_event_batch`
-BATCH_WRITABLE_EVENTS = {
-    DagsterEventType.ASSET_MATERIALIZATION,
-    DagsterEventType.ASSET_OBSERVATION,
+# Events that flush the write-behind event buffer of a `DagsterInstance` for their run
+EVENT_LOG_BUFFER_BOUNDARY_EVENTS = {
+    DagsterEventType.STEP_START,
+    DagsterEventType.STEP_SUCCESS,
+    DagsterEventType.STEP_FAILURE,
+    DagsterEventType.STEP_SKIPPED,
+    DagsterEventType.STEP_UP_FOR_RETRY,
+    DagsterEventType.STEP_RESTARTED,
+    *PIPELINE_EVENTS,
 }
 
 ASSET_EVENTS = {
@@ -54,6 +54,7 @@
 from dagster._core.storage.dagster_run import (
     CANCELABLE_RUN_STATUSES,
     IN_PROGRESS_RUN_STATUSES,
+    DagsterRun,
     DagsterRunStatus,
     RunsFilter,
 )
@@ -756,6 +757,11 @@ def _submit_runs_and_update_backfill_in_chunks(
 
     chunk_size = get_asset_backfill_run_chunk_size()
 
+    # run requests submitted since the backfill data was last updated. They are added to the
+    # requested subset once per chunk rather than once per run, since every update rebuilds the
+    # requested subset
+    run_requests_submitted_in_chunk: List[RunRequest] = []
+
     for run_request_idx, run_request in enumerate(run_requests):
         run_id = reserved_run_ids[run_request_idx] if reserved_run_ids else None
         try:
@@ -780,6 +786,11 @@ def _submit_runs_and_update_backfill_in_chunks(
                 "Error while submitting run - updating the backfill data before re-raising"
             )
             # Write the runs that we submitted before hitting an error
+            updated_backfill_data = updated_backfill_data.with_run_requests_submitted(
+                run_requests_submitted_in_chunk,
+                asset_graph,
+                instance_queryer,
+            )
             _write_updated_backfill_data(
                 instance,
                 backfill_id,
@@ -792,18 +803,20 @@ def _submit_runs_and_update_backfill_in_chunks(
         yield None
 
         num_submitted += 1
-
-        updated_backfill_data: AssetBackfillData = (
-            updated_backfill_data.with_run_requests_submitted(
-                [run_request],
-                asset_graph,
-                instance_queryer,
-            )
-        )
+        run_requests_submitted_in_chunk.append(run_request)
 
         # After each chunk or on the final request, write the updated backfill data
         # and check to make sure we weren't interrupted
         if (num_submitted % chunk_size == 0) or num_submitted == len(run_requests):
+            updated_backfill_data: AssetBackfillData = (
+                updated_backfill_data.with_run_requests_submitted(
+                    run_requests_submitted_in_chunk,
+                    asset_graph,
+                    instance_queryer,
+                )
+            )
+            run_requests_submitted_in_chunk = []
+
             backfill = _write_updated_backfill_data(
                 instance,
                 backfill_id,
@@ -1217,7 +1230,14 @@ def get_canceling_asset_backfill_iteration_data(
         )
 
     failed_subset = AssetGraphSubset.from_asset_partition_set(
-        set(_get_failed_asset_partitions(instance_queryer, backfill_id, asset_graph)),
+        set(
+            _get_failed_asset_partitions(
+                instance_queryer,
+                backfill_id,
+                asset_graph,
+                known_failed_subset=asset_backfill_data.failed_and_downstream_subset,
+            )
+        ),
         asset_graph,
     )
     updated_backfill_data = AssetBackfillData(
@@ -1290,7 +1310,24 @@ def _get_failed_and_downstream_asset_partitions(
     instance_queryer: CachingInstanceQueryer,
     backfill_start_timestamp: float,
 ) -> AssetGraphSubset:
-    failed_and_downstream_subset = AssetGraphSubset.from_asset_partition_set(
+    # Failed asset partitions stay failed, and everything downstream of the failed asset partitions
+    # from previous iterations is already in the subset, so only search downstream of the asset
+    # partitions that failed since then
+    previous_failed_and_downstream_subset = asset_backfill_data.failed_and_downstream_subset
+    newly_failed_asset_partitions = [
+        asset_partition
+        for asset_partition in _get_failed_asset_partitions(
+            instance_queryer,
+            backfill_id,
+            asset_graph,
+            known_failed_subset=previous_failed_and_downstream_subset,
+        )
+        if asset_partition not in previous_failed_and_downstream_subset
+    ]
+    if not newly_failed_asset_partitions:
+        return previous_failed_and_downstream_subset
+
+    newly_failed_and_downstream_subset = AssetGraphSubset.from_asset_partition_set(
         asset_graph.bfs_filter_asset_partitions(
             instance_queryer,
             lambda asset_partitions, _: (
@@ -1300,12 +1337,12 @@ def _get_failed_and_downstream_asset_partitions(
                 ),
                 "",
             ),
-            _get_failed_asset_partitions(instance_queryer, backfill_id, asset_graph),
+            newly_failed_asset_partitions,
             evaluation_time=datetime_from_timestamp(backfill_start_timestamp),
         )[0],
         asset_graph,
     )
-    return failed_and_downstream_subset
+    return previous_failed_and_downstream_subset | newly_failed_and_downstream_subset
 
 
 def _get_next_latest_storage_id(instance_queryer: CachingInstanceQueryer) -> int:
@@ -1369,6 +1406,10 @@ def execute_asset_backfill_iteration_inner(
 
     This is a generator so that we can return control to the daemon and let it heartbeat during
     expensive operations.
+
+    After the roots have been requested, the only candidates for the BFS are the target partitions
+    whose parents were updated since `latest_storage_id`; there is no separately persisted frontier.
+    The whole `AssetBackfillData` is still serialized and stored on each iteration.
     """
     initial_candidates: Set[AssetKeyPartitionKey] = set()
     request_roots = not asset_backfill_data.requested_runs_for_target_roots
@@ -1708,16 +1749,58 @@ def should_backfill_atomic_asset_partitions_unit(
     return True, ""
 
 
+def _get_run_partition_range(run: DagsterRun) -> Optional[PartitionKeyRange]:
+    if (
+        run.tags.get(ASSET_PARTITION_RANGE_START_TAG)
+        and run.tags.get(ASSET_PARTITION_RANGE_END_TAG)
+        and run.tags.get(PARTITION_NAME_TAG) is None
+    ):
+        return PartitionKeyRange(
+            start=run.tags[ASSET_PARTITION_RANGE_START_TAG],
+            end=run.tags[ASSET_PARTITION_RANGE_END_TAG],
+        )
+    return None
+
+
+def _run_asset_partitions_in_subset(
+    run: DagsterRun,
+    subset: AssetGraphSubset,
+    asset_graph: RemoteAssetGraph,
+    instance_queryer: CachingInstanceQueryer,
+) -> bool:
+    """Returns whether every asset partition targeted by the run is in the given subset."""
+    if not run.asset_selection:
+        return False
+
+    partition_range = _get_run_partition_range(run)
+    for asset_key in run.asset_selection:
+        if partition_range:
+            asset_partitions = asset_graph.get_partitions_in_range(
+                asset_key, partition_range, instance_queryer
+            )
+        else:
+            asset_partitions = [AssetKeyPartitionKey(asset_key, run.tags.get(PARTITION_NAME_TAG))]
+        if any(asset_partition not in subset for asset_partition in asset_partitions):
+            return False
+
+    return True
+
+
 def _get_failed_asset_partitions(
     instance_queryer: CachingInstanceQueryer,
     backfill_id: str,
     asset_graph: RemoteAssetGraph,
+    known_failed_subset: Optional[AssetGraphSubset] = None,
 ) -> Sequence[AssetKeyPartitionKey]:
     """Returns asset partitions that materializations were requested for as part of the backfill, but
     will not be materialized.
 
     Includes canceled asset partitions. Implementation assumes that successful runs won't have any
     failed partitions.
+
+    Runs that only target asset partitions in known_failed_subset are skipped without fetching
+    their planned and completed materializations, so the asset partitions they failed to
+    materialize may be omitted from the result.
     """
     runs = instance_queryer.instance.get_runs(
         filters=RunsFilter(
@@ -1729,6 +1812,11 @@ def _get_failed_asset_partitions(
     result: List[AssetKeyPartitionKey] = []
 
     for run in runs:
+        if known_failed_subset is not None and _run_asset_partitions_in_subset(
+            run, known_failed_subset, asset_graph, instance_queryer
+        ):
+            continue
+
         planned_asset_keys = instance_queryer.get_planned_materializations_for_run(
             run_id=run.run_id
         )
@@ -1737,16 +1825,9 @@ def _get_failed_asset_partitions(
         )
         failed_asset_keys = planned_asset_keys - completed_asset_keys
 
-        if (
-            run.tags.get(ASSET_PARTITION_RANGE_START_TAG)
-            and run.tags.get(ASSET_PARTITION_RANGE_END_TAG)
-            and run.tags.get(PARTITION_NAME_TAG) is None
-        ):
+        partition_range = _get_run_partition_range(run)
+        if partition_range:
             # reconstruct the partition keys from a chunked backfill run
-            partition_range = PartitionKeyRange(
-                start=run.tags[ASSET_PARTITION_RANGE_START_TAG],
-                end=run.tags[ASSET_PARTITION_RANGE_END_TAG],
-            )
             for asset_key in failed_asset_keys:
                 result.extend(
                     asset_graph.get_partitions_in_range(
@@ -1,4 +1,5 @@
 import time
+from collections import defaultdict
 from types import TracebackType
 from typing import (
     Any,
@@ -86,7 +87,17 @@ def __init__(
         self._step_outputs: Set[StepOutputHandle] = set(self._plan.known_state.ready_outputs)
 
         # All steps to be executed start out here in _pending
-        self._pending: Dict[str, Set[str]] = dict(self._plan.get_executable_step_deps())
+        self._pending: Dict[str, Set[str]] = {}
+        # pending steps are tracked by the number of their deps that have yet to reach a terminal
+        # state, so that resolving a step only has to visit its direct dependents
+        self._pending_dep_counts: Dict[str, int] = {}
+        self._pending_dependents: Dict[str, Set[str]] = defaultdict(set)
+        # pending steps with all deps resolved, evaluated in the order they were added to _pending
+        self._pending_order: Dict[str, int] = {}
+        self._pending_ready: Set[str] = set()
+        self._pending_counter: int = 0
+        # deps of every step that has been added to _pending, used to requeue retried steps
+        self._step_deps: Dict[str, Set[str]] = {}
 
         # track mapping keys from DynamicOutputs, step_key, output_name -> list of keys
         # to _gathering while in flight
@@ -116,12 +127,17 @@ def __init__(
         self._failed: Set[str] = set()
         self._skipped: Set[str] = set()
         self._abandoned: Set[str] = set()
+        # union of the terminal state sets above
+        self._resolved: Set[str] = set()
 
         # see verify_complete
         self._unknown_state: Set[str] = set()
 
         self._interrupted: bool = False
 
+        for step_key, deps in self._plan.get_executable_step_deps().items():
+            self._add_pending(step_key, deps)
+
         # Start the show by loading _executable with the set of _pending steps that have no deps
         self._update()
 
@@ -197,16 +213,39 @@ def _pending_state_str(self) -> str:
             ),
         )
 
-    def _should_skip_step(self, step_key: str, successful_or_skipped_steps: Set[str]) -> bool:
+    def _add_pending(self, step_key: str, deps: Set[str]) -> None:
+        self._pending[step_key] = deps
+        self._step_deps[step_key] = deps
+        self._pending_counter += 1
+        self._pending_order[step_key] = self._pending_counter
+
+        unresolved_deps = deps - self._resolved
+        for dep in unresolved_deps:
+            self._pending_dependents[dep].add(step_key)
+        self._pending_dep_counts[step_key] = len(unresolved_deps)
+        if not unresolved_deps:
+            self._pending_ready.add(step_key)
+
+    def _mark_resolved(self, step_key: str) -> None:
+        if step_key in self._resolved:
+            return
+        self._resolved.add(step_key)
+
+        for dependent_key in self._pending_dependents.pop(step_key, ()):
+            self._pending_dep_counts[dependent_key] -= 1
+            if self._pending_dep_counts[dependent_key] == 0:
+                self._pending_ready.add(dependent_key)
+
+    def _should_skip_step(self, step_key: str) -> bool:
         step = self.get_step_by_key(step_key)
         for step_input in step.step_inputs:
             missing_source_handles = []
 
             for source_handle in step_input.get_step_output_handle_dependencies():
                 if (
-                    source_handle.step_key in successful_or_skipped_steps
-                    and source_handle not in self._step_outputs
-                ):
+                    source_handle.step_key in self._success
+                    or source_handle.step_key in self._skipped
+                ) and source_handle not in self._step_outputs:
                     missing_source_handles.append(source_handle)
 
             if missing_source_handles:
@@ -222,42 +261,31 @@ def _should_skip_step(self, step_key: str, successful_or_skipped_steps: Set[str]
     def _update(self) -> None:
         """Moves steps from _pending to _executable / _pending_skip / _pending_retry
         as a function of what has been _completed.
-        """
-        new_steps_to_execute: List[str] = []
-        new_steps_to_skip: List[str] = []
-        new_steps_to_abandon: List[str] = []
-
-        successful_or_skipped_steps = self._success | self._skipped
-        failed_or_abandoned_steps = self._failed | self._abandoned
-        resolved_steps = self._success | self._skipped | self._failed | self._abandoned
 
+        Only the pending steps whose deps have all been resolved since the last call are visited.
+        """
         if self._new_dynamic_mappings:
             new_step_deps = self._plan.resolve(self._completed_dynamic_outputs)
             for step_key, deps in new_step_deps.items():
-                self._pending[step_key] = deps
+                self._add_pending(step_key, deps)
 
             self._new_dynamic_mappings = False
 
-        for step_key, depends_on_steps in self._pending.items():
-            if depends_on_steps.issubset(resolved_steps):
-                if self._should_skip_step(step_key, successful_or_skipped_steps):
-                    new_steps_to_skip.append(step_key)
-                elif depends_on_steps.intersection(failed_or_abandoned_steps):
-                    new_steps_to_abandon.append(step_key)
-                else:
-                    new_steps_to_execute.append(step_key)
-
-        for key in new_steps_to_execute:
-            self._executable.append(key)
-            del self._pending[key]
+        if self._pending_ready:
+            ready_step_keys = sorted(self._pending_ready, key=self._pending_order.__getitem__)
+            self._pending_ready.clear()
 
-        for key in new_steps_to_skip:
-            self._pending_skip.append(key)
-            del self._pending[key]
+            for step_key in ready_step_keys:
+                depends_on_steps = self._pending.pop(step_key)
+                del self._pending_order[step_key]
+                del self._pending_dep_counts[step_key]
 
-        for key in new_steps_to_abandon:
-            self._pending_abandon.append(key)
-            del self._pending[key]
+                if self._should_skip_step(step_key):
+                    self._pending_skip.append(step_key)
+                elif any(dep in self._failed or dep in self._abandoned for dep in depends_on_steps):
+                    self._pending_abandon.append(step_key)
+                else:
+                    self._executable.append(step_key)
 
         ready_to_retry = []
         tick_time = time.time()
@@ -445,20 +473,24 @@ def plan_events_iterator(
 
     def mark_failed(self, step_key: str) -> None:
         self._failed.add(step_key)
+        self._mark_resolved(step_key)
         self._mark_complete(step_key)
 
     def mark_success(self, step_key: str) -> None:
         self._success.add(step_key)
+        self._mark_resolved(step_key)
         self._mark_complete(step_key)
         self._resolve_any_dynamic_outputs(step_key)
 
     def mark_skipped(self, step_key: str) -> None:
         self._skipped.add(step_key)
+        self._mark_resolved(step_key)
         self._mark_complete(step_key)
         self._resolve_any_dynamic_outputs(step_key)
 
     def mark_abandoned(self, step_key: str) -> None:
         self._abandoned.add(step_key)
+        self._mark_resolved(step_key)
         self._mark_complete(step_key)
 
     def mark_interrupted(self) -> None:
@@ -479,11 +511,12 @@ def mark_up_for_retry(self, step_key: str, at_time: Optional[float] = None) -> N
             if at_time:
                 self._waiting_to_retry[step_key] = at_time
             else:
-                self._pending[step_key] = self._plan.get_executable_step_deps()[step_key]
+                self._add_pending(step_key, self._step_deps[step_key])
 
         elif self._retry_mode.deferred:
             # do not attempt to execute again
             self._abandoned.add(step_key)
+            self._mark_resolved(step_key)
 
         self._retry_state.mark_attempt(step_key)
 
@@ -5,9 +5,10 @@
 import sys
 from abc import ABC, abstractmethod
 from multiprocessing import Queue
+from multiprocessing.connection import Connection
 from multiprocessing.context import BaseContext as MultiprocessingBaseContext
 from multiprocessing.process import BaseProcess
-from typing import TYPE_CHECKING, Iterator, NamedTuple, Optional, Union
+from typing import TYPE_CHECKING, Any, Iterator, List, NamedTuple, Optional, Union
 
 from typing_extensions import Literal
 
@@ -56,6 +57,15 @@ def execute(self) -> Iterator[Union[ChildProcessEvent, "DagsterEvent"]]:
         Yields a sequence of events to be handled by _execute_command_in_child_process.
         """
 
+    def execute_in_worker(
+        self, term_event: Any
+    ) -> Iterator[Union[ChildProcessEvent, "DagsterEvent"]]:
+        """This method is invoked instead of execute when the command is run by a
+        ChildProcessWorker. The worker's term_event is set by the parent process when the command
+        should be interrupted.
+        """
+        return self.execute()
+
 
 class ChildProcessCrashException(Exception):
     """Thrown when the child process crashes."""
@@ -93,6 +103,42 @@ def _execute_command_in_child_process(event_queue: Queue, command: ChildProcessC
             )
 
 
+def _execute_commands_in_worker_process(
+    command_conn: Connection, event_queue: Queue, term_event: Any
+) -> None:
+    """Executes the ChildProcessCommands received over a pipe one at a time, until the parent
+    process sends None or closes the pipe.
+
+    Handles errors and communicates across a queue with the parent process.
+    """
+    with capture_interrupts():
+        pid = os.getpid()
+        while True:
+            try:
+                command = command_conn.recv()
+            except EOFError:
+                break
+            if command is None:
+                break
+
+            event_queue.put(ChildProcessStartEvent(pid=pid))
+            try:
+                for step_event in command.execute_in_worker(term_event):
+                    event_queue.put(step_event)
+                event_queue.put(ChildProcessDoneEvent(pid=pid))
+
+            except (
+                Exception,
+                KeyboardInterrupt,
+                DagsterExecutionInterruptedError,
+            ):
+                event_queue.put(
+                    ChildProcessSystemErrorEvent(
+                        pid=pid, error_info=serializable_error_info_from_exc_info(sys.exc_info())
+                    )
+                )
+
+
 TICK = 20.0 * 1.0 / 1000.0
 """The minimum interval at which to check for child process liveness -- default 20ms."""
 
@@ -175,3 +221,121 @@ def execute_child_process_command(
         process.join()
     finally:
         event_queue.close()
+
+
+WORKER_SHUTDOWN_TIMEOUT = 5.0
+"""The number of seconds to wait for an idle worker process to exit before terminating it."""
+
+
+class ChildProcessWorker:
+    """A long-lived child process that executes ChildProcessCommands one at a time.
+
+    Commands are sent to the worker over a pipe, and events are received over a queue in the same
+    way as for execute_child_process_command. State that is cached in the worker process, such as
+    loaded code, is reused by every command that it executes.
+    """
+
+    def __init__(self, multiprocessing_ctx: MultiprocessingBaseContext):
+        self._event_queue = multiprocessing_ctx.Queue()
+        self._command_conn, child_command_conn = multiprocessing_ctx.Pipe()  # type: ignore
+        # synchronization primitives can only be shared with child processes through inheritance,
+        # so each worker has a single term_event that is reset before each command
+        self.term_event = multiprocessing_ctx.Event()
+        self.process: BaseProcess = multiprocessing_ctx.Process(  # type: ignore
+            target=_execute_commands_in_worker_process,
+            args=(child_command_conn, self._event_queue, self.term_event),
+        )
+        self.process.start()
+        child_command_conn.close()
+
+    @property
+    def pid(self) -> Optional[int]:
+        return self.process.pid
+
+    def is_alive(self) -> bool:
+        return self.process.is_alive()
+
+    def execute_command(
+        self, command: ChildProcessCommand
+    ) -> Iterator[Optional[Union["DagsterEvent", ChildProcessEvent, BaseProcess]]]:
+        """Execute a ChildProcessCommand in the worker process, yielding the same objects as
+        execute_child_process_command. Must not be called again until the previous command's
+        iterator is exhausted.
+        """
+        check.inst_param(command, "command", ChildProcessCommand)
+
+        self.term_event.clear()
+        self._command_conn.send(command)
+        yield self.process
+
+        completed_properly = False
+
+        while not completed_properly:
+            event = _poll_for_event(self.process, self._event_queue)
+
+            if event == PROCESS_DEAD_AND_QUEUE_EMPTY:
+                break
+
+            yield event
+
+            if isinstance(event, (ChildProcessDoneEvent, ChildProcessSystemErrorEvent)):
+                completed_properly = True
+
+        if not completed_properly:
+            raise ChildProcessCrashException(pid=self.process.pid, exit_code=self.process.exitcode)
+
+    def shutdown(self) -> None:
+        if self.process.is_alive():
+            try:
+                self._command_conn.send(None)
+            except (BrokenPipeError, OSError):
+                pass
+            self.process.join(WORKER_SHUTDOWN_TIMEOUT)
+            if self.process.is_alive():
+                self.process.terminate()
+                self.process.join()
+        self._command_conn.close()
+        self._event_queue.close()
+
+
+class ChildProcessWorkerPool:
+    """A pool of up to max_workers ChildProcessWorkers, which are started as they are needed and
+    kept alive until the pool is shut down.
+    """
+
+    def __init__(self, multiprocessing_ctx: MultiprocessingBaseContext, max_workers: int):
+        self._multiprocessing_ctx = multiprocessing_ctx
+        self._max_workers = check.int_param(max_workers, "max_workers")
+        self._workers: List[ChildProcessWorker] = []
+        self._idle_workers: List[ChildProcessWorker] = []
+
+    def acquire(self) -> ChildProcessWorker:
+        while self._idle_workers:
+            worker = self._idle_workers.pop()
+            if worker.is_alive():
+                return worker
+            self._discard(worker)
+
+        check.invariant(
+            len(self._workers) < self._max_workers,
+            f"All {self._max_workers} worker processes are in use",
+        )
+        worker = ChildProcessWorker(self._multiprocessing_ctx)
+        self._workers.append(worker)
+        return worker
+
+    def release(self, worker: ChildProcessWorker) -> None:
+        if worker.is_alive():
+            self._idle_workers.append(worker)
+        else:
+            self._discard(worker)
+
+    def _discard(self, worker: ChildProcessWorker) -> None:
+        self._workers.remove(worker)
+        worker.shutdown()
+
+    def shutdown(self) -> None:
+        for worker in self._workers:
+            worker.shutdown()
+        self._workers = []
+        self._idle_workers = []
@@ -2,6 +2,7 @@
 import os
 import sys
 import threading
+from collections import defaultdict
 from contextlib import ExitStack
 from multiprocessing.context import BaseContext as MultiprocessingBaseContext
 from multiprocessing.process import BaseProcess
@@ -32,6 +33,8 @@
     ChildProcessCrashException,
     ChildProcessEvent,
     ChildProcessSystemErrorEvent,
+    ChildProcessWorker,
+    ChildProcessWorkerPool,
     execute_child_process_command,
 )
 from dagster._core.instance import DagsterInstance
@@ -53,7 +56,7 @@ def __init__(
         dagster_run: "DagsterRun",
         step_key: str,
         instance_ref: "InstanceRef",
-        term_event: Any,
+        term_event: Optional[Any],
         recon_pipeline: ReconstructableJob,
         retry_mode: RetryMode,
         known_state: Optional[KnownExecutionState],
@@ -70,10 +73,16 @@ def __init__(
         self.repository_load_data = repository_load_data
 
     def execute(self) -> Iterator[DagsterEvent]:
+        return self._execute(check.not_none(self.term_event))
+
+    def execute_in_worker(self, term_event: Any) -> Iterator[DagsterEvent]:
+        return self._execute(term_event)
+
+    def _execute(self, term_event: Any) -> Iterator[DagsterEvent]:
         recon_job = self.recon_pipeline
         with DagsterInstance.from_ref(self.instance_ref) as instance:
             done_event = threading.Event()
-            start_termination_thread(self.term_event, done_event)
+            start_termination_thread(term_event, done_event)
             try:
                 log_manager = create_context_free_log_manager(instance, self.dagster_run)
 
@@ -104,7 +113,7 @@ def execute(self) -> Iterator[DagsterEvent]:
             finally:
                 # set events to stop the termination thread on exit
                 done_event.set()  # waiting on term_event so set done first
-                self.term_event.set()
+                term_event.set()
 
 
 class MultiprocessExecutor(Executor):
@@ -115,6 +124,7 @@ def __init__(
         tag_concurrency_limits: Optional[List[Dict[str, Any]]] = None,
         start_method: Optional[str] = None,
         explicit_forkserver_preload: Optional[Sequence[str]] = None,
+        worker_pool: bool = False,
     ):
         self._retries = check.inst_param(retries, "retries", RetryMode)
         if not max_concurrent:
@@ -140,6 +150,7 @@ def __init__(
             )
         self._start_method = start_method
         self._explicit_forkserver_preload = explicit_forkserver_preload
+        self._worker_pool = check.bool_param(worker_pool, "worker_pool")
 
     @property
     def retries(self) -> RetryMode:
@@ -202,8 +213,14 @@ def execute(
                     instance_concurrency_context=instance_concurrency_context,
                 )
             )
+            worker_pool: Optional[ChildProcessWorkerPool] = None
+            if self._worker_pool:
+                worker_pool = ChildProcessWorkerPool(multiproc_ctx, max_workers=limit)
+                stack.callback(worker_pool.shutdown)
+
             active_iters: Dict[str, Iterator[Optional[DagsterEvent]]] = {}
-            errors: Dict[int, SerializableErrorInfo] = {}
+            # a worker of the worker pool executes many steps, so keep every error of each process
+            errors: Dict[int, List[SerializableErrorInfo]] = defaultdict(list)
             processes: Dict[str, BaseProcess] = {}
             term_events: Dict[str, Any] = {}
             stopping: bool = False
@@ -237,19 +254,35 @@ def execute(
 
                         for step in steps:
                             step_context = plan_context.for_step(step)
-                            term_events[step.key] = multiproc_ctx.Event()
-                            active_iters[step.key] = execute_step_out_of_process(
-                                multiproc_ctx,
-                                job,
-                                step_context,
-                                step,
-                                errors,
-                                processes,
-                                term_events,
-                                self.retries,
-                                active_execution.get_known_state(),
-                                execution_plan.repository_load_data,
-                            )
+                            if worker_pool:
+                                worker = worker_pool.acquire()
+                                term_events[step.key] = worker.term_event
+                                active_iters[step.key] = execute_step_in_worker(
+                                    worker_pool,
+                                    worker,
+                                    job,
+                                    step_context,
+                                    step,
+                                    errors,
+                                    processes,
+                                    self.retries,
+                                    active_execution.get_known_state(),
+                                    execution_plan.repository_load_data,
+                                )
+                            else:
+                                term_events[step.key] = multiproc_ctx.Event()
+                                active_iters[step.key] = execute_step_out_of_process(
+                                    multiproc_ctx,
+                                    job,
+                                    step_context,
+                                    step,
+                                    errors,
+                                    processes,
+                                    term_events,
+                                    self.retries,
+                                    active_execution.get_known_state(),
+                                    execution_plan.repository_load_data,
+                                )
 
                     # process active iterators
                     empty_iters = []
@@ -284,7 +317,7 @@ def execute(
                             active_execution.handle_event(failure_or_retry_event)
                             yield failure_or_retry_event
                             empty_iters.append(key)
-                            errors[crash.pid] = serializable_error
+                            errors[crash.pid].append(serializable_error)
                         except StopIteration:
                             empty_iters.append(key)
 
@@ -321,7 +354,7 @@ def execute(
 
                 raise
 
-            errs = {pid: err for pid, err in errors.items() if err}
+            errs = [(pid, err) for pid, pid_errors in errors.items() for err in pid_errors if err]
 
             # After termination starts, raise an interrupted exception once all subprocesses
             # have finished cleaning up (and the only errors were from being interrupted)
@@ -332,7 +365,7 @@ def execute(
                     [
                         err_info.cls_name
                         in {"DagsterExecutionInterruptedError", "KeyboardInterrupt"}
-                        for err_info in errs.values()
+                        for _, err_info in errs
                     ]
                 )
             ):
@@ -347,10 +380,10 @@ def execute(
                     "During multiprocess execution errors occurred in child"
                     " processes:\n{error_list}".format(
                         error_list="\n".join(
-                            [f"In process {pid}: {err.to_string()}" for pid, err in errs.items()]
+                            [f"In process {pid}: {err.to_string()}" for pid, err in errs]
                         )
                     ),
-                    subprocess_error_infos=list(errs.values()),
+                    subprocess_error_infos=[err for _, err in errs],
                 )
 
         if timer_result:
@@ -366,7 +399,7 @@ def execute_step_out_of_process(
     recon_job: ReconstructableJob,
     step_context: IStepContext,
     step: ExecutionStep,
-    errors: Dict[int, SerializableErrorInfo],
+    errors: Dict[int, List[SerializableErrorInfo]],
     processes: Dict[str, BaseProcess],
     term_events: Dict[str, Any],
     retries: RetryMode,
@@ -396,8 +429,54 @@ def execute_step_out_of_process(
             yield ret
         elif isinstance(ret, ChildProcessEvent):
             if isinstance(ret, ChildProcessSystemErrorEvent):
-                errors[ret.pid] = ret.error_info
+                errors[ret.pid].append(ret.error_info)
         elif isinstance(ret, BaseProcess):
             processes[step.key] = ret
         else:
             check.failed(f"Unexpected return value from child process {type(ret)}")
+
+
+def execute_step_in_worker(
+    worker_pool: ChildProcessWorkerPool,
+    worker: ChildProcessWorker,
+    recon_job: ReconstructableJob,
+    step_context: IStepContext,
+    step: ExecutionStep,
+    errors: Dict[int, List[SerializableErrorInfo]],
+    processes: Dict[str, BaseProcess],
+    retries: RetryMode,
+    known_state: KnownExecutionState,
+    repository_load_data: Optional[RepositoryLoadData],
+) -> Iterator[Optional[DagsterEvent]]:
+    command = MultiprocessExecutorChildProcessCommand(
+        run_config=step_context.run_config,
+        dagster_run=step_context.dagster_run,
+        step_key=step.key,
+        instance_ref=step_context.instance.get_ref(),
+        # the worker provides its own term_event, which is set by the parent process
+        term_event=None,
+        recon_pipeline=recon_job,
+        retry_mode=retries,
+        known_state=known_state,
+        repository_load_data=repository_load_data,
+    )
+
+    try:
+        yield DagsterEvent.step_worker_starting(
+            step_context,
+            f'Dispatching "{step.key}" to worker process (pid: {worker.pid}).',
+            metadata={},
+        )
+
+        for ret in worker.execute_command(command):
+            if ret is None or isinstance(ret, DagsterEvent):
+                yield ret
+            elif isinstance(ret, ChildProcessEvent):
+                if isinstance(ret, ChildProcessSystemErrorEvent):
+                    errors[ret.pid].append(ret.error_info)
+            elif isinstance(ret, BaseProcess):
+                processes[step.key] = ret
+            else:
+                check.failed(f"Unexpected return value from child process {type(ret)}")
+    finally:
+        worker_pool.release(worker)
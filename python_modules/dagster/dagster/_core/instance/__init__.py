@@ -1,7 +1,10 @@
+import atexit
 import logging
 import logging.config
 import os
 import sys
+import threading
+import time
 import warnings
 import weakref
 from abc import abstractmethod
@@ -41,6 +44,7 @@
 from dagster._core.definitions.events import AssetKey, AssetObservation
 from dagster._core.definitions.partition_key_range import PartitionKeyRange
 from dagster._core.errors import (
+    DagsterEventBatchPartiallyStoredError,
     DagsterHomeNotSetError,
     DagsterInvalidInvocationError,
     DagsterInvariantViolationError,
@@ -49,6 +53,8 @@
 )
 from dagster._core.instance.config import (
     DAGSTER_CONFIG_YAML_FILENAME,
+    DEFAULT_EVENT_LOG_BUFFER_MAX_EVENTS,
+    DEFAULT_EVENT_LOG_BUFFER_MAX_SECONDS,
     DEFAULT_LOCAL_CODE_SERVER_STARTUP_TIMEOUT,
     get_default_tick_retention_settings,
     get_tick_retention_settings,
@@ -200,6 +206,36 @@ def _is_batch_writing_enabled() -> bool:
     return _get_event_batch_size() > 0
 
 
+def _is_event_log_buffer_boundary(event: "EventLogEntry") -> bool:
+    """Events that always flush the write-behind buffer for their run, so that the stored state of
+    a step or run is never behind its in-process state.
+    """
+    from dagster._core.events import EVENT_LOG_BUFFER_BOUNDARY_EVENTS
+
+    if not event.run_id:
+        return True
+    return (
+        event.is_dagster_event
+        and event.get_dagster_event().event_type in EVENT_LOG_BUFFER_BOUNDARY_EVENTS
+    )
+
+
+def _flush_expired_event_log_buffers(
+    instance_ref: "weakref.ReferenceType[DagsterInstance]", shutdown_event: threading.Event
+) -> None:
+    """Target of the thread that writes buffered events once they have been buffered for
+    `max_seconds`, even if no further events arrive for their run. Only holds a weak reference to
+    the instance, so that the thread does not keep an instance that is never disposed alive.
+    """
+    timeout = 0.0
+    while not shutdown_event.wait(timeout):
+        instance = instance_ref()
+        if instance is None:
+            return
+        timeout = instance._flush_expired_write_behind_buffers()  # noqa: SLF001
+        del instance
+
+
 def _check_run_equality(
     pipeline_run: DagsterRun, candidate_run: DagsterRun
 ) -> Mapping[str, Tuple[Any, Any]]:
@@ -496,6 +532,14 @@ def __init__(
         # Used for batched event handling
         self._event_buffer: Dict[str, List[EventLogEntry]] = defaultdict(list)
 
+        # Used for write-behind event handling, keyed by run id. See `event_log_buffer` settings.
+        self._write_behind_buffer: Dict[str, List[EventLogEntry]] = defaultdict(list)
+        self._write_behind_buffer_start_times: Dict[str, float] = {}
+        self._write_behind_lock = threading.RLock()
+        self._write_behind_flusher_shutdown_event: Optional[threading.Event] = None
+        self._write_behind_flusher_thread: Optional[threading.Thread] = None
+        self._write_behind_atexit_flush: Optional[Callable[[], None]] = None
+
     # ctors
 
     @public
@@ -958,10 +1002,42 @@ def auto_materialize_max_tick_retries(self) -> int:
     def auto_materialize_use_sensors(self) -> int:
         return self.get_settings("auto_materialize").get("use_sensors", True)
 
+    @property
+    def auto_materialize_incremental_evaluation(self) -> bool:
+        return self.get_settings("auto_materialize").get("incremental_evaluation", False)
+
+    @property
+    def auto_materialize_num_evaluation_processes(self) -> int:
+        return self.get_settings("auto_materialize").get("num_evaluation_processes", 1)
+
     @property
     def global_op_concurrency_default_limit(self) -> Optional[int]:
         return self.get_settings("concurrency").get("default_op_concurrency_limit")
 
+    # event log buffering
+
+    @property
+    def event_log_buffer_enabled(self) -> bool:
+        return self.get_settings("event_log_buffer").get("enabled", False)
+
+    @property
+    def event_log_buffer_max_events(self) -> int:
+        return self.get_settings("event_log_buffer").get(
+            "max_events", DEFAULT_EVENT_LOG_BUFFER_MAX_EVENTS
+        )
+
+    @property
+    def event_log_buffer_max_seconds(self) -> float:
+        return self.get_settings("event_log_buffer").get(
+            "max_seconds", DEFAULT_EVENT_LOG_BUFFER_MAX_SECONDS
+        )
+
+    # asset status cache
+
+    @property
+    def asset_status_cache_update_on_write(self) -> bool:
+        return self.get_settings("asset_status_cache").get("update_on_write", False)
+
     # python logs
 
     @property
@@ -1015,6 +1091,8 @@ def reindex(self, print_fn: PrintFn = lambda _: None) -> None:
         print_fn("Done.")
 
     def dispose(self) -> None:
+        self._stop_write_behind_flusher()
+        self.flush_event_log_buffer()
         self._local_artifact_storage.dispose()
         self._run_storage.dispose()
         if self._run_coordinator:
@@ -1120,6 +1198,12 @@ def get_run_tags(
             tag_keys=tag_keys, value_prefix=value_prefix, limit=limit
         )
 
+    @traced
+    def get_run_tag_counts(
+        self, tag_keys: Sequence[str], filters: Optional[RunsFilter] = None
+    ) -> Mapping[Tuple[str, str], int]:
+        return self._run_storage.get_run_tag_counts(tag_keys=tag_keys, filters=filters)
+
     @traced
     def get_run_tag_keys(self) -> Sequence[str]:
         return self._run_storage.get_run_tag_keys()
@@ -2418,10 +2502,21 @@ def handle_new_event(
         to the storage layer in a single batch. If an error occurrs during batch writing, then we
         fall back to iterative individual event writes.
 
+        If the `event_log_buffer` instance setting is enabled, then all events are instead kept in
+        a per-run write-behind buffer, regardless of `batch_metadata`. The buffer for a run is
+        written in a single batch once it holds `max_events` events, once its oldest event has been
+        buffered for `max_seconds`, or when a step or run lifecycle event is received. Subscribers
+        are notified after the events are written, in the order they were received.
+
         Args:
             event (EventLogEntry): The event to handle.
             batch_metadata (Optional[DagsterEventBatchMetadata]): Metadata for batch writing.
         """
+        if self.event_log_buffer_enabled:
+            with self._write_behind_lock:
+                self._write_behind_buffer_event(event)
+            return
+
         if batch_metadata is None or not _is_batch_writing_enabled():
             events = [event]
         else:
@@ -2433,12 +2528,121 @@ def handle_new_event(
             else:
                 return
 
+        self._store_and_notify_events(events)
+
+    def _write_behind_buffer_event(self, event: "EventLogEntry") -> None:
+        run_id = event.run_id
+        if run_id not in self._write_behind_buffer_start_times:
+            self._write_behind_buffer_start_times[run_id] = time.monotonic()
+            self._start_write_behind_flusher()
+        self._write_behind_buffer[run_id].append(event)
+
+        if len(
+            self._write_behind_buffer[run_id]
+        ) >= self.event_log_buffer_max_events or _is_event_log_buffer_boundary(event):
+            self._flush_write_behind_buffer(run_id)
+        self._flush_expired_write_behind_buffers()
+
+    def _flush_expired_write_behind_buffers(self) -> float:
+        """Flushes the buffers whose oldest event has been buffered for `max_seconds`, and returns
+        the number of seconds until the next buffer expires.
+        """
+        max_seconds = self.event_log_buffer_max_seconds
+        with self._write_behind_lock:
+            now = time.monotonic()
+            for run_id, start_time in list(self._write_behind_buffer_start_times.items()):
+                if now - start_time >= max_seconds:
+                    self._flush_write_behind_buffer(run_id)
+            return max(
+                min(
+                    (
+                        start_time + max_seconds - now
+                        for start_time in self._write_behind_buffer_start_times.values()
+                    ),
+                    default=max_seconds,
+                ),
+                0.0,
+            )
+
+    def _start_write_behind_flusher(self) -> None:
+        if self._write_behind_flusher_thread is not None or self.event_log_buffer_max_seconds <= 0:
+            return
+
+        self._write_behind_flusher_shutdown_event = threading.Event()
+        self._write_behind_flusher_thread = threading.Thread(
+            target=_flush_expired_event_log_buffers,
+            args=(weakref.ref(self), self._write_behind_flusher_shutdown_event),
+            name="event-log-buffer-flusher",
+            daemon=True,
+        )
+        self._write_behind_flusher_thread.start()
+
+        # write any events that are still buffered when the process exits without disposing of the
+        # instance
+        instance_ref = weakref.ref(self)
+
+        def _flush_at_exit() -> None:
+            instance = instance_ref()
+            if instance is not None:
+                instance.flush_event_log_buffer()
+
+        self._write_behind_atexit_flush = _flush_at_exit
+        atexit.register(_flush_at_exit)
+
+    def _stop_write_behind_flusher(self) -> None:
+        with self._write_behind_lock:
+            shutdown_event = self._write_behind_flusher_shutdown_event
+            thread = self._write_behind_flusher_thread
+            atexit_flush = self._write_behind_atexit_flush
+            self._write_behind_flusher_shutdown_event = None
+            self._write_behind_flusher_thread = None
+            self._write_behind_atexit_flush = None
+
+        if shutdown_event and thread:
+            shutdown_event.set()
+            if thread is not threading.current_thread():
+                thread.join()
+        if atexit_flush:
+            atexit.unregister(atexit_flush)
+
+    def _flush_write_behind_buffer(self, run_id: str) -> None:
+        # pop the buffer before writing, so that events handled by subscribers while the buffer is
+        # being flushed are buffered again rather than written twice
+        events = self._write_behind_buffer.pop(run_id, [])
+        self._write_behind_buffer_start_times.pop(run_id, None)
+        if events:
+            self._store_and_notify_events(events)
+
+    def flush_event_log_buffer(self, run_id: Optional[str] = None) -> None:
+        """Write any events held in the write-behind event buffer to the event log.
+
+        Args:
+            run_id (Optional[str]): If provided, only flush the buffered events for this run.
+        """
+        check.opt_str_param(run_id, "run_id")
+        with self._write_behind_lock:
+            run_ids = [run_id] if run_id is not None else list(self._write_behind_buffer.keys())
+            for run_id_to_flush in run_ids:
+                self._flush_write_behind_buffer(run_id_to_flush)
+
+    def _store_and_notify_events(self, events: Sequence["EventLogEntry"]) -> None:
         if len(events) == 1:
             self._event_storage.store_event(events[0])
         else:
             try:
                 self._event_storage.store_event_batch(events)
 
+            # Some of the events were stored before the batch failed, so only fall back to storing
+            # the events which were not stored, to avoid storing any event twice.
+            except DagsterEventBatchPartiallyStoredError as e:
+                sys.stderr.write(f"Exception while storing event batch: {e.__cause__ or e}\n")
+                sys.stderr.write(
+                    f"Falling back to storing the {len(e.unstored_events)} events of the batch"
+                    " that were not stored with single-event storage requests...\n"
+                )
+                for event in e.unstored_events:
+                    self._event_storage.store_event(event)
+
             # Fall back to storing events one by one if writing a batch fails. We catch a generic
             # Exception because that is the parent class of the actually received error,
             # dagster_cloud_cli.core.errors.GraphQLStorageError, which we cannot import here due to
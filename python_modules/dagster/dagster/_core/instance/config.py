@@ -194,6 +194,9 @@ def python_logs_config_schema() -> Field:
 
 DEFAULT_LOCAL_CODE_SERVER_STARTUP_TIMEOUT = 180
 
+DEFAULT_EVENT_LOG_BUFFER_MAX_EVENTS = 100
+DEFAULT_EVENT_LOG_BUFFER_MAX_SECONDS = 1.0
+
 
 def get_default_tick_retention_settings(
     instigator_type: "InstigatorType",
@@ -317,6 +320,55 @@ def schedules_daemon_config() -> Field:
     )
 
 
+def event_log_buffer_config_schema() -> Field:
+    return Field(
+        {
+            "enabled": Field(Bool, is_required=False, default_value=False),
+            "max_events": Field(
+                int,
+                is_required=False,
+                default_value=DEFAULT_EVENT_LOG_BUFFER_MAX_EVENTS,
+                description=(
+                    "The maximum number of events to buffer for a run before they are written to"
+                    " the event log in a single batch."
+                ),
+            ),
+            "max_seconds": Field(
+                float,
+                is_required=False,
+                default_value=DEFAULT_EVENT_LOG_BUFFER_MAX_SECONDS,
+                description=(
+                    "The maximum amount of time, in seconds, that an event may be buffered before"
+                    " the buffer for its run is written to the event log."
+                ),
+            ),
+        },
+        is_required=False,
+        description=(
+            "Buffer the events emitted for a run and write them to the event log in batches. The"
+            " buffer for a run is also flushed whenever a step or the run changes state."
+        ),
+    )
+
+
+def asset_status_cache_config_schema() -> Field:
+    return Field(
+        {
+            "update_on_write": Field(
+                Bool,
+                is_required=False,
+                default_value=False,
+                description=(
+                    "Update the cached partition status of an asset whenever one of its"
+                    " materializations or planned materializations is stored, instead of catching"
+                    " up on new events whenever the cached status is read."
+                ),
+            ),
+        },
+        is_required=False,
+    )
+
+
 def secrets_loader_config_schema() -> Field:
     return Field(
         Selector(
@@ -406,6 +458,24 @@ def dagster_instance_config_schema() -> Mapping[str, Field]:
                     ),
                 ),
                 "use_sensors": Field(BoolSource, is_required=False),
+                "incremental_evaluation": Field(
+                    BoolSource,
+                    is_required=False,
+                    description=(
+                        "Whether to skip evaluating the automation conditions of assets whose"
+                        " results can not have changed since the previous tick"
+                    ),
+                ),
+                "num_evaluation_processes": Field(
+                    IntSource,
+                    is_required=False,
+                    description=(
+                        "How many processes to evaluate the automation conditions of a single tick"
+                        " with. Only applies to conditions evaluated by the daemon, as the"
+                        " conditions of sensors evaluated in a code server are always evaluated"
+                        " in a single process."
+                    ),
+                ),
                 "use_threads": Field(Bool, is_required=False, default_value=False),
                 "num_workers": Field(
                     int,
@@ -425,4 +495,6 @@ def dagster_instance_config_schema() -> Mapping[str, Field]:
                 ),
             }
         ),
+        "event_log_buffer": event_log_buffer_config_schema(),
+        "asset_status_cache": asset_status_cache_config_schema(),
     }
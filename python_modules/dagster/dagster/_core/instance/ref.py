@@ -456,6 +456,8 @@ def from_dir(
             "nux",
             "auto_materialize",
             "concurrency",
+            "event_log_buffer",
+            "asset_status_cache",
         }
         settings = {key: config_value.get(key) for key in settings_keys if config_value.get(key)}
 
@@ -131,6 +131,14 @@ def blocking_get_many(cls, context: LoadingContext, ids: Iterable[TKey]) -> Iter
         _, blocking_loader = context.get_loaders_for(cls)
         return list(filter(None, blocking_loader.blocking_load_many(ids)))
 
+    @classmethod
+    def prime(cls, context: LoadingContext, id: TKey, value: Optional[Self]) -> None:
+        """Add an object that was already fetched to the cache of the async loader, so that
+        subsequent calls to `gen` are served without fetching it again.
+        """
+        loader, _ = context.get_loaders_for(cls)
+        loader.prime(id, value)
+
     @classmethod
     def prepare(cls, context: LoadingContext, ids: Iterable[TKey]) -> None:
         """Ensure the provided ids will be fetched on the next blocking query."""
@@ -7,6 +7,7 @@
     AbstractSet,
     Any,
     Dict,
+    Iterator,
     Mapping,
     Optional,
     Sequence,
@@ -27,7 +28,11 @@
     sync_get_external_partition_set_execution_param_data_grpc,
     sync_get_external_partition_tags_grpc,
 )
-from dagster._api.snapshot_repository import sync_get_streaming_external_repositories_data_grpc
+from dagster._api.snapshot_repository import (
+    RepositorySnapPieceCache,
+    create_repository_snap_piece_cache,
+    sync_get_streaming_external_repositories_data_grpc,
+)
 from dagster._api.snapshot_schedule import sync_get_external_schedule_execution_data_grpc
 from dagster._core.code_pointer import CodePointer
 from dagster._core.definitions.asset_job import IMPLICIT_ASSET_JOB_NAME
@@ -66,7 +71,15 @@
     GrpcServerCodeLocationOrigin,
     InProcessCodeLocationOrigin,
 )
-from dagster._core.snap.execution_plan_snapshot import snapshot_from_execution_plan
+from dagster._core.snap.execution_plan_snapshot import (
+    ExecutionPlanSnapshot,
+    snapshot_from_execution_plan,
+)
+from dagster._core.snap.execution_plan_snapshot_cache import (
+    ExecutionPlanSnapshotCacheKey,
+    get_execution_plan_snapshot_cache,
+    get_execution_plan_snapshot_cache_key,
+)
 from dagster._grpc.impl import (
     get_external_schedule_execution,
     get_external_sensor_execution,
@@ -76,7 +89,7 @@
     get_partition_set_execution_param_data,
     get_partition_tags,
 )
-from dagster._grpc.types import GetCurrentImageResult, GetCurrentRunsResult
+from dagster._grpc.types import GetCurrentImageResult, GetCurrentRunsResult, SensorExecutionArgs
 from dagster._record import copy
 from dagster._serdes import deserialize_value
 from dagster._utils.merger import merge_dicts
@@ -92,6 +105,24 @@
     )
 
 
+def _get_execution_plan_snapshot_cache_key(
+    remote_job: RemoteJob,
+    run_config: Mapping[str, object],
+    step_keys_to_execute: Optional[Sequence[str]],
+    known_state: Optional[KnownExecutionState],
+) -> Optional[ExecutionPlanSnapshotCacheKey]:
+    return get_execution_plan_snapshot_cache_key(
+        job_origin_id=remote_job.get_remote_origin_id(),
+        job_snapshot_id=remote_job.identifying_job_snapshot_id,
+        run_config=run_config,
+        step_keys_to_execute=step_keys_to_execute,
+        known_state=known_state,
+        op_selection=remote_job.op_selection,
+        asset_selection=remote_job.asset_selection,
+        asset_check_selection=remote_job.asset_check_selection,
+    )
+
+
 class CodeLocation(AbstractContextManager):
     """A CodeLocation represents a target containing user code which has a set of Dagster
     definition objects. A given location will contain some number of uniquely named
@@ -303,6 +334,33 @@ def get_sensor_execution_data(
     ) -> "SensorExecutionData":
         pass
 
+    def get_sensor_execution_data_batch(
+        self,
+        instance: DagsterInstance,
+        sensor_execution_args: Sequence[SensorExecutionArgs],
+    ) -> Iterator[
+        Tuple[SensorExecutionArgs, Union["SensorExecutionData", SensorExecutionErrorSnap]]
+    ]:
+        """Evaluates several sensors of this code location, yielding the result of each sensor as
+        soon as it is available. A sensor that fails to evaluate yields a SensorExecutionErrorSnap
+        rather than interrupting the rest of the batch.
+        """
+        for args in sensor_execution_args:
+            try:
+                result = self.get_sensor_execution_data(
+                    instance,
+                    RepositoryHandle.from_location(args.repository_origin.repository_name, self),
+                    args.sensor_name,
+                    args.last_tick_completion_time,
+                    args.last_run_key,
+                    args.cursor,
+                    args.log_key,
+                    args.last_sensor_start_time,
+                )
+            except DagsterUserCodeProcessError as e:
+                result = SensorExecutionErrorSnap(error=e.user_code_process_error_infos[0])
+            yield args, result
+
     @abstractmethod
     def get_notebook_data(self, notebook_path: str) -> bytes:
         pass
@@ -480,24 +538,32 @@ def get_execution_plan(
         check.opt_inst_param(known_state, "known_state", KnownExecutionState)
         check.opt_inst_param(instance, "instance", DagsterInstance)
 
-        execution_plan = create_execution_plan(
-            job=self.get_reconstructable_job(
-                remote_job.repository_handle.repository_name, remote_job.name
-            ).get_subset(
-                op_selection=remote_job.resolved_op_selection,
-                asset_selection=remote_job.asset_selection,
-                asset_check_selection=remote_job.asset_check_selection,
-            ),
-            run_config=run_config,
-            step_keys_to_execute=step_keys_to_execute,
-            known_state=known_state,
-            instance_ref=instance.get_ref() if instance and instance.is_persistent else None,
-        )
-        return RemoteExecutionPlan(
-            execution_plan_snapshot=snapshot_from_execution_plan(
+        def _create_execution_plan_snapshot() -> ExecutionPlanSnapshot:
+            execution_plan = create_execution_plan(
+                job=self.get_reconstructable_job(
+                    remote_job.repository_handle.repository_name, remote_job.name
+                ).get_subset(
+                    op_selection=remote_job.resolved_op_selection,
+                    asset_selection=remote_job.asset_selection,
+                    asset_check_selection=remote_job.asset_check_selection,
+                ),
+                run_config=run_config,
+                step_keys_to_execute=step_keys_to_execute,
+                known_state=known_state,
+                instance_ref=instance.get_ref() if instance and instance.is_persistent else None,
+            )
+            return snapshot_from_execution_plan(
                 execution_plan,
                 remote_job.identifying_job_snapshot_id,
             )
+
+        return RemoteExecutionPlan(
+            execution_plan_snapshot=get_execution_plan_snapshot_cache().get_or_create(
+                _get_execution_plan_snapshot_cache_key(
+                    remote_job, run_config, step_keys_to_execute, known_state
+                ),
+                _create_execution_plan_snapshot,
+            )
         )
 
     def get_partition_config(
@@ -607,6 +673,30 @@ def get_sensor_execution_data(
 
         return result
 
+    def get_sensor_execution_data_batch(
+        self,
+        instance: DagsterInstance,
+        sensor_execution_args: Sequence[SensorExecutionArgs],
+    ) -> Iterator[
+        Tuple[SensorExecutionArgs, Union["SensorExecutionData", SensorExecutionErrorSnap]]
+    ]:
+        for args in sensor_execution_args:
+            yield (
+                args,
+                get_external_sensor_execution(
+                    self._get_repo_def(args.repository_origin.repository_name),
+                    self.origin,
+                    instance.get_ref(),
+                    args.sensor_name,
+                    args.last_tick_completion_time,
+                    args.last_run_key,
+                    args.cursor,
+                    args.log_key,
+                    args.last_sensor_start_time,
+                    instance=instance,
+                ),
+            )
+
     def get_partition_set_execution_params(
         self,
         repository_handle: RepositoryHandle,
@@ -646,6 +736,7 @@ def __init__(
         watch_server: Optional[bool] = True,
         grpc_server_registry: Optional[GrpcServerRegistry] = None,
         grpc_metadata: Optional[Sequence[Tuple[str, str]]] = None,
+        snapshot_piece_cache: Optional[RepositorySnapPieceCache] = None,
     ):
         from dagster._grpc.client import DagsterGrpcClient, client_heartbeat_thread
 
@@ -671,6 +762,13 @@ def __init__(
         self._heartbeat_thread = None
 
         self._heartbeat = check.bool_param(heartbeat, "heartbeat")
+        # shared by the locations of a workspace, so that reloads only fetch the changed pieces
+        self._snapshot_piece_cache = check.opt_inst_param(
+            snapshot_piece_cache,
+            "snapshot_piece_cache",
+            RepositorySnapPieceCache,
+            create_repository_snap_piece_cache(),
+        )
         self._watch_server = check.bool_param(watch_server, "watch_server")
 
         self._server_id = None
@@ -727,6 +825,7 @@ def __init__(
             self._repository_snaps = sync_get_streaming_external_repositories_data_grpc(
                 self.client,
                 self,
+                self._snapshot_piece_cache,
             )
 
             self.remote_repositories = {
@@ -847,20 +946,25 @@ def get_execution_plan(
             else None
         )
 
-        execution_plan_snapshot_or_error = sync_get_external_execution_plan_grpc(
-            api_client=self.client,
-            job_origin=remote_job.get_remote_origin(),
-            run_config=run_config,
-            job_snapshot_id=remote_job.identifying_job_snapshot_id,
-            asset_selection=asset_selection,
-            asset_check_selection=asset_check_selection,
-            op_selection=remote_job.op_selection,
-            step_keys_to_execute=step_keys_to_execute,
-            known_state=known_state,
-            instance=instance,
+        execution_plan_snapshot = get_execution_plan_snapshot_cache().get_or_create(
+            _get_execution_plan_snapshot_cache_key(
+                remote_job, run_config, step_keys_to_execute, known_state
+            ),
+            lambda: sync_get_external_execution_plan_grpc(
+                api_client=self.client,
+                job_origin=remote_job.get_remote_origin(),
+                run_config=run_config,
+                job_snapshot_id=remote_job.identifying_job_snapshot_id,
+                asset_selection=asset_selection,
+                asset_check_selection=asset_check_selection,
+                op_selection=remote_job.op_selection,
+                step_keys_to_execute=step_keys_to_execute,
+                known_state=known_state,
+                instance=instance,
+            ),
         )
 
-        return RemoteExecutionPlan(execution_plan_snapshot=execution_plan_snapshot_or_error)
+        return RemoteExecutionPlan(execution_plan_snapshot=execution_plan_snapshot)
 
     def get_subset_remote_job_result(self, selector: JobSubsetSelector) -> "RemoteJobSubsetResult":
         check.inst_param(selector, "selector", JobSubsetSelector)
@@ -974,6 +1078,19 @@ def get_sensor_execution_data(
             last_sensor_start_time,
         )
 
+    def get_sensor_execution_data_batch(
+        self,
+        instance: DagsterInstance,
+        sensor_execution_args: Sequence[SensorExecutionArgs],
+    ) -> Iterator[
+        Tuple[SensorExecutionArgs, Union["SensorExecutionData", SensorExecutionErrorSnap]]
+    ]:
+        from dagster._api.snapshot_sensor import sync_get_external_sensor_execution_data_batch_grpc
+
+        return sync_get_external_sensor_execution_data_batch_grpc(
+            self.client, sensor_execution_args
+        )
+
     def get_partition_set_execution_params(
         self,
         repository_handle: RepositoryHandle,
@@ -10,6 +10,7 @@
 from collections import defaultdict
 from enum import Enum
 from typing import (
+    AbstractSet,
     Any,
     Dict,
     Iterable,
@@ -100,9 +101,10 @@
 from dagster._core.storage.io_manager import IOManagerDefinition
 from dagster._core.storage.tags import COMPUTE_KIND_TAG
 from dagster._core.utils import is_valid_email
-from dagster._record import IHaveNew, record, record_custom
-from dagster._serdes import whitelist_for_serdes
+from dagster._record import IHaveNew, copy, record, record_custom
+from dagster._serdes import deserialize_value, serialize_value, whitelist_for_serdes
 from dagster._serdes.serdes import FieldSerializer, is_whitelisted_for_serdes_object
+from dagster._serdes.utils import hash_str
 from dagster._time import datetime_from_timestamp
 from dagster._utils.error import SerializableErrorInfo
 from dagster._utils.warnings import suppress_dagster_warnings
@@ -359,6 +361,91 @@ def get_sensor(self, name):
         check.failed("Could not find sensor data named " + name)
 
 
+# fields of RepositorySnap that are split into individually content-addressed pieces
+REPOSITORY_SNAP_PIECE_FIELDS: Final = ("job_datas", "asset_nodes", "sensors", "schedules")
+
+
+@whitelist_for_serdes
+@record
+class RepositorySnapPieces:
+    """A RepositorySnap split into content-addressed pieces, one per job, asset node, sensor and
+    schedule. `repository_snap` holds every other field, `piece_digests` lists the digests of the
+    pieces of each split field in order and `serialized_pieces` holds the serialized pieces by
+    digest. Pieces whose digest the requesting client already knows are omitted from
+    `serialized_pieces`, so that code location reloads only transfer and deserialize the parts of a
+    repository that changed.
+
+    Each piece is serialized once when splitting the snapshot and its digest is the hash of that
+    serialization, so pieces are not serialized a second time when the response is serialized.
+    """
+
+    repository_snap: RepositorySnap
+    piece_digests: Mapping[str, Sequence[str]]
+    serialized_pieces: Mapping[str, str]
+
+    @classmethod
+    def from_repository_snap(cls, repository_snap: RepositorySnap) -> Self:
+        piece_digests = {}
+        serialized_pieces = {}
+        for field in REPOSITORY_SNAP_PIECE_FIELDS:
+            field_pieces = getattr(repository_snap, field)
+            if field_pieces is None:
+                continue
+            digests = []
+            for piece in field_pieces:
+                serialized_piece = serialize_value(piece)
+                # equal to create_snapshot_id(piece)
+                digest = hash_str(serialized_piece)
+                digests.append(digest)
+                serialized_pieces[digest] = serialized_piece
+            piece_digests[field] = digests
+
+        return cls(
+            repository_snap=copy(repository_snap, **{field: [] for field in piece_digests}),
+            piece_digests=piece_digests,
+            serialized_pieces=serialized_pieces,
+        )
+
+    def without_pieces(self, known_piece_digests: AbstractSet[str]) -> Self:
+        """Returns a copy that omits the pieces whose digest is in `known_piece_digests`."""
+        return copy(
+            self,
+            serialized_pieces={
+                digest: serialized_piece
+                for digest, serialized_piece in self.serialized_pieces.items()
+                if digest not in known_piece_digests
+            },
+        )
+
+    def get_pieces(self, known_pieces: Mapping[str, Any]) -> Mapping[str, Any]:
+        """Returns every piece of the snapshot by digest, deserializing only the pieces that are
+        not in `known_pieces`.
+        """
+        pieces = {}
+        for field, digests in self.piece_digests.items():
+            for digest in digests:
+                if digest in known_pieces:
+                    pieces[digest] = known_pieces[digest]
+                elif digest in self.serialized_pieces:
+                    pieces[digest] = deserialize_value(self.serialized_pieces[digest])
+                else:
+                    check.failed(f"Repository snapshot piece {digest} for {field} is missing")
+        return pieces
+
+    def resolve(self, known_pieces: Mapping[str, Any]) -> RepositorySnap:
+        """Reassembles the RepositorySnap, taking the pieces that were omitted from
+        `known_pieces`.
+        """
+        pieces = self.get_pieces(known_pieces)
+        return copy(
+            self.repository_snap,
+            **{
+                field: [pieces[digest] for digest in digests]
+                for field, digests in self.piece_digests.items()
+            },
+        )
+
+
 @whitelist_for_serdes(
     storage_name="ExternalPresetData", storage_field_names={"op_selection": "solid_selection"}
 )
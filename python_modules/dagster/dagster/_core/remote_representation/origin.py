@@ -28,6 +28,7 @@
 from dagster._serdes import create_snapshot_id, whitelist_for_serdes
 
 if TYPE_CHECKING:
+    from dagster._api.snapshot_repository import RepositorySnapPieceCache
     from dagster._core.instance import DagsterInstance
     from dagster._core.remote_representation.code_location import (
         CodeLocation,
@@ -350,7 +351,11 @@ def get_display_metadata(self) -> Mapping[str, str]:
         }
         return {key: value for key, value in metadata.items() if value is not None}
 
-    def reload_location(self, instance: "DagsterInstance") -> "GrpcServerCodeLocation":
+    def reload_location(
+        self,
+        instance: "DagsterInstance",
+        snapshot_piece_cache: Optional["RepositorySnapPieceCache"] = None,
+    ) -> "GrpcServerCodeLocation":
         from dagster._core.remote_representation.code_location import GrpcServerCodeLocation
 
         try:
@@ -365,12 +370,20 @@ def reload_location(self, instance: "DagsterInstance") -> "GrpcServerCodeLocatio
             else:
                 raise
 
-        return GrpcServerCodeLocation(self, instance=instance)
+        return GrpcServerCodeLocation(
+            self, instance=instance, snapshot_piece_cache=snapshot_piece_cache
+        )
 
-    def create_location(self, instance: "DagsterInstance") -> "GrpcServerCodeLocation":
+    def create_location(
+        self,
+        instance: "DagsterInstance",
+        snapshot_piece_cache: Optional["RepositorySnapPieceCache"] = None,
+    ) -> "GrpcServerCodeLocation":
         from dagster._core.remote_representation.code_location import GrpcServerCodeLocation
 
-        return GrpcServerCodeLocation(self, instance=instance)
+        return GrpcServerCodeLocation(
+            self, instance=instance, snapshot_piece_cache=snapshot_piece_cache
+        )
 
     def create_client(self) -> "DagsterGrpcClient":
         from dagster._grpc.client import DagsterGrpcClient
@@ -69,6 +69,7 @@ def __init__(
         max_user_code_failure_retries: Optional[int] = None,
         user_code_failure_retry_delay: Optional[int] = None,
         block_op_concurrency_limited_runs: Optional[Mapping[str, Any]] = None,
+        bulk_dequeue: Optional[Mapping[str, Any]] = None,
         inst_data: Optional[ConfigurableClassData] = None,
     ):
         self._inst_data: Optional[ConfigurableClassData] = check.opt_inst_param(
@@ -116,6 +117,16 @@ def __init__(
                 "is enabled",
             )
 
+        self._bulk_dequeue_enabled: bool = bool(bulk_dequeue and bulk_dequeue.get("enabled"))
+        self._bulk_dequeue_max_launches_per_location: Optional[int] = (
+            bulk_dequeue.get("max_concurrent_launches_per_location") if bulk_dequeue else None
+        )
+        if self._bulk_dequeue_max_launches_per_location is not None:
+            check.invariant(
+                self._bulk_dequeue_max_launches_per_location >= 1,
+                "max_concurrent_launches_per_location must be at least 1",
+            )
+
         self._logger = logging.getLogger("dagster.run_coordinator.queued_run_coordinator")
         super().__init__()
 
@@ -145,6 +156,14 @@ def dequeue_use_threads(self) -> bool:
     def dequeue_num_workers(self) -> Optional[int]:
         return self._dequeue_num_workers
 
+    @property
+    def bulk_dequeue_enabled(self) -> bool:
+        return self._bulk_dequeue_enabled
+
+    @property
+    def bulk_dequeue_max_launches_per_location(self) -> Optional[int]:
+        return self._bulk_dequeue_max_launches_per_location
+
     @property
     def should_block_op_concurrency_limited_runs(self) -> bool:
         return self._should_block_op_concurrency_limited_runs
@@ -251,6 +270,29 @@ def config_type(cls) -> UserConfigSchema:
                     ),
                 }
             ),
+            "bulk_dequeue": Field(
+                {
+                    "enabled": Field(
+                        Bool,
+                        is_required=False,
+                        description=(
+                            "Whether to select every run that can be dequeued in a single pass"
+                            " over the queue, counting in progress runs per tag with a single"
+                            " query, and launch the selected runs concurrently using up to"
+                            " dequeue_num_workers threads."
+                        ),
+                    ),
+                    "max_concurrent_launches_per_location": Field(
+                        int,
+                        is_required=False,
+                        description=(
+                            "If bulk dequeuing is enabled, the maximum number of runs from the same"
+                            " code location to launch at once."
+                        ),
+                    ),
+                },
+                is_required=False,
+            ),
         }
 
     @classmethod
@@ -267,6 +309,7 @@ def from_config_value(
             max_user_code_failure_retries=config_value.get("max_user_code_failure_retries"),
             user_code_failure_retry_delay=config_value.get("user_code_failure_retry_delay"),
             block_op_concurrency_limited_runs=config_value.get("block_op_concurrency_limited_runs"),
+            bulk_dequeue=config_value.get("bulk_dequeue"),
         )
 
     def submit_run(self, context: SubmitRunContext) -> DagsterRun:
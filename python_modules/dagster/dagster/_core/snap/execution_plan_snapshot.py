@@ -30,8 +30,13 @@
 
 
 def create_execution_plan_snapshot_id(execution_plan_snapshot: "ExecutionPlanSnapshot") -> str:
+    from dagster._core.snap.execution_plan_snapshot_cache import get_execution_plan_snapshot_cache
+
     check.inst_param(execution_plan_snapshot, "execution_plan_snapshot", ExecutionPlanSnapshot)
-    return create_snapshot_id(execution_plan_snapshot)
+    # snapshots shared through the execution plan snapshot cache already know their id
+    return get_execution_plan_snapshot_cache().get_snapshot_id(
+        execution_plan_snapshot
+    ) or create_snapshot_id(execution_plan_snapshot)
 
 
 @whitelist_for_serdes(
@@ -0,0 +1,141 @@
+"""A bounded, process-wide cache of execution plan snapshots.
+
+Building an execution plan snapshot is a function of the job snapshot, the op / asset / asset
+check selection, the run config, the step keys to execute and the known state, so runs created
+with the same inputs (e.g. the runs of a partitioned backfill, or the runs requested by a sensor)
+can share one snapshot instead of each paying the full plan-building cost. The cache also
+remembers the id of each snapshot it holds, so that persisting a cached snapshot does not
+re-serialize it to compute its id.
+"""
+
+import json
+import os
+import threading
+from collections import OrderedDict
+from typing import AbstractSet, Callable, Dict, Mapping, Optional, Sequence, Tuple
+
+import dagster._check as check
+from dagster._core.definitions.asset_key import AssetCheckKey, AssetKey
+from dagster._core.execution.plan.state import KnownExecutionState
+from dagster._core.snap.execution_plan_snapshot import ExecutionPlanSnapshot
+from dagster._serdes import create_snapshot_id, serialize_value
+from dagster._serdes.utils import hash_str
+
+ExecutionPlanSnapshotCacheKey = Tuple[object, ...]
+
+
+def _get_default_max_entries() -> int:
+    return int(os.getenv("DAGSTER_EXECUTION_PLAN_SNAPSHOT_CACHE_SIZE", "128"))
+
+
+def get_execution_plan_snapshot_cache_key(
+    job_origin_id: str,
+    job_snapshot_id: str,
+    run_config: Mapping[str, object],
+    step_keys_to_execute: Optional[Sequence[str]],
+    known_state: Optional[KnownExecutionState],
+    op_selection: Optional[Sequence[str]] = None,
+    asset_selection: Optional[AbstractSet[AssetKey]] = None,
+    asset_check_selection: Optional[AbstractSet[AssetCheckKey]] = None,
+) -> Optional[ExecutionPlanSnapshotCacheKey]:
+    """Returns the key under which the execution plan snapshot built from these inputs is cached,
+    or None if the run config can not be hashed, in which case the snapshot should not be cached.
+    """
+    try:
+        run_config_key = hash_str(json.dumps(run_config, sort_keys=True))
+    except (TypeError, ValueError):
+        return None
+
+    return (
+        job_origin_id,
+        job_snapshot_id,
+        tuple(op_selection) if op_selection is not None else None,
+        frozenset(asset_selection) if asset_selection is not None else None,
+        frozenset(asset_check_selection) if asset_check_selection is not None else None,
+        tuple(step_keys_to_execute) if step_keys_to_execute is not None else None,
+        run_config_key,
+        hash_str(serialize_value(known_state)) if known_state else None,
+    )
+
+
+class ExecutionPlanSnapshotCache:
+    """An LRU cache of execution plan snapshots and their ids. Failures to build a snapshot are
+    never cached.
+    """
+
+    def __init__(self, max_entries: Optional[int] = None):
+        self._max_entries = check.opt_int_param(
+            max_entries, "max_entries", default=_get_default_max_entries()
+        )
+        self._lock = threading.Lock()
+        self._entries: OrderedDict[
+            ExecutionPlanSnapshotCacheKey, Tuple[ExecutionPlanSnapshot, str]
+        ] = OrderedDict()
+        # the cache holds a reference to every snapshot in this mapping, so the object ids can
+        # not be reused while they are in it
+        self._snapshot_ids_by_object_id: Dict[int, str] = {}
+
+    @property
+    def max_entries(self) -> int:
+        return self._max_entries
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def get_or_create(
+        self,
+        key: Optional[ExecutionPlanSnapshotCacheKey],
+        create_snapshot: Callable[[], ExecutionPlanSnapshot],
+    ) -> ExecutionPlanSnapshot:
+        if key is None or self._max_entries <= 0:
+            return create_snapshot()
+
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry:
+                self._entries.move_to_end(key)
+                return entry[0]
+
+        # build the snapshot outside of the lock, so that building a large plan does not block
+        # lookups of other plans
+        execution_plan_snapshot = check.inst(create_snapshot(), ExecutionPlanSnapshot)
+        snapshot_id = create_snapshot_id(execution_plan_snapshot)
+
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry:
+                # another thread built the same snapshot in the meantime
+                self._entries.move_to_end(key)
+                return entry[0]
+
+            self._entries[key] = (execution_plan_snapshot, snapshot_id)
+            self._snapshot_ids_by_object_id[id(execution_plan_snapshot)] = snapshot_id
+            while len(self._entries) > self._max_entries:
+                _, (evicted_snapshot, _) = self._entries.popitem(last=False)
+                self._snapshot_ids_by_object_id.pop(id(evicted_snapshot), None)
+
+        return execution_plan_snapshot
+
+    def get_snapshot_id(self, execution_plan_snapshot: ExecutionPlanSnapshot) -> Optional[str]:
+        """Returns the id of the given snapshot if it is held in the cache."""
+        with self._lock:
+            return self._snapshot_ids_by_object_id.get(id(execution_plan_snapshot))
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+            self._snapshot_ids_by_object_id.clear()
+
+
+_execution_plan_snapshot_cache: Optional[ExecutionPlanSnapshotCache] = None
+_execution_plan_snapshot_cache_lock = threading.Lock()
+
+
+def get_execution_plan_snapshot_cache() -> ExecutionPlanSnapshotCache:
+    """Returns the execution plan snapshot cache shared by everything running in this process."""
+    global _execution_plan_snapshot_cache  # noqa: PLW0603
+
+    with _execution_plan_snapshot_cache_lock:
+        if _execution_plan_snapshot_cache is None:
+            _execution_plan_snapshot_cache = ExecutionPlanSnapshotCache()
+        return _execution_plan_snapshot_cache
@@ -7,6 +7,8 @@
     InMemoryEventLogStorage as InMemoryEventLogStorage,
 )
 from dagster._core.storage.event_log.polling_event_watcher import (
+    EventLogNotifier as EventLogNotifier,
+    SqlMultiplexedEventWatcher as SqlMultiplexedEventWatcher,
     SqlPollingEventWatcher as SqlPollingEventWatcher,
 )
 from dagster._core.storage.event_log.schema import (
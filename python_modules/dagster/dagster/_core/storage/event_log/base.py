@@ -1,3 +1,4 @@
+import logging
 from abc import ABC, abstractmethod
 from typing import (
     TYPE_CHECKING,
@@ -47,6 +48,10 @@
     from dagster._core.events.log import EventLogEntry
     from dagster._core.storage.partition_status_cache import AssetStatusCacheValue
 
+# names of the storage classes which have been warned about not implementing the compare-and-set of
+# the cached status of an asset
+_STORAGES_WARNED_WITHOUT_COMPARE_AND_SET: Set[str] = set()
+
 
 class EventLogConnection(NamedTuple):
     records: Sequence[EventLogRecord]
@@ -376,6 +381,30 @@ def update_asset_cached_status_data(
     ) -> None:
         pass
 
+    def update_asset_cached_status_data_if_unchanged(
+        self,
+        asset_key: AssetKey,
+        expected_cache_value: Optional["AssetStatusCacheValue"],
+        cache_values: "AssetStatusCacheValue",
+    ) -> bool:
+        """Update the cached status of an asset only if it has not changed from the expected value,
+        e.g. because events of the asset were stored since it was read. Returns whether the cached
+        status was updated.
+
+        Storages that do not implement the compare-and-set do not update the cached status as
+        events are stored, so the cached status is updated unconditionally instead.
+        """
+        storage_class_name = self.__class__.__name__
+        if storage_class_name not in _STORAGES_WARNED_WITHOUT_COMPARE_AND_SET:
+            _STORAGES_WARNED_WITHOUT_COMPARE_AND_SET.add(storage_class_name)
+            logging.getLogger("dagster").warning(
+                f"{storage_class_name} does not support updating the cached status of an asset"
+                " with a compare-and-set, so the asset_status_cache: update_on_write setting has"
+                " no effect on it."
+            )
+        self.update_asset_cached_status_data(asset_key, cache_values)
+        return True
+
     def get_asset_keys(
         self,
         prefix: Optional[Sequence[str]] = None,
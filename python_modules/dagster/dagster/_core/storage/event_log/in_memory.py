@@ -7,6 +7,7 @@
 import sqlalchemy as db
 from sqlalchemy.pool import NullPool
 
+from dagster._core.errors import DagsterEventBatchPartiallyStoredError
 from dagster._core.storage.event_log.base import EventLogCursor
 from dagster._core.storage.event_log.schema import SqlEventLogStorageMetadata
 from dagster._core.storage.event_log.sql_event_log import SqlEventLogStorage
@@ -81,6 +82,22 @@ def upgrade(self):
 
     def store_event(self, event):
         super(InMemoryEventLogStorage, self).store_event(event)
+        self._notify_handlers(event)
+
+    def store_event_batch(self, events):
+        try:
+            super(InMemoryEventLogStorage, self).store_event_batch(events)
+        except DagsterEventBatchPartiallyStoredError as e:
+            unstored_event_ids = {id(event) for event in e.unstored_events}
+            for event in events:
+                if id(event) not in unstored_event_ids:
+                    self._notify_handlers(event)
+            raise
+
+        for event in events:
+            self._notify_handlers(event)
+
+    def _notify_handlers(self, event):
         self._storage_id += 1
 
         handlers = list(self._handlers[event.run_id])
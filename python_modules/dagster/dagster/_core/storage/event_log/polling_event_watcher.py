@@ -1,11 +1,29 @@
+import logging
 import os
 import threading
-from typing import Callable, List, MutableMapping, NamedTuple, Optional
+import time
+from abc import ABC, abstractmethod
+from typing import (
+    TYPE_CHECKING,
+    AbstractSet,
+    Callable,
+    Dict,
+    List,
+    Mapping,
+    MutableMapping,
+    NamedTuple,
+    Optional,
+    Set,
+    TypedDict,
+)
 
 import dagster._check as check
 from dagster._core.events.log import EventLogEntry
 from dagster._core.storage.event_log.base import EventLogCursor, EventLogStorage
 
+if TYPE_CHECKING:
+    from dagster._core.storage.event_log.sql_event_log import SqlEventLogStorage
+
 INIT_POLL_PERIOD = 0.250  # 250ms
 MAX_POLL_PERIOD = 16.0  # 16s
 
@@ -185,3 +203,314 @@ def run(self) -> None:
                                 str(EventLogCursor.from_storage_id(event_record.storage_id)),
                             )
             wait_time = INIT_POLL_PERIOD if conn.records else min(wait_time * 2, MAX_POLL_PERIOD)
+
+
+def _get_polling_event_watcher_batch_size() -> int:
+    return int(os.getenv("DAGSTER_POLLING_EVENT_WATCHER_BATCH_SIZE", "1000"))
+
+
+class EventLogNotifier(ABC):
+    """Source of notifications that new events have been stored for a set of runs, used by
+    SqlMultiplexedEventWatcher to avoid polling the event log while no new events are stored, e.g.
+    a LISTEN connection on a channel that is notified on every event insert.
+    """
+
+    @abstractmethod
+    def wait_for_notifications(self, timeout: float) -> AbstractSet[str]:
+        """Block until new events have been stored, or until the timeout expires.
+
+        Returns the run ids of the runs with new events, or an empty set if the timeout expired.
+        Raises an exception if notifications can no longer be received.
+        """
+
+    def close(self) -> None:
+        pass
+
+
+class EventWatcherMetrics(TypedDict):
+    """A dict of metrics for an event log watcher, describing the runs it is watching and the
+    queries it makes to the event log to fetch their new events.
+    """
+
+    watched_run_count: int
+    subscription_count: int
+    query_count: int
+    last_query_latency_seconds: Optional[float]
+    average_query_latency_seconds: Optional[float]
+    max_query_latency_seconds: Optional[float]
+
+
+class _WatchedRun:
+    """The callbacks watching a single run, each with the storage id of the last event it has been
+    called with, and the schedule on which the run is polled for new events.
+    """
+
+    def __init__(self):
+        self.storage_id_by_callback: Dict[Callable[[EventLogEntry, str], None], int] = {}
+        self.poll_period = INIT_POLL_PERIOD
+        # poll a newly watched run as soon as possible
+        self.next_poll_time = 0.0
+
+    @property
+    def storage_id(self) -> int:
+        return min(self.storage_id_by_callback.values())
+
+
+class SqlMultiplexedEventWatcher:
+    """Event log watcher that serves every watched run from a single background thread.
+
+    Each iteration of the thread fetches the new events of the runs that are due to be polled with a
+    single query, and fans them out to the callbacks of each run based on their cursors. Each run is
+    polled on its own schedule, backing off while the run has no new events and resetting to the
+    initial poll period as soon as it does, so that idle runs do not add to the cost of tailing
+    active ones. If a notifier is provided, runs are queried as soon as it reports new events for
+    them, and otherwise only polled every MAX_POLL_PERIOD in case a notification was missed. If the
+    notifier fails, the thread falls back to polling.
+
+    LOCKING INFO:
+        INVARIANTS: _lock protects _watched_runs, the callbacks of each run, and the query metrics
+    """
+
+    def __init__(
+        self,
+        event_log_storage: "SqlEventLogStorage",
+        notifier: Optional[EventLogNotifier] = None,
+    ):
+        from dagster._core.storage.event_log.sql_event_log import SqlEventLogStorage
+
+        self._event_log_storage = check.inst_param(
+            event_log_storage, "event_log_storage", SqlEventLogStorage
+        )
+        self._notifier = check.opt_inst_param(notifier, "notifier", EventLogNotifier)
+
+        self._lock = threading.RLock()
+        self._watched_runs: Dict[str, _WatchedRun] = {}
+        self._should_thread_exit = threading.Event()
+        # set when a run is due to be polled before the thread would otherwise wake up
+        self._wakeup = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+        self._disposed = False
+
+        self._query_count = 0
+        self._total_query_latency = 0.0
+        self._last_query_latency: Optional[float] = None
+        self._max_query_latency: Optional[float] = None
+
+    def has_run_id(self, run_id: str) -> bool:
+        run_id = check.str_param(run_id, "run_id")
+        with self._lock:
+            return run_id in self._watched_runs
+
+    def watch_run(
+        self,
+        run_id: str,
+        cursor: Optional[str],
+        callback: Callable[[EventLogEntry, str], None],
+    ) -> None:
+        run_id = check.str_param(run_id, "run_id")
+        cursor = check.opt_str_param(cursor, "cursor")
+        callback = check.callable_param(callback, "callback")
+        check.invariant(not self._disposed, "Attempted to watch_run after close")
+
+        # rely on the fact that all storage ids will be positive integers
+        storage_id = EventLogCursor.parse(cursor).storage_id() if cursor else 0
+
+        with self._lock:
+            if run_id not in self._watched_runs:
+                self._watched_runs[run_id] = _WatchedRun()
+            watched_run = self._watched_runs[run_id]
+            watched_run.storage_id_by_callback[callback] = storage_id
+            # the new callback may be behind the others, so catch it up right away
+            watched_run.poll_period = INIT_POLL_PERIOD
+            watched_run.next_poll_time = 0.0
+
+            if self._thread is None:
+                self._thread = threading.Thread(
+                    target=self._run, name="sql-multiplexed-event-watch", daemon=True
+                )
+                self._thread.start()
+
+        self._wakeup.set()
+
+    def unwatch_run(
+        self,
+        run_id: str,
+        handler: Callable[[EventLogEntry, str], None],
+    ) -> None:
+        run_id = check.str_param(run_id, "run_id")
+        handler = check.callable_param(handler, "handler")
+        with self._lock:
+            watched_run = self._watched_runs.get(run_id)
+            if watched_run is None:
+                return
+            watched_run.storage_id_by_callback.pop(handler, None)
+            if not watched_run.storage_id_by_callback:
+                del self._watched_runs[run_id]
+
+    def close(self) -> None:
+        if not self._disposed:
+            self._disposed = True
+            self._should_thread_exit.set()
+            self._wakeup.set()
+            if self._thread:
+                self._thread.join()
+                self._thread = None
+            if self._notifier:
+                self._notifier.close()
+                self._notifier = None
+            with self._lock:
+                self._watched_runs = {}
+
+    def get_metrics(self) -> EventWatcherMetrics:
+        with self._lock:
+            return {
+                "watched_run_count": len(self._watched_runs),
+                "subscription_count": sum(
+                    len(watched_run.storage_id_by_callback)
+                    for watched_run in self._watched_runs.values()
+                ),
+                "query_count": self._query_count,
+                "last_query_latency_seconds": self._last_query_latency,
+                "average_query_latency_seconds": (
+                    self._total_query_latency / self._query_count if self._query_count else None
+                ),
+                "max_query_latency_seconds": self._max_query_latency,
+            }
+
+    def _run(self) -> None:
+        while not self._should_thread_exit.is_set():
+            timeout = self._get_time_until_next_poll()
+            notified_run_ids: AbstractSet[str] = set()
+
+            if self._notifier:
+                try:
+                    # wake up at least every INIT_POLL_PERIOD to pick up newly watched runs
+                    notified_run_ids = self._notifier.wait_for_notifications(
+                        min(timeout, INIT_POLL_PERIOD)
+                    )
+                except Exception:
+                    logging.getLogger("dagster").warning(
+                        "Event log notifications are unavailable, falling back to polling the"
+                        " event log for watched runs.",
+                        exc_info=True,
+                    )
+                    self._notifier.close()
+                    self._notifier = None
+                    with self._lock:
+                        for watched_run in self._watched_runs.values():
+                            watched_run.poll_period = INIT_POLL_PERIOD
+                            watched_run.next_poll_time = 0.0
+            else:
+                self._wakeup.wait(timeout)
+                self._wakeup.clear()
+
+            if self._should_thread_exit.is_set():
+                break
+
+            self._poll(notified_run_ids)
+
+    def _get_time_until_next_poll(self) -> float:
+        with self._lock:
+            if not self._watched_runs:
+                return MAX_POLL_PERIOD
+            next_poll_time = min(
+                watched_run.next_poll_time for watched_run in self._watched_runs.values()
+            )
+        return min(max(next_poll_time - time.monotonic(), 0.0), MAX_POLL_PERIOD)
+
+    def _poll(self, notified_run_ids: AbstractSet[str]) -> None:
+        """Fetch the new events for the watched runs that have been notified or are due to be
+        polled, and reschedule the next poll of each of them based on whether it had new events.
+        """
+        now = time.monotonic()
+        with self._lock:
+            run_ids_to_query = {
+                run_id
+                for run_id, watched_run in self._watched_runs.items()
+                if run_id in notified_run_ids or watched_run.next_poll_time <= now
+            }
+
+        active_run_ids = self._fetch_and_dispatch(run_ids_to_query)
+
+        now = time.monotonic()
+        with self._lock:
+            for run_id in run_ids_to_query:
+                watched_run = self._watched_runs.get(run_id)
+                if watched_run is None:
+                    continue
+                if run_id in active_run_ids:
+                    watched_run.poll_period = INIT_POLL_PERIOD
+                else:
+                    watched_run.poll_period = min(watched_run.poll_period * 2, MAX_POLL_PERIOD)
+                # with a notifier, only poll in case a notification was missed
+                watched_run.next_poll_time = now + (
+                    MAX_POLL_PERIOD if self._notifier else watched_run.poll_period
+                )
+
+    def _fetch_and_dispatch(self, run_ids: AbstractSet[str]) -> AbstractSet[str]:
+        """Fetch the new events for the given watched runs and call the callbacks of each run with
+        them. Returns the ids of the runs that had new events.
+        """
+        with self._lock:
+            storage_ids_by_run_id: Mapping[str, int] = {
+                run_id: self._watched_runs[run_id].storage_id
+                for run_id in run_ids
+                if run_id in self._watched_runs
+            }
+
+        active_run_ids: Set[str] = set()
+        chunk_limit = _get_polling_event_watcher_batch_size()
+        while storage_ids_by_run_id and not self._should_thread_exit.is_set():
+            start_time = time.perf_counter()
+            records = self._event_log_storage.get_records_after_storage_ids(
+                storage_ids_by_run_id, limit=chunk_limit
+            )
+            self._record_query_latency(time.perf_counter() - start_time)
+            if not records:
+                break
+
+            with self._lock:
+                for record in records:
+                    active_run_ids.add(record.event_log_entry.run_id)
+                    self._dispatch(record.event_log_entry, record.storage_id)
+
+            if len(records) < chunk_limit:
+                break
+
+            last_storage_id = records[-1].storage_id
+            storage_ids_by_run_id = {
+                run_id: max(storage_id, last_storage_id)
+                for run_id, storage_id in storage_ids_by_run_id.items()
+            }
+
+        return active_run_ids
+
+    def _record_query_latency(self, latency: float) -> None:
+        with self._lock:
+            self._query_count += 1
+            self._total_query_latency += latency
+            self._last_query_latency = latency
+            self._max_query_latency = (
+                latency
+                if self._max_query_latency is None
+                else max(self._max_query_latency, latency)
+            )
+
+    def _dispatch(self, event: EventLogEntry, storage_id: int) -> None:
+        watched_run = self._watched_runs.get(event.run_id)
+        if watched_run is None:
+            return
+
+        cursor = str(EventLogCursor.from_storage_id(storage_id))
+        for callback, callback_storage_id in list(watched_run.storage_id_by_callback.items()):
+            # skip callbacks that have already seen this event, or were removed by another callback
+            if (
+                callback_storage_id >= storage_id
+                or callback not in watched_run.storage_id_by_callback
+            ):
+                continue
+            watched_run.storage_id_by_callback[callback] = storage_id
+            try:
+                callback(event, cursor)
+            except Exception:
+                logging.exception("Exception in callback for event watch on run %s.", event.run_id)
@@ -39,12 +39,14 @@
 from dagster._core.definitions.data_version import DATA_VERSION_TAG
 from dagster._core.definitions.events import AssetKey, AssetMaterialization
 from dagster._core.errors import (
+    DagsterEventBatchPartiallyStoredError,
     DagsterEventLogInvalidForRun,
     DagsterInvalidInvocationError,
     DagsterInvariantViolationError,
 )
 from dagster._core.event_api import (
     EventRecordsResult,
+    LazyEventLogRecord,
     RunShardedEventsCursor,
     RunStatusChangeRecordsFilter,
 )
@@ -117,6 +119,7 @@
 
 MIN_ASSET_ROWS = 25
 DEFAULT_MAX_LIMIT_EVENT_RECORDS = 10000
+ASSET_STATUS_CACHE_UPDATE_ATTEMPTS = 3
 
 
 def get_max_event_records_limit() -> int:
@@ -143,6 +146,27 @@ def enforce_max_records_limit(limit: int):
 SqlDbConnection: TypeAlias = Any
 
 
+def _group_rows_by_columns(
+    rows: Iterable[Mapping[str, Any]],
+) -> Sequence[Sequence[Mapping[str, Any]]]:
+    """Groups rows by their set of columns, so that each group can be written with a single
+    executemany statement.
+    """
+    rows_by_columns: Dict[Tuple[str, ...], List[Mapping[str, Any]]] = defaultdict(list)
+    for row in rows:
+        rows_by_columns[tuple(sorted(row.keys()))].append(row)
+    return list(rows_by_columns.values())
+
+
+def _group_event_indices_by_run_id(
+    events: Sequence[EventLogEntry],
+) -> Sequence[Tuple[str, Sequence[int]]]:
+    indices_by_run_id: Dict[str, List[int]] = defaultdict(list)
+    for i, event in enumerate(events):
+        indices_by_run_id[event.run_id].append(i)
+    return list(indices_by_run_id.items())
+
+
 class SqlEventLogStorage(EventLogStorage):
     """Base class for SQL backed event log storages.
 
@@ -268,6 +292,79 @@ def store_asset_event(self, event: EventLogEntry, event_id: int):
             except db_exc.IntegrityError:
                 conn.execute(update_statement)
 
+    def store_asset_event_batch(
+        self, events: Sequence[EventLogEntry], event_ids: Sequence[int]
+    ) -> None:
+        """Upserts the asset key rows for a batch of asset events, with one insert statement for the
+        new asset keys and one update statement per set of updated columns for the existing ones.
+        """
+        check.sequence_param(events, "events", EventLogEntry)
+        check.sequence_param(event_ids, "event_ids", int)
+
+        values_by_asset_key = self._get_asset_entry_values_by_asset_key(
+            events, event_ids, self.has_asset_key_index_cols()
+        )
+        if not values_by_asset_key:
+            return
+
+        try:
+            with self.index_transaction() as conn:
+                existing_asset_keys = {
+                    row[0]
+                    for row in conn.execute(
+                        db_select([AssetKeyTable.c.asset_key]).where(
+                            AssetKeyTable.c.asset_key.in_(list(values_by_asset_key.keys()))
+                        )
+                    ).fetchall()
+                }
+                for rows in _group_rows_by_columns(
+                    dict(asset_key=asset_key, **values)
+                    for asset_key, values in values_by_asset_key.items()
+                    if asset_key not in existing_asset_keys
+                ):
+                    conn.execute(AssetKeyTable.insert(), rows)
+
+                for rows in _group_rows_by_columns(
+                    dict(b_asset_key=asset_key, **values)
+                    for asset_key, values in values_by_asset_key.items()
+                    if asset_key in existing_asset_keys and values
+                ):
+                    conn.execute(
+                        AssetKeyTable.update()
+                        .where(AssetKeyTable.c.asset_key == db.bindparam("b_asset_key"))
+                        .values(
+                            {
+                                column: db.bindparam(column)
+                                for column in rows[0].keys()
+                                if column != "b_asset_key"
+                            }
+                        ),
+                        rows,
+                    )
+        except db_exc.IntegrityError:
+            # another process inserted one of the new asset keys in the meantime, fall back to
+            # upserting the asset keys one event at a time
+            for event, event_id in zip(events, event_ids):
+                self.store_asset_event(event, event_id)
+
+    def _get_asset_entry_values_by_asset_key(
+        self,
+        events: Sequence[EventLogEntry],
+        event_ids: Sequence[int],
+        has_asset_key_index_cols: bool,
+    ) -> Mapping[str, Mapping[str, Any]]:
+        # Applying the entry values of each event in order is equivalent to storing the events one
+        # at a time, since each event only overwrites the columns it updates.
+        values_by_asset_key: Dict[str, Dict[str, Any]] = {}
+        for event, event_id in zip(events, event_ids):
+            if not (event.dagster_event and event.dagster_event.asset_key):
+                continue
+            asset_key_str = event.dagster_event.asset_key.to_string()
+            values_by_asset_key.setdefault(asset_key_str, {}).update(
+                self._get_asset_entry_values(event, event_id, has_asset_key_index_cols)
+            )
+        return values_by_asset_key
+
     def _get_asset_entry_values(
         self, event: EventLogEntry, event_id: int, has_asset_key_index_cols: bool
     ) -> Dict[str, Any]:
@@ -461,10 +558,116 @@ def store_event(self, event: EventLogEntry) -> None:
                 )
 
             self.store_asset_event_tags([event], [event_id])
+            self.update_asset_cached_status_data_for_events([event], [event_id])
 
         if event.is_dagster_event and event.dagster_event_type in ASSET_CHECK_EVENTS:
             self.store_asset_check_event(event, event_id)
 
+    def store_event_batch(self, events: Sequence[EventLogEntry]) -> None:
+        """Store a batch of events.
+
+        The events of each run are inserted with a single statement, and the asset key, asset event
+        tag and asset check index tables are each written with one statement per run. If storing
+        the events of a run fails after the events of another run were stored, a
+        DagsterEventBatchPartiallyStoredError with the events that were not stored is raised.
+
+        Args:
+            events (Sequence[EventLogEntry]): The events to store.
+        """
+        check.sequence_param(events, "events", of_type=EventLogEntry)
+        if not events:
+            return
+
+        events_by_run = [
+            [events[i] for i in indices] for _, indices in _group_event_indices_by_run_id(events)
+        ]
+        for run_index, run_events in enumerate(events_by_run):
+            are_run_events_stored = False
+            try:
+                event_ids = self._insert_run_event_batch(run_events)
+                are_run_events_stored = True
+                self._store_run_event_batch_index_rows(run_events, event_ids)
+            except Exception as e:
+                if run_index == 0 and not are_run_events_stored:
+                    raise
+                # the event inserts of each run are committed separately from each other and from
+                # the index rows, so only the events of the later runs can be stored again
+                # without duplicating them
+                unstored_events = [
+                    event
+                    for later_run_events in events_by_run[
+                        run_index + 1 if are_run_events_stored else run_index :
+                    ]
+                    for event in later_run_events
+                ]
+                num_stored_events = len(events) - len(unstored_events)
+                raise DagsterEventBatchPartiallyStoredError(
+                    f"Failed to store a batch of events after storing {num_stored_events} of its"
+                    f" {len(events)} events",
+                    unstored_events=unstored_events,
+                ) from e
+
+    def _insert_run_event_batch(self, events: Sequence[EventLogEntry]) -> Sequence[Optional[int]]:
+        """Inserts a batch of events of a single run and returns their storage ids, in the order of
+        the events.
+        """
+        with self.run_connection(events[0].run_id) as conn:
+            return self._insert_event_batch(conn, events)
+
+    def _store_run_event_batch_index_rows(
+        self, events: Sequence[EventLogEntry], event_ids: Sequence[Optional[int]]
+    ) -> None:
+        self._store_event_batch_index_rows(events, event_ids)
+
+    def _insert_event_batch(
+        self, conn: Connection, events: Sequence[EventLogEntry]
+    ) -> Sequence[int]:
+        """Inserts a batch of events and returns their storage ids, in the order of the events.
+
+        Uses a single multi-row insert when the dialect can return the inserted ids, and falls back
+        to one insert per event over the same connection otherwise.
+        """
+        if getattr(conn.dialect, "insert_returning", False):
+            result = conn.execute(
+                self.prepare_insert_event_batch(events).returning(SqlEventLogStorageTable.c.id)
+            )
+            # ids are assigned in insertion order, but rows may be returned in any order
+            return sorted(int(row[0]) for row in result.fetchall())
+
+        return [
+            conn.execute(self.prepare_insert_event(event)).inserted_primary_key[0]
+            for event in events
+        ]
+
+    def _store_event_batch_index_rows(
+        self, events: Sequence[EventLogEntry], event_ids: Sequence[Optional[int]]
+    ) -> None:
+        asset_events = []
+        asset_event_ids = []
+        asset_check_events = []
+        asset_check_event_ids = []
+        for event, event_id in zip(events, event_ids):
+            if not event.is_dagster_event:
+                continue
+            if event.dagster_event_type in ASSET_EVENTS and event.get_dagster_event().asset_key:
+                if event_id is None:
+                    raise DagsterInvariantViolationError(
+                        "Cannot store asset event tags for null event id."
+                    )
+                asset_events.append(event)
+                asset_event_ids.append(event_id)
+            if event.dagster_event_type in ASSET_CHECK_EVENTS:
+                asset_check_events.append(event)
+                asset_check_event_ids.append(event_id)
+
+        if asset_events:
+            self.store_asset_event_batch(asset_events, asset_event_ids)
+            self.store_asset_event_tags(asset_events, asset_event_ids)
+            self.update_asset_cached_status_data_for_events(asset_events, asset_event_ids)
+
+        if asset_check_events:
+            self.store_asset_check_event_batch(asset_check_events, asset_check_event_ids)
+
     def get_records_for_run(
         self,
         run_id,
@@ -534,10 +737,7 @@ def get_records_for_run(
                 json_str,
             ) in results:
                 records.append(
-                    EventLogRecord(
-                        storage_id=record_id,
-                        event_log_entry=deserialize_value(json_str, EventLogEntry),
-                    )
+                    LazyEventLogRecord(storage_id=record_id, serialized_event_log_entry=json_str)
                 )
                 last_record_id = record_id
         except (seven.JSONDecodeError, DeserializationError) as err:
@@ -558,6 +758,60 @@ def get_records_for_run(
             has_more=bool(limit and len(results) == limit),
         )
 
+    def get_records_after_storage_ids(
+        self,
+        storage_ids_by_run_id: Mapping[str, int],
+        limit: Optional[int] = None,
+    ) -> Sequence[EventLogRecord]:
+        """Get the logs of multiple runs with a single query, used to watch many runs at once.
+
+        Only supported by storages that keep the events of all runs in the same database.
+
+        Args:
+            storage_ids_by_run_id (Mapping[str, int]): For each run to fetch logs for, the storage
+                id after which logs should be returned.
+            limit (Optional[int]): the maximum number of events to fetch
+
+        Returns:
+            Sequence[EventLogRecord]: The logs of all of the given runs, in storage id order.
+        """
+        check.mapping_param(storage_ids_by_run_id, "storage_ids_by_run_id", str, int)
+        check.opt_int_param(limit, "limit")
+
+        if not storage_ids_by_run_id:
+            return []
+
+        query = (
+            db_select([SqlEventLogStorageTable.c.id, SqlEventLogStorageTable.c.event])
+            .where(
+                db.or_(
+                    *[
+                        db.and_(
+                            SqlEventLogStorageTable.c.run_id == run_id,
+                            SqlEventLogStorageTable.c.id > storage_id,
+                        )
+                        for run_id, storage_id in storage_ids_by_run_id.items()
+                    ]
+                )
+            )
+            .order_by(SqlEventLogStorageTable.c.id.asc())
+        )
+        if limit:
+            query = query.limit(limit)
+
+        with self.index_connection() as conn:
+            results = conn.execute(query).fetchall()
+
+        records = []
+        for record_id, json_str in results:
+            try:
+                records.append(
+                    LazyEventLogRecord(storage_id=record_id, serialized_event_log_entry=json_str)
+                )
+            except (seven.JSONDecodeError, DeserializationError):
+                logging.warning("Could not parse event record id `%s`.", record_id)
+        return records
+
     def get_stats_for_run(self, run_id: str) -> DagsterRunStatsSnapshot:
         check.str_param(run_id, "run_id")
 
@@ -1005,15 +1259,12 @@ def _get_event_records(
         event_records = []
         for row_id, json_str in results:
             try:
-                event_record = deserialize_value(json_str, NamedTuple)
-                if not isinstance(event_record, EventLogEntry):
-                    logging.warning(
-                        "Could not resolve event record as EventLogEntry for id `%s`.", row_id
-                    )
-                    continue
-
                 event_records.append(
-                    EventLogRecord(storage_id=row_id, event_log_entry=event_record)
+                    LazyEventLogRecord(storage_id=row_id, serialized_event_log_entry=json_str)
+                )
+            except DeserializationError:
+                logging.warning(
+                    "Could not resolve event record as EventLogEntry for id `%s`.", row_id
                 )
             except seven.JSONDecodeError:
                 logging.warning("Could not parse event record id `%s`.", row_id)
@@ -1524,6 +1775,124 @@ def update_asset_cached_status_data(
                     .values(cached_status_data=serialize_value(cache_values))
                 )
 
+    def update_asset_cached_status_data_if_unchanged(
+        self,
+        asset_key: AssetKey,
+        expected_cache_value: Optional["AssetStatusCacheValue"],
+        cache_values: "AssetStatusCacheValue",
+    ) -> bool:
+        if not self.can_read_asset_status_cache():
+            return False
+
+        with self.index_connection() as conn:
+            return self._compare_and_set_asset_cached_status_data(
+                conn,
+                asset_key,
+                serialize_value(expected_cache_value) if expected_cache_value else None,
+                serialize_value(cache_values),
+            )
+
+    def _compare_and_set_asset_cached_status_data(
+        self,
+        conn: Connection,
+        asset_key: AssetKey,
+        expected_db_string: Optional[str],
+        db_string: str,
+    ) -> bool:
+        result = conn.execute(
+            AssetKeyTable.update()
+            .where(
+                db.and_(
+                    AssetKeyTable.c.asset_key == asset_key.to_string(),
+                    (
+                        AssetKeyTable.c.cached_status_data == expected_db_string
+                        if expected_db_string is not None
+                        else AssetKeyTable.c.cached_status_data.is_(None)
+                    ),
+                )
+            )
+            .values(cached_status_data=db_string)
+        )
+        return result.rowcount > 0
+
+    def update_asset_cached_status_data_for_events(
+        self, events: Sequence[EventLogEntry], event_ids: Sequence[Optional[int]]
+    ) -> None:
+        """Updates the cached status of the assets of newly stored events, if the instance is
+        configured to update the asset status cache on write.
+
+        Cached values are updated with a compare-and-set, so that concurrent writers and readers of
+        the cache do not lose each other's updates. Assets without a cached value are skipped, since
+        the next read builds their cached value from the event log. Cached values which accumulate
+        too many partition keys that have not been merged by a read are cleared as well.
+        """
+        from dagster._core.storage.partition_status_cache import (
+            MAX_UNMERGED_MATERIALIZED_PARTITION_KEYS,
+            AssetStatusCacheValue,
+        )
+
+        if not (self.has_instance and self._instance.asset_status_cache_update_on_write):
+            return
+
+        records_by_asset_key: Dict[AssetKey, List[EventLogRecord]] = defaultdict(list)
+        for event, event_id in zip(events, event_ids):
+            if event_id is None or event.dagster_event_type not in {
+                DagsterEventType.ASSET_MATERIALIZATION,
+                DagsterEventType.ASSET_MATERIALIZATION_PLANNED,
+            }:
+                continue
+            asset_key = event.get_dagster_event().asset_key
+            if asset_key:
+                records_by_asset_key[asset_key].append(
+                    EventLogRecord(storage_id=event_id, event_log_entry=event)
+                )
+
+        if not records_by_asset_key or not self.can_read_asset_status_cache():
+            return
+
+        with self.index_connection() as conn:
+            rows = conn.execute(
+                db_select([AssetKeyTable.c.asset_key, AssetKeyTable.c.cached_status_data]).where(
+                    AssetKeyTable.c.asset_key.in_(
+                        [asset_key.to_string() for asset_key in records_by_asset_key.keys()]
+                    )
+                )
+            ).fetchall()
+        db_string_by_asset_key = {asset_key_str: db_string for asset_key_str, db_string in rows}
+
+        for asset_key, records in records_by_asset_key.items():
+            db_string = db_string_by_asset_key.get(asset_key.to_string())
+            for _ in range(ASSET_STATUS_CACHE_UPDATE_ATTEMPTS):
+                cache_value = AssetStatusCacheValue.from_db_string(db_string) if db_string else None
+                if cache_value is None:
+                    break
+
+                new_cache_value = cache_value.with_new_event_records(records)
+                if (
+                    len(new_cache_value.unmerged_materialized_partition_keys or [])
+                    > MAX_UNMERGED_MATERIALIZED_PARTITION_KEYS
+                ):
+                    # reads have not merged the recorded partition keys for a while, e.g. because
+                    # their updates kept conflicting with those of writers, so rather than
+                    # growing the cached value with each write, clear it to be rebuilt on read
+                    self.wipe_asset_cached_status(asset_key)
+                    break
+
+                with self.index_connection() as conn:
+                    if self._compare_and_set_asset_cached_status_data(
+                        conn, asset_key, db_string, serialize_value(new_cache_value)
+                    ):
+                        break
+                    db_string = conn.execute(
+                        db_select([AssetKeyTable.c.cached_status_data]).where(
+                            AssetKeyTable.c.asset_key == asset_key.to_string()
+                        )
+                    ).scalar()
+            else:
+                # clear the cached value rather than risk losing these events from it, so that the
+                # next read rebuilds it from the event log
+                self.wipe_asset_cached_status(asset_key)
+
     def _fetch_backcompat_materialization_times(
         self, asset_keys: Sequence[AssetKey]
     ) -> Mapping[AssetKey, datetime]:
@@ -2793,6 +3162,111 @@ def store_asset_check_event(self, event: EventLogEntry, event_id: Optional[int])
             else:
                 self._update_asset_check_evaluation(event, event_id)
 
+    def store_asset_check_event_batch(
+        self, events: Sequence[EventLogEntry], event_ids: Sequence[Optional[int]]
+    ) -> None:
+        """Writes the asset check executions table for a batch of asset check events, with one
+        insert statement for planned and runless evaluation events and one update statement for
+        evaluations of planned checks.
+        """
+        check.sequence_param(events, "events", EventLogEntry)
+        check.sequence_param(event_ids, "event_ids")
+
+        check.invariant(
+            self.supports_asset_checks,
+            "Asset checks require a database schema migration. Run `dagster instance migrate`.",
+        )
+
+        inserted_rows = []
+        updated_rows = []
+        for event, event_id in zip(events, event_ids):
+            if event.dagster_event_type == DagsterEventType.ASSET_CHECK_EVALUATION_PLANNED:
+                planned = cast(
+                    AssetCheckEvaluationPlanned,
+                    check.not_none(event.dagster_event).event_specific_data,
+                )
+                inserted_rows.append(
+                    dict(
+                        asset_key=planned.asset_key.to_string(),
+                        check_name=planned.check_name,
+                        run_id=event.run_id,
+                        execution_status=AssetCheckExecutionRecordStatus.PLANNED.value,
+                        evaluation_event=serialize_value(event),
+                        evaluation_event_timestamp=self._event_insert_timestamp(event),
+                        evaluation_event_storage_id=None,
+                        materialization_event_storage_id=None,
+                    )
+                )
+            elif event.dagster_event_type == DagsterEventType.ASSET_CHECK_EVALUATION:
+                evaluation = cast(
+                    AssetCheckEvaluation, check.not_none(event.dagster_event).event_specific_data
+                )
+                values = dict(
+                    execution_status=(
+                        AssetCheckExecutionRecordStatus.SUCCEEDED.value
+                        if evaluation.passed
+                        else AssetCheckExecutionRecordStatus.FAILED.value
+                    ),
+                    evaluation_event=serialize_value(event),
+                    evaluation_event_timestamp=self._event_insert_timestamp(event),
+                    evaluation_event_storage_id=event_id,
+                    materialization_event_storage_id=(
+                        evaluation.target_materialization_data.storage_id
+                        if evaluation.target_materialization_data
+                        else None
+                    ),
+                )
+                if event.run_id == "" or event.run_id is None:
+                    inserted_rows.append(
+                        dict(
+                            asset_key=evaluation.asset_key.to_string(),
+                            check_name=evaluation.check_name,
+                            run_id=event.run_id,
+                            **values,
+                        )
+                    )
+                else:
+                    updated_rows.append(
+                        dict(
+                            b_asset_key=evaluation.asset_key.to_string(),
+                            b_check_name=evaluation.check_name,
+                            b_run_id=event.run_id,
+                            **values,
+                        )
+                    )
+
+        with self.index_transaction() as conn:
+            if inserted_rows:
+                conn.execute(AssetCheckExecutionsTable.insert(), inserted_rows)
+            if updated_rows:
+                rows_updated = conn.execute(
+                    AssetCheckExecutionsTable.update()
+                    .where(
+                        # (asset_key, check_name, run_id) uniquely identifies the row created for
+                        # the planned event
+                        db.and_(
+                            AssetCheckExecutionsTable.c.asset_key == db.bindparam("b_asset_key"),
+                            AssetCheckExecutionsTable.c.check_name == db.bindparam("b_check_name"),
+                            AssetCheckExecutionsTable.c.run_id == db.bindparam("b_run_id"),
+                        )
+                    )
+                    .values(
+                        {
+                            column: db.bindparam(column)
+                            for column in updated_rows[0].keys()
+                            if not column.startswith("b_")
+                        }
+                    ),
+                    updated_rows,
+                ).rowcount
+
+                # rowcounts are only reliable for multi-row updates on some dialects
+                if conn.dialect.supports_sane_multi_rowcount and rows_updated > len(updated_rows):
+                    raise DagsterInvariantViolationError(
+                        f"Updated {rows_updated} rows for {len(updated_rows)} asset check"
+                        " evaluations as a result of duplicate AssetCheckPlanned events."
+                    )
+
     def _store_asset_check_evaluation_planned(
         self, event: EventLogEntry, event_id: Optional[int]
     ) -> None:
@@ -24,7 +24,12 @@
 from dagster._config.config_schema import UserConfigSchema
 from dagster._core.definitions.events import AssetKey
 from dagster._core.errors import DagsterInvariantViolationError
-from dagster._core.event_api import EventHandlerFn, EventRecordsResult, RunStatusChangeRecordsFilter
+from dagster._core.event_api import (
+    EventHandlerFn,
+    EventRecordsResult,
+    LazyEventLogRecord,
+    RunStatusChangeRecordsFilter,
+)
 from dagster._core.events import (
     ASSET_CHECK_EVENTS,
     ASSET_EVENTS,
@@ -55,7 +60,6 @@
 )
 from dagster._serdes import ConfigurableClass, ConfigurableClassData
 from dagster._serdes.errors import DeserializationError
-from dagster._serdes.serdes import deserialize_value
 from dagster._utils import mkdir_p
 
 if TYPE_CHECKING:
@@ -277,6 +281,7 @@ def store_event(self, event: EventLogEntry) -> None:
                 )
 
             self.store_asset_event_tags([event], [event_id])
+            self.update_asset_cached_status_data_for_events([event], [event_id])
 
         if event.is_dagster_event and event.dagster_event_type in ASSET_CHECK_EVENTS:
             self.store_asset_check_event(event, None)
@@ -286,6 +291,47 @@ def store_event(self, event: EventLogEntry) -> None:
             with self.index_connection() as conn:
                 conn.execute(insert_event_statement)
 
+    def _insert_run_event_batch(self, events: Sequence[EventLogEntry]) -> Sequence[Optional[int]]:
+        """Overridden method to write the events of a run to its shard with a single statement. The
+        storage ids of the run shard are not used to index the events, so they are not returned.
+        """
+        with self.run_connection(events[0].run_id) as conn:
+            conn.execute(self.prepare_insert_event_batch(events))
+        return [None] * len(events)
+
+    def _store_run_event_batch_index_rows(
+        self, events: Sequence[EventLogEntry], event_ids: Sequence[Optional[int]]
+    ) -> None:
+        """Overridden method to mirror the asset and run status events of a run in the index shard,
+        and to index them by their storage ids in the index shard.
+        """
+        index_events = []
+        for event in events:
+            if not event.is_dagster_event:
+                continue
+            if event.get_dagster_event().asset_key:
+                check.invariant(
+                    event.dagster_event_type in ASSET_EVENTS,
+                    "Can only store asset materializations, materialization_planned, and"
+                    " observations in index database",
+                )
+                index_events.append(event)
+            elif event.dagster_event_type in EVENT_TYPE_TO_PIPELINE_RUN_STATUS:
+                # should mirror run status change events in the index shard
+                index_events.append(event)
+
+        index_event_ids: Sequence[int] = []
+        if index_events:
+            with self.index_connection() as conn:
+                index_event_ids = self._insert_event_batch(conn, index_events)
+
+        event_id_by_index_event = {
+            id(event): event_id for event, event_id in zip(index_events, index_event_ids)
+        }
+        self._store_event_batch_index_rows(
+            events, [event_id_by_index_event.get(id(event)) for event in events]
+        )
+
     def get_event_records(
         self,
         event_records_filter: EventRecordsFilter,
@@ -371,9 +417,8 @@ def _get_run_sharded_event_records(
 
             for row_id, json_str in results:
                 try:
-                    event_record = deserialize_value(json_str, EventLogEntry)
                     event_records.append(
-                        EventLogRecord(storage_id=row_id, event_log_entry=event_record)
+                        LazyEventLogRecord(storage_id=row_id, serialized_event_log_entry=json_str)
                     )
                     if limit and len(event_records) >= limit:
                         break
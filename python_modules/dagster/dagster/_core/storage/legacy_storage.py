@@ -240,6 +240,11 @@ def get_run_tags(
     ) -> Sequence[Tuple[str, Set[str]]]:
         return self._storage.run_storage.get_run_tags(tag_keys, value_prefix, limit)
 
+    def get_run_tag_counts(
+        self, tag_keys: Sequence[str], filters: Optional["RunsFilter"] = None
+    ) -> Mapping[Tuple[str, str], int]:
+        return self._storage.run_storage.get_run_tag_counts(tag_keys, filters)
+
     def get_run_tag_keys(self) -> Sequence[str]:
         return self._storage.run_storage.get_run_tag_keys()
 
@@ -414,6 +419,9 @@ def get_step_stats_for_run(
     def store_event(self, event: "EventLogEntry") -> None:
         return self._storage.event_log_storage.store_event(event)
 
+    def store_event_batch(self, events: Sequence["EventLogEntry"]) -> None:
+        return self._storage.event_log_storage.store_event_batch(events)
+
     def delete_events(self, run_id: str) -> None:
         return self._storage.event_log_storage.delete_events(run_id)
 
@@ -632,6 +640,18 @@ def update_asset_cached_status_data(
             asset_key=asset_key, cache_values=cache_values
         )
 
+    def update_asset_cached_status_data_if_unchanged(
+        self,
+        asset_key: "AssetKey",
+        expected_cache_value: Optional["AssetStatusCacheValue"],
+        cache_values: "AssetStatusCacheValue",
+    ) -> bool:
+        return self._storage.event_log_storage.update_asset_cached_status_data_if_unchanged(
+            asset_key=asset_key,
+            expected_cache_value=expected_cache_value,
+            cache_values=cache_values,
+        )
+
     def get_records_for_run(
         self,
         run_id: str,
@@ -20,6 +20,7 @@
     StaticPartitionsDefinition,
 )
 from dagster._core.definitions.time_window_partitions import TimeWindowPartitionsDefinition
+from dagster._core.events import DagsterEventType
 from dagster._core.instance import DynamicPartitionsStore
 from dagster._core.loader import LoadableBy, LoadingContext
 from dagster._core.storage.dagster_run import FINISHED_STATUSES, RunsFilter
@@ -33,6 +34,7 @@
 from dagster._time import get_current_datetime
 
 if TYPE_CHECKING:
+    from dagster._core.event_api import EventLogRecord
     from dagster._core.storage.event_log.base import AssetRecord
 
 
@@ -43,6 +45,9 @@
     DynamicPartitionsDefinition,
 )
 RUN_FETCH_BATCH_SIZE = 100
+# the maximum number of materialized partition keys that are recorded in a cached status value as
+# events are stored, before the cached value is cleared and rebuilt from the event log on read
+MAX_UNMERGED_MATERIALIZED_PARTITION_KEYS = 1000
 
 
 class AssetPartitionStatus(Enum):
@@ -80,6 +85,7 @@ class AssetStatusCacheValue(
             ("serialized_failed_partition_subset", Optional[str]),
             ("serialized_in_progress_partition_subset", Optional[str]),
             ("earliest_in_progress_materialization_event_id", Optional[int]),
+            ("unmerged_materialized_partition_keys", Optional[Sequence[str]]),
         ],
     ),
     LoadableBy[Tuple[AssetKey, PartitionsDefinition]],
@@ -102,6 +108,10 @@ class AssetStatusCacheValue(
         earliest_in_progress_materialization_event_id (Optional(int)): The event id of the earliest
             materialization planned event for a run that is still in progress. This is used to check
             on the status of runs that are still in progress.
+        unmerged_materialized_partition_keys (Optional(Sequence[str])): The keys of partitions
+            materialized up to the latest storage id that have not yet been merged into the
+            serialized materialized partition subset. Set when the cache value is updated as events
+            are stored, without access to the partitions definition, and merged on the next read.
     """
 
     def __new__(
@@ -112,6 +122,7 @@ def __new__(
         serialized_failed_partition_subset: Optional[str] = None,
         serialized_in_progress_partition_subset: Optional[str] = None,
         earliest_in_progress_materialization_event_id: Optional[int] = None,
+        unmerged_materialized_partition_keys: Optional[Sequence[str]] = None,
     ):
         check.int_param(latest_storage_id, "latest_storage_id")
         check.opt_str_param(partitions_def_id, "partitions_def_id")
@@ -124,6 +135,11 @@ def __new__(
         check.opt_str_param(
             serialized_in_progress_partition_subset, "serialized_in_progress_partition_subset"
         )
+        check.opt_sequence_param(
+            unmerged_materialized_partition_keys,
+            "unmerged_materialized_partition_keys",
+            of_type=str,
+        )
         return super(AssetStatusCacheValue, cls).__new__(
             cls,
             latest_storage_id,
@@ -132,6 +148,7 @@ def __new__(
             serialized_failed_partition_subset,
             serialized_in_progress_partition_subset,
             earliest_in_progress_materialization_event_id,
+            unmerged_materialized_partition_keys,
         )
 
     @staticmethod
@@ -146,6 +163,50 @@ def from_db_string(db_string: str) -> Optional["AssetStatusCacheValue"]:
 
         return cached_data
 
+    def with_new_event_records(
+        self, event_records: Sequence["EventLogRecord"]
+    ) -> "AssetStatusCacheValue":
+        """Returns this cache value updated with newly stored events of the asset, without needing
+        the partitions definition of the asset to deserialize the cached subsets.
+
+        Materialized partitions are recorded as unmerged partition keys, which are merged into the
+        materialized and failed subsets on the next read. Planned materializations move back the
+        earliest in progress materialization event id, so that the next read checks on the status of
+        their runs.
+        """
+        latest_storage_id = self.latest_storage_id
+        earliest_in_progress_materialization_event_id = (
+            self.earliest_in_progress_materialization_event_id
+        )
+        unmerged_materialized_partition_keys = set(self.unmerged_materialized_partition_keys or [])
+
+        for record in event_records:
+            event_type = record.event_log_entry.dagster_event_type
+            if event_type == DagsterEventType.ASSET_MATERIALIZATION:
+                # the cached subsets are only maintained for partitioned assets
+                if self.partitions_def_id is not None and record.partition_key is not None:
+                    unmerged_materialized_partition_keys.add(record.partition_key)
+            elif event_type == DagsterEventType.ASSET_MATERIALIZATION_PLANNED:
+                if self.partitions_def_id is not None:
+                    earliest_in_progress_materialization_event_id = min(
+                        earliest_in_progress_materialization_event_id or record.storage_id,
+                        record.storage_id,
+                    )
+            else:
+                continue
+
+            latest_storage_id = max(latest_storage_id, record.storage_id)
+
+        return self._replace(
+            latest_storage_id=latest_storage_id,
+            earliest_in_progress_materialization_event_id=earliest_in_progress_materialization_event_id,
+            unmerged_materialized_partition_keys=(
+                sorted(unmerged_materialized_partition_keys)
+                if unmerged_materialized_partition_keys
+                else None
+            ),
+        )
+
     @classmethod
     def _blocking_batch_load(
         cls, keys: Iterable[Tuple[AssetKey, PartitionsDefinition]], context: LoadingContext
@@ -282,6 +343,40 @@ def get_last_planned_storage_id(
     return info.storage_id
 
 
+def _is_stored_cache_value_current(
+    instance: DagsterInstance,
+    asset_key: AssetKey,
+    stored_cache_value: AssetStatusCacheValue,
+    asset_record: Optional["AssetRecord"],
+) -> bool:
+    """Whether the stored cache value already reflects every materialization and planned
+    materialization of the asset, along with the status of the runs that planned them, so that
+    rebuilding it would not change it.
+    """
+    if (
+        stored_cache_value.unmerged_materialized_partition_keys
+        or stored_cache_value.earliest_in_progress_materialization_event_id is not None
+    ):
+        # partition keys need to be merged, or the status of in progress runs needs to be checked
+        return False
+
+    last_materialization_storage_id = (
+        asset_record.asset_entry.last_materialization_storage_id if asset_record else None
+    )
+    if (last_materialization_storage_id or 0) > stored_cache_value.latest_storage_id:
+        return False
+
+    if instance.event_log_storage.asset_records_have_last_planned_materialization_storage_id:
+        return (
+            get_last_planned_storage_id(instance, asset_key, asset_record)
+            <= stored_cache_value.latest_storage_id
+        )
+
+    # finding the last planned materialization requires querying the event log, unless the cached
+    # value is updated with planned materializations as they are stored
+    return instance.asset_status_cache_update_on_write
+
+
 def _build_status_cache(
     instance: DagsterInstance,
     asset_key: AssetKey,
@@ -342,6 +437,13 @@ def _build_status_cache(
                     asset_key, after_cursor=stored_cache_value.latest_storage_id
                 ),
             )
+        if stored_cache_value.unmerged_materialized_partition_keys:
+            # merge the partitions that were materialized since the subsets were last serialized
+            new_partitions |= get_validated_partition_keys(
+                dynamic_partitions_store,
+                partitions_def,
+                set(stored_cache_value.unmerged_materialized_partition_keys),
+            )
 
         materialized_subset: PartitionsSubset = (
             partitions_def.deserialize_subset(
@@ -490,13 +592,24 @@ def get_and_update_asset_status_cache_value(
         stored_cache_value = asset_record.asset_entry.cached_status
 
     dynamic_partitions_store = dynamic_partitions_loader if dynamic_partitions_loader else instance
+    partitions_def_id = (
+        partitions_def.get_serializable_unique_identifier(
+            dynamic_partitions_store=dynamic_partitions_store
+        )
+        if partitions_def
+        else None
+    )
+    if (
+        stored_cache_value
+        and stored_cache_value.partitions_def_id == partitions_def_id
+        and _is_stored_cache_value_current(instance, asset_key, stored_cache_value, asset_record)
+    ):
+        return stored_cache_value
+
     use_cached_value = (
         stored_cache_value
         and partitions_def
-        and stored_cache_value.partitions_def_id
-        == partitions_def.get_serializable_unique_identifier(
-            dynamic_partitions_store=dynamic_partitions_store
-        )
+        and stored_cache_value.partitions_def_id == partitions_def_id
     )
     updated_cache_value = _build_status_cache(
         instance=instance,
@@ -511,6 +624,13 @@ def get_and_update_asset_status_cache_value(
         and instance.event_log_storage.can_write_asset_status_cache()
         and updated_cache_value != stored_cache_value
     ):
-        instance.update_asset_cached_status_data(asset_key, updated_cache_value)
+        if instance.asset_status_cache_update_on_write:
+            # the cached value may have been updated with new events since it was read, in which
+            # case it is left for the next read to merge them
+            instance.event_log_storage.update_asset_cached_status_data_if_unchanged(
+                asset_key, stored_cache_value, updated_cache_value
+            )
+        else:
+            instance.update_asset_cached_status_data(asset_key, updated_cache_value)
 
     return updated_cache_value
@@ -174,6 +174,25 @@ def get_run_tags(
             List[Tuple[str, Set[str]]]
         """
 
+    def get_run_tag_counts(
+        self, tag_keys: Sequence[str], filters: Optional[RunsFilter] = None
+    ) -> Mapping[Tuple[str, str], int]:
+        """Get the number of runs matching the given filters with each value of the given tag keys.
+
+        Args:
+            tag_keys (Sequence[str]): tag keys to count runs by.
+            filters (Optional[RunsFilter]): the filter by which to filter runs.
+
+        Returns:
+            Mapping[Tuple[str, str], int]: the number of runs by tag key and value.
+        """
+        counts: Dict[Tuple[str, str], int] = {}
+        for run in self.get_runs(filters=filters):
+            for key in tag_keys:
+                if key in run.tags:
+                    counts[(key, run.tags[key])] = counts.get((key, run.tags[key]), 0) + 1
+        return counts
+
     @abstractmethod
     def get_run_tag_keys(self) -> Sequence[str]:
         """Get a list of tag keys.
@@ -86,7 +86,7 @@
     RUN_FAILURE_REASON_TAG,
 )
 from dagster._daemon.types import DaemonHeartbeat
-from dagster._serdes import deserialize_value, serialize_value
+from dagster._serdes import deserialize_value, is_binary_serialized_value, serialize_value
 from dagster._serdes.serdes import deserialize_values
 from dagster._seven import JSONDecodeError
 from dagster._time import datetime_from_timestamp, get_current_datetime, utc_datetime_from_naive
@@ -462,6 +462,27 @@ def get_run_tags(
             result[r["key"]].add(r["value"])
         return sorted(list([(k, v) for k, v in result.items()]), key=lambda x: x[0])
 
+    def get_run_tag_counts(
+        self, tag_keys: Sequence[str], filters: Optional[RunsFilter] = None
+    ) -> Mapping[Tuple[str, str], int]:
+        check.sequence_param(tag_keys, "tag_keys", of_type=str)
+        if not tag_keys:
+            return {}
+
+        runs_subquery = db_subquery(
+            self._runs_query(filters=filters, columns=["run_id"]), "filtered_runs"
+        )
+        query = (
+            db_select([RunTagsTable.c.key, RunTagsTable.c.value, db.func.count().label("count")])
+            .select_from(
+                RunTagsTable.join(runs_subquery, RunTagsTable.c.run_id == runs_subquery.c.run_id)
+            )
+            .where(RunTagsTable.c.key.in_(tag_keys))
+            .group_by(RunTagsTable.c.key, RunTagsTable.c.value)
+        )
+        rows = self.fetchall(query)
+        return {(row["key"], row["value"]): row["count"] for row in rows}
+
     def get_run_tag_keys(self) -> Sequence[str]:
         query = db_select([RunTagsTable.c.key]).distinct().order_by(RunTagsTable.c.key)
         rows = self.fetchall(query)
@@ -589,7 +610,7 @@ def get_job_snapshot(self, job_snapshot_id: str) -> JobSnap:
 
     def has_execution_plan_snapshot(self, execution_plan_snapshot_id: str) -> bool:
         check.str_param(execution_plan_snapshot_id, "execution_plan_snapshot_id")
-        return bool(self.get_execution_plan_snapshot(execution_plan_snapshot_id))
+        return self._has_snapshot_id(execution_plan_snapshot_id)
 
     def add_execution_plan_snapshot(
         self, execution_plan_snapshot: ExecutionPlanSnapshot, snapshot_id: Optional[str] = None
@@ -1152,6 +1173,9 @@ def _warn(msg: str) -> None:
         _warn("Could not decompress bytes stored in snapshot table.")
         return None
 
+    if is_binary_serialized_value(uncompressed_bytes):
+        return deserialize_value(uncompressed_bytes, (ExecutionPlanSnapshot, JobSnap))
+
     try:
         decoded_str = uncompressed_bytes.decode("utf-8")
     except UnicodeDecodeError:
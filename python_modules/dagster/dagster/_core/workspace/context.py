@@ -635,7 +635,11 @@ def __init__(
             workspace_load_target, "workspace_load_target", WorkspaceLoadTarget
         )
 
+        from dagster._api.snapshot_repository import create_repository_snap_piece_cache
+
         self._read_only = read_only
+        # the snapshot pieces of the code locations of this workspace, kept across reloads
+        self._snapshot_piece_cache = create_repository_snap_piece_cache()
 
         self._version = version
 
@@ -770,6 +774,17 @@ def _load_location(self, origin: CodeLocationOrigin, reload: bool) -> CodeLocati
                     watch_server=False,
                     grpc_server_registry=self._grpc_server_registry,
                     instance=self._instance,
+                    snapshot_piece_cache=self._snapshot_piece_cache,
+                )
+            elif isinstance(origin, GrpcServerCodeLocationOrigin):
+                location = (
+                    origin.reload_location(
+                        self.instance, snapshot_piece_cache=self._snapshot_piece_cache
+                    )
+                    if reload
+                    else origin.create_location(
+                        self.instance, snapshot_piece_cache=self._snapshot_piece_cache
+                    )
                 )
             else:
                 location = (
@@ -2,9 +2,10 @@
 import sys
 import threading
 import time
-from concurrent.futures import ThreadPoolExecutor, as_completed
+from collections import defaultdict, deque
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, as_completed, wait
 from contextlib import ExitStack
-from typing import Dict, Iterable, Iterator, List, Optional, Sequence
+from typing import AbstractSet, Deque, Dict, Iterable, Iterator, List, Optional, Sequence
 
 from dagster import (
     DagsterEvent,
@@ -84,6 +85,20 @@ def run_iteration(
         run_queue_config = run_coordinator.get_run_queue_config()
 
         instance = workspace_process_context.instance
+        if run_coordinator.bulk_dequeue_enabled:
+            runs_to_dequeue = self._get_runs_to_dequeue_bulk(
+                instance, run_queue_config, fixed_iteration_time=fixed_iteration_time
+            )
+            yield from self._dequeue_runs_iter_bulk(
+                workspace_process_context,
+                runs_to_dequeue,
+                run_coordinator.dequeue_num_workers,
+                run_coordinator.bulk_dequeue_max_launches_per_location,
+                run_queue_config,
+                fixed_iteration_time=fixed_iteration_time,
+            )
+            return
+
         runs_to_dequeue = self._get_runs_to_dequeue(
             instance, run_queue_config, fixed_iteration_time=fixed_iteration_time
         )
@@ -185,6 +200,75 @@ def _dequeue_runs_iter_loop(
         if num_dequeued_runs > 0:
             self._logger.info("Launched %d runs.", num_dequeued_runs)
 
+    def _dequeue_runs_iter_bulk(
+        self,
+        workspace_process_context: IWorkspaceProcessContext,
+        runs_to_dequeue: List[DagsterRun],
+        max_workers: Optional[int],
+        max_launches_per_location: Optional[int],
+        run_queue_config: RunQueueConfig,
+        fixed_iteration_time: Optional[float],
+    ) -> Iterator[None]:
+        executor = self._get_executor(max_workers)
+        num_dequeued_runs = 0
+
+        in_flight: Dict[Future, Optional[str]] = {}
+        in_flight_counts_by_location: Dict[Optional[str], int] = defaultdict(int)
+        # runs held back until a launch from the same location finishes
+        deferred_runs_by_location: Dict[str, Deque[DagsterRun]] = defaultdict(deque)
+
+        def _submit(run: DagsterRun, location_name: Optional[str]) -> None:
+            future = executor.submit(
+                self._dequeue_run_thread,
+                workspace_process_context,
+                run,
+                run_queue_config,
+                fixed_iteration_time=fixed_iteration_time,
+            )
+            in_flight[future] = location_name
+            in_flight_counts_by_location[location_name] += 1
+
+        for run in runs_to_dequeue:
+            location_name = _get_location_name(run)
+            if (
+                location_name
+                and max_launches_per_location
+                and in_flight_counts_by_location[location_name] >= max_launches_per_location
+            ):
+                deferred_runs_by_location[location_name].append(run)
+            else:
+                _submit(run, location_name)
+
+        while in_flight:
+            done, _ = wait(in_flight, return_when=FIRST_COMPLETED)
+            for future in done:
+                location_name = in_flight.pop(future)
+                in_flight_counts_by_location[location_name] -= 1
+                run_launched = future.result()
+                yield None
+                if run_launched:
+                    num_dequeued_runs += 1
+
+                if not location_name or not deferred_runs_by_location.get(location_name):
+                    continue
+
+                now = fixed_iteration_time or time.time()
+                if self._is_location_pausing_dequeues(location_name, now):
+                    # a launch from this location failed to reach its code server, leave the rest
+                    # of its runs in the queue until the location recovers
+                    deferred_runs = deferred_runs_by_location.pop(location_name)
+                    self._logger.info(
+                        "Pausing dequeues for %d runs from code location %s to give its code"
+                        " server time to recover",
+                        len(deferred_runs),
+                        location_name,
+                    )
+                else:
+                    _submit(deferred_runs_by_location[location_name].popleft(), location_name)
+
+        if num_dequeued_runs > 0:
+            self._logger.info("Launched %d runs.", num_dequeued_runs)
+
     def _get_runs_to_dequeue(
         self,
         instance: DagsterInstance,
@@ -214,21 +298,8 @@ def _get_runs_to_dequeue(
         has_more = True
         batch: List[DagsterRun] = []
 
-        now = fixed_iteration_time or time.time()
-
-        with self._location_timeouts_lock:
-            paused_location_names = {
-                location_name
-                for location_name in self._location_timeouts
-                if self._location_timeouts[location_name] > now
-            }
-
-        locations_clause = ""
-        if paused_location_names:
-            locations_clause = (
-                " Temporarily skipping runs from the following locations due to a user code error: "
-                + ",".join(list(paused_location_names))
-            )
+        paused_location_names = self._get_paused_location_names(fixed_iteration_time)
+        locations_clause = self._get_paused_locations_clause(paused_location_names)
 
         logged_this_iteration = False
         # Paginate through our runs list so we don't need to hold every run
@@ -262,63 +333,181 @@ def _get_runs_to_dequeue(
             batch += queued_runs
             batch = self._priority_sort(batch)
 
-            if run_queue_config.should_block_op_concurrency_limited_runs:
-                try:
-                    global_concurrency_limits_counter = GlobalOpConcurrencyLimitsCounter(
-                        instance,
-                        batch,
-                        in_progress_run_records,
-                        run_queue_config.op_concurrency_slot_buffer,
-                    )
-                except:
-                    self._logger.exception("Failed to initialize op concurrency counter")
-                    # when we cannot initialize the global concurrency counter, we should fall back
-                    # to not blocking any runs based on op concurrency limits
-                    global_concurrency_limits_counter = None
-            else:
-                global_concurrency_limits_counter = None
-
-            to_remove = []
-            for run in batch:
-                if tag_concurrency_limits_counter.is_blocked(run):
-                    to_remove.append(run)
-                    continue
-                else:
-                    tag_concurrency_limits_counter.update_counters_with_launched_item(run)
-
-                if (
-                    global_concurrency_limits_counter
-                    and global_concurrency_limits_counter.is_blocked(run)
-                ):
-                    to_remove.append(run)
-                    if run.run_id not in self._global_concurrency_blocked_runs:
-                        with self._global_concurrency_blocked_runs_lock:
-                            self._global_concurrency_blocked_runs.add(run.run_id)
-                        concurrency_blocked_info = json.dumps(
-                            global_concurrency_limits_counter.get_blocked_run_debug_info(run)
-                        )
-                        self._logger.info(
-                            f"Run {run.run_id} is blocked by global concurrency limits: {concurrency_blocked_info}"
-                        )
-                    continue
-                elif global_concurrency_limits_counter:
-                    global_concurrency_limits_counter.update_counters_with_launched_item(run)
-
-                location_name = (
-                    run.remote_job_origin.location_name if run.remote_job_origin else None
-                )
-                if location_name and location_name in paused_location_names:
-                    to_remove.append(run)
-                    continue
+            global_concurrency_limits_counter = self._get_global_concurrency_limits_counter(
+                instance, run_queue_config, batch, in_progress_run_records
+            )
 
-            for run in to_remove:
-                batch.remove(run)
+            batch = self._filter_runs_to_dequeue(
+                batch,
+                tag_concurrency_limits_counter,
+                global_concurrency_limits_counter,
+                paused_location_names,
+            )
 
             if max_runs_to_launch >= 1:
                 batch = batch[:max_runs_to_launch]
 
         return batch
 
+    def _get_runs_to_dequeue_bulk(
+        self,
+        instance: DagsterInstance,
+        run_queue_config: RunQueueConfig,
+        fixed_iteration_time: Optional[float],
+    ) -> List[DagsterRun]:
+        """Selects the runs to dequeue with a single pass over the priority sorted queue, instead
+        of re-evaluating the limits against every page of queued runs.
+        """
+        max_concurrent_runs = run_queue_config.max_concurrent_runs
+        tag_concurrency_limits = run_queue_config.tag_concurrency_limits
+        in_progress_filter = RunsFilter(statuses=IN_PROGRESS_RUN_STATUSES)
+
+        if run_queue_config.should_block_op_concurrency_limited_runs:
+            # the op concurrency counter needs the full in progress run records
+            in_progress_run_records = self._get_in_progress_run_records(instance)
+            num_in_progress_runs = len(in_progress_run_records)
+        else:
+            in_progress_run_records = []
+            num_in_progress_runs = instance.get_runs_count(in_progress_filter)
+
+        max_concurrent_runs_enabled = max_concurrent_runs != -1  # setting to -1 disables the limit
+        max_runs_to_launch = max_concurrent_runs - num_in_progress_runs
+        if max_concurrent_runs_enabled and max_runs_to_launch <= 0:
+            self._logger.info(
+                f"{num_in_progress_runs} runs are currently in progress. Maximum is {max_concurrent_runs}, won't launch more."
+            )
+            return []
+
+        queued_runs: List[DagsterRun] = []
+        cursor = None
+        while True:
+            page = instance.get_runs(
+                RunsFilter(statuses=[DagsterRunStatus.QUEUED]),
+                cursor=cursor,
+                limit=self._page_size,
+                ascending=True,
+            )
+            queued_runs.extend(page)
+            if len(page) < self._page_size:
+                break
+            cursor = page[-1].run_id
+
+        if not queued_runs:
+            return []
+
+        paused_location_names = self._get_paused_location_names(fixed_iteration_time)
+        self._logger.info(
+            "Priority sorting and checking tag concurrency limits for queued runs."
+            + self._get_paused_locations_clause(paused_location_names)
+        )
+
+        tag_concurrency_limits_counter = TagConcurrencyLimitsCounter(tag_concurrency_limits, [])
+        tag_keys = list({tag_limit["key"] for tag_limit in tag_concurrency_limits})
+        if tag_keys:
+            tag_concurrency_limits_counter.update_counters_with_tag_counts(
+                instance.get_run_tag_counts(tag_keys, filters=in_progress_filter)
+            )
+
+        queued_runs = self._priority_sort(queued_runs)
+        global_concurrency_limits_counter = self._get_global_concurrency_limits_counter(
+            instance, run_queue_config, queued_runs, in_progress_run_records
+        )
+
+        return self._filter_runs_to_dequeue(
+            queued_runs,
+            tag_concurrency_limits_counter,
+            global_concurrency_limits_counter,
+            paused_location_names,
+            limit=max_runs_to_launch if max_concurrent_runs_enabled else None,
+        )
+
+    def _get_paused_location_names(self, fixed_iteration_time: Optional[float]) -> AbstractSet[str]:
+        now = fixed_iteration_time or time.time()
+
+        with self._location_timeouts_lock:
+            return {
+                location_name
+                for location_name in self._location_timeouts
+                if self._location_timeouts[location_name] > now
+            }
+
+    def _get_paused_locations_clause(self, paused_location_names: AbstractSet[str]) -> str:
+        if not paused_location_names:
+            return ""
+
+        return (
+            " Temporarily skipping runs from the following locations due to a user code error: "
+            + ",".join(list(paused_location_names))
+        )
+
+    def _get_global_concurrency_limits_counter(
+        self,
+        instance: DagsterInstance,
+        run_queue_config: RunQueueConfig,
+        runs: Sequence[DagsterRun],
+        in_progress_run_records: Sequence[RunRecord],
+    ) -> Optional[GlobalOpConcurrencyLimitsCounter]:
+        if not run_queue_config.should_block_op_concurrency_limited_runs:
+            return None
+
+        try:
+            return GlobalOpConcurrencyLimitsCounter(
+                instance,
+                runs,
+                in_progress_run_records,
+                run_queue_config.op_concurrency_slot_buffer,
+            )
+        except:
+            self._logger.exception("Failed to initialize op concurrency counter")
+            # when we cannot initialize the global concurrency counter, we should fall back
+            # to not blocking any runs based on op concurrency limits
+            return None
+
+    def _filter_runs_to_dequeue(
+        self,
+        runs: Sequence[DagsterRun],
+        tag_concurrency_limits_counter: TagConcurrencyLimitsCounter,
+        global_concurrency_limits_counter: Optional[GlobalOpConcurrencyLimitsCounter],
+        paused_location_names: AbstractSet[str],
+        limit: Optional[int] = None,
+    ) -> List[DagsterRun]:
+        """Returns the priority sorted runs that are not blocked by concurrency limits or paused
+        code locations, stopping once limit runs have been selected.
+        """
+        runs_to_dequeue = []
+        for run in runs:
+            if limit is not None and len(runs_to_dequeue) >= limit:
+                break
+
+            if tag_concurrency_limits_counter.is_blocked(run):
+                continue
+            else:
+                tag_concurrency_limits_counter.update_counters_with_launched_item(run)
+
+            if global_concurrency_limits_counter and global_concurrency_limits_counter.is_blocked(
+                run
+            ):
+                if run.run_id not in self._global_concurrency_blocked_runs:
+                    with self._global_concurrency_blocked_runs_lock:
+                        self._global_concurrency_blocked_runs.add(run.run_id)
+                    concurrency_blocked_info = json.dumps(
+                        global_concurrency_limits_counter.get_blocked_run_debug_info(run)
+                    )
+                    self._logger.info(
+                        f"Run {run.run_id} is blocked by global concurrency limits: {concurrency_blocked_info}"
+                    )
+                continue
+            elif global_concurrency_limits_counter:
+                global_concurrency_limits_counter.update_counters_with_launched_item(run)
+
+            location_name = _get_location_name(run)
+            if location_name and location_name in paused_location_names:
+                continue
+
+            runs_to_dequeue.append(run)
+
+        return runs_to_dequeue
+
     def _get_in_progress_run_records(self, instance: DagsterInstance) -> Sequence[RunRecord]:
         return instance.get_run_records(filters=RunsFilter(statuses=IN_PROGRESS_RUN_STATUSES))
 
@@ -364,9 +553,7 @@ def _dequeue_run(
             )
             return False
 
-        # Very old (pre 0.10.0) runs and programatically submitted runs may not have an
-        # attached code location name
-        location_name = run.remote_job_origin.location_name if run.remote_job_origin else None
+        location_name = _get_location_name(run)
 
         if location_name and self._is_location_pausing_dequeues(location_name, now):
             self._logger.info(
@@ -471,3 +658,9 @@ def _dequeue_run(
                 instance.report_run_failed(run)
                 return False
         return True
+
+
+def _get_location_name(run: DagsterRun) -> Optional[str]:
+    # Very old (pre 0.10.0) runs and programatically submitted runs may not have an
+    # attached code location name
+    return run.remote_job_origin.location_name if run.remote_job_origin else None
@@ -37,18 +37,23 @@
 )
 from dagster._core.definitions.run_request import DagsterRunReaction, InstigatorType, RunRequest
 from dagster._core.definitions.selector import JobSubsetSelector
-from dagster._core.definitions.sensor_definition import DefaultSensorStatus, SensorType
+from dagster._core.definitions.sensor_definition import (
+    DefaultSensorStatus,
+    SensorExecutionData,
+    SensorType,
+)
 from dagster._core.errors import (
     DagsterCodeLocationLoadError,
     DagsterError,
     DagsterInvalidInvocationError,
+    DagsterUserCodeProcessError,
     DagsterUserCodeUnreachableError,
 )
 from dagster._core.execution.backfill import PartitionBackfill
 from dagster._core.instance import DagsterInstance
 from dagster._core.remote_representation.code_location import CodeLocation
 from dagster._core.remote_representation.external import RemoteJob, RemoteSensor
-from dagster._core.remote_representation.external_data import TargetSnap
+from dagster._core.remote_representation.external_data import SensorExecutionErrorSnap, TargetSnap
 from dagster._core.scheduler.instigation import (
     DynamicPartitionsRequestResult,
     InstigatorState,
@@ -63,7 +68,8 @@
 from dagster._core.telemetry import SENSOR_RUN_CREATED, hash_name, log_action
 from dagster._core.utils import make_new_backfill_id, make_new_run_id
 from dagster._core.workspace.context import IWorkspaceProcessContext
-from dagster._daemon.utils import DaemonErrorCapture
+from dagster._daemon.utils import DaemonErrorCapture, TickRunPlanCache
+from dagster._grpc.types import SensorExecutionArgs
 from dagster._scheduler.stale import resolve_stale_or_missing_assets
 from dagster._time import get_current_datetime, get_current_timestamp
 from dagster._utils import DebugCrashFlags, SingleInstigatorDebugCrashFlags, check_for_debug_crash
@@ -141,11 +147,7 @@ def tick_id(self) -> str:
 
     @property
     def log_key(self) -> Sequence[str]:
-        return [
-            self._remote_sensor.handle.repository_handle.repository_name,
-            self._remote_sensor.name,
-            self.tick_id,
-        ]
+        return _get_tick_log_key(self._remote_sensor, self._tick)
 
     def update_state(self, status: TickStatus, **kwargs: object):
         skip_reason = cast(Optional[str], kwargs.get("skip_reason"))
@@ -300,6 +302,14 @@ def __exit__(
             )
 
 
+def _get_tick_log_key(remote_sensor: RemoteSensor, tick: InstigatorTick) -> Sequence[str]:
+    return [
+        remote_sensor.handle.repository_handle.repository_name,
+        remote_sensor.name,
+        str(tick.tick_id),
+    ]
+
+
 def execute_sensor_iteration_loop(
     workspace_process_context: IWorkspaceProcessContext,
     logger: logging.Logger,
@@ -395,6 +405,11 @@ def execute_sensor_iteration(
         yield
         return
 
+    # the sensors of a code location are ticked together, so that they can be evaluated with a
+    # single call to the code location
+    sensors_to_tick_by_location: Dict[
+        str, List[Tuple[RemoteSensor, Optional[SingleInstigatorDebugCrashFlags]]]
+    ] = defaultdict(list)
     for sensor in sensors.values():
         sensor_name = sensor.name
         sensor_debug_crash_flags = debug_crash_flags.get(sensor_name) if debug_crash_flags else None
@@ -426,51 +441,50 @@ def execute_sensor_iteration(
             ):
                 continue
 
+        sensors_to_tick_by_location[sensor.handle.location_name].append(
+            (sensor, sensor_debug_crash_flags)
+        )
+
+    for location_sensors in sensors_to_tick_by_location.values():
+        if threadpool_executor:
             future = threadpool_executor.submit(
-                _process_tick,
+                _process_ticks,
                 workspace_process_context,
                 logger,
-                sensor,
-                sensor_state,
-                sensor_debug_crash_flags,
+                location_sensors,
                 tick_retention_settings,
                 submit_threadpool_executor,
             )
-            sensor_tick_futures[sensor.selector_id] = future
+            for sensor, _ in location_sensors:
+                check.not_none(sensor_tick_futures)[sensor.selector_id] = future
             yield
 
         else:
             # evaluate the sensors in a loop, synchronously, yielding to allow the sensor daemon to
             # heartbeat
-            yield from _process_tick_generator(
+            yield from _process_ticks_generator(
                 workspace_process_context,
                 logger,
-                sensor,
-                sensor_state,
-                sensor_debug_crash_flags,
+                location_sensors,
                 tick_retention_settings,
                 submit_threadpool_executor=None,
             )
 
 
-def _process_tick(
+def _process_ticks(
     workspace_process_context: IWorkspaceProcessContext,
     logger: logging.Logger,
-    remote_sensor: RemoteSensor,
-    sensor_state: InstigatorState,
-    sensor_debug_crash_flags: Optional[SingleInstigatorDebugCrashFlags],
+    sensors: Sequence[Tuple[RemoteSensor, Optional[SingleInstigatorDebugCrashFlags]]],
     tick_retention_settings,
     submit_threadpool_executor: Optional[ThreadPoolExecutor],
 ):
-    # evaluate the tick immediately, but from within a thread.  The main thread should be able to
+    # evaluate the ticks immediately, but from within a thread.  The main thread should be able to
     # heartbeat to keep the daemon alive
     return list(
-        _process_tick_generator(
+        _process_ticks_generator(
             workspace_process_context,
             logger,
-            remote_sensor,
-            sensor_state,
-            sensor_debug_crash_flags,
+            sensors,
             tick_retention_settings,
             submit_threadpool_executor,
         )
@@ -555,79 +569,181 @@ def _get_evaluation_tick(
     )
 
 
-def _process_tick_generator(
+def _process_ticks_generator(
     workspace_process_context: IWorkspaceProcessContext,
     logger: logging.Logger,
-    remote_sensor: RemoteSensor,
-    sensor_state: InstigatorState,
-    sensor_debug_crash_flags: Optional[SingleInstigatorDebugCrashFlags],
+    sensors: Sequence[Tuple[RemoteSensor, Optional[SingleInstigatorDebugCrashFlags]]],
     tick_retention_settings,
     submit_threadpool_executor: Optional[ThreadPoolExecutor],
 ):
+    """Ticks sensors of the same code location. A tick is created for each sensor first, so that
+    the sensors can then be evaluated with a single batched call to the code location.
+    """
     instance = workspace_process_context.instance
-    error_info = None
     now = get_current_datetime()
-    sensor_state = check.not_none(
-        instance.get_instigator_state(
-            remote_sensor.get_remote_origin_id(), remote_sensor.selector_id
+
+    started_ticks: List[
+        Tuple[
+            RemoteSensor, InstigatorState, InstigatorTick, Optional[SingleInstigatorDebugCrashFlags]
+        ]
+    ] = []
+    for remote_sensor, sensor_debug_crash_flags in sensors:
+        sensor_state = check.not_none(
+            instance.get_instigator_state(
+                remote_sensor.get_remote_origin_id(), remote_sensor.selector_id
+            )
         )
+        if is_under_min_interval(sensor_state, remote_sensor):
+            # check the since we might have been queued before processing
+            continue
+        else:
+            mark_sensor_state_for_tick(instance, remote_sensor, sensor_state, now)
+
+        try:
+            # get the tick that we should be evaluating for
+            tick = _get_evaluation_tick(
+                instance,
+                remote_sensor,
+                _sensor_instigator_data(sensor_state),
+                now.timestamp(),
+                logger,
+            )
+
+            check_for_debug_crash(sensor_debug_crash_flags, "TICK_CREATED")
+        except Exception:
+            yield DaemonErrorCapture.on_exception(
+                exc_info=sys.exc_info(),
+                logger=logger,
+                log_message=f"Sensor daemon caught an error for sensor {remote_sensor.name}",
+            )
+            continue
+
+        started_ticks.append((remote_sensor, sensor_state, tick, sensor_debug_crash_flags))
+
+    sensor_execution_data_by_selector_id = _evaluate_sensor_batch(
+        workspace_process_context,
+        logger,
+        [
+            (remote_sensor, sensor_state, tick)
+            for remote_sensor, sensor_state, tick, _ in started_ticks
+        ],
     )
-    if is_under_min_interval(sensor_state, remote_sensor):
-        # check the since we might have been queued before processing
-        return
-    else:
-        mark_sensor_state_for_tick(instance, remote_sensor, sensor_state, now)
 
-    try:
-        # get the tick that we should be evaluating for
-        tick = _get_evaluation_tick(
-            instance,
-            remote_sensor,
-            _sensor_instigator_data(sensor_state),
-            now.timestamp(),
-            logger,
-        )
+    for remote_sensor, sensor_state, tick, sensor_debug_crash_flags in started_ticks:
+        error_info = None
+        try:
+            with SensorLaunchContext(
+                remote_sensor,
+                tick,
+                instance,
+                logger,
+                tick_retention_settings,
+            ) as tick_context:
+                check_for_debug_crash(sensor_debug_crash_flags, "TICK_HELD")
+                tick_context.add_log_key(tick_context.log_key)
+
+                # in cases where there is unresolved work left to do, do it
+                if len(tick.unsubmitted_run_ids_with_requests) > 0:
+                    yield from _resume_tick(
+                        workspace_process_context,
+                        tick_context,
+                        tick,
+                        remote_sensor,
+                        submit_threadpool_executor,
+                        sensor_debug_crash_flags,
+                    )
+                else:
+                    yield from _evaluate_sensor(
+                        workspace_process_context,
+                        tick_context,
+                        remote_sensor,
+                        sensor_state,
+                        submit_threadpool_executor,
+                        sensor_debug_crash_flags,
+                        sensor_execution_data=sensor_execution_data_by_selector_id.get(
+                            remote_sensor.selector_id
+                        ),
+                    )
 
-        check_for_debug_crash(sensor_debug_crash_flags, "TICK_CREATED")
+        except Exception:
+            error_info = DaemonErrorCapture.on_exception(
+                exc_info=sys.exc_info(),
+                logger=logger,
+                log_message=f"Sensor daemon caught an error for sensor {remote_sensor.name}",
+            )
 
-        with SensorLaunchContext(
-            remote_sensor,
-            tick,
-            instance,
-            logger,
-            tick_retention_settings,
-        ) as tick_context:
-            check_for_debug_crash(sensor_debug_crash_flags, "TICK_HELD")
-            tick_context.add_log_key(tick_context.log_key)
-
-            # in cases where there is unresolved work left to do, do it
-            if len(tick.unsubmitted_run_ids_with_requests) > 0:
-                yield from _resume_tick(
-                    workspace_process_context,
-                    tick_context,
-                    tick,
-                    remote_sensor,
-                    submit_threadpool_executor,
-                    sensor_debug_crash_flags,
-                )
-            else:
-                yield from _evaluate_sensor(
-                    workspace_process_context,
-                    tick_context,
-                    remote_sensor,
-                    sensor_state,
-                    submit_threadpool_executor,
-                    sensor_debug_crash_flags,
-                )
+        yield error_info
+
+
+def _evaluate_sensor_batch(
+    workspace_process_context: IWorkspaceProcessContext,
+    logger: logging.Logger,
+    started_ticks: Sequence[Tuple[RemoteSensor, InstigatorState, InstigatorTick]],
+) -> Mapping[str, Union[SensorExecutionData, SensorExecutionErrorSnap]]:
+    """Evaluates the sensors of new ticks with a single call to their code location. Sensors
+    that are missing from the returned results are evaluated one at a time instead.
+    """
+    instance = workspace_process_context.instance
+    ticks_to_evaluate = [
+        (remote_sensor, sensor_state, tick)
+        for remote_sensor, sensor_state, tick in started_ticks
+        if not tick.unsubmitted_run_ids_with_requests
+        and (
+            remote_sensor.sensor_type != SensorType.AUTOMATION
+            or instance.auto_materialize_use_sensors
+        )
+    ]
+    if len(ticks_to_evaluate) < 2:
+        return {}
+
+    selector_ids_by_sensor: Dict[Tuple[str, str], str] = {}
+    sensor_execution_args: List[SensorExecutionArgs] = []
+    for remote_sensor, sensor_state, tick in ticks_to_evaluate:
+        instigator_data = _sensor_instigator_data(sensor_state)
+        repository_origin = remote_sensor.handle.repository_handle.get_remote_origin()
+        selector_ids_by_sensor[(repository_origin.repository_name, remote_sensor.name)] = (
+            remote_sensor.selector_id
+        )
+        sensor_execution_args.append(
+            SensorExecutionArgs(
+                repository_origin=repository_origin,
+                instance_ref=instance.get_ref(),
+                sensor_name=remote_sensor.name,
+                last_tick_completion_time=instigator_data.last_tick_timestamp
+                if instigator_data
+                else None,
+                last_run_key=instigator_data.last_run_key if instigator_data else None,
+                cursor=instigator_data.cursor if instigator_data else None,
+                log_key=_get_tick_log_key(remote_sensor, tick),
+                last_sensor_start_time=instigator_data.last_sensor_start_timestamp
+                if instigator_data
+                else None,
+            )
+        )
 
+    sensor_execution_data_by_selector_id = {}
+    try:
+        code_location = _get_code_location_for_sensor(
+            workspace_process_context, ticks_to_evaluate[0][0]
+        )
+        for args, sensor_execution_data in code_location.get_sensor_execution_data_batch(
+            instance, sensor_execution_args
+        ):
+            selector_id = selector_ids_by_sensor[
+                (args.repository_origin.repository_name, args.sensor_name)
+            ]
+            sensor_execution_data_by_selector_id[selector_id] = sensor_execution_data
     except Exception:
-        error_info = DaemonErrorCapture.on_exception(
-            exc_info=sys.exc_info(),
-            logger=logger,
-            log_message=f"Sensor daemon caught an error for sensor {remote_sensor.name}",
+        # the sensors without results are evaluated one at a time, so that each of their ticks
+        # records its own error
+        logger.warning(
+            f"Batched evaluation of {len(sensor_execution_args)} sensors failed, evaluating the"
+            f" {len(sensor_execution_args) - len(sensor_execution_data_by_selector_id)} sensors"
+            " without results one at a time",
+            exc_info=True,
         )
 
-    yield error_info
+    return sensor_execution_data_by_selector_id
 
 
 def _sensor_instigator_data(state: InstigatorState) -> Optional[SensorInstigatorData]:
@@ -679,8 +795,11 @@ def _submit_run_request(
     existing_runs_by_key,
     logger,
     sensor_debug_crash_flags,
+    existing_runs_by_id: Optional[Mapping[str, DagsterRun]] = None,
+    run_plan_cache: Optional[TickRunPlanCache] = None,
 ) -> SubmitRunRequestResult:
     instance = workspace_process_context.instance
+    run_plan_cache = run_plan_cache or TickRunPlanCache()
 
     sensor_origin = remote_sensor.get_remote_origin()
 
@@ -698,7 +817,7 @@ def _submit_run_request(
         asset_selection=run_request.asset_selection,
         asset_check_selection=run_request.asset_check_keys,
     )
-    remote_job = code_location.get_job(job_subset_selector)
+    remote_job = run_plan_cache.get_job(code_location, job_subset_selector)
     run = _get_or_create_sensor_run(
         logger,
         instance,
@@ -709,6 +828,8 @@ def _submit_run_request(
         run_request,
         target_data,
         existing_runs_by_key,
+        existing_runs_by_id=existing_runs_by_id,
+        run_plan_cache=run_plan_cache,
     )
 
     if isinstance(run, SkippedSensorRun):
@@ -785,6 +906,7 @@ def _evaluate_sensor(
     state: InstigatorState,
     submit_threadpool_executor: Optional[ThreadPoolExecutor],
     sensor_debug_crash_flags: Optional[SingleInstigatorDebugCrashFlags] = None,
+    sensor_execution_data: Optional[Union[SensorExecutionData, SensorExecutionErrorSnap]] = None,
 ):
     instance = workspace_process_context.instance
     if (
@@ -797,20 +919,26 @@ def _evaluate_sensor(
         )
 
     context.logger.info(f"Checking for new runs for sensor: {remote_sensor.name}")
-    code_location = _get_code_location_for_sensor(workspace_process_context, remote_sensor)
-    repository_handle = remote_sensor.handle.repository_handle
-    instigator_data = _sensor_instigator_data(state)
+    if isinstance(sensor_execution_data, SensorExecutionErrorSnap):
+        raise DagsterUserCodeProcessError.from_error_info(sensor_execution_data.error)
+    elif sensor_execution_data:
+        # the sensor was already evaluated as part of a batch
+        sensor_runtime_data = sensor_execution_data
+    else:
+        code_location = _get_code_location_for_sensor(workspace_process_context, remote_sensor)
+        repository_handle = remote_sensor.handle.repository_handle
+        instigator_data = _sensor_instigator_data(state)
 
-    sensor_runtime_data = code_location.get_sensor_execution_data(
-        instance,
-        repository_handle,
-        remote_sensor.name,
-        instigator_data.last_tick_timestamp if instigator_data else None,
-        instigator_data.last_run_key if instigator_data else None,
-        instigator_data.cursor if instigator_data else None,
-        context.log_key,
-        instigator_data.last_sensor_start_timestamp if instigator_data else None,
-    )
+        sensor_runtime_data = code_location.get_sensor_execution_data(
+            instance,
+            repository_handle,
+            remote_sensor.name,
+            instigator_data.last_tick_timestamp if instigator_data else None,
+            instigator_data.last_run_key if instigator_data else None,
+            instigator_data.cursor if instigator_data else None,
+            context.log_key,
+            instigator_data.last_sensor_start_timestamp if instigator_data else None,
+        )
 
     yield
 
@@ -1097,8 +1225,23 @@ def _submit_run_requests(
         has_evaluations=len(automation_condition_evaluations) > 0,
     )
     existing_runs_by_key = _fetch_existing_runs(
-        instance, remote_sensor, [request for _, request in resolved_run_ids_with_requests]
+        instance,
+        remote_sensor,
+        [request for _, request in resolved_run_ids_with_requests],
+        submit_threadpool_executor,
     )
+    # runs that were already created for the reserved run ids, if this tick is being resumed
+    existing_runs_by_id = _fetch_existing_runs_by_id(
+        instance,
+        [
+            run_id
+            for run_id, run_request in resolved_run_ids_with_requests
+            if not run_request.requires_backfill_daemon()
+        ],
+    )
+    # run requests for the same job selection and run config share their remote job and
+    # execution plan
+    run_plan_cache = TickRunPlanCache()
 
     def submit_run_request(
         run_id_with_run_request: Tuple[str, RunRequest],
@@ -1115,6 +1258,8 @@ def submit_run_request(
                 existing_runs_by_key,
                 context.logger,
                 sensor_debug_crash_flags,
+                existing_runs_by_id=existing_runs_by_id,
+                run_plan_cache=run_plan_cache,
             )
 
     if submit_threadpool_executor:
@@ -1216,6 +1361,7 @@ def _fetch_existing_runs(
     instance: DagsterInstance,
     remote_sensor: RemoteSensor,
     run_requests: Sequence[RunRequest],
+    threadpool_executor: Optional[ThreadPoolExecutor] = None,
 ):
     run_keys = [run_request.run_key for run_request in run_requests if run_request.run_key]
 
@@ -1225,13 +1371,19 @@ def _fetch_existing_runs(
     # fetch runs from the DB with only the run key tag
     # note: while possible to filter more at DB level with tags - it is avoided here due to observed
     # perf problems
+    # do one query per run key, which has better perf than a single query with an IN clause, due to
+    # how the query planner does the runs/run_tags join. The queries are spread over the threadpool
+    # if there is one, so that many run keys don't mean many serial round-trips
+    fetch_runs_for_run_key = lambda run_key: instance.get_runs(
+        filters=RunsFilter(tags={RUN_KEY_TAG: run_key})
+    )
     runs_with_run_keys = []
-    for run_key in run_keys:
-        # do serial fetching, which has better perf than a single query with an IN clause, due to
-        # how the query planner does the runs/run_tags join
-        runs_with_run_keys.extend(
-            instance.get_runs(filters=RunsFilter(tags={RUN_KEY_TAG: run_key}))
-        )
+    for runs in (
+        threadpool_executor.map(fetch_runs_for_run_key, run_keys)
+        if threadpool_executor
+        else map(fetch_runs_for_run_key, run_keys)
+    ):
+        runs_with_run_keys.extend(runs)
 
     # filter down to runs with run_key that match the sensor name and its namespace (repository)
     valid_runs: List[DagsterRun] = []
@@ -1257,6 +1409,15 @@ def _fetch_existing_runs(
     return existing_runs
 
 
+def _fetch_existing_runs_by_id(
+    instance: DagsterInstance, run_ids: Sequence[str]
+) -> Mapping[str, DagsterRun]:
+    if not run_ids:
+        return {}
+
+    return {run.run_id: run for run in instance.get_runs(filters=RunsFilter(run_ids=run_ids))}
+
+
 def _get_or_create_sensor_run(
     logger: logging.Logger,
     instance: DagsterInstance,
@@ -1267,8 +1428,14 @@ def _get_or_create_sensor_run(
     run_request: RunRequest,
     target_data: TargetSnap,
     existing_runs_by_key: Mapping[Optional[str], DagsterRun],
+    existing_runs_by_id: Optional[Mapping[str, DagsterRun]] = None,
+    run_plan_cache: Optional[TickRunPlanCache] = None,
 ) -> Union[DagsterRun, SkippedSensorRun]:
-    run = existing_runs_by_key.get(run_request.run_key) or instance.get_run_by_id(run_id)
+    run = existing_runs_by_key.get(run_request.run_key) or (
+        existing_runs_by_id.get(run_id)
+        if existing_runs_by_id is not None
+        else instance.get_run_by_id(run_id)
+    )
 
     if run:
         if run.status != DagsterRunStatus.NOT_STARTED:
@@ -1285,7 +1452,14 @@ def _get_or_create_sensor_run(
     logger.info(f"Creating new run for {remote_sensor.name}")
 
     return _create_sensor_run(
-        instance, code_location, remote_sensor, remote_job, run_id, run_request, target_data
+        instance,
+        code_location,
+        remote_sensor,
+        remote_job,
+        run_id,
+        run_request,
+        target_data,
+        run_plan_cache=run_plan_cache,
     )
 
 
@@ -1297,15 +1471,12 @@ def _create_sensor_run(
     run_id: str,
     run_request: RunRequest,
     target_data: TargetSnap,
+    run_plan_cache: Optional[TickRunPlanCache] = None,
 ) -> DagsterRun:
     from dagster._daemon.daemon import get_telemetry_daemon_session_id
 
-    remote_execution_plan = code_location.get_execution_plan(
-        remote_job,
-        run_request.run_config,
-        step_keys_to_execute=None,
-        known_state=None,
-        instance=instance,
+    remote_execution_plan = (run_plan_cache or TickRunPlanCache()).get_execution_plan(
+        code_location, remote_job, run_request.run_config, instance=instance
     )
     execution_plan_snapshot = remote_execution_plan.execution_plan_snapshot
 
@@ -1,5 +1,8 @@
+import json
 import logging
-from typing import Optional
+import threading
+from concurrent.futures import Future
+from typing import TYPE_CHECKING, Callable, Dict, Hashable, Mapping, Optional, TypeVar
 
 from dagster._utils.error import (
     ExceptionInfo,
@@ -7,6 +10,14 @@
     serializable_error_info_from_exc_info,
 )
 
+if TYPE_CHECKING:
+    from dagster._core.definitions.selector import JobSubsetSelector
+    from dagster._core.instance import DagsterInstance
+    from dagster._core.remote_representation.code_location import CodeLocation
+    from dagster._core.remote_representation.external import RemoteExecutionPlan, RemoteJob
+
+T = TypeVar("T")
+
 
 class DaemonErrorCapture:
     @staticmethod
@@ -22,3 +33,80 @@ def default_on_exception(
 
     # global behavior for how to handle unexpected exceptions
     on_exception = default_on_exception
+
+
+def _run_config_key(run_config: Mapping[str, object]) -> Optional[str]:
+    try:
+        return json.dumps(run_config, sort_keys=True)
+    except (TypeError, ValueError):
+        return None
+
+
+class TickRunPlanCache:
+    """Remote jobs and execution plans fetched while submitting the run requests of a single tick.
+    Run requests that target the same job selection, or the same job selection with the same run
+    config, share one code server call. Safe to use from the threads of a submission threadpool.
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._futures: Dict[Hashable, Future] = {}
+
+    def _get_or_compute(self, key: Hashable, fn: Callable[[], T]) -> T:
+        with self._lock:
+            future = self._futures.get(key)
+            is_owner = future is None
+            if future is None:
+                future = Future()
+                self._futures[key] = future
+
+        if is_owner:
+            try:
+                future.set_result(fn())
+            except Exception as e:
+                # don't cache failures, so that the next request for the key tries again
+                with self._lock:
+                    del self._futures[key]
+                future.set_exception(e)
+
+        return future.result()
+
+    def get_job(self, code_location: "CodeLocation", selector: "JobSubsetSelector") -> "RemoteJob":
+        key = (
+            "job",
+            selector.location_name,
+            selector.repository_name,
+            selector.job_name,
+            tuple(selector.op_selection) if selector.op_selection is not None else None,
+            selector.asset_selection,
+            selector.asset_check_selection,
+        )
+        return self._get_or_compute(key, lambda: code_location.get_job(selector))
+
+    def get_execution_plan(
+        self,
+        code_location: "CodeLocation",
+        remote_job: "RemoteJob",
+        run_config: Mapping[str, object],
+        instance: Optional["DagsterInstance"] = None,
+    ) -> "RemoteExecutionPlan":
+        def _get_execution_plan() -> "RemoteExecutionPlan":
+            return code_location.get_execution_plan(
+                remote_job,
+                run_config,
+                step_keys_to_execute=None,
+                known_state=None,
+                instance=instance,
+            )
+
+        run_config_key = _run_config_key(run_config)
+        if run_config_key is None:
+            return _get_execution_plan()
+
+        key = (
+            "execution_plan",
+            remote_job.get_remote_origin_id(),
+            remote_job.identifying_job_snapshot_id,
+            run_config_key,
+        )
+        return self._get_or_compute(key, _get_execution_plan)
@@ -3,7 +3,9 @@
 isort:skip_file
 If you make changes to this file, run "python -m dagster._grpc.compile" after."""
 import builtins
+import collections.abc
 import google.protobuf.descriptor
+import google.protobuf.internal.containers
 import google.protobuf.message
 import sys
 
@@ -422,19 +424,37 @@ class ExternalRepositoryRequest(google.protobuf.message.Message):
 
     SERIALIZED_REPOSITORY_PYTHON_ORIGIN_FIELD_NUMBER: builtins.int
     DEFER_SNAPSHOTS_FIELD_NUMBER: builtins.int
+    ACCEPTS_BINARY_SERDES_FIELD_NUMBER: builtins.int
+    ACCEPTS_SNAPSHOT_PIECES_FIELD_NUMBER: builtins.int
+    KNOWN_SNAPSHOT_PIECE_DIGESTS_FIELD_NUMBER: builtins.int
     serialized_repository_python_origin: builtins.str
     defer_snapshots: builtins.bool
+    accepts_binary_serdes: builtins.bool
+    accepts_snapshot_pieces: builtins.bool
+    @property
+    def known_snapshot_piece_digests(
+        self,
+    ) -> google.protobuf.internal.containers.RepeatedScalarFieldContainer[builtins.str]: ...
     def __init__(
         self,
         *,
         serialized_repository_python_origin: builtins.str = ...,
         defer_snapshots: builtins.bool = ...,
+        accepts_binary_serdes: builtins.bool = ...,
+        accepts_snapshot_pieces: builtins.bool = ...,
+        known_snapshot_piece_digests: collections.abc.Iterable[builtins.str] | None = ...,
     ) -> None: ...
     def ClearField(
         self,
         field_name: typing_extensions.Literal[
+            "accepts_binary_serdes",
+            b"accepts_binary_serdes",
+            "accepts_snapshot_pieces",
+            b"accepts_snapshot_pieces",
             "defer_snapshots",
             b"defer_snapshots",
+            "known_snapshot_piece_digests",
+            b"known_snapshot_piece_digests",
             "serialized_repository_python_origin",
             b"serialized_repository_python_origin",
         ],
@@ -468,19 +488,24 @@ class StreamingExternalRepositoryEvent(google.protobuf.message.Message):
 
     SEQUENCE_NUMBER_FIELD_NUMBER: builtins.int
     SERIALIZED_EXTERNAL_REPOSITORY_CHUNK_FIELD_NUMBER: builtins.int
+    SERIALIZED_EXTERNAL_REPOSITORY_BINARY_CHUNK_FIELD_NUMBER: builtins.int
     sequence_number: builtins.int
     serialized_external_repository_chunk: builtins.str
+    serialized_external_repository_binary_chunk: builtins.bytes
     def __init__(
         self,
         *,
         sequence_number: builtins.int = ...,
         serialized_external_repository_chunk: builtins.str = ...,
+        serialized_external_repository_binary_chunk: builtins.bytes = ...,
     ) -> None: ...
     def ClearField(
         self,
         field_name: typing_extensions.Literal[
             "sequence_number",
             b"sequence_number",
+            "serialized_external_repository_binary_chunk",
+            b"serialized_external_repository_binary_chunk",
             "serialized_external_repository_chunk",
             b"serialized_external_repository_chunk",
         ],
@@ -553,6 +578,63 @@ class StreamingChunkEvent(google.protobuf.message.Message):
 
 global___StreamingChunkEvent = StreamingChunkEvent
 
+@typing_extensions.final
+class ExternalSensorExecutionBatchRequest(google.protobuf.message.Message):
+    DESCRIPTOR: google.protobuf.descriptor.Descriptor
+
+    SERIALIZED_SENSOR_EXECUTION_BATCH_ARGS_FIELD_NUMBER: builtins.int
+    serialized_sensor_execution_batch_args: builtins.str
+    def __init__(
+        self,
+        *,
+        serialized_sensor_execution_batch_args: builtins.str = ...,
+    ) -> None: ...
+    def ClearField(
+        self,
+        field_name: typing_extensions.Literal[
+            "serialized_sensor_execution_batch_args",
+            b"serialized_sensor_execution_batch_args",
+        ],
+    ) -> None: ...
+
+global___ExternalSensorExecutionBatchRequest = ExternalSensorExecutionBatchRequest
+
+@typing_extensions.final
+class ExternalSensorExecutionBatchEvent(google.protobuf.message.Message):
+    DESCRIPTOR: google.protobuf.descriptor.Descriptor
+
+    SENSOR_INDEX_FIELD_NUMBER: builtins.int
+    SEQUENCE_NUMBER_FIELD_NUMBER: builtins.int
+    SERIALIZED_CHUNK_FIELD_NUMBER: builtins.int
+    IS_LAST_CHUNK_FIELD_NUMBER: builtins.int
+    sensor_index: builtins.int
+    sequence_number: builtins.int
+    serialized_chunk: builtins.str
+    is_last_chunk: builtins.bool
+    def __init__(
+        self,
+        *,
+        sensor_index: builtins.int = ...,
+        sequence_number: builtins.int = ...,
+        serialized_chunk: builtins.str = ...,
+        is_last_chunk: builtins.bool = ...,
+    ) -> None: ...
+    def ClearField(
+        self,
+        field_name: typing_extensions.Literal[
+            "is_last_chunk",
+            b"is_last_chunk",
+            "sensor_index",
+            b"sensor_index",
+            "sequence_number",
+            b"sequence_number",
+            "serialized_chunk",
+            b"serialized_chunk",
+        ],
+    ) -> None: ...
+
+global___ExternalSensorExecutionBatchEvent = ExternalSensorExecutionBatchEvent
+
 @typing_extensions.final
 class ShutdownServerReply(google.protobuf.message.Message):
     DESCRIPTOR: google.protobuf.descriptor.Descriptor
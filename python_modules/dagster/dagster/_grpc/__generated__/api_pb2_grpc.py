@@ -115,6 +115,11 @@ def __init__(self, channel):
             request_serializer=api__pb2.ExternalSensorExecutionRequest.SerializeToString,
             response_deserializer=api__pb2.ExternalSensorExecutionReply.FromString,
         )
+        self.ExternalSensorExecutionBatch = channel.unary_stream(
+            "/api.DagsterApi/ExternalSensorExecutionBatch",
+            request_serializer=api__pb2.ExternalSensorExecutionBatchRequest.SerializeToString,
+            response_deserializer=api__pb2.ExternalSensorExecutionBatchEvent.FromString,
+        )
         self.ShutdownServer = channel.unary_unary(
             "/api.DagsterApi/ShutdownServer",
             request_serializer=api__pb2.Empty.SerializeToString,
@@ -269,6 +274,12 @@ def SyncExternalSensorExecution(self, request, context):
         context.set_details("Method not implemented!")
         raise NotImplementedError("Method not implemented!")
 
+    def ExternalSensorExecutionBatch(self, request, context):
+        """Missing associated documentation comment in .proto file."""
+        context.set_code(grpc.StatusCode.UNIMPLEMENTED)
+        context.set_details("Method not implemented!")
+        raise NotImplementedError("Method not implemented!")
+
     def ShutdownServer(self, request, context):
         """Missing associated documentation comment in .proto file."""
         context.set_code(grpc.StatusCode.UNIMPLEMENTED)
@@ -409,6 +420,11 @@ def add_DagsterApiServicer_to_server(servicer, server):
             request_deserializer=api__pb2.ExternalSensorExecutionRequest.FromString,
             response_serializer=api__pb2.ExternalSensorExecutionReply.SerializeToString,
         ),
+        "ExternalSensorExecutionBatch": grpc.unary_stream_rpc_method_handler(
+            servicer.ExternalSensorExecutionBatch,
+            request_deserializer=api__pb2.ExternalSensorExecutionBatchRequest.FromString,
+            response_serializer=api__pb2.ExternalSensorExecutionBatchEvent.SerializeToString,
+        ),
         "ShutdownServer": grpc.unary_unary_rpc_method_handler(
             servicer.ShutdownServer,
             request_deserializer=api__pb2.Empty.FromString,
@@ -1004,6 +1020,35 @@ def SyncExternalSensorExecution(
             metadata,
         )
 
+    @staticmethod
+    def ExternalSensorExecutionBatch(
+        request,
+        target,
+        options=(),
+        channel_credentials=None,
+        call_credentials=None,
+        insecure=False,
+        compression=None,
+        wait_for_ready=None,
+        timeout=None,
+        metadata=None,
+    ):
+        return grpc.experimental.unary_stream(
+            request,
+            target,
+            "/api.DagsterApi/ExternalSensorExecutionBatch",
+            api__pb2.ExternalSensorExecutionBatchRequest.SerializeToString,
+            api__pb2.ExternalSensorExecutionBatchEvent.FromString,
+            options,
+            channel_credentials,
+            insecure,
+            call_credentials,
+            compression,
+            wait_for_ready,
+            timeout,
+            metadata,
+        )
+
     @staticmethod
     def ShutdownServer(
         request,
@@ -41,6 +41,7 @@
     PartitionNamesArgs,
     PartitionSetExecutionParamArgs,
     SensorExecutionArgs,
+    SensorExecutionBatchArgs,
 )
 from dagster._grpc.utils import (
     default_grpc_timeout,
@@ -49,6 +50,8 @@
     default_sensor_grpc_timeout,
     max_rx_bytes,
     max_send_bytes,
+    sensor_execution_batch_timeout,
+    sensor_execution_timeout_message,
 )
 from dagster._serdes import serialize_value
 from dagster._utils.error import serializable_error_info_from_exc_info
@@ -458,6 +461,8 @@ def streaming_external_repository(
         self,
         remote_repository_origin: RemoteRepositoryOrigin,
         defer_snapshots: bool = False,
+        accepts_binary_serdes: bool = False,
+        known_snapshot_piece_digests: Optional[Sequence[str]] = None,
         timeout=DEFAULT_REPOSITORY_GRPC_TIMEOUT,
     ) -> Iterator[dict]:
         for res in self._streaming_query(
@@ -466,17 +471,25 @@ def streaming_external_repository(
             # Rename parameter
             serialized_repository_python_origin=serialize_value(remote_repository_origin),
             defer_snapshots=defer_snapshots,
+            accepts_binary_serdes=accepts_binary_serdes,
+            accepts_snapshot_pieces=known_snapshot_piece_digests is not None,
+            known_snapshot_piece_digests=known_snapshot_piece_digests or [],
             timeout=timeout,
         ):
             yield {
                 "sequence_number": res.sequence_number,
                 "serialized_external_repository_chunk": res.serialized_external_repository_chunk,
+                "serialized_external_repository_binary_chunk": (
+                    res.serialized_external_repository_binary_chunk
+                ),
             }
 
     async def gen_streaming_external_repository(
         self,
         remote_repository_origin: RemoteRepositoryOrigin,
         defer_snapshots: bool = False,
+        accepts_binary_serdes: bool = False,
+        known_snapshot_piece_digests: Optional[Sequence[str]] = None,
         timeout=DEFAULT_REPOSITORY_GRPC_TIMEOUT,
     ) -> AsyncIterable[dict]:
         async for res in self._gen_streaming_query(
@@ -485,11 +498,17 @@ async def gen_streaming_external_repository(
             # Rename parameter
             serialized_repository_python_origin=serialize_value(remote_repository_origin),
             defer_snapshots=defer_snapshots,
+            accepts_binary_serdes=accepts_binary_serdes,
+            accepts_snapshot_pieces=known_snapshot_piece_digests is not None,
+            known_snapshot_piece_digests=known_snapshot_piece_digests or [],
             timeout=timeout,
         ):
             yield {
                 "sequence_number": res.sequence_number,
                 "serialized_external_repository_chunk": res.serialized_external_repository_chunk,
+                "serialized_external_repository_binary_chunk": (
+                    res.serialized_external_repository_binary_chunk
+                ),
             }
 
     def _is_unimplemented_error(self, e: Exception) -> bool:
@@ -567,12 +586,7 @@ def external_sensor_execution(self, sensor_execution_args: SensorExecutionArgs)
             else DEFAULT_SENSOR_GRPC_TIMEOUT
         )
 
-        custom_timeout_message = (
-            f"The sensor tick timed out due to taking longer than {timeout} seconds to execute the"
-            " sensor function. One way to avoid this error is to break up the sensor work into"
-            " chunks, using cursors to let subsequent sensor calls pick up where the previous call"
-            " left off."
-        )
+        custom_timeout_message = sensor_execution_timeout_message(timeout)
 
         try:
             return self._query(
@@ -601,6 +615,46 @@ def external_sensor_execution(self, sensor_execution_args: SensorExecutionArgs)
             else:
                 raise
 
+    def external_sensor_execution_batch(
+        self,
+        sensor_execution_batch_args: SensorExecutionBatchArgs,
+        timeout: Optional[int] = None,
+    ) -> Iterator[Tuple[int, str]]:
+        """Yields the index of each sensor in the batch together with its serialized result, as
+        soon as the sensor has been evaluated.
+        """
+        check.inst_param(
+            sensor_execution_batch_args, "sensor_execution_batch_args", SensorExecutionBatchArgs
+        )
+
+        if timeout is None:
+            timeout = sensor_execution_batch_timeout(sensor_execution_batch_args)
+
+        has_results = False
+        chunks = []
+        try:
+            for event in self._streaming_query(
+                "ExternalSensorExecutionBatch",
+                api_pb2.ExternalSensorExecutionBatchRequest,
+                timeout=timeout,
+                serialized_sensor_execution_batch_args=serialize_value(sensor_execution_batch_args),
+            ):
+                chunks.append(event.serialized_chunk)
+                if event.is_last_chunk:
+                    has_results = True
+                    yield event.sensor_index, "".join(chunks)
+                    chunks = []
+        except Exception as e:
+            # On older servers that don't have the batch API call implemented, evaluate each sensor
+            # with its own call
+            if self._is_unimplemented_error(e) and not has_results:
+                for sensor_index, sensor_execution_args in enumerate(
+                    sensor_execution_batch_args.sensor_execution_args
+                ):
+                    yield sensor_index, self.external_sensor_execution(sensor_execution_args)
+            else:
+                raise
+
     def external_notebook_data(self, notebook_path: str) -> bytes:
         check.str_param(notebook_path, "notebook_path")
         res = self._query(
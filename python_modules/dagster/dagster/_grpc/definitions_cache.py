@@ -0,0 +1,200 @@
+"""An opt-in on-disk cache of the definitions served by a code server, which lets a restarted code
+server answer `ListRepositories` and `ExternalRepository` calls from the previous boot while it
+imports the user code in the background.
+
+A cache entry is only used when the fingerprint of the code location still matches the one it was
+written with. The fingerprint covers the loadable target, the dagster version, the values of a
+configurable set of env vars, the modification times and sizes of the python source files of the
+code location and those of the files under a configurable set of extra paths.
+
+Definitions that depend on anything else, such as data files outside of those paths or remote
+state, can be served stale from the cache until the code has loaded. The server then compares the
+loaded definitions with the cached ones and, if they differ, changes its server id so that clients
+fetch them again.
+"""
+
+import hashlib
+import importlib.util
+import logging
+import os
+import tempfile
+from typing import Iterator, Mapping, Optional, Sequence
+
+import dagster._check as check
+from dagster._core.code_pointer import CodePointer
+from dagster._core.remote_representation.external_data import RepositorySnap
+from dagster._core.types.loadable_target_origin import LoadableTargetOrigin
+from dagster._grpc.types import LoadableRepositorySymbol
+from dagster._record import record
+from dagster._serdes import (
+    deserialize_value,
+    serialize_value,
+    serialize_value_binary,
+    whitelist_for_serdes,
+)
+from dagster._serdes.utils import create_snapshot_id
+from dagster.version import __version__
+
+
+@whitelist_for_serdes
+@record
+class CachedDefinitions:
+    fingerprint: str
+    loadable_repository_symbols: Sequence[LoadableRepositorySymbol]
+    code_pointers_by_repo_name: Mapping[str, CodePointer]
+    repository_snaps: Mapping[str, RepositorySnap]
+
+
+def _get_source_roots(loadable_target_origin: LoadableTargetOrigin) -> Sequence[str]:
+    if loadable_target_origin.python_file:
+        return [os.path.dirname(os.path.abspath(loadable_target_origin.python_file))]
+
+    module_name = check.not_none(
+        loadable_target_origin.module_name or loadable_target_origin.package_name
+    )
+    top_level_name = module_name.split(".")[0]
+
+    if loadable_target_origin.working_directory:
+        for candidate in (top_level_name, f"{top_level_name}.py"):
+            path = os.path.join(loadable_target_origin.working_directory, candidate)
+            if os.path.exists(path):
+                return [os.path.abspath(path)]
+
+    # resolving the spec of a top-level module does not import it
+    spec = importlib.util.find_spec(top_level_name)
+    if spec is None:
+        return []
+    if spec.submodule_search_locations:
+        return list(spec.submodule_search_locations)
+    return [spec.origin] if spec.origin else []
+
+
+def _iter_files(root: str, python_only: bool) -> Iterator[str]:
+    if os.path.isfile(root):
+        yield root
+        return
+
+    for dirpath, dirnames, filenames in os.walk(root):
+        dirnames[:] = sorted(
+            dirname
+            for dirname in dirnames
+            if not dirname.startswith(".") and dirname != "__pycache__"
+        )
+        for filename in sorted(filenames):
+            if not python_only or filename.endswith(".py"):
+                yield os.path.join(dirpath, filename)
+
+
+def get_code_location_fingerprint(
+    loadable_target_origin: LoadableTargetOrigin,
+    env_vars: Sequence[str] = (),
+    extra_paths: Sequence[str] = (),
+) -> Optional[str]:
+    """Returns a fingerprint of the code location, or None if its source files could not be
+    located without importing it. Every file under the given extra paths is fingerprinted, while
+    only the python files under the source roots of the code location are.
+    """
+    source_roots = _get_source_roots(loadable_target_origin)
+    if not source_roots:
+        return None
+
+    fingerprint = hashlib.sha1()
+    fingerprint.update(__version__.encode("utf-8"))
+    fingerprint.update(serialize_value(loadable_target_origin).encode("utf-8"))
+    for env_var in sorted(env_vars):
+        fingerprint.update(f"{env_var}={os.getenv(env_var)}".encode("utf-8"))
+    roots = [
+        *((source_root, True) for source_root in source_roots),
+        *((os.path.abspath(extra_path), False) for extra_path in sorted(extra_paths)),
+    ]
+    for root, python_only in roots:
+        if not os.path.exists(root):
+            # a missing extra path is fingerprinted too, so that creating it invalidates the cache
+            fingerprint.update(f"{root}:missing".encode("utf-8"))
+            continue
+        for path in _iter_files(root, python_only):
+            stat = os.stat(path)
+            fingerprint.update(f"{path}:{stat.st_mtime_ns}:{stat.st_size}".encode("utf-8"))
+    return fingerprint.hexdigest()
+
+
+class DefinitionsCache:
+    """Reads and writes the cached definitions of a single code location in `cache_dir`. The
+    fingerprint is computed once on construction, before the user code is imported, so that an
+    entry written after the import never claims source changes made while it was running.
+    """
+
+    def __init__(
+        self,
+        cache_dir: str,
+        loadable_target_origin: LoadableTargetOrigin,
+        env_vars: Sequence[str] = (),
+        extra_paths: Sequence[str] = (),
+        logger: Optional[logging.Logger] = None,
+    ):
+        self._cache_dir = check.str_param(cache_dir, "cache_dir")
+        self._loadable_target_origin = check.inst_param(
+            loadable_target_origin, "loadable_target_origin", LoadableTargetOrigin
+        )
+        self._logger = logger or logging.getLogger("dagster.code_server")
+        self._path = os.path.join(cache_dir, f"{create_snapshot_id(loadable_target_origin)}.cache")
+
+        try:
+            self._fingerprint = get_code_location_fingerprint(
+                loadable_target_origin,
+                env_vars=check.sequence_param(env_vars, "env_vars", of_type=str),
+                extra_paths=check.sequence_param(extra_paths, "extra_paths", of_type=str),
+            )
+        except Exception:
+            self._logger.exception("Could not fingerprint the code location, not caching it")
+            self._fingerprint = None
+
+    @property
+    def fingerprint(self) -> Optional[str]:
+        return self._fingerprint
+
+    def read(self) -> Optional[CachedDefinitions]:
+        if self._fingerprint is None or not os.path.exists(self._path):
+            return None
+
+        try:
+            with open(self._path, "rb") as f:
+                cached_definitions = deserialize_value(f.read(), CachedDefinitions)
+        except Exception:
+            self._logger.exception(f"Could not read cached definitions from {self._path}")
+            return None
+
+        if cached_definitions.fingerprint != self._fingerprint:
+            return None
+
+        return cached_definitions
+
+    def write(
+        self,
+        loadable_repository_symbols: Sequence[LoadableRepositorySymbol],
+        code_pointers_by_repo_name: Mapping[str, CodePointer],
+        repository_snaps: Mapping[str, RepositorySnap],
+    ) -> None:
+        if self._fingerprint is None:
+            return
+
+        cached_definitions = CachedDefinitions(
+            fingerprint=self._fingerprint,
+            loadable_repository_symbols=loadable_repository_symbols,
+            code_pointers_by_repo_name=code_pointers_by_repo_name,
+            repository_snaps=repository_snaps,
+        )
+        try:
+            os.makedirs(self._cache_dir, exist_ok=True)
+            # write to a temporary file first so that concurrent readers never see a partial file
+            with tempfile.NamedTemporaryFile(
+                "wb", dir=self._cache_dir, suffix=".tmp", delete=False
+            ) as f:
+                f.write(serialize_value_binary(cached_definitions))
+            os.replace(f.name, self._path)
+        except Exception:
+            self._logger.exception(f"Could not write cached definitions to {self._path}")
+
+    def clear(self) -> None:
+        if os.path.exists(self._path):
+            os.remove(self._path)
@@ -358,6 +358,7 @@ def get_external_sensor_execution(
     cursor: Optional[str],
     log_key: Optional[Sequence[str]],
     last_sensor_start_timestamp: Optional[float],
+    instance: Optional[DagsterInstance] = None,
 ) -> Union["SensorExecutionData", SensorExecutionErrorSnap]:
     from dagster._core.execution.resources_init import get_transitive_required_resource_keys
 
@@ -385,6 +386,7 @@ def get_external_sensor_execution(
             resources=resources_to_build,
             last_sensor_start_time=last_sensor_start_timestamp,
             code_location_origin=code_location_origin,
+            instance=instance,
         ) as sensor_context:
             with user_code_error_boundary(
                 SensorExecutionError,
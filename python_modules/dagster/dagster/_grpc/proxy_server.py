@@ -1,8 +1,10 @@
+import json
 import logging
 import sys
 import threading
-from contextlib import ExitStack
-from typing import TYPE_CHECKING, Dict, Optional
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import ExitStack, contextmanager
+from typing import TYPE_CHECKING, Dict, Iterator, List, Optional, Sequence
 
 import dagster._check as check
 from dagster._core.instance import InstanceRef
@@ -17,9 +19,11 @@
     CancelExecutionResult,
     ExecuteExternalJobArgs,
     SensorExecutionArgs,
+    SensorExecutionBatchArgs,
     ShutdownServerResult,
     StartRunResult,
 )
+from dagster._grpc.utils import sensor_execution_batch_timeout
 from dagster._serdes import deserialize_value, serialize_value
 from dagster._utils.error import serializable_error_info_from_exc_info
 
@@ -29,10 +33,51 @@
 CLEANUP_TICK = 1
 
 
+class CodeServerClientPool:
+    """The clients of the code server processes that a proxy server forwards calls to. The first
+    client is the primary one, which serves every call that is not an evaluation call. Evaluation
+    calls are routed to the client with the fewest evaluation calls currently in flight.
+    """
+
+    def __init__(self, clients: Sequence["DagsterGrpcClient"]):
+        self._clients = check.sequence_param(clients, "clients")
+        check.invariant(len(self._clients) > 0, "A client pool needs at least one client")
+        self._in_flight_counts = [0] * len(self._clients)
+        self._lock = threading.Lock()
+
+    @property
+    def clients(self) -> Sequence["DagsterGrpcClient"]:
+        return self._clients
+
+    @property
+    def primary_client(self) -> "DagsterGrpcClient":
+        return self._clients[0]
+
+    def get_in_flight_counts(self) -> Sequence[int]:
+        with self._lock:
+            return list(self._in_flight_counts)
+
+    @contextmanager
+    def acquire_client(self) -> Iterator["DagsterGrpcClient"]:
+        with self._lock:
+            index = min(range(len(self._clients)), key=lambda i: self._in_flight_counts[i])
+            self._in_flight_counts[index] += 1
+        try:
+            yield self._clients[index]
+        finally:
+            with self._lock:
+                self._in_flight_counts[index] -= 1
+
+
 class DagsterProxyApiServicer(DagsterApiServicer):
     """Service that implements the dagster gRPC API by opening up a "dagster api grpc" subprocess, and proxying
     all gRPC calls to the server running in that subprocess. This allows us to reload code by
     restarting the subprocess without needing to restart the parent process.
+
+    If num_processes is greater than one, that many subprocesses are started. Sensor, schedule and
+    partition evaluation calls are spread over all of them by load, so that CPU-heavy evaluations
+    don't serialize on the GIL of a single process, while every other call is served by the first
+    subprocess.
     """
 
     def __init__(
@@ -48,9 +93,13 @@ def __init__(
         server_termination_event: threading.Event,
         instance_ref: Optional[InstanceRef],
         logger: logging.Logger,
+        num_processes: int = 1,
     ):
         super(DagsterProxyApiServicer, self).__init__()
 
+        self._num_processes = check.int_param(num_processes, "num_processes")
+        check.invariant(self._num_processes >= 1, "num_processes must be at least 1")
+
         self._loadable_target_origin = loadable_target_origin
         self._fixed_server_id = fixed_server_id
         self._container_image = container_image
@@ -61,28 +110,32 @@ def __init__(
         self._log_level = log_level
         self._logger = logger
 
-        self._client = None
+        self._client_pool: Optional[CodeServerClientPool] = None
         self._load_error = None
         self._heartbeat_shutdown_event = None
-        self._heartbeat_thread = None
+        self._heartbeat_threads: List[threading.Thread] = []
 
         self._exit_stack = ExitStack()
 
         self._reload_lock = threading.Lock()
 
-        self._grpc_server_registry = self._exit_stack.enter_context(
-            GrpcServerRegistry(
-                instance_ref=self._instance_ref,
-                heartbeat_ttl=30,
-                startup_timeout=startup_timeout,
-                log_level=self._log_level,
-                inject_env_vars_from_instance=self._inject_env_vars_from_instance,
-                container_image=self._container_image,
-                container_context=self._container_context,
-                wait_for_processes_on_shutdown=True,
-                additional_timeout_msg="Set from --startup-timeout command line argument. ",
+        # Each registry manages the subprocess for one slot of the pool
+        self._grpc_server_registries = [
+            self._exit_stack.enter_context(
+                GrpcServerRegistry(
+                    instance_ref=self._instance_ref,
+                    heartbeat_ttl=30,
+                    startup_timeout=startup_timeout,
+                    log_level=self._log_level,
+                    inject_env_vars_from_instance=self._inject_env_vars_from_instance,
+                    container_image=self._container_image,
+                    container_context=self._container_context,
+                    wait_for_processes_on_shutdown=True,
+                    additional_timeout_msg="Set from --startup-timeout command line argument. ",
+                )
             )
-        )
+            for _ in range(self._num_processes)
+        ]
         self._origin = ManagedGrpcPythonEnvCodeLocationOrigin(
             loadable_target_origin=self._loadable_target_origin, location_name=location_name
         )
@@ -108,46 +161,66 @@ def __init__(
 
         self._reload_location()
 
+    @property
+    def _client(self) -> Optional["DagsterGrpcClient"]:
+        return self._client_pool.primary_client if self._client_pool else None
+
     def _reload_location(self):
         from dagster._grpc.client import client_heartbeat_thread
 
+        client_pool = None
         try:
-            endpoint = self._grpc_server_registry.reload_grpc_endpoint(self._origin)
+            # start all of the subprocesses at once so that reloading doesn't take longer with
+            # more processes
+            with ThreadPoolExecutor(
+                max_workers=self._num_processes, thread_name_prefix="code-server-reload"
+            ) as executor:
+                endpoint_futures = [
+                    executor.submit(registry.reload_grpc_endpoint, self._origin)
+                    for registry in self._grpc_server_registries
+                ]
+                endpoints = [future.result() for future in endpoint_futures]
             self._load_error = None
-            self._client = endpoint.create_client()
+            client_pool = CodeServerClientPool([endpoint.create_client() for endpoint in endpoints])
+            self._client_pool = client_pool
         except Exception:
             # Server crashed when starting up
             self._load_error = serializable_error_info_from_exc_info(sys.exc_info())
             self._logger.exception("Failure while loading code")
 
-        if self._client:
+        if client_pool:
             self._heartbeat_shutdown_event = threading.Event()
-            self._heartbeat_thread = threading.Thread(
-                target=client_heartbeat_thread,
-                args=(
-                    self._client,
-                    self._heartbeat_shutdown_event,
-                ),
-                name="grpc-client-heartbeat",
-                daemon=True,
-            )
-            self._heartbeat_thread.start()
+            self._heartbeat_threads = [
+                threading.Thread(
+                    target=client_heartbeat_thread,
+                    args=(
+                        client,
+                        self._heartbeat_shutdown_event,
+                    ),
+                    name="grpc-client-heartbeat",
+                    daemon=True,
+                )
+                for client in client_pool.clients
+            ]
+            for heartbeat_thread in self._heartbeat_threads:
+                heartbeat_thread.start()
 
     def ReloadCode(self, request, context):
         with self._reload_lock:  # can only call this method once at a time
             old_heartbeat_shutdown_event = self._heartbeat_shutdown_event
-            old_heartbeat_thread = self._heartbeat_thread
-            old_client = self._client
+            old_heartbeat_threads = self._heartbeat_threads
+            old_client_pool = self._client_pool
 
-            self._reload_location()  # Creates and starts a new heartbeat thread
+            self._reload_location()  # Creates and starts new heartbeat threads
 
-        if old_client:
-            old_client.shutdown_server()
+        if old_client_pool:
+            for old_client in old_client_pool.clients:
+                old_client.shutdown_server()
 
         if old_heartbeat_shutdown_event:
             old_heartbeat_shutdown_event.set()
 
-        if old_heartbeat_thread:
+        for old_heartbeat_thread in old_heartbeat_threads:
             old_heartbeat_thread.join()
 
         return api_pb2.ReloadCodeReply()
@@ -160,9 +233,9 @@ def cleanup(self):
             self._heartbeat_shutdown_event.set()
             self._heartbeat_shutdown_event = None
 
-        if self._heartbeat_thread:
-            self._heartbeat_thread.join()
-            self._heartbeat_thread = None
+        for heartbeat_thread in self._heartbeat_threads:
+            heartbeat_thread.join()
+        self._heartbeat_threads = []
 
         self._exit_stack.close()
 
@@ -175,7 +248,10 @@ def _cleanup_thread(self) -> None:
                 break
 
             if self._shutdown_once_executions_finish_event.is_set():
-                if self._grpc_server_registry.are_all_servers_shut_down():
+                if all(
+                    registry.are_all_servers_shut_down()
+                    for registry in self._grpc_server_registries
+                ):
                     self._server_termination_event.set()
 
     def _get_grpc_client(self):
@@ -193,6 +269,25 @@ def _streaming_query(
             raise Exception("No available client to code serer")
         return check.not_none(self._client)._get_streaming_response(api_name, request, timeout)  # noqa
 
+    def _evaluation_query(
+        self, api_name: str, request, _context, timeout: int = DEFAULT_GRPC_TIMEOUT
+    ):
+        client_pool = self._client_pool
+        if not client_pool:
+            raise Exception("No available client to code serer")
+        with client_pool.acquire_client() as client:
+            return client._get_response(api_name, request, timeout)  # noqa
+
+    def _evaluation_streaming_query(
+        self, api_name: str, request, _context, timeout: int = DEFAULT_GRPC_TIMEOUT
+    ):
+        client_pool = self._client_pool
+        if not client_pool:
+            raise Exception("No available client to code serer")
+        # the call counts as in flight until the response has been fully streamed back
+        with client_pool.acquire_client() as client:
+            yield from client._get_streaming_response(api_name, request, timeout)  # noqa
+
     def ExecutionPlanSnapshot(self, request, context):
         return self._query("ExecutionPlanSnapshot", request, context)
 
@@ -204,7 +299,26 @@ def ListRepositories(self, request, context):
         return self._query("ListRepositories", request, context)
 
     def Ping(self, request, context):
-        return self._query("Ping", request, context)
+        client_pool = self._client_pool
+        if not client_pool or len(client_pool.clients) == 1:
+            return self._query("Ping", request, context)
+
+        # report the utilization metrics of every process, in the order of the pool
+        replies = [
+            client._get_response("Ping", request, DEFAULT_GRPC_TIMEOUT)  # noqa
+            for client in client_pool.clients
+        ]
+        worker_metrics = []
+        for reply, in_flight_count in zip(replies, client_pool.get_in_flight_counts()):
+            metrics = json.loads(reply.serialized_server_utilization_metrics or "{}")
+            metrics["in_flight_evaluation_count"] = in_flight_count
+            worker_metrics.append(metrics)
+
+        metrics = json.loads(replies[0].serialized_server_utilization_metrics or "{}")
+        metrics["per_worker_metrics"] = worker_metrics
+        return api_pb2.PingReply(
+            echo=replies[0].echo, serialized_server_utilization_metrics=json.dumps(metrics)
+        )
 
     def GetServerId(self, request, context):
         return self._fixed_server_id or self._query("GetServerId", request, context)
@@ -222,19 +336,21 @@ def StreamingPing(self, request, context):
         return self._streaming_query("StreamingPing", request, context)
 
     def ExternalPartitionNames(self, request, context):
-        return self._query("ExternalPartitionNames", request, context)
+        return self._evaluation_query("ExternalPartitionNames", request, context)
 
     def ExternalNotebookData(self, request, context):
         return self._query("ExternalNotebookData", request, context)
 
     def ExternalPartitionConfig(self, request, context):
-        return self._query("ExternalPartitionConfig", request, context)
+        return self._evaluation_query("ExternalPartitionConfig", request, context)
 
     def ExternalPartitionTags(self, request, context):
-        return self._query("ExternalPartitionTags", request, context)
+        return self._evaluation_query("ExternalPartitionTags", request, context)
 
     def ExternalPartitionSetExecutionParams(self, request, context):
-        return self._streaming_query("ExternalPartitionSetExecutionParams", request, context)
+        return self._evaluation_streaming_query(
+            "ExternalPartitionSetExecutionParams", request, context
+        )
 
     def ExternalPipelineSubsetSnapshot(self, request, context):
         return self._query("ExternalPipelineSubsetSnapshot", request, context)
@@ -246,17 +362,17 @@ def ExternalJob(self, request, context):
         return self._query("ExternalJob", request, context)
 
     def ExternalScheduleExecution(self, request, context):
-        return self._streaming_query("ExternalScheduleExecution", request, context)
+        return self._evaluation_streaming_query("ExternalScheduleExecution", request, context)
 
     def SyncExternalScheduleExecution(self, request, context):
-        return self._query("SyncExternalScheduleExecution", request, context)
+        return self._evaluation_query("SyncExternalScheduleExecution", request, context)
 
     def ExternalSensorExecution(self, request, context):
         sensor_execution_args = deserialize_value(
             request.serialized_external_sensor_execution_args,
             SensorExecutionArgs,
         )
-        return self._streaming_query(
+        return self._evaluation_streaming_query(
             "ExternalSensorExecution",
             request,
             context,
@@ -268,17 +384,30 @@ def SyncExternalSensorExecution(self, request, context):
             request.serialized_external_sensor_execution_args,
             SensorExecutionArgs,
         )
-        return self._query(
+        return self._evaluation_query(
             "SyncExternalSensorExecution",
             request,
             context,
             sensor_execution_args.timeout or DEFAULT_GRPC_TIMEOUT,
         )
 
+    def ExternalSensorExecutionBatch(self, request, context):
+        sensor_execution_batch_args = deserialize_value(
+            request.serialized_sensor_execution_batch_args,
+            SensorExecutionBatchArgs,
+        )
+        return self._evaluation_streaming_query(
+            "ExternalSensorExecutionBatch",
+            request,
+            context,
+            sensor_execution_batch_timeout(sensor_execution_batch_args),
+        )
+
     def ShutdownServer(self, request, context):
         try:
             self._shutdown_once_executions_finish_event.set()
-            self._grpc_server_registry.shutdown_all_processes()
+            for registry in self._grpc_server_registries:
+                registry.shutdown_all_processes()
             return api_pb2.ShutdownServerReply(
                 serialized_shutdown_server_result=serialize_value(
                     ShutdownServerResult(success=True, serializable_error_info=None)
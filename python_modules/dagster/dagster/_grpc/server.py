@@ -26,6 +26,7 @@
     Sequence,
     Tuple,
     TypedDict,
+    Union,
     cast,
 )
 
@@ -51,6 +52,7 @@
     RemoteJobSubsetResult,
     RepositoryErrorSnap,
     RepositorySnap,
+    RepositorySnapPieces,
     ScheduleExecutionErrorSnap,
     SensorExecutionErrorSnap,
 )
@@ -67,6 +69,7 @@
     DagsterApiServicer,
     add_DagsterApiServicer_to_server,
 )
+from dagster._grpc.definitions_cache import CachedDefinitions, DefinitionsCache
 from dagster._grpc.impl import (
     RunInSubprocessComplete,
     StartRunInSubprocessSuccessful,
@@ -98,6 +101,7 @@
     PartitionNamesArgs,
     PartitionSetExecutionParamArgs,
     SensorExecutionArgs,
+    SensorExecutionBatchArgs,
     ShutdownServerResult,
     StartRunResult,
 )
@@ -106,15 +110,17 @@
     get_loadable_targets,
     max_rx_bytes,
     max_send_bytes,
+    sensor_execution_timeout,
+    sensor_execution_timeout_message,
 )
-from dagster._serdes import deserialize_value, serialize_value
+from dagster._serdes import deserialize_value, serialize_value, serialize_value_binary
 from dagster._serdes.ipc import IPCErrorMessage, open_ipc_subprocess
 from dagster._utils import find_free_port, get_run_crash_explanation, safe_tempfile_path_unmanaged
 from dagster._utils.container import (
     ContainerUtilizationMetrics,
     retrieve_containerized_utilization_metrics,
 )
-from dagster._utils.error import serializable_error_info_from_exc_info
+from dagster._utils.error import SerializableErrorInfo, serializable_error_info_from_exc_info
 from dagster._utils.typed_dict import init_optional_typeddict
 
 if TYPE_CHECKING:
@@ -352,6 +358,9 @@ def __init__(
         instance_ref: Optional[InstanceRef] = None,
         location_name: Optional[str] = None,
         enable_metrics: bool = False,
+        definitions_cache_dir: Optional[str] = None,
+        definitions_cache_env_vars: Optional[Sequence[str]] = None,
+        definitions_cache_paths: Optional[Sequence[str]] = None,
     ):
         super(DagsterApiServer, self).__init__()
 
@@ -407,6 +416,28 @@ def __init__(
         self._enable_metrics = check.bool_param(enable_metrics, "enable_metrics")
         self._server_threadpool_executor = server_threadpool_executor
 
+        self._definitions_cache = (
+            DefinitionsCache(
+                definitions_cache_dir,
+                loadable_target_origin,
+                env_vars=check.opt_sequence_param(
+                    definitions_cache_env_vars, "definitions_cache_env_vars", of_type=str
+                ),
+                extra_paths=check.opt_sequence_param(
+                    definitions_cache_paths, "definitions_cache_paths", of_type=str
+                ),
+                logger=logger,
+            )
+            if definitions_cache_dir and loadable_target_origin
+            else None
+        )
+        self._cached_definitions: Optional[CachedDefinitions] = None
+        self._loaded_repositories: Optional[LoadedRepositories] = None
+        self._loaded_repositories_event = threading.Event()
+        self._lazy_load_user_code = check.bool_param(lazy_load_user_code, "lazy_load_user_code")
+        self._fixed_server_id = fixed_server_id
+        self._stopped_on_load_error = False
+
         try:
             if inject_env_vars_from_instance:
                 from dagster._cli.utils import get_instance_for_cli
@@ -418,17 +449,26 @@ def __init__(
                 )
                 self._instance.inject_env_vars(location_name)
 
-            self._loaded_repositories: Optional[LoadedRepositories] = LoadedRepositories(
-                loadable_target_origin,
-                self._entry_point,
-                self._container_image,
+            self._cached_definitions = (
+                self._definitions_cache.read() if self._definitions_cache else None
             )
+            if self._cached_definitions:
+                # answer with the cached definitions while the code is imported in the background
+                self._logger.info("Serving cached definitions while loading code")
+                threading.Thread(
+                    target=self._load_repositories_in_background,
+                    name="grpc-server-load-repositories",
+                    daemon=True,
+                ).start()
+            else:
+                self._load_repositories()
         except Exception:
             if not lazy_load_user_code:
                 raise
             self._loaded_repositories = None
             self._serializable_load_error = serializable_error_info_from_exc_info(sys.exc_info())
             self._logger.exception("Error while importing code")
+            self._loaded_repositories_event.set()
 
         self.__last_heartbeat_time = time.time()
         if heartbeat:
@@ -451,6 +491,98 @@ def __init__(
 
         self.__cleanup_thread.start()
 
+    def _load_repositories(self) -> None:
+        self._loaded_repositories = LoadedRepositories(
+            self._loadable_target_origin,
+            self._entry_point,
+            self._container_image,
+        )
+        self._loaded_repositories_event.set()
+
+        if self._definitions_cache:
+            threading.Thread(
+                target=self._write_definitions_cache,
+                name="grpc-server-write-definitions-cache",
+                daemon=True,
+            ).start()
+
+    def _load_repositories_in_background(self) -> None:
+        try:
+            self._load_repositories()
+        except Exception:
+            self._serializable_load_error = serializable_error_info_from_exc_info(sys.exc_info())
+            self._logger.exception("Error while importing code")
+            check.not_none(self._definitions_cache).clear()
+            if not self._lazy_load_user_code:
+                # match a failed import without cached definitions, which stops the server
+                self._logger.error("Shutting down the server, as its code could not be loaded")
+                self._stopped_on_load_error = True
+                self._server_termination_event.set()
+        finally:
+            self._loaded_repositories_event.set()
+
+    def _write_definitions_cache(self) -> None:
+        loaded_repositories = check.not_none(self._loaded_repositories)
+        try:
+            repository_snaps = {
+                name: RepositorySnap.from_def(repository_def)
+                for name, repository_def in loaded_repositories.definitions_by_name.items()
+            }
+        except Exception:
+            self._logger.exception("Error while snapshotting definitions for the definitions cache")
+            return
+
+        cached_definitions = self._cached_definitions
+        self._cached_definitions = None
+        if cached_definitions:
+            if cached_definitions.repository_snaps == repository_snaps:
+                return
+            self._logger.warning(
+                "The loaded definitions differ from the cached definitions that were served while"
+                " loading code. If the definitions depend on env vars or on files other than the"
+                " python files of the code location, include them in the definitions cache env"
+                " vars or paths."
+            )
+            if self._fixed_server_id is None:
+                # clients that fetched the cached definitions refetch them when the server id
+                # changes
+                self._server_id = str(uuid.uuid4())
+            else:
+                self._logger.warning(
+                    "The server id is fixed, so clients that fetched the cached definitions must"
+                    " reload the code location to fetch the loaded ones."
+                )
+
+        check.not_none(self._definitions_cache).write(
+            loaded_repositories.loadable_repository_symbols,
+            loaded_repositories.code_pointers_by_repo_name,
+            repository_snaps,
+        )
+
+    def _get_loaded_repositories(self) -> LoadedRepositories:
+        # blocks until the code has been imported when cached definitions are being served
+        self._loaded_repositories_event.wait()
+        return check.not_none(self._loaded_repositories)
+
+    def _get_cached_repository_snap(
+        self, repository_origin: RemoteRepositoryOrigin, defer_snapshots: bool
+    ) -> Optional[RepositorySnap]:
+        cached_definitions = self._cached_definitions
+        if (
+            defer_snapshots
+            or cached_definitions is None
+            or self._loaded_repositories_event.is_set()
+        ):
+            return None
+        return cached_definitions.repository_snaps.get(repository_origin.repository_name)
+
+    @property
+    def stopped_on_load_error(self) -> bool:
+        """Whether the server stopped because its code failed to load in the background after it
+        started serving cached definitions.
+        """
+        return self._stopped_on_load_error
+
     def cleanup(self) -> None:
         # In case ShutdownServer was not called
         self._shutdown_once_executions_finish_event.set()
@@ -517,7 +649,7 @@ def _get_repo_for_origin(
         self,
         remote_repo_origin: RemoteRepositoryOrigin,
     ) -> RepositoryDefinition:
-        loaded_repos = check.not_none(self._loaded_repositories)
+        loaded_repos = self._get_loaded_repositories()
         if remote_repo_origin.repository_name not in loaded_repos.definitions_by_name:
             raise Exception(
                 f'Could not find a repository called "{remote_repo_origin.repository_name}"'
@@ -599,16 +731,24 @@ def ListRepositories(
                 )
             )
         try:
-            loaded_repositories = check.not_none(self._loaded_repositories)
+            cached_definitions = self._cached_definitions
+            if cached_definitions and not self._loaded_repositories_event.is_set():
+                loadable_repository_symbols = cached_definitions.loadable_repository_symbols
+                code_pointers_by_repo_name = cached_definitions.code_pointers_by_repo_name
+            else:
+                loaded_repositories = self._get_loaded_repositories()
+                loadable_repository_symbols = loaded_repositories.loadable_repository_symbols
+                code_pointers_by_repo_name = loaded_repositories.code_pointers_by_repo_name
+
             serialized_response = serialize_value(
                 ListRepositoriesResponse(
-                    loaded_repositories.loadable_repository_symbols,
+                    loadable_repository_symbols,
                     executable_path=(
                         self._loadable_target_origin.executable_path
                         if self._loadable_target_origin
                         else None
                     ),
-                    repository_code_pointer_dict=loaded_repositories.code_pointers_by_repo_name,
+                    repository_code_pointer_dict=code_pointers_by_repo_name,
                     entry_point=self._entry_point,
                     container_image=self._container_image,
                     container_context=self._container_context,
@@ -779,31 +919,40 @@ def ExternalPipelineSubsetSnapshot(
             serialized_external_pipeline_subset_result=serialized_external_pipeline_subset_result
         )
 
-    def _get_serialized_external_repository_data(
+    def _get_external_repository_snap(
         self, request: api_pb2.ExternalRepositoryRequest
-    ) -> str:
+    ) -> Union[RepositorySnap, RepositorySnapPieces, RepositoryErrorSnap]:
         try:
             repository_origin = deserialize_value(
                 request.serialized_repository_python_origin,
                 RemoteRepositoryOrigin,
             )
 
-            return serialize_value(
-                RepositorySnap.from_def(
-                    self._get_repo_for_origin(repository_origin),
-                    defer_snapshots=request.defer_snapshots,
-                )
+            repository_snap = self._get_cached_repository_snap(
+                repository_origin, request.defer_snapshots
+            ) or RepositorySnap.from_def(
+                self._get_repo_for_origin(repository_origin),
+                defer_snapshots=request.defer_snapshots,
             )
+
+            # clients that keep a cache of snapshot pieces advertise it on the request and list
+            # the digests they hold, so only the pieces they are missing are sent back
+            if request.accepts_snapshot_pieces:
+                return RepositorySnapPieces.from_repository_snap(repository_snap).without_pieces(
+                    set(request.known_snapshot_piece_digests)
+                )
+
+            return repository_snap
         except Exception:
             _maybe_log_exception(self._logger, "Repository")
-            return serialize_value(
-                RepositoryErrorSnap(error=serializable_error_info_from_exc_info(sys.exc_info()))
-            )
+            return RepositoryErrorSnap(error=serializable_error_info_from_exc_info(sys.exc_info()))
 
     def ExternalRepository(
         self, request: api_pb2.ExternalRepositoryRequest, _context: grpc.ServicerContext
     ) -> api_pb2.ExternalRepositoryReply:
-        serialized_external_repository_data = self._get_serialized_external_repository_data(request)
+        serialized_external_repository_data = serialize_value(
+            self._get_external_repository_snap(request)
+        )
 
         return api_pb2.ExternalRepositoryReply(
             serialized_external_repository_data=serialized_external_repository_data,
@@ -834,7 +983,24 @@ def ExternalJob(
     def StreamingExternalRepository(
         self, request: api_pb2.ExternalRepositoryRequest, _context: grpc.ServicerContext
     ) -> Iterable[api_pb2.StreamingExternalRepositoryEvent]:
-        serialized_external_repository_data = self._get_serialized_external_repository_data(request)
+        external_repository_snap = self._get_external_repository_snap(request)
+
+        # clients that can decode the binary serdes format advertise it on the request, older
+        # clients never set the field and keep receiving JSON string chunks
+        if request.accepts_binary_serdes:
+            binary_external_repository_data = serialize_value_binary(external_repository_snap)
+            for i, start_index in enumerate(
+                range(0, len(binary_external_repository_data), STREAMING_CHUNK_SIZE)
+            ):
+                yield api_pb2.StreamingExternalRepositoryEvent(
+                    sequence_number=i,
+                    serialized_external_repository_binary_chunk=binary_external_repository_data[
+                        start_index : start_index + STREAMING_CHUNK_SIZE
+                    ],
+                )
+            return
+
+        serialized_external_repository_data = serialize_value(external_repository_snap)
 
         num_chunks = int(
             math.ceil(float(len(serialized_external_repository_data)) / STREAMING_CHUNK_SIZE)
@@ -914,7 +1080,20 @@ def _external_sensor_execution(self, request: api_pb2.ExternalSensorExecutionReq
                 request.serialized_external_sensor_execution_args,
                 SensorExecutionArgs,
             )
+        except Exception:
+            _maybe_log_exception(self._logger, "SensorExecution")
+            return serialize_value(
+                SensorExecutionErrorSnap(
+                    error=serializable_error_info_from_exc_info(sys.exc_info())
+                )
+            )
 
+        return self._evaluate_sensor(args)
+
+    def _evaluate_sensor(
+        self, args: SensorExecutionArgs, instance: Optional[DagsterInstance] = None
+    ) -> str:
+        try:
             return serialize_value(
                 get_external_sensor_execution(
                     self._get_repo_for_origin(args.repository_origin),
@@ -926,6 +1105,7 @@ def _external_sensor_execution(self, request: api_pb2.ExternalSensorExecutionReq
                     args.cursor,
                     args.log_key,
                     args.last_sensor_start_time,
+                    instance=instance,
                 )
             )
         except Exception:
@@ -936,6 +1116,36 @@ def _external_sensor_execution(self, request: api_pb2.ExternalSensorExecutionReq
                 )
             )
 
+    def _evaluate_sensor_with_timeout(
+        self, args: SensorExecutionArgs, instance: Optional[DagsterInstance] = None
+    ) -> str:
+        # Evaluate the sensor in its own thread, so that a sensor that hangs only times out its
+        # own evaluation instead of the rest of the batch. Like a single sensor evaluation whose
+        # caller timed out, the thread is left to finish in the background.
+        timeout = sensor_execution_timeout(args)
+        results: List[str] = []
+        thread = threading.Thread(
+            target=lambda: results.append(self._evaluate_sensor(args, instance)),
+            name=f"sensor-evaluation-{args.sensor_name}",
+            daemon=True,
+        )
+        thread.start()
+        thread.join(timeout)
+
+        if results:
+            return results[0]
+
+        self._logger.warning(
+            f"Evaluation of sensor {args.sensor_name} timed out after {timeout} seconds"
+        )
+        return serialize_value(
+            SensorExecutionErrorSnap(
+                error=SerializableErrorInfo(
+                    message=sensor_execution_timeout_message(timeout), stack=[], cls_name=None
+                )
+            )
+        )
+
     @retrieve_metrics()
     def SyncExternalSensorExecution(
         self, request: api_pb2.ExternalSensorExecutionRequest, _context: grpc.ServicerContext
@@ -952,6 +1162,52 @@ def ExternalSensorExecution(
             self._external_sensor_execution(request)
         )
 
+    @retrieve_metrics()
+    def ExternalSensorExecutionBatch(
+        self,
+        request: api_pb2.ExternalSensorExecutionBatchRequest,
+        _context: grpc.ServicerContext,
+    ) -> Iterable[api_pb2.ExternalSensorExecutionBatchEvent]:
+        batch_args = deserialize_value(
+            request.serialized_sensor_execution_batch_args,
+            SensorExecutionBatchArgs,
+        )
+
+        with ExitStack() as stack:
+            # Sensors in the batch share an instance per instance ref, instead of each sensor
+            # context opening its own
+            instances: Dict[str, Optional[DagsterInstance]] = {}
+
+            for sensor_index, args in enumerate(batch_args.sensor_execution_args):
+                instance = None
+                if args.instance_ref:
+                    instance_key = serialize_value(args.instance_ref)
+                    if instance_key not in instances:
+                        try:
+                            instances[instance_key] = stack.enter_context(
+                                DagsterInstance.from_ref(args.instance_ref)
+                            )
+                        except Exception:
+                            # Leave it to each sensor context to open the instance and report
+                            # the error
+                            self._logger.exception("Could not open instance for sensor batch")
+                            instances[instance_key] = None
+                    instance = instances[instance_key]
+
+                serialized_data = self._evaluate_sensor_with_timeout(args, instance)
+                num_chunks = max(
+                    1, int(math.ceil(float(len(serialized_data)) / STREAMING_CHUNK_SIZE))
+                )
+                for i in range(num_chunks):
+                    yield api_pb2.ExternalSensorExecutionBatchEvent(
+                        sensor_index=sensor_index,
+                        sequence_number=i,
+                        serialized_chunk=serialized_data[
+                            i * STREAMING_CHUNK_SIZE : (i + 1) * STREAMING_CHUNK_SIZE
+                        ],
+                        is_last_chunk=i == num_chunks - 1,
+                    )
+
     def ShutdownServer(
         self, request: api_pb2.Empty, _context: grpc.ServicerContext
     ) -> api_pb2.ShutdownServerReply:
@@ -1046,7 +1302,7 @@ def StartRun(
             run_id = execute_external_job_args.run_id
 
             # reconstructable required for handing execution off to subprocess
-            recon_repo = check.not_none(self._loaded_repositories).reconstructables_by_name[
+            recon_repo = self._get_loaded_repositories().reconstructables_by_name[
                 execute_external_job_args.job_origin.repository_origin.repository_name
             ]
             recon_job = recon_repo.get_reconstructable_job(
@@ -678,6 +678,26 @@ def __new__(
         )
 
 
+@whitelist_for_serdes
+class SensorExecutionBatchArgs(
+    NamedTuple(
+        "_SensorExecutionBatchArgs",
+        [("sensor_execution_args", Sequence[SensorExecutionArgs])],
+    )
+):
+    """Evaluates several sensors of a code location in a single call. The results are streamed
+    back as each sensor finishes evaluating.
+    """
+
+    def __new__(cls, sensor_execution_args: Sequence[SensorExecutionArgs]):
+        return super(SensorExecutionBatchArgs, cls).__new__(
+            cls,
+            sensor_execution_args=check.sequence_param(
+                sensor_execution_args, "sensor_execution_args", of_type=SensorExecutionArgs
+            ),
+        )
+
+
 @whitelist_for_serdes
 class ExternalJobArgs(
     NamedTuple(
@@ -10,6 +10,7 @@
 
 if TYPE_CHECKING:
     from dagster._core.workspace.autodiscovery import LoadableTarget
+    from dagster._grpc.types import SensorExecutionArgs, SensorExecutionBatchArgs
 
 _DEFAULT_GRPC_TIMEOUT_IF_NO_ENV_VAR_SET = 60
 _DEFAULT_REPOSITORY_TIMEOUT_IF_NO_ENV_VAR_SET = 180
@@ -113,6 +114,37 @@ def default_sensor_grpc_timeout() -> int:
     return default_grpc_timeout()
 
 
+def sensor_execution_timeout(sensor_execution_args: "SensorExecutionArgs") -> int:
+    """The timeout of a sensor evaluation, which is the same whether the sensor is evaluated on its
+    own or as part of a batch.
+    """
+    if sensor_execution_args.timeout is not None:
+        return sensor_execution_args.timeout
+
+    return default_sensor_grpc_timeout()
+
+
+def sensor_execution_batch_timeout(sensor_execution_batch_args: "SensorExecutionBatchArgs") -> int:
+    # The sensors of a batch are evaluated one after the other, each bounded by its own timeout.
+    # The default grpc timeout leaves room for the rest of the call.
+    return (
+        sum(
+            sensor_execution_timeout(sensor_execution_args)
+            for sensor_execution_args in sensor_execution_batch_args.sensor_execution_args
+        )
+        + default_grpc_timeout()
+    )
+
+
+def sensor_execution_timeout_message(timeout: int) -> str:
+    return (
+        f"The sensor tick timed out due to taking longer than {timeout} seconds to execute the"
+        " sensor function. One way to avoid this error is to break up the sensor work into"
+        " chunks, using cursors to let subsequent sensor calls pick up where the previous call"
+        " left off."
+    )
+
+
 def default_grpc_server_shutdown_grace_period():
     # Time to wait for calls to finish before shutting down the server
     # Defaults to the same as default_grpc_timeout() unless
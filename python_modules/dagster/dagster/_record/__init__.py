@@ -338,6 +338,11 @@ def get_original_class(obj):
     return getattr(obj, _ORIGINAL_CLASS_FIELD)
 
 
+def get_field_to_new_mapping(obj) -> Mapping[str, str]:
+    check.invariant(is_record(obj), "Only works for @record decorated classes")
+    return getattr(obj, _REMAPPING_FIELD)
+
+
 def as_dict(obj) -> Mapping[str, Any]:
     """Creates a dict representation of the record based on the fields."""
     check.invariant(is_record(obj), "Only works for @record decorated classes")
@@ -6,16 +6,18 @@
 import threading
 from collections import defaultdict
 from concurrent.futures import Future, ThreadPoolExecutor
-from contextlib import AbstractContextManager, ExitStack
+from contextlib import AbstractContextManager, ExitStack, contextmanager
 from typing import (
     TYPE_CHECKING,
     Dict,
     Generator,
+    Iterator,
     List,
     Mapping,
     NamedTuple,
     Optional,
     Sequence,
+    Set,
     Union,
     cast,
 )
@@ -47,7 +49,7 @@
 from dagster._core.telemetry import SCHEDULED_RUN_CREATED, hash_name, log_action
 from dagster._core.utils import InheritContextThreadPoolExecutor
 from dagster._core.workspace.context import IWorkspaceProcessContext
-from dagster._daemon.utils import DaemonErrorCapture
+from dagster._daemon.utils import DaemonErrorCapture, TickRunPlanCache
 from dagster._scheduler.stale import resolve_stale_or_missing_assets
 from dagster._time import get_current_datetime, get_current_timestamp
 from dagster._utils import DebugCrashFlags, SingleInstigatorDebugCrashFlags, check_for_debug_crash
@@ -728,6 +730,41 @@ class SubmitRunRequestResult(NamedTuple):
     submitted_run: Optional[DagsterRun]
 
 
+class _ScheduleTickRuns:
+    """The runs that run requests of a single schedule tick are matched against: the runs that
+    already existed for the schedule time, plus the runs created during the tick. Run requests
+    with the same run key are submitted one at a time, so that they share a single run. Safe to
+    use from the threads of a submission threadpool.
+    """
+
+    def __init__(self, existing_runs: Sequence[DagsterRun]):
+        self._lock = threading.Lock()
+        self._runs = list(existing_runs)
+        self._created_run_ids: Set[str] = set()
+        self._run_key_locks: Dict[Optional[str], threading.Lock] = defaultdict(threading.Lock)
+
+    @contextmanager
+    def lock_run_key(self, run_key: Optional[str]) -> Iterator[None]:
+        with self._lock:
+            run_key_lock = self._run_key_locks[run_key]
+
+        with run_key_lock:
+            yield
+
+    def get_run_for_request(self, run_request: RunRequest) -> Optional[DagsterRun]:
+        with self._lock:
+            return _get_existing_run_for_request(self._runs, run_request)
+
+    def was_created_during_tick(self, run: DagsterRun) -> bool:
+        with self._lock:
+            return run.run_id in self._created_run_ids
+
+    def add_created_run(self, run: DagsterRun) -> None:
+        with self._lock:
+            self._runs.append(run)
+            self._created_run_ids.add(run.run_id)
+
+
 def _submit_run_request(
     run_request: RunRequest,
     workspace_process_context: IWorkspaceProcessContext,
@@ -735,13 +772,33 @@ def _submit_run_request(
     schedule_time: datetime.datetime,
     logger,
     debug_crash_flags,
+    tick_runs: _ScheduleTickRuns,
+    run_plan_cache: TickRunPlanCache,
 ) -> SubmitRunRequestResult:
     instance = workspace_process_context.instance
-    schedule_origin = remote_schedule.get_remote_origin()
 
-    run = _get_existing_run_for_request(instance, remote_schedule, schedule_time, run_request)
-    if run:
-        if run.status != DagsterRunStatus.NOT_STARTED:
+    with tick_runs.lock_run_key(run_request.run_key):
+        run = tick_runs.get_run_for_request(run_request)
+        if run and tick_runs.was_created_during_tick(run):
+            # an earlier run request of this tick with the same run key already created the run
+            logger.info(
+                f"Run {run.run_id} already created with the run key `{run_request.run_key}` for"
+                f" this execution of {remote_schedule.name}"
+            )
+            return SubmitRunRequestResult(
+                run_key=run_request.run_key, error_info=None, existing_run=run, submitted_run=None
+            )
+
+        if not run:
+            run = _create_run_for_request(
+                run_request,
+                workspace_process_context,
+                remote_schedule,
+                schedule_time,
+                run_plan_cache,
+            )
+            tick_runs.add_created_run(run)
+        elif run.status != DagsterRunStatus.NOT_STARTED:
             # A run already exists and was launched for this time period,
             # but the scheduler must have crashed or errored before the tick could be put
             # into a SUCCESS state
@@ -755,30 +812,6 @@ def _submit_run_request(
             logger.info(
                 f"Run {run.run_id} already created for this execution of {remote_schedule.name}"
             )
-    else:
-        job_subset_selector = JobSubsetSelector(
-            location_name=schedule_origin.repository_origin.code_location_origin.location_name,
-            repository_name=schedule_origin.repository_origin.repository_name,
-            job_name=remote_schedule.job_name,
-            op_selection=remote_schedule.op_selection,
-            asset_selection=run_request.asset_selection,
-        )
-
-        # reload the code_location on each submission, request_context derived data can become out date
-        # * non-threaded: if number of serial submissions is too many
-        # * threaded: if thread sits pending in pool too long
-        code_location = _get_code_location_for_schedule(workspace_process_context, remote_schedule)
-
-        remote_job = code_location.get_job(job_subset_selector)
-
-        run = _create_scheduler_run(
-            instance,
-            schedule_time,
-            code_location,
-            remote_schedule,
-            remote_job,
-            run_request,
-        )
 
     check_for_debug_crash(debug_crash_flags, "RUN_CREATED")
 
@@ -802,6 +835,40 @@ def _submit_run_request(
     )
 
 
+def _create_run_for_request(
+    run_request: RunRequest,
+    workspace_process_context: IWorkspaceProcessContext,
+    remote_schedule: RemoteSchedule,
+    schedule_time: datetime.datetime,
+    run_plan_cache: TickRunPlanCache,
+) -> DagsterRun:
+    schedule_origin = remote_schedule.get_remote_origin()
+    job_subset_selector = JobSubsetSelector(
+        location_name=schedule_origin.repository_origin.code_location_origin.location_name,
+        repository_name=schedule_origin.repository_origin.repository_name,
+        job_name=remote_schedule.job_name,
+        op_selection=remote_schedule.op_selection,
+        asset_selection=run_request.asset_selection,
+    )
+
+    # reload the code_location on each submission, request_context derived data can become out date
+    # * non-threaded: if number of serial submissions is too many
+    # * threaded: if thread sits pending in pool too long
+    code_location = _get_code_location_for_schedule(workspace_process_context, remote_schedule)
+
+    remote_job = run_plan_cache.get_job(code_location, job_subset_selector)
+
+    return _create_scheduler_run(
+        workspace_process_context.instance,
+        schedule_time,
+        code_location,
+        remote_schedule,
+        remote_job,
+        run_request,
+        run_plan_cache,
+    )
+
+
 def _get_code_location_for_schedule(
     workspace_process_context: IWorkspaceProcessContext,
     remote_schedule: RemoteSchedule,
@@ -887,6 +954,15 @@ def _schedule_runs_at_time(
 
         run_requests.append(run_request)
 
+    # look up the runs that were already created for this schedule time once for the whole tick,
+    # rather than once per run request
+    tick_runs = _ScheduleTickRuns(
+        _get_existing_runs_for_schedule_time(instance, remote_schedule, schedule_time)
+    )
+    # run requests for the same job selection and run config share their remote job and
+    # execution plan
+    run_plan_cache = TickRunPlanCache()
+
     submit_run_request = lambda run_request: _submit_run_request(
         run_request,
         workspace_process_context,
@@ -894,6 +970,8 @@ def _schedule_runs_at_time(
         schedule_time,
         logger,
         debug_crash_flags,
+        tick_runs,
+        run_plan_cache,
     )
 
     if submit_threadpool_executor:
@@ -918,12 +996,11 @@ def _schedule_runs_at_time(
     tick_context.update_state(TickStatus.SUCCESS)
 
 
-def _get_existing_run_for_request(
+def _get_existing_runs_for_schedule_time(
     instance: DagsterInstance,
     remote_schedule: RemoteSchedule,
     schedule_time: datetime.datetime,
-    run_request: RunRequest,
-) -> Optional[DagsterRun]:
+) -> Sequence[DagsterRun]:
     tags = merge_dicts(
         DagsterRun.tags_for_schedule(remote_schedule),
         {
@@ -932,8 +1009,6 @@ def _get_existing_run_for_request(
             ).isoformat(),
         },
     )
-    if run_request.run_key:
-        tags[RUN_KEY_TAG] = run_request.run_key
     runs_filter = RunsFilter(tags=tags)
     existing_runs = instance.get_runs(runs_filter)
 
@@ -950,10 +1025,17 @@ def _get_existing_run_for_request(
         ):
             matching_runs.append(run)
 
-    if not len(matching_runs):
-        return None
+    return matching_runs
 
-    return matching_runs[0]
+
+def _get_existing_run_for_request(
+    existing_runs: Sequence[DagsterRun], run_request: RunRequest
+) -> Optional[DagsterRun]:
+    for run in existing_runs:
+        if not run_request.run_key or run.tags.get(RUN_KEY_TAG) == run_request.run_key:
+            return run
+
+    return None
 
 
 def _create_scheduler_run(
@@ -963,18 +1045,14 @@ def _create_scheduler_run(
     remote_schedule: RemoteSchedule,
     remote_job: RemoteJob,
     run_request: RunRequest,
+    run_plan_cache: TickRunPlanCache,
 ) -> DagsterRun:
     from dagster._daemon.daemon import get_telemetry_daemon_session_id
 
     run_config = run_request.run_config
     schedule_tags = run_request.tags
 
-    remote_execution_plan = code_location.get_execution_plan(
-        remote_job,
-        run_config,
-        step_keys_to_execute=None,
-        known_state=None,
-    )
+    remote_execution_plan = run_plan_cache.get_execution_plan(code_location, remote_job, run_config)
     execution_plan_snapshot = remote_execution_plan.execution_plan_snapshot
 
     tags = {
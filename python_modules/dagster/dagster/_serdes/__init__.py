@@ -11,8 +11,10 @@
     deserialize_value as deserialize_value,
     deserialize_values as deserialize_values,
     get_storage_name as get_storage_name,
+    is_binary_serialized_value as is_binary_serialized_value,
     pack_value as pack_value,
     serialize_value as serialize_value,
+    serialize_value_binary as serialize_value_binary,
     unpack_value as unpack_value,
     whitelist_for_serdes as whitelist_for_serdes,
 )
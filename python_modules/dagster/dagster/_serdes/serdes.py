@@ -15,7 +15,10 @@
 
 import collections.abc
 import dataclasses
+import struct
+import sys
 from abc import ABC, abstractmethod
+from array import array
 from dataclasses import is_dataclass
 from enum import Enum
 from functools import cached_property, partial
@@ -52,6 +55,7 @@
 from dagster._record import (
     IHaveNew,
     as_dict_for_new,
+    get_field_to_new_mapping,
     get_record_annotations,
     has_generated_new,
     is_record,
@@ -207,6 +211,12 @@ def register_object(
 
         self.object_type_map[name] = serializer.klass
 
+    def register_object_subclass(self, name: str, base_name: str) -> None:
+        """Register a subclass of a registered model class, whose instances are serialized by the
+        serializer of the base class and are therefore deserialized as instances of the base class.
+        """
+        self.object_serializers[name] = self.object_serializers[base_name]
+
     def register_enum(
         self,
         name: str,
@@ -361,6 +371,23 @@ def whitelist_for_serdes(
         )
 
 
+def whitelist_subclass_for_serdes(klass: T_Type) -> T_Type:
+    """Decorator to allow serializing instances of a subclass of a whitelisted class that differs
+    from it only in how an instance is held in memory. Instances are serialized as, and deserialize
+    to, instances of the whitelisted base class. The serializer of the base class must read fields
+    through `object_as_mapping` so that any fields the subclass computes are respected.
+    """
+    base_class = next(
+        (base for base in klass.__mro__[1:] if base.__name__ in _WHITELIST_MAP.object_serializers),
+        None,
+    )
+    check.invariant(
+        base_class is not None, f"{klass.__name__} does not subclass a whitelisted class."
+    )
+    _WHITELIST_MAP.register_object_subclass(klass.__name__, cast(Type, base_class).__name__)
+    return klass
+
+
 def _whitelist_for_serdes(
     whitelist_map: WhitelistMap,
     serializer: Optional[Type["Serializer"]] = None,
@@ -581,39 +608,63 @@ def unpack(
         unpacked_dict: Dict[str, UnpackedValue],
         whitelist_map: WhitelistMap,
         context: UnpackContext,
+    ) -> T:
+        return self._unpack_codec(unpacked_dict, whitelist_map, context)
+
+    def _unpack_generic(
+        self,
+        unpacked_dict: Dict[str, UnpackedValue],
+        whitelist_map: WhitelistMap,
+        context: UnpackContext,
     ) -> T:
         try:
             unpacked_dict = self.before_unpack(context, unpacked_dict)
-            unpacked: Dict[str, PackableValue] = {}
-            for key, value in unpacked_dict.items():
-                loaded_name = self.loaded_field_names.get(key, key)
-                # Naively implements backwards compatibility by filtering arguments that aren't present in
-                # the constructor. If a property is present in the serialized object, but doesn't exist in
-                # the version of the class loaded into memory, that property will be completely ignored.
-                if loaded_name in self.constructor_param_names:
-                    # custom unpack regardless of hook vs recursive descent
-                    custom = self.field_serializers.get(loaded_name)
-                    if custom:
-                        unpacked[loaded_name] = custom.unpack(
-                            value,
-                            whitelist_map=whitelist_map,
-                            context=context,
-                        )
-                    elif context.observed_unknown_serdes_values:
-                        unpacked[loaded_name] = context.assert_no_unknown_values(value)
-                    else:
-                        unpacked[loaded_name] = value  # type: ignore # 2 hot 4 cast()
+            return self.klass(**self._unpack_fields(unpacked_dict, whitelist_map, context))
+        except Exception as exc:
+            return self._handle_unpack_exception(exc, context, unpacked_dict)
 
+    def _unpack_fields(
+        self,
+        unpacked_dict: Dict[str, UnpackedValue],
+        whitelist_map: WhitelistMap,
+        context: UnpackContext,
+    ) -> Dict[str, PackableValue]:
+        unpacked: Dict[str, PackableValue] = {}
+        for key, value in unpacked_dict.items():
+            loaded_name = self.loaded_field_names.get(key, key)
+            # Naively implements backwards compatibility by filtering arguments that aren't present in
+            # the constructor. If a property is present in the serialized object, but doesn't exist in
+            # the version of the class loaded into memory, that property will be completely ignored.
+            if loaded_name in self.constructor_param_names:
+                # custom unpack regardless of hook vs recursive descent
+                custom = self.field_serializers.get(loaded_name)
+                if custom:
+                    unpacked[loaded_name] = custom.unpack(
+                        value,
+                        whitelist_map=whitelist_map,
+                        context=context,
+                    )
+                elif context.observed_unknown_serdes_values:
+                    unpacked[loaded_name] = context.assert_no_unknown_values(value)
                 else:
-                    context.clear_ignored_unknown_values(value)
+                    unpacked[loaded_name] = value  # type: ignore # 2 hot 4 cast()
 
-            return self.klass(**unpacked)
-        except Exception as exc:
-            value = self.handle_unpack_error(exc, context, unpacked_dict)
-            if isinstance(context, UnpackContext):
-                context.assert_no_unknown_values(value)
-                context.clear_ignored_unknown_values(unpacked_dict)
-            return value
+            else:
+                context.clear_ignored_unknown_values(value)
+
+        return unpacked
+
+    def _handle_unpack_exception(
+        self,
+        exc: Exception,
+        context: UnpackContext,
+        unpacked_dict: Dict[str, UnpackedValue],
+    ) -> T:
+        value = self.handle_unpack_error(exc, context, unpacked_dict)
+        if isinstance(context, UnpackContext):
+            context.assert_no_unknown_values(value)
+            context.clear_ignored_unknown_values(unpacked_dict)
+        return value
 
     # Hook: Modify the contents of the unpacked dict before domain object construction during
     # deserialization.
@@ -640,9 +691,31 @@ def pack_items(
         whitelist_map: WhitelistMap,
         object_handler: Callable[[SerializableObject, WhitelistMap, str], JsonSerializableValue],
         descent_path: str,
+    ) -> Iterator[Tuple[str, JsonSerializableValue]]:
+        return self._pack_items_codec(value, whitelist_map, object_handler, descent_path)
+
+    def _pack_items_generic(
+        self,
+        value: T,
+        whitelist_map: WhitelistMap,
+        object_handler: Callable[[SerializableObject, WhitelistMap, str], JsonSerializableValue],
+        descent_path: str,
     ) -> Iterator[Tuple[str, JsonSerializableValue]]:
         yield "__class__", self.get_storage_name()
-        for key, inner_value in self.object_as_mapping(self.before_pack(value)).items():
+        yield from self._pack_fields(
+            self.before_pack(value), whitelist_map, object_handler, descent_path
+        )
+        for key, default in self.old_fields.items():
+            yield key, default
+
+    def _pack_fields(
+        self,
+        value: T,
+        whitelist_map: WhitelistMap,
+        object_handler: Callable[[SerializableObject, WhitelistMap, str], JsonSerializableValue],
+        descent_path: str,
+    ) -> Iterator[Tuple[str, JsonSerializableValue]]:
+        for key, inner_value in self.object_as_mapping(value).items():
             if (key in self.skip_when_empty_fields and inner_value in EMPTY_VALUES_TO_SKIP) or (
                 key in self.skip_when_none_fields and inner_value is None
             ):
@@ -668,8 +741,6 @@ def pack_items(
                         descent_path=f"{descent_path}.{key}",
                     ),
                 )
-        for key, default in self.old_fields.items():
-            yield key, default
 
     # Hook: Modify the contents of the object before packing
     def before_pack(self, value: T) -> T:
@@ -682,6 +753,31 @@ def constructor_param_names(self) -> Sequence[str]: ...
     def get_storage_name(self) -> str:
         return self.storage_name or self.klass.__name__
 
+    # The keys of the fields the compiled pack codec reads positionally off of the object (which
+    # must then be a tuple), or None if fields can only be read through `object_as_mapping`.
+    def _codec_field_keys(self) -> Optional[Sequence[str]]:
+        return None
+
+    # Codecs are compiled on first use rather than at registration time, which keeps import cheap
+    # and defers inspecting the class until any forward references it has can be resolved.
+    @cached_property
+    def _pack_items_codec(
+        self,
+    ) -> Callable[
+        [T, WhitelistMap, Callable[..., JsonSerializableValue], str],
+        Iterator[Tuple[str, JsonSerializableValue]],
+    ]:
+        field_keys = self._codec_field_keys()
+        if field_keys is None:
+            return self._pack_items_generic
+        return _compile_pack_codec(self, field_keys)
+
+    @cached_property
+    def _unpack_codec(
+        self,
+    ) -> Callable[[Dict[str, UnpackedValue], WhitelistMap, UnpackContext], T]:
+        return _compile_unpack_codec(self)
+
 
 T_NamedTuple = TypeVar("T_NamedTuple", default=NamedTuple)
 
@@ -700,6 +796,15 @@ def object_as_mapping(self, value: T_NamedTuple) -> Mapping[str, Any]:
         # Value is always a NamedTuple, we just can't express that in the type of T_NamedTuple.
         return value._asdict()  # type: ignore
 
+    def _codec_field_keys(self) -> Optional[Sequence[str]]:
+        # fields are only read directly off the tuple when the mapping is the default one
+        if type(self).object_as_mapping is not NamedTupleSerializer.object_as_mapping:
+            return None
+        if is_record(self.klass):
+            remap = get_field_to_new_mapping(self.klass)
+            return [remap.get(name, name) for name in self.klass._fields]  # type: ignore
+        return list(self.klass._fields)  # type: ignore
+
     @cached_property
     def constructor_param_names(self) -> Sequence[str]:
         if has_generated_new(self.klass):
@@ -816,6 +921,177 @@ def pack(
         )
 
 
+###################################################################################################
+# Compiled codecs
+###################################################################################################
+
+# Each registered object gets a pack and an unpack function generated for its class, with storage
+# names, skip rules and field serializers resolved when the function is built instead of being
+# looked up for every field of every object.
+
+_SCALAR_TYPES = (int, float, str, bool)
+
+_PACK_CODEC_NAME = "__serdes_pack_items__"
+_UNPACK_CODEC_NAME = "__serdes_unpack__"
+
+
+def _compile_codec(lines: Sequence[str], fn_name: str, namespace: Dict[str, Any]) -> Callable:
+    local_ns: Dict[str, Any] = {}
+    exec("\n".join(lines), namespace, local_ns)
+    return local_ns[fn_name]
+
+
+def _compile_pack_codec(
+    serializer: ObjectSerializer, field_keys: Sequence[str]
+) -> Callable[..., Iterator[Tuple[str, JsonSerializableValue]]]:
+    namespace: Dict[str, Any] = {
+        "klass": serializer.klass,
+        "storage_name": serializer.get_storage_name(),
+        "before_pack": serializer.before_pack,
+        "pack_fields": serializer._pack_fields,  # noqa: SLF001
+        "iter_fields": tuple.__iter__,
+        "transform": _transform_for_serialization,
+        "SCALAR_TYPES": _SCALAR_TYPES,
+        "EMPTY_VALUES_TO_SKIP": EMPTY_VALUES_TO_SKIP,
+    }
+    lines = [
+        f"def {_PACK_CODEC_NAME}(value, whitelist_map, object_handler, descent_path):",
+        "    yield '__class__', storage_name",
+    ]
+    if type(serializer).before_pack is not ObjectSerializer.before_pack:
+        lines.append("    value = before_pack(value)")
+    # values of any other class (e.g. a subclass sharing the registered name) take the generic path
+    lines.extend(
+        [
+            "    if value.__class__ is not klass:",
+            "        yield from pack_fields(value, whitelist_map, object_handler, descent_path)",
+            "    else:",
+        ]
+    )
+    # fields are read off the underlying tuple, since NamedTuple subclasses commonly shadow their
+    # fields with properties and @record classes do not support iteration
+    if field_keys:
+        field_vars = ", ".join(f"v{i}" for i in range(len(field_keys)))
+        lines.append(f"        {field_vars}, = iter_fields(value)")
+    else:
+        lines.append("        pass")
+    for i, key in enumerate(field_keys):
+        storage_key = serializer.storage_field_names.get(key, key)
+        field_path = f"descent_path + {'.' + key!r}"
+        indent = " " * 8
+        v = f"v{i}"
+
+        skip_conditions = []
+        if key in serializer.skip_when_empty_fields:
+            skip_conditions.append(f"{v} in EMPTY_VALUES_TO_SKIP")
+        if key in serializer.skip_when_none_fields:
+            skip_conditions.append(f"{v} is None")
+        if skip_conditions:
+            lines.append(f"{indent}if not ({' or '.join(skip_conditions)}):")
+            indent += " " * 4
+
+        custom = serializer.field_serializers.get(key)
+        if custom:
+            namespace[f"field_serializer_{i}"] = custom
+            lines.append(
+                f"{indent}yield {storage_key!r}, field_serializer_{i}.pack("
+                f"{v}, whitelist_map=whitelist_map, descent_path={field_path})"
+            )
+        else:
+            lines.extend(
+                [
+                    f"{indent}if {v} is None or type({v}) in SCALAR_TYPES:",
+                    f"{indent}    yield {storage_key!r}, {v}",
+                    f"{indent}else:",
+                    f"{indent}    yield {storage_key!r}, transform("
+                    f"{v}, whitelist_map, object_handler, {field_path})",
+                ]
+            )
+    for i, (key, default) in enumerate(serializer.old_fields.items()):
+        namespace[f"old_field_{i}"] = default
+        lines.append(f"    yield {key!r}, old_field_{i}")
+
+    return _compile_codec(lines, _PACK_CODEC_NAME, namespace)
+
+
+def _compile_unpack_codec(
+    serializer: ObjectSerializer[T],
+) -> Callable[[Dict[str, UnpackedValue], WhitelistMap, UnpackContext], T]:
+    param_names = set(serializer.constructor_param_names)
+    loaded_field_names = serializer.loaded_field_names
+    # storage keys that are passed through to the constructor, after renaming
+    known_keys = frozenset(
+        key
+        for key in [*param_names, *loaded_field_names]
+        if loaded_field_names.get(key, key) in param_names
+    )
+    renames = {
+        key: loaded_field_names[key]
+        for key in known_keys
+        if loaded_field_names.get(key, key) != key
+    }
+    custom_fields = {
+        name: custom for name, custom in serializer.field_serializers.items() if name in param_names
+    }
+    namespace: Dict[str, Any] = {
+        "klass": serializer.klass,
+        "known_keys": known_keys,
+        "renames": renames,
+        "before_unpack": serializer.before_unpack,
+        "unpack_fields": serializer._unpack_fields,  # noqa: SLF001
+        "handle_exception": serializer._handle_unpack_exception,  # noqa: SLF001
+    }
+    lines = [
+        f"def {_UNPACK_CODEC_NAME}(unpacked_dict, whitelist_map, context):",
+        "    try:",
+    ]
+    if type(serializer).before_unpack is not ObjectSerializer.before_unpack:
+        lines.append("        unpacked_dict = before_unpack(context, unpacked_dict)")
+    # unknown values need the generic per-field handling, which reports or clears them. Otherwise
+    # storage keys that are not constructor params (e.g. old_fields) can simply be dropped.
+    lines.extend(
+        [
+            "        if context.observed_unknown_serdes_values:",
+            "            return klass(**unpack_fields(unpacked_dict, whitelist_map, context))",
+            "        if unpacked_dict.keys() <= known_keys:",
+        ]
+    )
+    if renames:
+        lines.append(
+            "            kwargs = {renames.get(k, k): v for k, v in unpacked_dict.items()}"
+        )
+    elif custom_fields:
+        lines.append("            kwargs = dict(unpacked_dict)")
+    else:
+        lines.append("            kwargs = unpacked_dict")
+    lines.extend(
+        [
+            "        else:",
+            "            kwargs = {",
+            "                renames.get(k, k): v for k, v in unpacked_dict.items() if k in known_keys",
+            "            }",
+        ]
+    )
+    for i, (name, custom) in enumerate(custom_fields.items()):
+        namespace[f"field_serializer_{i}"] = custom
+        lines.extend(
+            [
+                f"        if {name!r} in kwargs:",
+                f"            kwargs[{name!r}] = field_serializer_{i}.unpack("
+                f"kwargs[{name!r}], whitelist_map=whitelist_map, context=context)",
+            ]
+        )
+    lines.extend(
+        [
+            "        return klass(**kwargs)",
+            "    except Exception as exc:",
+            "        return handle_exception(exc, context, unpacked_dict)",
+        ]
+    )
+
+    return _compile_codec(lines, _UNPACK_CODEC_NAME, namespace)
+
+
 ###################################################################################################
 # Serialize / Pack
 ###################################################################################################
@@ -839,6 +1115,20 @@ def serialize_value(
     return seven.json.dumps(serializable_value, **json_kwargs)
 
 
+def serialize_value_binary(
+    val: PackableValue,
+    whitelist_map: WhitelistMap = _WHITELIST_MAP,
+) -> bytes:
+    """Serialize an object to the binary serdes format.
+
+    This is an alternative to `serialize_value` for large payloads like repository and job
+    snapshots. The result is typically several times smaller than the equivalent JSON, since every
+    distinct string and every object's field names are only stored once. `deserialize_value`
+    detects the format automatically.
+    """
+    return _encode_binary(pack_value(val, whitelist_map=whitelist_map))
+
+
 @overload
 def pack_value(
     val: T_Scalar,
@@ -1096,7 +1386,7 @@ def _wrap_object(
 
 @overload
 def deserialize_value(
-    val: str,
+    val: Union[str, bytes],
     as_type: Tuple[Type[T_PackableValue], Type[U_PackableValue]],
     whitelist_map: WhitelistMap = ...,
 ) -> Union[T_PackableValue, U_PackableValue]: ...
@@ -1104,7 +1394,7 @@ def deserialize_value(
 
 @overload
 def deserialize_value(
-    val: str,
+    val: Union[str, bytes],
     as_type: Type[T_PackableValue],
     whitelist_map: WhitelistMap = ...,
 ) -> T_PackableValue: ...
@@ -1112,14 +1402,14 @@ def deserialize_value(
 
 @overload
 def deserialize_value(
-    val: str,
+    val: Union[str, bytes],
     as_type: None = ...,
     whitelist_map: WhitelistMap = ...,
 ) -> PackableValue: ...
 
 
 def deserialize_value(
-    val: str,
+    val: Union[str, bytes],
     as_type: Optional[
         Union[Type[T_PackableValue], Tuple[Type[T_PackableValue], Type[U_PackableValue]]]
     ] = None,
@@ -1129,17 +1419,18 @@ def deserialize_value(
 
     Two steps:
 
-    - Parse the input string as JSON with an object_hook for custom types.
+    - Parse the input string as JSON with an object_hook for custom types. Values serialized with
+      `serialize_value_binary` are detected and decoded from the binary format instead.
     - Optionally, check that the resulting object is of the expected type.
     """
-    check.str_param(val, "val")
+    check.inst_param(val, "val", (str, bytes))
 
     return deserialize_values([val], as_type, whitelist_map)[0]
 
 
 @overload
 def deserialize_values(
-    vals: Iterable[str],
+    vals: Iterable[Union[str, bytes]],
     as_type: Type[T_PackableValue],
     whitelist_map: WhitelistMap = ...,
 ) -> Sequence[T_PackableValue]: ...
@@ -1147,7 +1438,7 @@ def deserialize_values(
 
 @overload
 def deserialize_values(
-    vals: Iterable[str],
+    vals: Iterable[Union[str, bytes]],
     as_type: None = ...,
     whitelist_map: WhitelistMap = ...,
 ) -> Sequence[PackableValue]: ...
@@ -1155,7 +1446,7 @@ def deserialize_values(
 
 @overload
 def deserialize_values(
-    vals: Iterable[str],
+    vals: Iterable[Union[str, bytes]],
     as_type: Optional[
         Union[Type[T_PackableValue], Tuple[Type[T_PackableValue], Type[U_PackableValue]]]
     ],
@@ -1164,7 +1455,7 @@ def deserialize_values(
 
 
 def deserialize_values(
-    vals: Iterable[str],
+    vals: Iterable[Union[str, bytes]],
     as_type: Optional[
         Union[Type[T_PackableValue], Tuple[Type[T_PackableValue], Type[U_PackableValue]]]
     ] = None,
@@ -1177,10 +1468,15 @@ def deserialize_values(
         unpacked_values = []
         for val in vals:
             context = UnpackContext()
-            unpacked_value = seven.json.loads(
-                val,
-                object_hook=partial(_unpack_object, whitelist_map=whitelist_map, context=context),
-            )
+            if is_binary_serialized_value(val):
+                unpacked_value = _unpack_binary(cast(bytes, val), whitelist_map, context)
+            else:
+                unpacked_value = seven.json.loads(
+                    val,
+                    object_hook=partial(
+                        _unpack_object, whitelist_map=whitelist_map, context=context
+                    ),
+                )
             unpacked_value = context.finalize_unpack(unpacked_value)
             if as_type and not (
                 is_named_tuple_instance(unpacked_value)
@@ -1195,6 +1491,20 @@ def deserialize_values(
     return unpacked_values
 
 
+def deserialize_packed_value(
+    val: JsonSerializableValue,
+    as_type: Type[T_PackableValue],
+    whitelist_map: WhitelistMap = _WHITELIST_MAP,
+) -> T_PackableValue:
+    """Deserialize a value that was already parsed from its JSON string, e.g. with `json.loads`,
+    without parsing the string a second time. The parsed value is not modified.
+    """
+    with disable_dagster_warnings(), check.EvalContext.contextual_namespace(
+        whitelist_map.object_type_map
+    ):
+        return unpack_value(val, as_type, whitelist_map)
+
+
 class UnknownSerdesValue:
     def __init__(self, message: str, value: Mapping[str, UnpackedValue]):
         self.message = message
@@ -1322,6 +1632,272 @@ def _unpack_value(
     return val
 
 
+###################################################################################################
+# Binary format
+###################################################################################################
+
+# The binary format encodes the same packed values as the JSON format. It starts with a header
+# (magic bytes and a format version) followed by length-prefixed sections:
+#
+# - strings: a JSON array of every distinct string in the payload, including dict keys
+# - shapes: a JSON array of object shapes, each a list of string indices for the storage name of
+#   a serialized object followed by its field names
+# - tags: one byte per value, identifying its type
+# - operands: little-endian uint32s, consumed in order by string, shape, list and dict tags
+# - ints / floats: little-endian int64s / float64s, consumed in order by int and float tags
+#
+# Values are written depth-first. Objects are written as a shape index followed by their field
+# values, so field names and storage names are not repeated per object. The leading NUL in the
+# magic bytes guarantees the payload can never be mistaken for JSON text.
+
+_BINARY_MAGIC: Final = b"\x00dsb"
+_BINARY_VERSION: Final = 1
+_BINARY_HEADER: Final = _BINARY_MAGIC + bytes([_BINARY_VERSION])
+_BINARY_NUM_SECTIONS: Final = 6
+
+_TAG_STR: Final = 0
+_TAG_OBJECT: Final = 1
+_TAG_LIST: Final = 2
+_TAG_DICT: Final = 3
+_TAG_NONE: Final = 4
+_TAG_TRUE: Final = 5
+_TAG_FALSE: Final = 6
+_TAG_INT: Final = 7
+_TAG_FLOAT: Final = 8
+_TAG_BIG_INT: Final = 9
+
+_MIN_INT64: Final = -(2**63)
+_MAX_INT64: Final = 2**63 - 1
+
+_SECTION_LENGTH = struct.Struct("<I")
+_UINT32_TYPECODE: Final = "I" if array("I").itemsize == 4 else "L"
+_SWAP_BYTES: Final = sys.byteorder == "big"
+
+
+def _array_to_bytes(typecode: str, values: List[Any]) -> bytes:
+    arr = array(typecode, values)
+    if _SWAP_BYTES:
+        arr.byteswap()
+    return arr.tobytes()
+
+
+def _bytes_to_array(typecode: str, data: bytes) -> "array[Any]":
+    arr = array(typecode)
+    arr.frombytes(data)
+    if _SWAP_BYTES:
+        arr.byteswap()
+    return arr
+
+
+def is_binary_serialized_value(val: Union[str, bytes]) -> bool:
+    return isinstance(val, bytes) and val.startswith(_BINARY_MAGIC)
+
+
+def _coerce_key(key: Any) -> str:
+    # non-string keys are coerced the same way the JSON encoder does
+    return str(key) if isinstance(key, str) else seven.json.dumps(key)
+
+
+def _encode_binary(packed: JsonSerializableValue) -> bytes:
+    string_ids: Dict[str, int] = {}
+    shape_ids: Dict[Tuple[str, ...], int] = {}
+    shapes: List[List[int]] = []
+    tags = bytearray()
+    operands: List[int] = []
+    ints: List[int] = []
+    floats: List[float] = []
+
+    add_tag = tags.append
+    add_operand = operands.append
+
+    def _string_id(string: str) -> int:
+        string_id = string_ids.get(string)
+        if string_id is None:
+            string_id = string_ids[string] = len(string_ids)
+        return string_id
+
+    def _encode(val: Any) -> None:
+        tval = type(val)
+        if tval is str:
+            add_tag(_TAG_STR)
+            add_operand(_string_id(val))
+        elif tval is dict:
+            storage_name = val.get("__class__")
+            if type(storage_name) is str:
+                field_names = [key for key in val if key != "__class__"]
+                shape = (storage_name, *field_names)
+                shape_id = shape_ids.get(shape)
+                if shape_id is None:
+                    shape_id = shape_ids[shape] = len(shape_ids)
+                    shapes.append([_string_id(name) for name in shape])
+                add_tag(_TAG_OBJECT)
+                add_operand(shape_id)
+                for field_name in field_names:
+                    _encode(val[field_name])
+            else:
+                add_tag(_TAG_DICT)
+                add_operand(len(val))
+                for key, item in val.items():
+                    add_operand(_string_id(key if type(key) is str else _coerce_key(key)))
+                    _encode(item)
+        elif tval is list:
+            add_tag(_TAG_LIST)
+            add_operand(len(val))
+            for item in val:
+                _encode(item)
+        elif val is None:
+            add_tag(_TAG_NONE)
+        elif val is True:
+            add_tag(_TAG_TRUE)
+        elif val is False:
+            add_tag(_TAG_FALSE)
+        elif tval is int:
+            if _MIN_INT64 <= val <= _MAX_INT64:
+                add_tag(_TAG_INT)
+                ints.append(val)
+            else:
+                add_tag(_TAG_BIG_INT)
+                add_operand(_string_id(str(val)))
+        elif tval is float:
+            add_tag(_TAG_FLOAT)
+            floats.append(val)
+        # subclasses of scalar types, which the JSON encoder also accepts
+        elif isinstance(val, str):
+            _encode(str(val))
+        elif isinstance(val, int):
+            _encode(int(val))
+        elif isinstance(val, float):
+            _encode(float(val))
+        else:
+            raise SerializationError(f"Unhandled value type {tval}")
+
+    _encode(packed)
+
+    sections = [
+        seven.json.dumps(list(string_ids)).encode("utf-8"),
+        seven.json.dumps(shapes).encode("utf-8"),
+        bytes(tags),
+        _array_to_bytes(_UINT32_TYPECODE, operands),
+        _array_to_bytes("q", ints),
+        _array_to_bytes("d", floats),
+    ]
+    encoded = bytearray(_BINARY_HEADER)
+    for section in sections:
+        encoded += _SECTION_LENGTH.pack(len(section))
+        encoded += section
+    return bytes(encoded)
+
+
+def _read_binary_sections(val: bytes) -> Sequence[bytes]:
+    if len(val) <= len(_BINARY_MAGIC) or val[len(_BINARY_MAGIC)] != _BINARY_VERSION:
+        raise DeserializationError(
+            "Unsupported binary serdes format version. This error can occur due to version skew,"
+            " verify processes are running expected versions."
+        )
+
+    sections = []
+    view = memoryview(val)
+    offset = len(_BINARY_HEADER)
+    for _ in range(_BINARY_NUM_SECTIONS):
+        if offset + _SECTION_LENGTH.size > len(view):
+            raise DeserializationError("Truncated binary serdes payload")
+        (length,) = _SECTION_LENGTH.unpack_from(view, offset)
+        offset += _SECTION_LENGTH.size
+        if offset + length > len(view):
+            raise DeserializationError("Truncated binary serdes payload")
+        sections.append(view[offset : offset + length].tobytes())
+        offset += length
+    return sections
+
+
+def _unpack_binary(
+    val: bytes, whitelist_map: WhitelistMap, context: UnpackContext
+) -> UnpackedValue:
+    (
+        strings_section,
+        shapes_section,
+        tags_section,
+        operands_section,
+        ints_section,
+        floats_section,
+    ) = _read_binary_sections(val)
+
+    strings: List[str] = seven.json.loads(strings_section)
+    next_tag = iter(tags_section).__next__
+    next_operand = iter(_bytes_to_array(_UINT32_TYPECODE, operands_section)).__next__
+    next_int = iter(_bytes_to_array("q", ints_section)).__next__
+    next_float = iter(_bytes_to_array("d", floats_section)).__next__
+
+    # resolve each shape to the deserializer for its storage name ahead of time
+    shapes: List[Tuple[Callable[..., UnpackedValue], Sequence[str]]] = []
+    for shape in seven.json.loads(shapes_section):
+        storage_name, *field_names = [strings[string_id] for string_id in shape]
+        deserializer = whitelist_map.object_deserializers.get(storage_name)
+        shapes.append(
+            (
+                deserializer.unpack
+                if deserializer
+                else partial(_unpack_unknown_object, storage_name),
+                field_names,
+            )
+        )
+
+    def _decode(tag: int) -> UnpackedValue:
+        # strings are by far the most common value, so they are decoded inline by containers
+        if tag == _TAG_OBJECT:
+            unpack, field_names = shapes[next_operand()]
+            return unpack(
+                {
+                    field_name: strings[next_operand()]
+                    if (t := next_tag()) == _TAG_STR
+                    else _decode(t)
+                    for field_name in field_names
+                },
+                whitelist_map,
+                context,
+            )
+        if tag == _TAG_LIST:
+            return [
+                strings[next_operand()] if (t := next_tag()) == _TAG_STR else _decode(t)
+                for _ in range(next_operand())
+            ]
+        if tag == _TAG_STR:
+            return strings[next_operand()]
+        if tag == _TAG_NONE:
+            return None
+        if tag == _TAG_INT:
+            return next_int()
+        if tag == _TAG_TRUE:
+            return True
+        if tag == _TAG_FALSE:
+            return False
+        if tag == _TAG_DICT:
+            return _unpack_object(
+                {strings[next_operand()]: _decode(next_tag()) for _ in range(next_operand())},
+                whitelist_map,
+                context,
+            )
+        if tag == _TAG_FLOAT:
+            return next_float()
+        if tag == _TAG_BIG_INT:
+            return int(strings[next_operand()])
+        raise DeserializationError(f"Unknown tag {tag} in binary serdes payload")
+
+    try:
+        return _decode(next_tag())
+    except (StopIteration, IndexError) as exc:
+        raise DeserializationError("Malformed binary serdes payload") from exc
+
+
+def _unpack_unknown_object(
+    storage_name: str,
+    unpacked_dict: Dict[str, UnpackedValue],
+    whitelist_map: WhitelistMap,
+    context: UnpackContext,
+) -> UnpackedValue:
+    return _unpack_object({"__class__": storage_name, **unpacked_dict}, whitelist_map, context)
+
+
 ###################################################################################################
 # Validation
 ###################################################################################################
@@ -1422,3 +1998,13 @@ def get_storage_name(klass: Type, *, whitelist_map: WhitelistMap = _WHITELIST_MA
         check.failed(f"{klass.__name__} is not a known serializable object type.")
     ser = whitelist_map.object_serializers[klass.__name__]
     return ser.get_storage_name()
+
+
+def get_class_for_storage_name(
+    storage_name: str, *, whitelist_map: WhitelistMap = _WHITELIST_MAP
+) -> Optional[Type]:
+    """Returns the class that objects serialized under the given storage name (current or old)
+    deserialize to, or None if the storage name is not known.
+    """
+    deserializer = whitelist_map.object_deserializers.get(storage_name)
+    return deserializer.klass if deserializer else None
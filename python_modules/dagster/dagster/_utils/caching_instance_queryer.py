@@ -112,10 +112,19 @@ def evaluation_time(self) -> datetime:
     ####################
 
     def prefetch_asset_records(self, asset_keys: Iterable[AssetKey]):
-        """For performance, batches together queries for selected assets."""
+        """For performance, batches together queries for selected assets. The fetched records are
+        also shared with the async loaders, so that async and blocking queries for these assets see
+        the same state.
+        """
         from dagster._core.storage.event_log.base import AssetRecord
 
-        AssetRecord.blocking_get_many(self._loading_context, asset_keys)
+        asset_keys = list(asset_keys)
+        records_by_key = {
+            record.asset_entry.asset_key: record
+            for record in AssetRecord.blocking_get_many(self._loading_context, asset_keys)
+        }
+        for asset_key in asset_keys:
+            AssetRecord.prime(self._loading_context, asset_key, records_by_key.get(asset_key))
 
     ####################
     # ASSET STATUS CACHE
@@ -193,22 +202,9 @@ def get_in_progress_asset_subset(
                 else None
             )
 
-            planned_materialization_run_id = None
-            if self.instance.event_log_storage.asset_records_have_last_planned_materialization_storage_id:
-                planned_materialization_run_id = (
-                    asset_record.asset_entry.last_planned_materialization_run_id
-                    if asset_record
-                    else None
-                )
-            else:
-                planned_materialization_info = (
-                    self.instance.event_log_storage.get_latest_planned_materialization_info(
-                        asset_key
-                    )
-                )
-                planned_materialization_run_id = (
-                    planned_materialization_info.run_id if planned_materialization_info else None
-                )
+            planned_materialization_run_id = self.get_latest_planned_materialization_run_id(
+                asset_key=asset_key
+            )
             if (
                 not planned_materialization_run_id
                 # if the latest materialization happened in the same run as the latest planned materialization,
@@ -241,18 +237,33 @@ def get_failed_asset_subset(self, *, asset_key: AssetKey) -> SerializableEntityS
                 value = cache_value.deserialize_failed_partition_subsets(partitions_def)
         else:
             # ideally, unpartitioned assets would also be handled by the asset status cache
-            planned_materialization_info = (
-                self.instance.event_log_storage.get_latest_planned_materialization_info(asset_key)
+            planned_materialization_run_id = self.get_latest_planned_materialization_run_id(
+                asset_key=asset_key
             )
-            if not planned_materialization_info:
+            if not planned_materialization_run_id:
                 value = False
             else:
-                dagster_run = self.instance.get_run_by_id(planned_materialization_info.run_id)
+                dagster_run = self.instance.get_run_by_id(planned_materialization_run_id)
 
                 value = dagster_run is not None and dagster_run.status == DagsterRunStatus.FAILURE
 
         return SerializableEntitySubset(key=asset_key, value=value)
 
+    @cached_method
+    def get_latest_planned_materialization_run_id(self, *, asset_key: AssetKey) -> Optional[str]:
+        """Returns the id of the run that most recently planned to materialize the given asset."""
+        if self.instance.event_log_storage.asset_records_have_last_planned_materialization_storage_id:
+            asset_record = self.get_asset_record(asset_key)
+            return (
+                asset_record.asset_entry.last_planned_materialization_run_id
+                if asset_record
+                else None
+            )
+        planned_materialization_info = (
+            self.instance.event_log_storage.get_latest_planned_materialization_info(asset_key)
+        )
+        return planned_materialization_info.run_id if planned_materialization_info else None
+
     ####################
     # ASSET RECORDS / STORAGE IDS
     ####################
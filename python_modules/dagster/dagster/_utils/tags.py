@@ -91,6 +91,19 @@ def update_counters_with_launched_item(
             if key in self._unique_value_limits:
                 self._unique_value_counts[tag_tuple] += 1
 
+    def update_counters_with_tag_counts(self, tag_counts: Mapping[Tuple[str, str], int]) -> None:
+        """Add in progress items to the counters, given the number of items with each tag."""
+        for tag_tuple, count in tag_counts.items():
+            key, _value = tag_tuple
+            if key in self._key_limits:
+                self._key_counts[key] += count
+
+            if tag_tuple in self._key_value_limits:
+                self._key_value_counts[tag_tuple] += count
+
+            if key in self._unique_value_limits:
+                self._unique_value_counts[tag_tuple] += count
+
 
 def get_boolean_tag_value(tag_value: Optional[str], default_value: bool = False) -> bool:
     if tag_value is None:
@@ -5,6 +5,7 @@
 import pytest
 from dagster import IntMetadataValue, TextMetadataValue, job, op, repository
 from dagster._api.snapshot_repository import (
+    RepositorySnapPieceCache,
     gen_streaming_external_repositories_data_grpc,
     sync_get_streaming_external_repositories_data_grpc,
 )
@@ -15,7 +16,7 @@
     RepositorySnap,
 )
 from dagster._core.remote_representation.external import RemoteRepository
-from dagster._core.remote_representation.external_data import JobDataSnap
+from dagster._core.remote_representation.external_data import JobDataSnap, RepositorySnapPieces
 from dagster._core.remote_representation.handle import RepositoryHandle
 from dagster._core.remote_representation.origin import RemoteRepositoryOrigin
 from dagster._core.test_utils import instance_for_test
@@ -49,6 +50,87 @@ def test_streaming_external_repositories_api_grpc(instance):
         assert async_repository_snaps == repository_snaps
 
 
+def test_streaming_external_repository_binary_serdes(instance):
+    with get_bar_repo_code_location(instance) as code_location:
+        repo_origin = RemoteRepositoryOrigin(code_location.origin, "bar_repo")
+
+        json_chunks = list(code_location.client.streaming_external_repository(repo_origin))
+        assert all(
+            not chunk["serialized_external_repository_binary_chunk"] for chunk in json_chunks
+        )
+
+        binary_chunks = list(
+            code_location.client.streaming_external_repository(
+                repo_origin, accepts_binary_serdes=True
+            )
+        )
+        assert all(not chunk["serialized_external_repository_chunk"] for chunk in binary_chunks)
+
+        assert deserialize_value(
+            b"".join(
+                chunk["serialized_external_repository_binary_chunk"] for chunk in binary_chunks
+            ),
+            RepositorySnap,
+        ) == deserialize_value(
+            "".join(chunk["serialized_external_repository_chunk"] for chunk in json_chunks),
+            RepositorySnap,
+        )
+
+
+def test_streaming_external_repositories_snapshot_pieces(instance, tmp_path):
+    with get_bar_repo_code_location(instance) as code_location:
+        repo_origin = RemoteRepositoryOrigin(code_location.origin, "bar_repo")
+        origin_id = repo_origin.get_id()
+        full_repository_snap = deserialize_value(
+            "".join(
+                chunk["serialized_external_repository_chunk"]
+                for chunk in code_location.client.streaming_external_repository(repo_origin)
+            ),
+            RepositorySnap,
+        )
+
+        piece_cache = RepositorySnapPieceCache(str(tmp_path))
+        repository_snaps = sync_get_streaming_external_repositories_data_grpc(
+            code_location.client, code_location, piece_cache
+        )
+        assert repository_snaps["bar_repo"] == full_repository_snap
+
+        known_pieces = piece_cache.get_pieces(origin_id)
+        assert len(known_pieces) == (
+            len(full_repository_snap.get_job_datas())
+            + len(full_repository_snap.asset_nodes)
+            + len(full_repository_snap.sensors)
+            + len(full_repository_snap.schedules)
+        )
+
+        # a client holding every piece only receives the rest of the snapshot
+        repository_snap_pieces = deserialize_value(
+            b"".join(
+                chunk["serialized_external_repository_binary_chunk"]
+                for chunk in code_location.client.streaming_external_repository(
+                    repo_origin,
+                    accepts_binary_serdes=True,
+                    known_snapshot_piece_digests=list(known_pieces),
+                )
+            ),
+            RepositorySnapPieces,
+        )
+        assert repository_snap_pieces.serialized_pieces == {}
+        assert repository_snap_pieces.resolve(known_pieces) == full_repository_snap
+
+        # the pieces are read back from disk by a new process
+        restarted_piece_cache = RepositorySnapPieceCache(str(tmp_path))
+        assert restarted_piece_cache.get_pieces(origin_id) == known_pieces
+        assert (
+            asyncio.run(
+                gen_streaming_external_repositories_data_grpc(
+                    code_location.client, code_location, restarted_piece_cache
+                )
+            )["bar_repo"]
+            == full_repository_snap
+        )
+
+
 def test_streaming_external_repositories_error(instance):
     with get_bar_repo_code_location(instance) as code_location:
         code_location.repository_names = {"does_not_exist"}
@@ -4,6 +4,7 @@
 
 import pytest
 from dagster._api.snapshot_sensor import (
+    sync_get_external_sensor_execution_data_batch_grpc,
     sync_get_external_sensor_execution_data_ephemeral_grpc,
     sync_get_external_sensor_execution_data_grpc,
 )
@@ -63,6 +64,106 @@ def test_remote_sensor_grpc_fallback_to_streaming(instance):
                     }
 
 
+def _sensor_execution_args(instance, repository_handle, sensor_name, cursor=None):
+    return SensorExecutionArgs(
+        repository_origin=repository_handle.get_remote_origin(),
+        instance_ref=instance.get_ref(),
+        sensor_name=sensor_name,
+        cursor=cursor,
+    )
+
+
+def test_remote_sensor_batch_grpc(instance):
+    with get_bar_repo_handle(instance) as repository_handle:
+        origin = repository_handle.get_remote_origin()
+        sensor_execution_args = [
+            _sensor_execution_args(instance, repository_handle, "sensor_foo", cursor="a"),
+            _sensor_execution_args(instance, repository_handle, "sensor_error"),
+            _sensor_execution_args(instance, repository_handle, "sensor_foo", cursor="b"),
+        ]
+        with ephemeral_grpc_api_client(
+            origin.code_location_origin.loadable_target_origin
+        ) as api_client:
+            results = list(
+                sync_get_external_sensor_execution_data_batch_grpc(
+                    api_client, sensor_execution_args
+                )
+            )
+
+        assert [args for args, _ in results] == sensor_execution_args
+
+        # a failing sensor doesn't affect the rest of the batch
+        first_result, error_result, last_result = [result for _, result in results]
+        assert isinstance(first_result, SensorExecutionData)
+        assert len(first_result.run_requests) == 2
+        assert isinstance(error_result, SensorExecutionErrorSnap)
+        assert "womp womp" in error_result.error.to_string()
+        assert isinstance(last_result, SensorExecutionData)
+        assert len(last_result.run_requests) == 2
+
+
+def test_remote_sensor_batch_grpc_fallback_to_single_calls(instance):
+    with get_bar_repo_handle(instance) as repository_handle:
+        origin = repository_handle.get_remote_origin()
+        sensor_execution_args = [
+            _sensor_execution_args(instance, repository_handle, "sensor_foo"),
+            _sensor_execution_args(instance, repository_handle, "sensor_error"),
+        ]
+        with ephemeral_grpc_api_client(
+            origin.code_location_origin.loadable_target_origin
+        ) as api_client:
+            with mock.patch(
+                "dagster._grpc.client.DagsterGrpcClient._get_streaming_response",
+                side_effect=Exception("Unimplemented"),
+            ):
+                with mock.patch(
+                    "dagster._grpc.client.DagsterGrpcClient._is_unimplemented_error",
+                    return_value=True,
+                ):
+                    results = [
+                        result
+                        for _, result in sync_get_external_sensor_execution_data_batch_grpc(
+                            api_client, sensor_execution_args
+                        )
+                    ]
+
+        assert isinstance(results[0], SensorExecutionData)
+        assert isinstance(results[1], SensorExecutionErrorSnap)
+
+
+def test_remote_sensor_batch_grpc_timeout(instance):
+    with get_bar_repo_handle(instance) as repository_handle:
+        origin = repository_handle.get_remote_origin()
+        sensor_execution_args = [
+            SensorExecutionArgs(
+                repository_origin=origin,
+                instance_ref=instance.get_ref(),
+                sensor_name="sensor_times_out",
+                timeout=1,
+            ),
+            _sensor_execution_args(instance, repository_handle, "sensor_foo"),
+        ]
+        with ephemeral_grpc_api_client(
+            origin.code_location_origin.loadable_target_origin
+        ) as api_client:
+            results = [
+                result
+                for _, result in sync_get_external_sensor_execution_data_batch_grpc(
+                    api_client, sensor_execution_args
+                )
+            ]
+
+        # a sensor that times out only fails its own evaluation
+        timed_out_result, last_result = results
+        assert isinstance(timed_out_result, SensorExecutionErrorSnap)
+        assert (
+            "The sensor tick timed out due to taking longer than 1 seconds"
+            in timed_out_result.error.message
+        )
+        assert isinstance(last_result, SensorExecutionData)
+        assert len(last_result.run_requests) == 2
+
+
 def test_remote_sensor_error(instance):
     with get_bar_repo_handle(instance) as repository_handle:
         with pytest.raises(DagsterUserCodeProcessError, match="womp womp"):
@@ -1,4 +1,15 @@
-from dagster import AssetDep, Definitions, asset
+import asyncio
+from unittest import mock
+
+from dagster import (
+    AssetDep,
+    AssetSpec,
+    Definitions,
+    MaterializeResult,
+    asset,
+    materialize,
+    multi_asset,
+)
 from dagster._core.asset_graph_view.asset_graph_view import AssetGraphView
 from dagster._core.definitions.asset_check_spec import AssetCheckSpec
 from dagster._core.definitions.events import AssetKeyPartitionKey
@@ -165,3 +176,39 @@ def unpartitioned() -> None: ...
         == upstream_last.expensively_compute_asset_partitions()
     )
     assert unpartitioned_empty.compute_parent_subset(parent_key=upstream.key) == upstream_empty
+
+
+def test_status_queries_are_batched() -> None:
+    @multi_asset(specs=[AssetSpec(f"asset_{i}") for i in range(5)])
+    def assets():
+        for i in range(5):
+            yield MaterializeResult(asset_key=f"asset_{i}")
+
+    @asset
+    def failing_asset() -> None:
+        raise Exception("failed")
+
+    defs = Definitions([assets, failing_asset])
+    instance = DagsterInstance.ephemeral()
+    materialize([assets], instance=instance)
+    materialize([failing_asset], instance=instance, raise_on_error=False)
+
+    asset_graph_view = AssetGraphView.for_test(defs, instance)
+    asset_keys = [*assets.keys, failing_asset.key]
+
+    async def _compute_statuses():
+        return await asyncio.gather(
+            *(asset_graph_view.compute_execution_failed_subset(key=key) for key in asset_keys),
+            *(asset_graph_view.compute_run_in_progress_subset(key=key) for key in asset_keys),
+        )
+
+    with mock.patch.object(
+        instance, "get_run_records", wraps=instance.get_run_records
+    ) as get_run_records:
+        subsets = asyncio.run(_compute_statuses())
+
+    # the runs of all assets are fetched in a single query
+    assert get_run_records.call_count == 1
+    failed_subsets, in_progress_subsets = subsets[: len(asset_keys)], subsets[len(asset_keys) :]
+    assert {subset.key for subset in failed_subsets if not subset.is_empty} == {failing_asset.key}
+    assert all(subset.is_empty for subset in in_progress_subsets)
@@ -3,7 +3,11 @@
 
 import pytest
 from dagster import DailyPartitionsDefinition, MultiPartitionsDefinition, StaticPartitionsDefinition
-from dagster._core.definitions.partition import AllPartitionsSubset, DefaultPartitionsSubset
+from dagster._core.definitions.partition import (
+    AllPartitionsSubset,
+    BitmapPartitionsSubset,
+    DefaultPartitionsSubset,
+)
 from dagster._core.definitions.time_window_partitions import (
     PersistedTimeWindow,
     TimeWindowPartitionsDefinition,
@@ -53,6 +57,85 @@ def test_static_partitions_subset_current_version_serialization():
     assert deserialized.get_partition_keys() == {"baz", "foo"}
 
 
+def test_bitmap_partitions_subset_set_operations():
+    partitions_def = StaticPartitionsDefinition([str(i) for i in range(200)])
+    evens = partitions_def.subset_with_partition_keys([str(i) for i in range(0, 200, 2)])
+    first_half = partitions_def.subset_with_partition_keys([str(i) for i in range(100)])
+
+    assert isinstance(evens, BitmapPartitionsSubset)
+    assert len(evens) == 100
+    assert "2" in evens
+    assert "3" not in evens
+    assert "foo" not in evens
+
+    assert (evens | first_half).get_partition_keys() == {
+        str(i) for i in range(200) if i < 100 or i % 2 == 0
+    }
+    assert (evens & first_half).get_partition_keys() == {str(i) for i in range(0, 100, 2)}
+    assert (evens - first_half).get_partition_keys() == {str(i) for i in range(100, 200, 2)}
+    assert (evens - evens).is_empty
+
+    # operations with other kinds of subsets
+    assert evens & DefaultPartitionsSubset({"0", "1", "foo"}) == DefaultPartitionsSubset({"0"})
+    assert DefaultPartitionsSubset({"0", "1"}) - evens == DefaultPartitionsSubset({"1"})
+    assert evens | DefaultPartitionsSubset({"foo"}) == DefaultPartitionsSubset(
+        {str(i) for i in range(0, 200, 2)} | {"foo"}
+    )
+
+
+def test_bitmap_partitions_subset_multi_partitions():
+    subset = composite.empty_subset().with_partition_keys(
+        ["a|2023-01-01", "b|2023-01-01", "c|2023-01-02"]
+    )
+    assert isinstance(subset, BitmapPartitionsSubset)
+    assert len(subset) == 3
+    assert "a|2023-01-01" in subset
+    assert "a|2023-01-02" not in subset
+    assert all(
+        key.keys_by_dimension["abc"] in {"a", "b", "c"} for key in subset.get_partition_keys()
+    )  # type: ignore
+
+    other = composite.empty_subset().with_partition_keys(["a|2023-01-01", "c|2023-01-03"])
+    assert (subset - other).get_partition_keys() == {"b|2023-01-01", "c|2023-01-02"}
+    assert (subset & other).get_partition_keys() == {"a|2023-01-01"}
+    assert len(subset | other) == 4
+
+    assert composite.deserialize_subset(subset.serialize()) == subset
+    assert composite.deserialize_subset(subset.serialize_bitmaps()) == subset
+
+    daily_multi = MultiPartitionsDefinition(
+        {"date": time_window_partitions, "other_date": time_window_partitions}
+    )
+    assert type(daily_multi.empty_subset()) is DefaultPartitionsSubset
+
+
+def test_bitmap_partitions_subset_serialization():
+    partitions_def = StaticPartitionsDefinition([str(i) for i in range(10000)])
+    subset = partitions_def.subset_with_partition_keys([str(i) for i in range(0, 10000, 3)])
+
+    # written in the format that older versions of dagster can read
+    serialized = subset.serialize()
+    assert serialized == DefaultPartitionsSubset(set(subset.get_partition_keys())).serialize()
+    assert partitions_def.can_deserialize_subset(serialized, None, None)
+    assert partitions_def.deserialize_subset(serialized) == subset
+
+    serialized_bitmaps = subset.serialize_bitmaps()
+    assert len(serialized_bitmaps) < len(serialized)
+    assert partitions_def.can_deserialize_subset(serialized_bitmaps, None, None)
+    assert partitions_def.deserialize_subset(serialized_bitmaps) == subset
+
+    # bitmaps cannot be deserialized against different partition keys
+    other_partitions_def = StaticPartitionsDefinition([str(i) for i in range(10001)])
+    assert not other_partitions_def.can_deserialize_subset(serialized_bitmaps, None, None)
+    with pytest.raises(DagsterInvalidDeserializationVersionError):
+        other_partitions_def.deserialize_subset(serialized_bitmaps)
+
+    # serialized with serdes as a DefaultPartitionsSubset
+    round_trip_subset = deserialize_value(serialize_value(subset))  # type: ignore
+    assert isinstance(round_trip_subset, DefaultPartitionsSubset)
+    assert round_trip_subset == subset
+
+
 def test_time_window_subset_cannot_deserialize_invalid_version():
     daily_partitions_def = DailyPartitionsDefinition(start_date="2023-01-01")
     serialized_subset = (
@@ -82,7 +165,8 @@ def test_get_subset_type():
 
 
 def test_empty_subsets():
-    assert type(static_partitions.empty_subset()) is DefaultPartitionsSubset
+    assert type(static_partitions.empty_subset()) is BitmapPartitionsSubset
+    assert type(composite.empty_subset()) is BitmapPartitionsSubset
     assert type(time_window_partitions.empty_subset()) is TimeWindowPartitionsSubset
 
 
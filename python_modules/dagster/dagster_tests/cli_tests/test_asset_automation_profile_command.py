@@ -0,0 +1,156 @@
+import logging
+import tempfile
+from unittest import mock
+
+import pytest
+from click.testing import CliRunner
+from dagster import (
+    AutomationCondition,
+    DailyPartitionsDefinition,
+    Definitions,
+    asset,
+    materialize,
+)
+from dagster._cli.asset import asset_automation_profile_command
+from dagster._core.definitions.asset_daemon_cursor import AssetDaemonCursor
+from dagster._core.definitions.declarative_automation.automation_condition_evaluator import (
+    AutomationConditionEvaluator,
+)
+from dagster._core.definitions.declarative_automation.automation_condition_profile import (
+    count_storage_queries,
+    get_most_expensive_condition_nodes,
+    profile_storage_queries,
+)
+from dagster._core.definitions.partition import AllPartitionsSubset
+from dagster._core.test_utils import instance_for_test
+
+
+@pytest.fixture(name="instance_runner")
+def mock_instance_runner():
+    with tempfile.TemporaryDirectory() as dagster_home_temp:
+        with instance_for_test(
+            temp_dir=dagster_home_temp,
+        ) as instance:
+            runner = CliRunner(env={"DAGSTER_HOME": dagster_home_temp})
+            yield instance, runner
+
+
+@asset
+def upstream() -> None: ...
+
+
+@asset(
+    deps=[upstream],
+    automation_condition=AutomationCondition.in_progress() | AutomationCondition.execution_failed(),
+)
+def downstream() -> None: ...
+
+
+def test_asset_automation_profile(instance_runner):
+    instance, runner = instance_runner
+    materialize([upstream, downstream], instance=instance)
+    materialize([upstream], instance=instance)
+
+    asset_graph = Definitions(assets=[upstream, downstream]).get_asset_graph()
+    evaluator = AutomationConditionEvaluator(
+        entity_keys={downstream.key},
+        instance=instance,
+        asset_graph=asset_graph,
+        cursor=AssetDaemonCursor.empty(),
+        emit_backfills=False,
+        logger=logging.getLogger("dagster.automation"),
+    )
+    results, _ = evaluator.evaluate()
+    evaluations = [result.serializable_evaluation for result in results]
+
+    # storage queries are recorded for every node of the evaluation tree
+    nodes = [node for evaluation in evaluations for node in evaluation.iter_nodes()]
+    assert all(node.num_storage_queries is not None for node in nodes)
+    assert sum(node.num_storage_queries or 0 for node in nodes) > 0
+
+    instance.schedule_storage.add_auto_materialize_asset_evaluations(
+        evaluation_id=1,
+        asset_evaluations=[evaluation.with_run_ids(set()) for evaluation in evaluations],
+    )
+
+    result = runner.invoke(
+        asset_automation_profile_command, ["--evaluation-id", "1", "--limit", "3"]
+    )
+    assert result.exit_code == 0, result.output
+    lines = result.output.strip().split("\n")
+    assert len(lines) == 4
+    assert all("queries" in line and "downstream" in line for line in lines[1:])
+
+    result = runner.invoke(asset_automation_profile_command, ["--evaluation-id", "2"])
+    assert result.exit_code == 2
+    assert "no automation condition evaluations found" in result.output
+
+
+def test_profile_storage_queries_is_scoped_to_instance():
+    import sqlalchemy as db
+
+    with instance_for_test() as instance, instance_for_test() as other_instance:
+        with mock.patch.object(db.event, "listen", wraps=db.event.listen) as listen_mock:
+            with profile_storage_queries(instance):
+                with count_storage_queries() as counter:
+                    other_instance.get_runs()
+                assert counter.num_queries == 0
+
+                with count_storage_queries() as counter:
+                    instance.get_runs()
+                assert (counter.num_queries or 0) > 0
+
+        # the listeners are removed once profiling ends
+        listeners = [
+            call.args
+            for call in listen_mock.call_args_list
+            if call.args[1] == "after_cursor_execute"
+        ]
+        assert listeners
+        for target, identifier, fn in listeners:
+            assert not db.event.contains(target, identifier, fn)
+
+        with count_storage_queries() as counter:
+            instance.get_runs()
+        assert counter.num_queries is None
+
+
+def test_most_expensive_nodes_of_partitioned_asset():
+    partitions_def = DailyPartitionsDefinition("2020-01-01")
+
+    @asset(partitions_def=partitions_def, automation_condition=AutomationCondition.eager())
+    def partitioned() -> None: ...
+
+    with instance_for_test() as instance:
+        evaluator = AutomationConditionEvaluator(
+            entity_keys={partitioned.key},
+            instance=instance,
+            asset_graph=Definitions(assets=[partitioned]).get_asset_graph(),
+            cursor=AssetDaemonCursor.empty(),
+            emit_backfills=False,
+        )
+        results, _ = evaluator.evaluate()
+        evaluations = [result.serializable_evaluation for result in results]
+        nodes = [node for evaluation in evaluations for node in evaluation.iter_nodes()]
+        all_partitions_nodes = [
+            node for node in nodes if isinstance(node.true_subset.value, AllPartitionsSubset)
+        ]
+        assert all_partitions_nodes
+
+        # the size of a subset of all partitions is computed without building its partition keys
+        with mock.patch.object(
+            AllPartitionsSubset, "get_partition_keys", side_effect=Exception("too expensive")
+        ):
+            assert len(get_most_expensive_condition_nodes(evaluations, limit=2)) == 2
+            profiles = get_most_expensive_condition_nodes(evaluations, limit=len(nodes))
+
+        assert len(profiles) == len(nodes)
+        durations = [profile.duration for profile in profiles]
+        assert durations == sorted(durations, reverse=True)
+        all_partitions_subset = all_partitions_nodes[0].true_subset.value
+        assert isinstance(all_partitions_subset, AllPartitionsSubset)
+        assert {
+            profile.true_subset_size
+            for profile in profiles
+            if profile.unique_id == all_partitions_nodes[0].condition_snapshot.unique_id
+        } == {partitions_def.get_num_partitions(all_partitions_subset.current_time)}
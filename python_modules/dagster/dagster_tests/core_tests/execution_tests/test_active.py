@@ -352,3 +352,53 @@ def test_active_concurrency_sleep():
             )
             assert math.isclose(active_execution.sleep_interval(), 2.0, abs_tol=0.1)
             active_execution.mark_interrupted()
+
+
+def define_fan_out_fan_in_job():
+    @op
+    def start():
+        return 1
+
+    @op
+    def middle(x):
+        return x
+
+    @op
+    def end(xs):
+        return sum(xs)
+
+    @job
+    def fan_out_fan_in_job():
+        x = start()
+        end([middle.alias(f"middle_{i}")(x) for i in range(3)])
+
+    return fan_out_fan_in_job
+
+
+def test_downstream_steps_wait_for_all_deps():
+    fan_out_fan_in_job = define_fan_out_fan_in_job()
+
+    with create_execution_plan(fan_out_fan_in_job).start(RetryMode.DISABLED) as active_execution:
+        assert [step.key for step in active_execution.get_steps_to_execute()] == ["start"]
+        active_execution.mark_step_produced_output(StepOutputHandle("start", "result"))
+        active_execution.mark_success("start")
+
+        middle_steps = active_execution.get_steps_to_execute()
+        assert [step.key for step in middle_steps] == ["middle_0", "middle_1", "middle_2"]
+
+        active_execution.mark_failed("middle_0")
+        assert not active_execution.get_steps_to_execute()
+        assert not active_execution.get_steps_to_abandon()
+
+        active_execution.mark_step_produced_output(StepOutputHandle("middle_1", "result"))
+        active_execution.mark_success("middle_1")
+        assert not active_execution.get_steps_to_execute()
+        assert not active_execution.get_steps_to_abandon()
+
+        active_execution.mark_step_produced_output(StepOutputHandle("middle_2", "result"))
+        active_execution.mark_success("middle_2")
+        assert not active_execution.get_steps_to_execute()
+        assert [step.key for step in active_execution.get_steps_to_abandon()] == ["end"]
+        active_execution.mark_abandoned("end")
+
+    assert active_execution.is_complete
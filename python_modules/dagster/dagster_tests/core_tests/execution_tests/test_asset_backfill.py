@@ -52,6 +52,7 @@
     AssetBackfillData,
     AssetBackfillIterationResult,
     AssetBackfillStatus,
+    _get_failed_asset_partitions,
     execute_asset_backfill_iteration_inner,
     get_canceling_asset_backfill_iteration_data,
 )
@@ -63,6 +64,7 @@
     PARTITION_NAME_TAG,
 )
 from dagster._core.test_utils import (
+    create_run_for_test,
     environ,
     freeze_time,
     instance_for_test,
@@ -1251,6 +1253,55 @@ def downstream_daily_partitioned_asset(
     )
 
 
+def test_get_failed_asset_partitions_skips_runs_of_known_failed_partitions():
+    @asset(partitions_def=DailyPartitionsDefinition("2023-01-01"))
+    def daily_asset():
+        pass
+
+    asset_graph = get_asset_graph({"repo": [daily_asset]})
+    instance = DagsterInstance.ephemeral()
+
+    backfill_id = "dummy_backfill_id"
+    create_run_for_test(
+        instance,
+        asset_selection=frozenset({daily_asset.key}),
+        status=DagsterRunStatus.FAILURE,
+        tags={BACKFILL_ID_TAG: backfill_id, PARTITION_NAME_TAG: "2023-01-09"},
+    )
+    instance_queryer = _get_instance_queryer(
+        instance, asset_graph, create_datetime(2023, 1, 10, 0, 0, 0)
+    )
+
+    with patch.object(
+        CachingInstanceQueryer,
+        "get_planned_materializations_for_run",
+        side_effect=Exception("should not be called"),
+    ):
+        # the run only targets a partition that is already known to have failed, so its planned
+        # materializations are not fetched again
+        assert (
+            _get_failed_asset_partitions(
+                instance_queryer,
+                backfill_id,
+                asset_graph,
+                known_failed_subset=AssetGraphSubset.from_asset_partition_set(
+                    {AssetKeyPartitionKey(daily_asset.key, "2023-01-09")}, asset_graph
+                ),
+            )
+            == []
+        )
+
+        with pytest.raises(Exception, match="should not be called"):
+            _get_failed_asset_partitions(
+                instance_queryer,
+                backfill_id,
+                asset_graph,
+                known_failed_subset=AssetGraphSubset.from_asset_partition_set(
+                    {AssetKeyPartitionKey(daily_asset.key, "2023-01-08")}, asset_graph
+                ),
+            )
+
+
 def test_asset_backfill_target_asset_and_same_partitioning_grandchild():
     instance = DagsterInstance.ephemeral()
 
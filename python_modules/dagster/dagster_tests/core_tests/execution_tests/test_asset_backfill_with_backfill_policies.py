@@ -1148,8 +1148,9 @@ def partitioned_asset():
             monkeypatch.setenv("DAGSTER_EVENT_BATCH_SIZE", str(batch_size))
             if throw_store_event_batch_error:
                 stack.enter_context(
-                    patch(
-                        "dagster._core.storage.event_log.base.EventLogStorage.store_event_batch",
+                    patch.object(
+                        type(instance.event_log_storage),
+                        "store_event_batch",
                         side_effect=Exception("failed"),
                     )
                 )
@@ -35,12 +35,15 @@
     AssetNodeSnap,
     AssetParentEdgeSnap,
     MultiPartitionsSnap,
+    RepositorySnap,
+    RepositorySnapPieces,
     SensorSnap,
     TargetSnap,
     TimeWindowPartitionsSnap,
     asset_node_snaps_from_repo,
 )
 from dagster._serdes import deserialize_value, serialize_value, unpack_value
+from dagster._serdes.utils import create_snapshot_id
 from dagster._time import create_datetime, get_timezone
 from dagster._utils.partitions import DEFAULT_HOURLY_FORMAT_WITHOUT_TIMEZONE
 
@@ -1344,3 +1347,48 @@ def test_back_compat_team_owners():
 
     asset_node_snap = unpack_value(packed_1_7_7_external_asset)
     assert asset_node_snap.owners == ["team:foo", "hi@me.com"]
+
+
+def test_repository_snap_pieces():
+    @asset
+    def upstream():
+        return 1
+
+    @asset(deps=[upstream])
+    def downstream():
+        return 2
+
+    repository_snap = RepositorySnap.from_def(
+        Definitions(assets=[upstream, downstream]).get_repository_def()
+    )
+    repository_snap_pieces = RepositorySnapPieces.from_repository_snap(repository_snap)
+    assert repository_snap_pieces.repository_snap.asset_nodes == []
+    assert len(repository_snap_pieces.piece_digests["asset_nodes"]) == 2
+    assert repository_snap_pieces.resolve({}) == repository_snap
+
+    # only the asset whose definition changed gets a new digest
+    @asset(deps=[upstream], description="changed")
+    def downstream():
+        return 2
+
+    changed_repository_snap = RepositorySnap.from_def(
+        Definitions(assets=[upstream, downstream]).get_repository_def()
+    )
+    changed_pieces = RepositorySnapPieces.from_repository_snap(changed_repository_snap)
+    known_pieces = repository_snap_pieces.get_pieces({})
+    delta = deserialize_value(
+        serialize_value(changed_pieces.without_pieces(set(known_pieces))),
+        RepositorySnapPieces,
+    )
+    assert [
+        deserialize_value(delta.serialized_pieces[digest]).description
+        for digest in delta.piece_digests["asset_nodes"]
+        if digest in delta.serialized_pieces
+    ] == ["changed"]
+    assert delta.resolve(known_pieces) == changed_repository_snap
+
+    # digests are the snapshot ids of the pieces
+    assert set(known_pieces) == {create_snapshot_id(piece) for piece in known_pieces.values()}
+
+    with pytest.raises(Exception, match="is missing"):
+        delta.resolve({})
@@ -1,6 +1,7 @@
 import os
 import re
 import tempfile
+import time
 from typing import Any, Mapping, Optional
 from unittest.mock import MagicMock, patch
 
@@ -31,12 +32,15 @@
     DagsterInvalidConfigError,
     DagsterInvariantViolationError,
 )
+from dagster._core.events import DagsterEvent, DagsterEventType
+from dagster._core.events.log import EventLogEntry
 from dagster._core.execution.api import create_execution_plan
 from dagster._core.instance import DagsterInstance, InstanceRef
 from dagster._core.instance.config import DEFAULT_LOCAL_CODE_SERVER_STARTUP_TIMEOUT
 from dagster._core.launcher import LaunchRunContext, RunLauncher
 from dagster._core.run_coordinator.queued_run_coordinator import QueuedRunCoordinator
 from dagster._core.snap import create_execution_plan_snapshot_id, snapshot_from_execution_plan
+from dagster._core.storage.dagster_run import DagsterRunStatus
 from dagster._core.storage.partition_status_cache import AssetPartitionStatus, AssetStatusCacheValue
 from dagster._core.storage.sqlite_storage import (
     _event_logs_directory,
@@ -57,6 +61,7 @@
 from dagster._daemon.asset_daemon import AssetDaemon
 from dagster._serdes import ConfigurableClass
 from dagster._serdes.config_class import ConfigurableClassData
+from dagster._time import get_current_timestamp
 from typing_extensions import Self
 
 from dagster_tests.api_tests.utils import get_bar_workspace
@@ -774,3 +779,147 @@ def test_invalid_run_id():
             match="run_id must be a valid UUID. Got invalid_run_id",
         ):
             create_run_for_test(instance, job_name="foo_job", run_id="invalid_run_id")
+
+
+def _log_entry(run_id: str, message: str, dagster_event: Optional[DagsterEvent] = None):
+    return EventLogEntry(
+        error_info=None,
+        level="debug",
+        user_message=message,
+        run_id=run_id,
+        timestamp=get_current_timestamp(),
+        dagster_event=dagster_event,
+    )
+
+
+def test_event_log_buffer_settings():
+    with instance_for_test() as instance:
+        assert not instance.event_log_buffer_enabled
+
+    with instance_for_test(
+        overrides={"event_log_buffer": {"enabled": True, "max_events": 5, "max_seconds": 2}}
+    ) as instance:
+        assert instance.event_log_buffer_enabled
+        assert instance.event_log_buffer_max_events == 5
+        assert instance.event_log_buffer_max_seconds == 2
+
+
+def test_event_log_buffer_max_events():
+    with instance_for_test(
+        overrides={"event_log_buffer": {"enabled": True, "max_events": 3, "max_seconds": 600}}
+    ) as instance:
+        run = create_run_for_test(instance, job_name="foo_job")
+        received = []
+        instance.add_event_listener(run.run_id, lambda event: received.append(event.message))
+
+        with patch.object(
+            instance.event_log_storage,
+            "store_event_batch",
+            wraps=instance.event_log_storage.store_event_batch,
+        ) as store_event_batch:
+            for i in range(2):
+                instance.handle_new_event(_log_entry(run.run_id, f"message {i}"))
+            assert instance.all_logs(run.run_id) == []
+            assert received == []
+
+            instance.handle_new_event(_log_entry(run.run_id, "message 2"))
+            assert store_event_batch.call_count == 1
+            assert [event.message for event in instance.all_logs(run.run_id)] == [
+                "message 0",
+                "message 1",
+                "message 2",
+            ]
+            assert received == ["message 0", "message 1", "message 2"]
+
+            instance.handle_new_event(_log_entry(run.run_id, "message 3"))
+            assert len(instance.all_logs(run.run_id)) == 3
+            instance.flush_event_log_buffer(run.run_id)
+            assert len(instance.all_logs(run.run_id)) == 4
+            assert received == ["message 0", "message 1", "message 2", "message 3"]
+
+
+def test_event_log_buffer_max_seconds():
+    with instance_for_test(
+        overrides={"event_log_buffer": {"enabled": True, "max_events": 100, "max_seconds": 0}}
+    ) as instance:
+        run = create_run_for_test(instance, job_name="foo_job")
+        instance.handle_new_event(_log_entry(run.run_id, "message"))
+        assert len(instance.all_logs(run.run_id)) == 1
+
+
+def test_event_log_buffer_flushes_after_max_seconds():
+    with instance_for_test(
+        overrides={"event_log_buffer": {"enabled": True, "max_events": 100, "max_seconds": 0.5}}
+    ) as instance:
+        run = create_run_for_test(instance, job_name="foo_job")
+        received = []
+        instance.add_event_listener(run.run_id, lambda event: received.append(event.message))
+
+        # the buffer is written once its deadline passes, without any further events for the run
+        instance.handle_new_event(_log_entry(run.run_id, "message"))
+        assert instance.all_logs(run.run_id) == []
+        start_time = time.time()
+        while not instance.all_logs(run.run_id):
+            assert time.time() - start_time < 10, "Buffered event was never written"
+            time.sleep(0.1)
+        assert received == ["message"]
+
+        # disposing of the instance stops the flusher thread, after writing any buffered events
+        instance.handle_new_event(_log_entry(run.run_id, "last message"))
+        flusher_thread = instance._write_behind_flusher_thread  # noqa: SLF001
+        assert flusher_thread and flusher_thread.is_alive()
+        instance.dispose()
+        assert not flusher_thread.is_alive()
+        assert len(instance.all_logs(run.run_id)) == 2
+
+
+def test_event_log_buffer_flushes_on_boundaries():
+    with instance_for_test(
+        overrides={"event_log_buffer": {"enabled": True, "max_events": 100, "max_seconds": 600}}
+    ) as instance:
+        run = create_run_for_test(instance, job_name="foo_job")
+        instance.handle_new_event(_log_entry(run.run_id, "message"))
+        assert instance.all_logs(run.run_id) == []
+
+        instance.handle_new_event(
+            _log_entry(
+                run.run_id,
+                "run started",
+                DagsterEvent(DagsterEventType.RUN_START.value, "foo_job"),
+            )
+        )
+        assert len(instance.all_logs(run.run_id)) == 2
+        run_record = instance.get_run_record_by_id(run.run_id)
+        assert run_record
+        assert run_record.dagster_run.status == DagsterRunStatus.STARTED
+
+        # buffered events are written when the instance is disposed
+        instance.handle_new_event(_log_entry(run.run_id, "last message"))
+        assert len(instance.all_logs(run.run_id)) == 2
+        instance.dispose()
+        assert len(instance.all_logs(run.run_id)) == 3
+
+
+@op
+def buffered_op(context):
+    for i in range(10):
+        context.log.info(f"message {i}")
+
+
+@job
+def buffered_job():
+    buffered_op()
+    buffered_op.alias("other_buffered_op")()
+
+
+def test_event_log_buffer_execute_job():
+    with instance_for_test(
+        overrides={"event_log_buffer": {"enabled": True, "max_events": 1000, "max_seconds": 600}}
+    ) as instance:
+        result = execute_job(reconstructable(buffered_job), instance=instance)
+        assert result.success
+        messages = [event.message for event in instance.all_logs(result.run_id)]
+        assert len([message for message in messages if message.startswith("message")]) == 20
+        run_record = instance.get_run_record_by_id(result.run_id)
+        assert run_record
+        assert run_record.dagster_run.status == DagsterRunStatus.SUCCESS
@@ -0,0 +1,106 @@
+import pytest
+from dagster import job, op
+from dagster._core.execution.api import create_execution_plan
+from dagster._core.execution.plan.state import KnownExecutionState
+from dagster._core.snap import snapshot_from_execution_plan
+from dagster._core.snap.execution_plan_snapshot import create_execution_plan_snapshot_id
+from dagster._core.snap.execution_plan_snapshot_cache import (
+    ExecutionPlanSnapshotCache,
+    get_execution_plan_snapshot_cache,
+    get_execution_plan_snapshot_cache_key,
+)
+from dagster._serdes import create_snapshot_id
+
+
+@op(config_schema={"value": int})
+def config_op(context):
+    return context.op_config["value"]
+
+
+@job
+def config_job():
+    config_op()
+
+
+def _create_snapshot(value: int):
+    return snapshot_from_execution_plan(
+        create_execution_plan(
+            config_job, run_config={"ops": {"config_op": {"config": {"value": value}}}}
+        ),
+        config_job.get_job_snapshot().snapshot_id,
+    )
+
+
+def _cache_key(run_config, **kwargs):
+    return get_execution_plan_snapshot_cache_key(
+        job_origin_id="origin_id",
+        job_snapshot_id="snapshot_id",
+        run_config=run_config,
+        step_keys_to_execute=kwargs.pop("step_keys_to_execute", None),
+        known_state=kwargs.pop("known_state", None),
+        **kwargs,
+    )
+
+
+def test_cache_key():
+    assert _cache_key({"a": 1, "b": 2}) == _cache_key({"b": 2, "a": 1})
+    assert _cache_key({"a": 1}) != _cache_key({"a": 2})
+    assert _cache_key({}) != _cache_key({}, step_keys_to_execute=["config_op"])
+    assert _cache_key({}) != _cache_key({}, op_selection=["config_op"])
+    assert _cache_key({}) != _cache_key(
+        {}, known_state=KnownExecutionState(previous_retry_attempts={"config_op": 1})
+    )
+
+    # run config that can not be hashed is not cached
+    assert _cache_key({"a": object()}) is None
+
+
+def test_get_or_create():
+    cache = ExecutionPlanSnapshotCache(max_entries=2)
+    calls = []
+
+    def _create(value):
+        calls.append(value)
+        return _create_snapshot(value)
+
+    snapshot_one = cache.get_or_create(_cache_key({"value": 1}), lambda: _create(1))
+    assert cache.get_or_create(_cache_key({"value": 1}), lambda: _create(1)) is snapshot_one
+    assert calls == [1]
+    assert cache.get_snapshot_id(snapshot_one) == create_snapshot_id(snapshot_one)
+
+    # snapshots are not cached without a key
+    cache.get_or_create(None, lambda: _create(1))
+    assert calls == [1, 1]
+
+    # the least recently used snapshot is evicted once the cache is full
+    cache.get_or_create(_cache_key({"value": 2}), lambda: _create(2))
+    cache.get_or_create(_cache_key({"value": 3}), lambda: _create(3))
+    assert len(cache) == 2
+    assert cache.get_snapshot_id(snapshot_one) is None
+    cache.get_or_create(_cache_key({"value": 1}), lambda: _create(1))
+    assert calls == [1, 1, 2, 3, 1]
+
+
+def test_failures_are_not_cached():
+    cache = ExecutionPlanSnapshotCache()
+
+    def _fail():
+        raise Exception("failed to build plan")
+
+    with pytest.raises(Exception, match="failed to build plan"):
+        cache.get_or_create(_cache_key({}), _fail)
+
+    assert len(cache) == 0
+    snapshot = cache.get_or_create(_cache_key({}), lambda: _create_snapshot(1))
+    assert cache.get_or_create(_cache_key({}), _fail) is snapshot
+
+
+def test_snapshot_id_from_cache():
+    cache = get_execution_plan_snapshot_cache()
+    snapshot = cache.get_or_create(
+        _cache_key({"test_snapshot_id_from_cache": True}), lambda: _create_snapshot(1)
+    )
+
+    assert create_execution_plan_snapshot_id(snapshot) == create_snapshot_id(snapshot)
+    # an equal snapshot that is not held by the cache gets the same id
+    assert create_execution_plan_snapshot_id(_create_snapshot(1)) == create_snapshot_id(snapshot)
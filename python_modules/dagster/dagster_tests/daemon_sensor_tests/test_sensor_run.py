@@ -68,6 +68,7 @@
 from dagster._core.events import DagsterEventType
 from dagster._core.log_manager import LOG_RECORD_METADATA_ATTR
 from dagster._core.remote_representation import (
+    GrpcServerCodeLocation,
     RemoteInstigatorOrigin,
     RemoteRepositoryOrigin,
     RemoteSensor,
@@ -1364,6 +1365,67 @@ def test_error_sensor(caplog, executor, instance, workspace_context, remote_repo
         assert state.instigator_data.last_tick_timestamp == freeze_datetime.timestamp()
 
 
+def _evaluate_sensors_of_code_location(instance, workspace_context, remote_repo, executor):
+    freeze_datetime = create_datetime(year=2019, month=2, day=27, hour=23, minute=59, second=59)
+    with freeze_time(freeze_datetime):
+        sensors = [
+            remote_repo.get_sensor(sensor_name)
+            for sensor_name in ["always_on_sensor", "error_sensor", "run_key_sensor"]
+        ]
+        for sensor in sensors:
+            instance.add_instigator_state(
+                InstigatorState(
+                    sensor.get_remote_origin(),
+                    InstigatorType.SENSOR,
+                    InstigatorStatus.RUNNING,
+                )
+            )
+
+        evaluate_sensors(workspace_context, executor)
+
+        always_on_sensor, error_sensor, run_key_sensor = sensors
+        assert instance.get_runs_count() == 2
+        for sensor in [always_on_sensor, run_key_sensor]:
+            ticks = instance.get_ticks(sensor.get_remote_origin_id(), sensor.selector_id)
+            assert len(ticks) == 1
+            validate_tick(ticks[0], sensor, freeze_datetime, TickStatus.SUCCESS)
+            assert len(ticks[0].run_ids) == 1
+
+        ticks = instance.get_ticks(error_sensor.get_remote_origin_id(), error_sensor.selector_id)
+        assert len(ticks) == 1
+        validate_tick(
+            ticks[0],
+            error_sensor,
+            freeze_datetime,
+            TickStatus.FAILURE,
+            [],
+            "Error occurred during the execution of evaluation_fn for sensor error_sensor",
+        )
+        assert ticks[0].log_key == [remote_repo.name, error_sensor.name, str(ticks[0].tick_id)]
+
+
+def test_sensors_of_code_location_are_evaluated_in_a_batch(
+    executor, instance, workspace_context, remote_repo
+):
+    with mock.patch.object(
+        GrpcServerCodeLocation,
+        "get_sensor_execution_data",
+        side_effect=Exception("sensors should be evaluated in a batch"),
+    ):
+        _evaluate_sensors_of_code_location(instance, workspace_context, remote_repo, executor)
+
+
+def test_sensors_are_evaluated_one_at_a_time_when_batch_fails(
+    executor, instance, workspace_context, remote_repo
+):
+    with mock.patch.object(
+        GrpcServerCodeLocation,
+        "get_sensor_execution_data_batch",
+        side_effect=Exception("batch failed"),
+    ):
+        _evaluate_sensors_of_code_location(instance, workspace_context, remote_repo, executor)
+
+
 def test_wrong_config_sensor(caplog, executor, instance, workspace_context, remote_repo):
     freeze_datetime = create_datetime(
         year=2019,
@@ -2745,11 +2807,24 @@ def test_run_request_list_sensor(executor, instance, workspace_context, remote_r
         ticks = instance.get_ticks(sensor.get_remote_origin_id(), sensor.selector_id)
         assert len(ticks) == 0
 
-        evaluate_sensors(workspace_context, executor)
+        code_location_class = type(
+            workspace_context.create_request_context().get_code_location(
+                sensor.handle.location_name
+            )
+        )
+        with mock.patch.object(
+            code_location_class,
+            "get_execution_plan",
+            autospec=True,
+            side_effect=code_location_class.get_execution_plan,
+        ) as get_execution_plan_mock:
+            evaluate_sensors(workspace_context, executor)
 
         assert instance.get_runs_count() == 2
         ticks = instance.get_ticks(sensor.get_remote_origin_id(), sensor.selector_id)
         assert len(ticks) == 1
+        # both run requests target the same job with the same config, so share an execution plan
+        assert get_execution_plan_mock.call_count == 1
 
 
 def test_sensor_purge(executor, instance, workspace_context, remote_repo):
@@ -208,6 +208,7 @@ def test_attempt_to_launch_runs_no_queued(
         [
             dict(max_concurrent_runs=4, dequeue_use_threads=True),
             dict(max_concurrent_runs=4, dequeue_use_threads=False),
+            dict(max_concurrent_runs=4, bulk_dequeue={"enabled": True}),
         ],
     )
     def test_get_queued_runs_max_runs(
@@ -250,6 +251,7 @@ def test_get_queued_runs_max_runs(
         [
             dict(max_concurrent_runs=-1, dequeue_use_threads=True),
             dict(max_concurrent_runs=-1, dequeue_use_threads=False),
+            dict(max_concurrent_runs=-1, bulk_dequeue={"enabled": True}),
         ],
     )
     def test_disable_max_concurrent_runs_limit(
@@ -322,6 +324,11 @@ def test_priority_on_malformed_tag(self, instance, workspace_context, job_handle
                 tag_concurrency_limits=[{"key": "database", "value": "tiny", "limit": 1}],
                 dequeue_use_threads=False,
             ),
+            dict(
+                max_concurrent_runs=10,
+                tag_concurrency_limits=[{"key": "database", "value": "tiny", "limit": 1}],
+                bulk_dequeue={"enabled": True},
+            ),
         ],
     )
     def test_tag_limits(self, workspace_context, job_handle, daemon, instance):
@@ -356,6 +363,13 @@ def test_tag_limits(self, workspace_context, job_handle, daemon, instance):
                 ],
                 dequeue_use_threads=False,
             ),
+            dict(
+                max_concurrent_runs=10,
+                tag_concurrency_limits=[
+                    {"key": "database", "value": {"applyLimitPerUniqueValue": False}, "limit": 2}
+                ],
+                bulk_dequeue={"enabled": True},
+            ),
         ],
     )
     def test_tag_limits_just_key(self, workspace_context, job_handle, daemon, instance):
@@ -392,6 +406,14 @@ def test_tag_limits_just_key(self, workspace_context, job_handle, daemon, instan
                 ],
                 dequeue_use_threads=False,
             ),
+            dict(
+                max_concurrent_runs=10,
+                tag_concurrency_limits=[
+                    {"key": "database", "value": "tiny", "limit": 1},
+                    {"key": "user", "value": "johann", "limit": 2},
+                ],
+                bulk_dequeue={"enabled": True},
+            ),
         ],
     )
     def test_multiple_tag_limits(
@@ -451,6 +473,14 @@ def test_multiple_tag_limits(
                 ],
                 dequeue_use_threads=False,
             ),
+            dict(
+                max_concurrent_runs=10,
+                tag_concurrency_limits=[
+                    {"key": "foo", "limit": 2},
+                    {"key": "foo", "value": "bar", "limit": 1},
+                ],
+                bulk_dequeue={"enabled": True},
+            ),
         ],
     )
     def test_overlapping_tag_limits(self, workspace_context, daemon, job_handle, instance):
@@ -482,6 +512,13 @@ def test_overlapping_tag_limits(self, workspace_context, daemon, job_handle, ins
                 ],
                 dequeue_use_threads=False,
             ),
+            dict(
+                max_concurrent_runs=10,
+                tag_concurrency_limits=[
+                    {"key": "foo", "limit": 1, "value": {"applyLimitPerUniqueValue": True}},
+                ],
+                bulk_dequeue={"enabled": True},
+            ),
         ],
     )
     def test_limits_per_unique_value(self, workspace_context, job_handle, daemon, instance):
@@ -522,6 +559,14 @@ def test_limits_per_unique_value(self, workspace_context, job_handle, daemon, in
                 ],
                 dequeue_use_threads=False,
             ),
+            dict(
+                max_concurrent_runs=10,
+                tag_concurrency_limits=[
+                    {"key": "foo", "limit": 1, "value": {"applyLimitPerUniqueValue": True}},
+                    {"key": "foo", "limit": 2},
+                ],
+                bulk_dequeue={"enabled": True},
+            ),
         ],
     )
     def test_limits_per_unique_value_overlapping_limits_less_than(
@@ -561,6 +606,14 @@ def test_limits_per_unique_value_overlapping_limits_less_than(
                 ],
                 dequeue_use_threads=False,
             ),
+            dict(
+                max_concurrent_runs=10,
+                tag_concurrency_limits=[
+                    {"key": "foo", "limit": 2, "value": {"applyLimitPerUniqueValue": True}},
+                    {"key": "foo", "limit": 1, "value": "bar"},
+                ],
+                bulk_dequeue={"enabled": True},
+            ),
         ],
     )
     def test_limits_per_unique_value_overlapping_limits_greater_than(
@@ -659,6 +712,11 @@ def test_skip_error_runs(self, job_handle, daemon, instance, workspace_context):
             dict(
                 max_user_code_failure_retries=2, max_concurrent_runs=10, dequeue_use_threads=False
             ),
+            dict(
+                max_user_code_failure_retries=2,
+                max_concurrent_runs=10,
+                bulk_dequeue={"enabled": True},
+            ),
         ],
     )
     def test_retry_user_code_error_run(
@@ -737,6 +795,65 @@ def test_retry_user_code_error_run(
             good_run_same_location_id,
         ]
 
+    @pytest.mark.parametrize(
+        "run_coordinator_config",
+        [
+            dict(
+                max_user_code_failure_retries=2,
+                max_concurrent_runs=10,
+                bulk_dequeue={"enabled": True, "max_concurrent_launches_per_location": 1},
+            ),
+        ],
+    )
+    def test_bulk_dequeue_location_backpressure(
+        self, job_handle, other_location_job_handle, daemon, instance, workspace_context
+    ):
+        same_location_run_ids = [make_new_run_id() for _ in range(2)]
+        other_location_run_ids = [make_new_run_id() for _ in range(2)]
+        fixed_iteration_time = time.time() - 3600 * 24 * 365
+
+        self.create_queued_run(
+            instance, job_handle, run_id=BAD_USER_CODE_RUN_ID_UUID, tags={PRIORITY_TAG: "5"}
+        )
+        for run_id in same_location_run_ids:
+            self.create_queued_run(instance, job_handle, run_id=run_id)
+        for run_id in other_location_run_ids:
+            self.create_queued_run(instance, other_location_job_handle, run_id=run_id)
+
+        list(daemon.run_iteration(workspace_context, fixed_iteration_time=fixed_iteration_time))
+
+        # the runs held back behind the failed launch stay queued while the location is paused
+        assert instance.get_run_by_id(BAD_USER_CODE_RUN_ID_UUID).status == DagsterRunStatus.QUEUED
+        for run_id in same_location_run_ids:
+            assert instance.get_run_by_id(run_id).status == DagsterRunStatus.QUEUED
+        assert set(self.get_run_ids(instance.run_launcher.queue())) == set(other_location_run_ids)
+
+        fixed_iteration_time = fixed_iteration_time + 121
+
+        list(daemon.run_iteration(workspace_context, fixed_iteration_time=fixed_iteration_time))
+
+        assert instance.get_run_by_id(BAD_USER_CODE_RUN_ID_UUID).status == DagsterRunStatus.QUEUED
+        for run_id in same_location_run_ids:
+            assert instance.get_run_by_id(run_id).status == DagsterRunStatus.QUEUED
+
+        fixed_iteration_time = fixed_iteration_time + 121
+
+        # gives up on the bad run after max_user_code_failure_retries retries
+        list(daemon.run_iteration(workspace_context, fixed_iteration_time=fixed_iteration_time))
+
+        assert instance.get_run_by_id(BAD_USER_CODE_RUN_ID_UUID).status == DagsterRunStatus.FAILURE
+        for run_id in same_location_run_ids:
+            assert instance.get_run_by_id(run_id).status == DagsterRunStatus.QUEUED
+
+        fixed_iteration_time = fixed_iteration_time + 121
+
+        # the rest of the location's runs are launched one at a time
+        list(daemon.run_iteration(workspace_context, fixed_iteration_time=fixed_iteration_time))
+
+        assert set(self.get_run_ids(instance.run_launcher.queue())) == set(
+            other_location_run_ids + same_location_run_ids
+        )
+
     @pytest.mark.parametrize(
         "run_coordinator_config",
         [
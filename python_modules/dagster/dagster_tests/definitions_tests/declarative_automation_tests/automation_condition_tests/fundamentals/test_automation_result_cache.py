@@ -0,0 +1,131 @@
+import logging
+from typing import Optional, Sequence
+from unittest import mock
+
+from dagster import AssetSpec, AutomationCondition, Definitions, asset, materialize
+from dagster._core.definitions.asset_daemon_cursor import AssetDaemonCursor
+from dagster._core.definitions.declarative_automation.automation_condition_evaluator import (
+    AutomationConditionEvaluator,
+)
+from dagster._core.definitions.declarative_automation.automation_result_cache import (
+    AutomationResultCache,
+)
+from dagster._core.definitions.declarative_automation.serialized_objects import (
+    AutomationConditionEvaluation,
+)
+from dagster._core.instance import DagsterInstance
+from dagster._core.test_utils import freeze_time
+from dagster._time import get_current_datetime
+
+NUM_CHILDREN = 10
+
+
+@asset
+def raw() -> None: ...
+
+
+children = [
+    AssetSpec(f"child_{i}", deps=[raw], automation_condition=AutomationCondition.eager())
+    for i in range(NUM_CHILDREN)
+]
+defs = Definitions(assets=[raw, *children])
+
+
+def _get_evaluator(
+    instance: DagsterInstance,
+    cursor: Optional[AssetDaemonCursor] = None,
+    definitions: Definitions = defs,
+) -> AutomationConditionEvaluator:
+    asset_graph = definitions.get_asset_graph()
+    return AutomationConditionEvaluator(
+        entity_keys=asset_graph.get_all_asset_keys() - {raw.key},
+        instance=instance,
+        asset_graph=asset_graph,
+        cursor=cursor or AssetDaemonCursor.empty(),
+        emit_backfills=False,
+        logger=logging.getLogger("dagster.automation"),
+    )
+
+
+def test_shared_parent_results() -> None:
+    instance = DagsterInstance.ephemeral()
+    materialize([raw], instance=instance)
+
+    evaluator = _get_evaluator(instance)
+    results, _ = evaluator.evaluate()
+    cursor = AssetDaemonCursor.empty().with_updates(
+        evaluation_id=1,
+        evaluation_timestamp=get_current_datetime().timestamp(),
+        newly_observe_requested_asset_keys=[],
+        condition_cursors=[result.get_new_cursor() for result in results],
+    )
+
+    # the conditions evaluated over the shared parent are only computed for the first child
+    assert evaluator.result_cache.num_hits >= NUM_CHILDREN - 1
+    assert "Shared" in evaluator.result_cache.get_report()
+
+    # shared results produce the same requests
+    materialize([raw], instance=instance)
+    with freeze_time(get_current_datetime()):
+        evaluator = _get_evaluator(instance, cursor)
+        _, requested_subsets = evaluator.evaluate()
+    assert {subset.key for subset in requested_subsets} == {spec.key for spec in children}
+    assert evaluator.result_cache.num_hits >= NUM_CHILDREN - 1
+
+
+def _get_node_results(evaluation: AutomationConditionEvaluation) -> Sequence:
+    # everything but the timing and storage query statistics of each node
+    return [
+        (node.condition_snapshot, node.true_subset, node.candidate_subset)
+        for node in evaluation.iter_nodes()
+    ]
+
+
+def test_shared_results_match_unshared_results() -> None:
+    # the children evaluate structurally identical conditions over the shared parent, which only
+    # differ in their labels
+    labeled_children = [
+        AssetSpec(
+            "labeled",
+            deps=[raw],
+            automation_condition=AutomationCondition.any_deps_match(
+                AutomationCondition.missing().with_label("LABEL_A")
+            ),
+        ),
+        AssetSpec(
+            "unlabeled",
+            deps=[raw],
+            automation_condition=AutomationCondition.any_deps_match(AutomationCondition.missing()),
+        ),
+        *children,
+    ]
+    labeled_defs = Definitions(assets=[raw, *labeled_children])
+    instance = DagsterInstance.ephemeral()
+
+    with freeze_time(get_current_datetime()):
+        evaluator = _get_evaluator(instance, definitions=labeled_defs)
+        shared_results, _ = evaluator.evaluate()
+        assert evaluator.result_cache.num_hits > 0
+
+        with mock.patch.object(AutomationResultCache, "get_cache_key", return_value=None):
+            evaluator = _get_evaluator(instance, definitions=labeled_defs)
+            unshared_results, _ = evaluator.evaluate()
+            assert evaluator.result_cache.num_hits == 0
+
+    shared_evaluations = {
+        result.key: _get_node_results(result.serializable_evaluation) for result in shared_results
+    }
+    unshared_evaluations = {
+        result.key: _get_node_results(result.serializable_evaluation) for result in unshared_results
+    }
+    assert shared_evaluations == unshared_evaluations
+    assert len(shared_evaluations) == len(labeled_children)
+
+    labels = {
+        result.key.to_user_string(): {
+            node.condition_snapshot.label for node in result.serializable_evaluation.iter_nodes()
+        }
+        for result in shared_results
+    }
+    assert "LABEL_A" in labels["labeled"]
+    assert "LABEL_A" not in labels["unlabeled"]
@@ -0,0 +1,224 @@
+import datetime
+import logging
+from typing import AbstractSet, Optional, Tuple
+
+from dagster import (
+    AutomationCondition,
+    DagsterRunStatus,
+    DailyPartitionsDefinition,
+    Definitions,
+    asset,
+    materialize,
+)
+from dagster._core.definitions.asset_daemon_cursor import AssetDaemonCursor
+from dagster._core.definitions.asset_key import AssetKey, EntityKey
+from dagster._core.definitions.declarative_automation.automation_condition_evaluator import (
+    AutomationConditionEvaluator,
+)
+from dagster._core.execution.api import create_execution_plan
+from dagster._core.instance import DagsterInstance
+from dagster._serdes import deserialize_value, serialize_value
+
+
+@asset(automation_condition=AutomationCondition.eager())
+def A() -> None: ...
+
+
+@asset(automation_condition=AutomationCondition.eager())
+def C() -> None: ...
+
+
+@asset(automation_condition=AutomationCondition.eager(), deps=[A, C])
+def B() -> None: ...
+
+
+@asset(automation_condition=AutomationCondition.on_cron("0 * * * *"))
+def D() -> None: ...
+
+
+defs = Definitions(assets=[A, B, C, D])
+
+
+def _evaluate(
+    instance: DagsterInstance,
+    definitions: Definitions,
+    cursor: AssetDaemonCursor,
+    evaluation_time: datetime.datetime,
+    evaluate_incrementally: bool,
+) -> Tuple[AssetDaemonCursor, AbstractSet[EntityKey], AbstractSet[EntityKey]]:
+    asset_graph = definitions.get_asset_graph()
+    evaluator = AutomationConditionEvaluator(
+        entity_keys=asset_graph.materializable_asset_keys,
+        instance=instance,
+        asset_graph=asset_graph,
+        # round-trip the cursor to simulate actual usage
+        cursor=deserialize_value(serialize_value(cursor), AssetDaemonCursor),
+        emit_backfills=False,
+        evaluation_time=evaluation_time,
+        logger=logging.getLogger("dagster.automation"),
+        evaluate_incrementally=evaluate_incrementally,
+    )
+    results, requested_subsets = evaluator.evaluate()
+    new_cursor = cursor.with_updates(
+        evaluation_id=cursor.evaluation_id + 1,
+        evaluation_timestamp=evaluation_time.timestamp(),
+        newly_observe_requested_asset_keys=[],
+        condition_cursors=[result.get_new_cursor() for result in results],
+    )
+    return (
+        new_cursor,
+        {result.key for result in results},
+        {subset.key for subset in requested_subsets},
+    )
+
+
+class _Ticker:
+    """Evaluates the same definitions both incrementally and in full on each tick, and checks that
+    both make the same requests.
+    """
+
+    def __init__(
+        self,
+        instance: DagsterInstance,
+        definitions: Definitions = defs,
+        time: datetime.datetime = datetime.datetime(
+            2024, 1, 1, 0, 10, tzinfo=datetime.timezone.utc
+        ),
+    ):
+        self.instance = instance
+        self.definitions = definitions
+        self.time = time
+        self.cursor = AssetDaemonCursor.empty()
+        self.full_cursor = AssetDaemonCursor.empty()
+
+    def tick(
+        self, minutes: int = 1, expected_requested: Optional[AbstractSet[AssetKey]] = None
+    ) -> AbstractSet[EntityKey]:
+        self.time += datetime.timedelta(minutes=minutes)
+        self.cursor, evaluated, requested = _evaluate(
+            self.instance, self.definitions, self.cursor, self.time, True
+        )
+        assert requested == (expected_requested or set())
+
+        # the same requests are made when evaluating everything
+        self.full_cursor, _, full_requested = _evaluate(
+            self.instance, self.definitions, self.full_cursor, self.time, False
+        )
+        assert requested == full_requested
+        return evaluated
+
+    def settle(self) -> None:
+        for _ in range(3):
+            self.tick()
+        assert self.tick() == set()
+
+
+def test_incremental_evaluation() -> None:
+    instance = DagsterInstance.ephemeral()
+    materialize([A, B, C, D], instance=instance)
+    ticker = _Ticker(instance)
+    _tick = ticker.tick
+
+    all_keys = {AssetKey("A"), AssetKey("B"), AssetKey("C"), AssetKey("D")}
+
+    # everything is evaluated until the results settle
+    assert _tick() == all_keys
+    assert _tick() == all_keys
+    assert _tick() == all_keys
+    assert _tick() == set()
+    assert _tick() == set()
+
+    # a new materialization of A makes A and its child B dirty, and B gets requested
+    materialize([A], instance=instance)
+    assert _tick(expected_requested={AssetKey("B")}) == {AssetKey("A"), AssetKey("B")}
+
+    # B is still evaluated on the next ticks, as it was just requested and its parent changed
+    assert AssetKey("B") in _tick()
+    materialize([B], instance=instance)
+    assert AssetKey("B") in _tick()
+
+    ticker.settle()
+
+    # passing the cron tick of D makes it dirty
+    assert _tick(minutes=60, expected_requested={AssetKey("D")}) == {AssetKey("D")}
+
+
+def test_incremental_evaluation_new_time_window() -> None:
+    partitions_def = DailyPartitionsDefinition("2024-01-01")
+
+    @asset(partitions_def=partitions_def, automation_condition=AutomationCondition.eager())
+    def daily_root() -> None: ...
+
+    @asset(
+        partitions_def=partitions_def,
+        automation_condition=AutomationCondition.eager(),
+        deps=[daily_root],
+    )
+    def daily_child() -> None: ...
+
+    instance = DagsterInstance.ephemeral()
+    materialize([daily_root, daily_child], instance=instance, partition_key="2024-01-04")
+    ticker = _Ticker(
+        instance,
+        Definitions(assets=[daily_root, daily_child]),
+        datetime.datetime(2024, 1, 5, 23, 50, tzinfo=datetime.timezone.utc),
+    )
+    ticker.settle()
+
+    # nothing changes within the time window
+    assert ticker.tick() == set()
+
+    # a new partition of both assets becomes the latest one at midnight, and is missing
+    assert ticker.tick(minutes=10, expected_requested={daily_root.key, daily_child.key}) == {
+        daily_root.key,
+        daily_child.key,
+    }
+
+
+def test_incremental_evaluation_failed_and_in_progress_runs() -> None:
+    @asset(automation_condition=AutomationCondition.execution_failed())
+    def failable() -> None: ...
+
+    @asset(automation_condition=AutomationCondition.in_progress())
+    def slow() -> None: ...
+
+    instance = DagsterInstance.ephemeral()
+    run_defs = Definitions(assets=[failable, slow])
+    materialize([failable, slow], instance=instance)
+    ticker = _Ticker(instance, run_defs)
+    ticker.settle()
+
+    # a run starts that plans to materialize both assets
+    job_def = run_defs.get_implicit_job_def_for_assets([failable.key, slow.key])
+    assert job_def
+    run = instance.create_run_for_job(
+        job_def=job_def,
+        status=DagsterRunStatus.STARTED,
+        asset_selection=frozenset({failable.key, slow.key}),
+        execution_plan=create_execution_plan(job_def),
+    )
+    assert ticker.tick(expected_requested={slow.key}) == {failable.key, slow.key}
+    assert ticker.tick(expected_requested={slow.key}) == {failable.key, slow.key}
+
+    # the run fails without any new events for either asset
+    instance.report_run_failed(run)
+    assert ticker.tick(expected_requested={failable.key}) == {failable.key, slow.key}
+
+    # the assets of the failed run are evaluated until they are materialized again
+    assert ticker.tick(expected_requested={failable.key}) == {failable.key, slow.key}
+    materialize([failable], instance=instance)
+    for _ in range(5):
+        assert slow.key in ticker.tick()
+    materialize([slow], instance=instance)
+    ticker.settle()
+
+
+def test_incremental_evaluation_wiped_asset() -> None:
+    instance = DagsterInstance.ephemeral()
+    materialize([A, B, C, D], instance=instance)
+    ticker = _Ticker(instance)
+    ticker.settle()
+
+    # wiping an asset removes its events rather than adding new ones, which makes it missing again
+    instance.wipe_assets([A.key])
+    assert ticker.tick(expected_requested={A.key, B.key}) == {A.key, B.key}
@@ -0,0 +1,135 @@
+import logging
+
+import dagster._check as check
+import pytest
+from dagster import (
+    AssetKey,
+    AssetSelection,
+    AssetSpec,
+    AutomationCondition,
+    Definitions,
+    asset,
+    materialize,
+    multi_asset,
+)
+from dagster._core.definitions.asset_daemon_cursor import AssetDaemonCursor
+from dagster._core.definitions.automation_tick_evaluation_context import (
+    AutomationTickEvaluationContext,
+)
+from dagster._core.definitions.base_asset_graph import BaseAssetGraph
+from dagster._core.definitions.declarative_automation.automation_condition_sharding import (
+    get_automation_condition_shards,
+)
+from dagster._core.definitions.remote_asset_graph import RemoteWorkspaceAssetGraph
+from dagster._core.instance import DagsterInstance
+from dagster._core.test_utils import instance_for_test, mock_workspace_from_repos
+
+
+@asset
+def raw() -> None: ...
+
+
+@asset(deps=[raw], automation_condition=AutomationCondition.eager())
+def a() -> None: ...
+
+
+@asset(deps=[a], automation_condition=AutomationCondition.eager())
+def a_child() -> None: ...
+
+
+@asset(deps=[raw], automation_condition=AutomationCondition.eager())
+def b() -> None: ...
+
+
+@multi_asset(
+    specs=[
+        AssetSpec("m1", deps=[raw], automation_condition=AutomationCondition.eager()),
+        AssetSpec("m2"),
+    ],
+    can_subset=False,
+)
+def m(): ...
+
+
+@asset(deps=["m2"], automation_condition=AutomationCondition.eager())
+def m_child() -> None: ...
+
+
+defs = Definitions(assets=[raw, a, a_child, b, m, m_child])
+target_keys = {a.key, a_child.key, b.key, AssetKey("m1"), m_child.key}
+
+
+def test_get_automation_condition_shards() -> None:
+    asset_graph = defs.get_asset_graph()
+
+    # the unevaluated parent does not connect its children, but the unevaluated member of an
+    # execution set does
+    shards = get_automation_condition_shards(asset_graph, target_keys, max_num_shards=10)
+    assert {frozenset(shard) for shard in shards} == {
+        frozenset({a.key, a_child.key}),
+        frozenset({b.key}),
+        frozenset({AssetKey("m1"), m_child.key}),
+    }
+
+    shards = get_automation_condition_shards(asset_graph, target_keys, max_num_shards=2)
+    assert len(shards) == 2
+    assert {len(shard) for shard in shards} == {2, 3}
+    assert any({a.key, a_child.key} <= shard for shard in shards)
+
+    shards = get_automation_condition_shards(asset_graph, target_keys, max_num_shards=1)
+    assert shards == [target_keys]
+
+
+def _evaluate(instance: DagsterInstance, asset_graph: BaseAssetGraph, cursor: AssetDaemonCursor):
+    return AutomationTickEvaluationContext(
+        evaluation_id=cursor.evaluation_id + 1,
+        instance=instance,
+        asset_graph=asset_graph,
+        cursor=cursor,
+        materialize_run_tags={},
+        observe_run_tags={},
+        auto_observe_asset_keys=set(),
+        asset_selection=AssetSelection.all(),
+        logger=logging.getLogger("dagster.automation"),
+        emit_backfills=False,
+    ).evaluate()
+
+
+def _evaluate_two_ticks(asset_graph: BaseAssetGraph, num_evaluation_processes: int):
+    with instance_for_test(
+        overrides={"auto_materialize": {"num_evaluation_processes": num_evaluation_processes}}
+    ) as instance:
+        _, cursor, _ = _evaluate(instance, asset_graph, AssetDaemonCursor.empty())
+        materialize([raw], instance=instance)
+        return _evaluate(instance, asset_graph, cursor)
+
+
+@pytest.mark.parametrize("remote", [True, False])
+def test_sharded_evaluation(remote: bool) -> None:
+    # shards are only evaluated in separate processes for remote asset graphs, whose nodes can be
+    # sent to those processes
+    asset_graph = (
+        RemoteWorkspaceAssetGraph.build(mock_workspace_from_repos([defs.get_repository_def()]))
+        if remote
+        else defs.get_asset_graph()
+    )
+    run_requests, cursor, evaluations = _evaluate_two_ticks(asset_graph, num_evaluation_processes=1)
+    sharded_run_requests, sharded_cursor, sharded_evaluations = _evaluate_two_ticks(
+        asset_graph, num_evaluation_processes=3
+    )
+
+    # the requests of the shards are merged into the run requests of a single tick
+    requested_keys = {key for rr in run_requests for key in rr.asset_selection or []}
+    assert {a.key, a_child.key, b.key, AssetKey("m1"), AssetKey("m2")} <= requested_keys
+    assert {
+        key for rr in sharded_run_requests for key in rr.asset_selection or []
+    } == requested_keys
+
+    assert sharded_cursor.evaluation_id == cursor.evaluation_id == 2
+    assert {evaluation.key for evaluation in sharded_evaluations} == {
+        evaluation.key for evaluation in evaluations
+    }
+    for key in target_keys:
+        condition_cursor = check.not_none(cursor.get_previous_condition_cursor(key))
+        sharded_condition_cursor = check.not_none(sharded_cursor.get_previous_condition_cursor(key))
+        assert sharded_condition_cursor.result_value_hash == condition_cursor.result_value_hash
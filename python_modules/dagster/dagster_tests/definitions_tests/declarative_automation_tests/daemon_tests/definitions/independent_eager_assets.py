@@ -0,0 +1,39 @@
+from typing import Sequence
+
+import dagster as dg
+
+
+def get_assets(group_name: str) -> Sequence[dg.AssetsDefinition]:
+    assets = []
+    for prefix in ["a", "b"]:
+
+        @dg.asset(name=f"{prefix}_root_{group_name}", group_name=group_name)
+        def _root() -> None: ...
+
+        @dg.asset(
+            name=f"{prefix}_downstream_{group_name}",
+            group_name=group_name,
+            deps=[_root],
+            automation_condition=dg.AutomationCondition.eager(),
+        )
+        def _downstream() -> None: ...
+
+        assets.extend([_root, _downstream])
+    return assets
+
+
+defs = dg.Definitions(
+    assets=[*get_assets("user_code"), *get_assets("daemon")],
+    sensors=[
+        dg.AutomationConditionSensorDefinition(
+            name="user_code_sensor",
+            target=dg.AssetSelection.groups("user_code"),
+            use_user_code_server=True,
+        ),
+        dg.AutomationConditionSensorDefinition(
+            name="daemon_sensor",
+            target=dg.AssetSelection.groups("daemon"),
+            use_user_code_server=False,
+        ),
+    ],
+)
@@ -696,6 +696,38 @@ def test_fail_if_not_use_sensors(capsys) -> None:
         )
 
 
+def test_sharded_evaluation_grpc() -> None:
+    with instance_for_test(
+        overrides={"auto_materialize": {"num_evaluation_processes": 2}}
+    ) as instance, get_grpc_workspace_request_context(
+        "independent_eager_assets", instance_ref=instance.get_ref()
+    ) as context, get_threadpool_executor() as executor:
+        time = datetime.datetime(2024, 8, 16, 1, 35)
+        with freeze_time(time):
+            # initial evaluation
+            _execute_ticks(context, executor)
+            runs = _get_runs_for_latest_ticks(context)
+            assert len(runs) == 0
+
+        time += datetime.timedelta(minutes=1)
+        with freeze_time(time):
+            # the conditions of the sensor evaluated by the daemon are evaluated in a separate
+            # process for each chain of assets, and the conditions of the sensor evaluated in the
+            # code server are evaluated in a single process
+            for prefix in ["a", "b"]:
+                for group_name in ["user_code", "daemon"]:
+                    instance.report_runless_asset_event(
+                        AssetMaterialization(f"{prefix}_root_{group_name}")
+                    )
+            _execute_ticks(context, executor)
+            runs = _get_runs_for_latest_ticks(context)
+            assert {key for run in runs for key in run.asset_selection or []} == {
+                AssetKey(f"{prefix}_downstream_{group_name}")
+                for prefix in ["a", "b"]
+                for group_name in ["user_code", "daemon"]
+            }
+
+
 def test_simple_old_code_server() -> None:
     with get_grpc_workspace_request_context(
         "old_code_server_simulation"
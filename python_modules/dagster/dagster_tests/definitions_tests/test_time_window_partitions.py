@@ -1826,3 +1826,83 @@ def test_persisted_time_window_serdes():
     deserialized_time_window = deserialize_value(serialized_time_window, PersistedTimeWindow)
     assert isinstance(deserialized_time_window, PersistedTimeWindow)
     assert serialize_value(deserialized_time_window) == serialized_time_window
+
+
+@pytest.mark.parametrize(
+    "partitions_def",
+    [
+        TimeWindowPartitionsDefinition(
+            cron_schedule="*/15 * * * *",
+            start="2021-03-01-00:00",
+            fmt="%Y-%m-%d-%H:%M",
+            timezone="America/New_York",
+        ),
+        HourlyPartitionsDefinition(start_date="2021-03-01-00:00", timezone="America/New_York"),
+        HourlyPartitionsDefinition(start_date="2021-03-01-00:00", minute_offset=15, end_offset=2),
+        DailyPartitionsDefinition(start_date="2021-03-01", hour_offset=7, end_offset=-2),
+        DailyPartitionsDefinition(start_date="2021-03-01", end="2021-11-15"),
+        WeeklyPartitionsDefinition(start_date="2021-03-01", day_offset=3),
+    ],
+)
+def test_fixed_interval_partitions_match_cron_iteration(
+    partitions_def: TimeWindowPartitionsDefinition,
+):
+    assert partitions_def._fixed_interval_seconds  # noqa: SLF001
+    # the same partitions definition, with partition keys computed by iterating the cron schedule
+    cron_partitions_def = copy(partitions_def)
+    cron_partitions_def.__dict__["_fixed_interval_seconds"] = None
+
+    current_time = create_datetime(2021, 11, 20, 13, 22, tz=partitions_def.timezone)
+    partition_keys = partitions_def.get_partition_keys(current_time)
+    assert partition_keys == cron_partitions_def.get_partition_keys(current_time)
+    assert len(partition_keys) > 0
+    assert partitions_def.get_partition_keys_between_indexes(
+        10, 20, current_time
+    ) == cron_partitions_def.get_partition_keys_between_indexes(10, 20, current_time)
+
+    key_range = PartitionKeyRange(partition_keys[3], partition_keys[-3])
+    assert partitions_def.get_partition_keys_in_range(
+        key_range
+    ) == cron_partitions_def.get_partition_keys_in_range(key_range)
+
+    sample_keys = frozenset(partition_keys[::7])
+    assert partitions_def.time_windows_for_partition_keys(
+        sample_keys, validate=False
+    ) == cron_partitions_def.time_windows_for_partition_keys(sample_keys, validate=False)
+    assert partitions_def.time_window_for_partition_key(
+        partition_keys[-1]
+    ) == cron_partitions_def.time_window_for_partition_key(partition_keys[-1])
+
+
+def test_fixed_interval_only_for_regular_schedules():
+    assert HourlyPartitionsDefinition(start_date="2021-03-01-00:00")._fixed_interval_seconds == 3600  # noqa: SLF001
+    dst_partitions_def = DailyPartitionsDefinition(
+        start_date="2021-03-01", timezone="America/New_York"
+    )
+    assert dst_partitions_def._fixed_interval_seconds is None  # noqa: SLF001
+    assert MonthlyPartitionsDefinition(start_date="2021-03-01")._fixed_interval_seconds is None  # noqa: SLF001
+
+
+@pytest.mark.parametrize("cron_schedule", ["*/15 9 * * *", "*/15 * * * 1-5", "*/30 * 1 * *"])
+def test_restricted_every_n_minutes_schedule_has_no_fixed_interval(cron_schedule: str):
+    partitions_def = TimeWindowPartitionsDefinition(
+        cron_schedule=cron_schedule, start="2021-03-01-00:00", fmt="%Y-%m-%d-%H:%M"
+    )
+    assert partitions_def._fixed_interval_seconds is None  # noqa: SLF001
+
+    current_time = create_datetime(2021, 5, 1, tz="UTC")
+    partition_keys = partitions_def.get_partition_keys(current_time)
+    if cron_schedule == "*/15 9 * * *":
+        # four partitions starting between 9:00 and 9:45 on each day, the last of which has not
+        # ended yet
+        assert len(partition_keys) == 4 * 61 - 1
+        assert partition_keys[:5] == [
+            "2021-03-01-09:00",
+            "2021-03-01-09:15",
+            "2021-03-01-09:30",
+            "2021-03-01-09:45",
+            "2021-03-02-09:00",
+        ]
+    assert partitions_def.get_partition_keys_between_indexes(3, 5, current_time) == (
+        partition_keys[3:5]
+    )
@@ -11,6 +11,7 @@
     ChildProcessEvent,
     ChildProcessStartEvent,
     ChildProcessSystemErrorEvent,
+    ChildProcessWorkerPool,
     execute_child_process_command,
 )
 from dagster._utils import segfault
@@ -106,6 +107,63 @@ def test_child_process_segfault():
     assert exc.value.exit_code == -11
 
 
+def test_child_process_worker_executes_commands_in_same_process():
+    pool = ChildProcessWorkerPool(multiprocessing, max_workers=1)
+    try:
+        worker = pool.acquire()
+        first_events = [
+            event
+            for event in worker.execute_command(DoubleAStringChildProcessCommand("aa"))
+            if event
+        ]
+        pool.release(worker)
+
+        worker = pool.acquire()
+        second_events = [event for event in worker.execute_command(ThrowAnErrorCommand()) if event]
+        third_events = [
+            event
+            for event in worker.execute_command(DoubleAStringChildProcessCommand("b"))
+            if event
+        ]
+        pool.release(worker)
+
+        assert isinstance(first_events[1], ChildProcessStartEvent)
+        assert first_events[2] == "aaaa"
+        assert isinstance(second_events[-1], ChildProcessSystemErrorEvent)
+        assert "AnError" in str(second_events[-1].error_info.message)
+        assert third_events[2] == "bb"
+
+        # every command ran in the same worker process
+        assert {first_events[1].pid, second_events[1].pid, third_events[1].pid} == {worker.pid}
+    finally:
+        pool.shutdown()
+
+    assert not worker.is_alive()
+
+
+def test_child_process_worker_crash():
+    pool = ChildProcessWorkerPool(multiprocessing, max_workers=1)
+    try:
+        worker = pool.acquire()
+        with pytest.raises(ChildProcessCrashException) as exc:
+            list(worker.execute_command(CrashyCommand()))
+        assert exc.value.exit_code == 1
+        pool.release(worker)
+
+        # the crashed worker is replaced
+        new_worker = pool.acquire()
+        assert new_worker is not worker
+        events = [
+            event
+            for event in new_worker.execute_command(DoubleAStringChildProcessCommand("c"))
+            if event
+        ]
+        assert events[2] == "cc"
+        pool.release(new_worker)
+    finally:
+        pool.shutdown()
+
+
 @pytest.mark.skip("too long")
 def test_long_running_command():
     list(execute_child_process_command(multiprocessing, LongRunningCommand()))
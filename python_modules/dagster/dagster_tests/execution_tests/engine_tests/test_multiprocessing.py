@@ -1,6 +1,8 @@
 import os
 import sys
 import time
+from collections import defaultdict
+from unittest import mock
 
 import pytest
 from dagster import (
@@ -23,10 +25,13 @@
 from dagster._core.events import DagsterEvent, DagsterEventType
 from dagster._core.execution import execution_result
 from dagster._core.execution.api import execute_job
+from dagster._core.executor.child_process_executor import ChildProcessSystemErrorEvent
+from dagster._core.executor.multiprocess import execute_step_in_worker
 from dagster._core.instance import DagsterInstance
 from dagster._core.storage.mem_io_manager import mem_io_manager
 from dagster._core.test_utils import instance_for_test
 from dagster._utils import safe_tempfile_path, segfault
+from dagster._utils.error import SerializableErrorInfo
 
 from dagster_tests.execution_tests.engine_tests.retry_jobs import (
     assert_expected_failure_behavior,
@@ -107,6 +112,76 @@ def test_forkserver_preload():
             assert result.output_for_node("adder") == 11
 
 
+def test_worker_pool_execution():
+    with instance_for_test() as instance:
+        recon_job = reconstructable(define_diamond_job)
+        with execute_job(
+            recon_job,
+            run_config={
+                "execution": {
+                    "config": {"multiprocess": {"worker_pool": True, "max_concurrent": 2}}
+                },
+            },
+            instance=instance,
+        ) as result:
+            assert result.success
+            assert result.output_for_node("adder") == 11
+
+            worker_pids = {
+                event.event_specific_data.metadata["pid"].value
+                for event in result.all_events
+                if event.event_type == DagsterEventType.STEP_WORKER_STARTED
+            }
+            # the four steps are executed by at most two worker processes
+            assert 0 < len(worker_pids) <= 2
+
+
+@pytest.mark.skipif(os.name == "nt", reason="Different crash output on Windows: See issue #2791")
+def test_worker_pool_crash():
+    with instance_for_test() as instance:
+        with execute_job(
+            reconstructable(sys_exit_job),
+            run_config={"execution": {"config": {"multiprocess": {"worker_pool": True}}}},
+            instance=instance,
+            raise_on_error=False,
+        ) as result:
+            assert not result.success
+            failure_data = result.failure_data_for_node("sys_exit")
+            assert failure_data
+            assert failure_data.error.cls_name == "ChildProcessCrashException"
+
+
+def test_worker_pool_keeps_errors_of_every_step():
+    worker = mock.MagicMock(pid=1234)
+    worker_pool = mock.MagicMock()
+    errors = defaultdict(list)
+
+    with mock.patch.object(DagsterEvent, "step_worker_starting"):
+        for step_key in ["first", "second"]:
+            error_info = SerializableErrorInfo(f"{step_key} failed", [], "Exception")
+            worker.execute_command.return_value = [
+                ChildProcessSystemErrorEvent(pid=worker.pid, error_info=error_info)
+            ]
+            list(
+                execute_step_in_worker(
+                    worker_pool,
+                    worker,
+                    recon_job=mock.MagicMock(),
+                    step_context=mock.MagicMock(),
+                    step=mock.MagicMock(key=step_key),
+                    errors=errors,
+                    processes={},
+                    retries=mock.MagicMock(),
+                    known_state=mock.MagicMock(),
+                    repository_load_data=None,
+                )
+            )
+
+    # the same worker process executes both steps, and neither error is overwritten
+    assert [error.message for error in errors[worker.pid]] == ["first failed", "second failed"]
+    assert worker_pool.release.call_count == 2
+
+
 JUST_ADDER_CONFIG = {
     "ops": {"adder": {"inputs": {"left": {"value": 1}, "right": {"value": 1}}}},
 }
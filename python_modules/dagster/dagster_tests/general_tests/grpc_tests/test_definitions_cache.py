@@ -0,0 +1,238 @@
+import logging
+import os
+import sys
+import threading
+import time
+from unittest import mock
+
+import pytest
+from dagster._core.remote_representation import RemoteRepositoryOrigin
+from dagster._core.remote_representation.external_data import RepositorySnap
+from dagster._core.remote_representation.origin import GrpcServerCodeLocationOrigin
+from dagster._core.test_utils import environ
+from dagster._core.types.loadable_target_origin import LoadableTargetOrigin
+from dagster._core.utils import FuturesAwareThreadPoolExecutor
+from dagster._grpc.__generated__ import api_pb2
+from dagster._grpc.definitions_cache import DefinitionsCache, get_code_location_fingerprint
+from dagster._grpc.server import DagsterApiServer, LoadedRepositories
+from dagster._grpc.types import ListRepositoriesResponse
+from dagster._serdes import deserialize_value, serialize_value
+from dagster._utils import file_relative_path
+
+
+def _loadable_target_origin(python_file: str) -> LoadableTargetOrigin:
+    return LoadableTargetOrigin(executable_path=sys.executable, python_file=python_file)
+
+
+def _start_api_server(
+    loadable_target_origin: LoadableTargetOrigin, cache_dir: str, lazy_load_user_code: bool = False
+):
+    return DagsterApiServer(
+        server_termination_event=threading.Event(),
+        logger=logging.getLogger("dagster.code_server"),
+        server_threadpool_executor=FuturesAwareThreadPoolExecutor(),
+        loadable_target_origin=loadable_target_origin,
+        lazy_load_user_code=lazy_load_user_code,
+        definitions_cache_dir=cache_dir,
+    )
+
+
+def _stop_api_server(api_server: DagsterApiServer) -> None:
+    api_server._server_termination_event.set()  # noqa: SLF001
+    api_server.cleanup()
+
+
+def _list_repositories(api_server: DagsterApiServer) -> ListRepositoriesResponse:
+    return deserialize_value(
+        api_server.ListRepositories(
+            api_pb2.ListRepositoriesRequest(), None
+        ).serialized_list_repositories_response_or_error,
+        ListRepositoriesResponse,
+    )
+
+
+def _get_repository_snap(api_server: DagsterApiServer) -> RepositorySnap:
+    repository_origin = RemoteRepositoryOrigin(
+        GrpcServerCodeLocationOrigin(host="localhost", port=1234, location_name="test"),
+        "bar_repo",
+    )
+    return deserialize_value(
+        api_server.ExternalRepository(
+            api_pb2.ExternalRepositoryRequest(
+                serialized_repository_python_origin=serialize_value(repository_origin)
+            ),
+            None,
+        ).serialized_external_repository_data,
+        RepositorySnap,
+    )
+
+
+def _get_server_id(api_server: DagsterApiServer) -> str:
+    return api_server.GetServerId(api_pb2.Empty(), None).server_id
+
+
+def _wait_for_cache_file(cache_dir: str) -> None:
+    start_time = time.time()
+    while not os.path.exists(cache_dir) or not any(
+        filename.endswith(".cache") for filename in os.listdir(cache_dir)
+    ):
+        assert time.time() - start_time < 30, "Definitions cache was never written"
+        time.sleep(0.1)
+
+
+def test_code_location_fingerprint(tmp_path):
+    python_file = tmp_path / "defs.py"
+    python_file.write_text("x = 1\n")
+    loadable_target_origin = _loadable_target_origin(str(python_file))
+
+    with environ({"MY_SETTING": "a", "OTHER_SETTING": "a"}):
+        fingerprint = get_code_location_fingerprint(loadable_target_origin, ["MY_SETTING"])
+
+    # env vars that are not listed do not affect the fingerprint
+    with environ({"MY_SETTING": "a", "OTHER_SETTING": "b"}):
+        assert fingerprint == get_code_location_fingerprint(loadable_target_origin, ["MY_SETTING"])
+
+    with environ({"MY_SETTING": "b"}):
+        assert fingerprint != get_code_location_fingerprint(loadable_target_origin, ["MY_SETTING"])
+
+    with environ({"MY_SETTING": "a"}):
+        (tmp_path / "other_module.py").write_text("y = 2\n")
+        assert fingerprint != get_code_location_fingerprint(loadable_target_origin, ["MY_SETTING"])
+
+
+def test_code_location_fingerprint_extra_paths(tmp_path):
+    python_file = tmp_path / "defs.py"
+    python_file.write_text("x = 1\n")
+    loadable_target_origin = _loadable_target_origin(str(python_file))
+    data_dir = tmp_path / "data"
+
+    # only python files are fingerprinted by default
+    fingerprint = get_code_location_fingerprint(loadable_target_origin)
+    (tmp_path / "config.yaml").write_text("a: 1\n")
+    assert fingerprint == get_code_location_fingerprint(loadable_target_origin)
+
+    fingerprint = get_code_location_fingerprint(loadable_target_origin, extra_paths=[str(data_dir)])
+    data_dir.mkdir()
+    (data_dir / "schema.json").write_text("{}")
+    data_fingerprint = get_code_location_fingerprint(
+        loadable_target_origin, extra_paths=[str(data_dir)]
+    )
+    assert data_fingerprint != fingerprint
+
+    (data_dir / "schema.json").write_text('{"a": 1}')
+    assert data_fingerprint != get_code_location_fingerprint(
+        loadable_target_origin, extra_paths=[str(data_dir)]
+    )
+
+
+def test_serve_cached_definitions_while_loading(tmp_path):
+    cache_dir = str(tmp_path / "cache")
+    loadable_target_origin = _loadable_target_origin(file_relative_path(__file__, "grpc_repo.py"))
+
+    api_server = _start_api_server(loadable_target_origin, cache_dir)
+    try:
+        _wait_for_cache_file(cache_dir)
+        list_repositories_response = _list_repositories(api_server)
+        repository_snap = _get_repository_snap(api_server)
+    finally:
+        _stop_api_server(api_server)
+
+    load_event = threading.Event()
+
+    class BlockingLoadedRepositories(LoadedRepositories):
+        def __init__(self, *args, **kwargs):
+            load_event.wait()
+            super().__init__(*args, **kwargs)
+
+    with mock.patch("dagster._grpc.server.LoadedRepositories", BlockingLoadedRepositories):
+        api_server = _start_api_server(loadable_target_origin, cache_dir)
+        try:
+            # the definitions are served from the cache before the code has been loaded
+            assert _list_repositories(api_server) == list_repositories_response
+            assert _get_repository_snap(api_server) == repository_snap
+            assert not api_server._loaded_repositories_event.is_set()  # noqa: SLF001
+
+            load_event.set()
+            assert api_server._loaded_repositories_event.wait(timeout=30)  # noqa: SLF001
+            assert _list_repositories(api_server) == list_repositories_response
+            assert _get_repository_snap(api_server) == repository_snap
+        finally:
+            _stop_api_server(api_server)
+
+
+def test_server_id_changes_when_cached_definitions_are_stale(tmp_path):
+    cache_dir = str(tmp_path / "cache")
+    loadable_target_origin = _loadable_target_origin(file_relative_path(__file__, "grpc_repo.py"))
+
+    api_server = _start_api_server(loadable_target_origin, cache_dir)
+    try:
+        _wait_for_cache_file(cache_dir)
+        repository_snap = _get_repository_snap(api_server)
+    finally:
+        _stop_api_server(api_server)
+
+    # simulate definitions that changed without changing the fingerprint of the code location
+    definitions_cache = DefinitionsCache(cache_dir, loadable_target_origin)
+    cached_definitions = definitions_cache.read()
+    assert cached_definitions
+    definitions_cache.write(
+        cached_definitions.loadable_repository_symbols,
+        cached_definitions.code_pointers_by_repo_name,
+        {},
+    )
+
+    load_event = threading.Event()
+
+    class BlockingLoadedRepositories(LoadedRepositories):
+        def __init__(self, *args, **kwargs):
+            load_event.wait()
+            super().__init__(*args, **kwargs)
+
+    with mock.patch("dagster._grpc.server.LoadedRepositories", BlockingLoadedRepositories):
+        api_server = _start_api_server(loadable_target_origin, cache_dir)
+        try:
+            server_id = _get_server_id(api_server)
+            load_event.set()
+
+            # clients are told to refetch the definitions once they turn out to differ
+            start_time = time.time()
+            while _get_server_id(api_server) == server_id:
+                assert time.time() - start_time < 30, "Server id never changed"
+                time.sleep(0.1)
+
+            cached_definitions = definitions_cache.read()
+            assert cached_definitions
+            assert cached_definitions.repository_snaps == {"bar_repo": repository_snap}
+        finally:
+            _stop_api_server(api_server)
+
+
+@pytest.mark.parametrize("lazy_load_user_code", [True, False])
+def test_load_error_with_cached_definitions(tmp_path, lazy_load_user_code: bool):
+    cache_dir = str(tmp_path / "cache")
+    loadable_target_origin = _loadable_target_origin(file_relative_path(__file__, "grpc_repo.py"))
+
+    api_server = _start_api_server(loadable_target_origin, cache_dir)
+    try:
+        _wait_for_cache_file(cache_dir)
+    finally:
+        _stop_api_server(api_server)
+
+    class FailingLoadedRepositories(LoadedRepositories):
+        def __init__(self, *args, **kwargs):
+            raise Exception("Failed to import")
+
+    with mock.patch("dagster._grpc.server.LoadedRepositories", FailingLoadedRepositories):
+        api_server = _start_api_server(
+            loadable_target_origin, cache_dir, lazy_load_user_code=lazy_load_user_code
+        )
+        try:
+            assert api_server._loaded_repositories_event.wait(timeout=30)  # noqa: SLF001
+
+            # as without cached definitions, a load error stops the server unless the code is
+            # loaded lazily
+            assert api_server._server_termination_event.is_set() != lazy_load_user_code  # noqa: SLF001
+            assert api_server.stopped_on_load_error != lazy_load_user_code
+            assert DefinitionsCache(cache_dir, loadable_target_origin).read() is None
+        finally:
+            _stop_api_server(api_server)
@@ -3,10 +3,13 @@
 import re
 import subprocess
 import sys
+import time
+from concurrent.futures import ThreadPoolExecutor
 
 import pytest
 from dagster import _seven
 from dagster._api.list_repositories import sync_list_repositories_grpc
+from dagster._core.definitions.sensor_definition import SensorExecutionData
 from dagster._core.errors import DagsterUserCodeUnreachableError
 from dagster._core.remote_representation.origin import (
     GrpcServerCodeLocationOrigin,
@@ -958,3 +961,72 @@ def test_load_with_error_logging(capfd):
     out, _err = capfd.readouterr()
 
     assert 'Could not find a repository called "missing_repo_name"' in out
+
+
+def test_code_server_with_multiple_processes():
+    port = find_free_port()
+    python_file = file_relative_path(__file__, "grpc_repo.py")
+
+    subprocess_args = [
+        "dagster",
+        "code-server",
+        "start",
+        "--port",
+        str(port),
+        "--python-file",
+        python_file,
+        "--num-processes",
+        "2",
+    ]
+
+    process = subprocess.Popen(subprocess_args)
+
+    try:
+        client = DagsterGrpcClient(port=port, host="localhost")
+        wait_for_grpc_server(process, client, subprocess_args)
+
+        # utilization metrics are reported for each process
+        ping_result = client.ping("foobar")
+        assert ping_result["echo"] == "foobar"
+        per_worker_metrics = json.loads(ping_result["serialized_server_utilization_metrics"])[
+            "per_worker_metrics"
+        ]
+        assert [metrics["in_flight_evaluation_count"] for metrics in per_worker_metrics] == [0, 0]
+
+        repo_origin = RemoteRepositoryOrigin(
+            code_location_origin=GrpcServerCodeLocationOrigin(port=port, host="localhost"),
+            repository_name="bar_repo",
+        )
+        with instance_for_test() as instance:
+            sensor_execution_args = SensorExecutionArgs(
+                repository_origin=repo_origin,
+                instance_ref=instance.get_ref(),
+                sensor_name="slow_sensor",
+                last_tick_completion_time=None,
+                last_run_key=None,
+                cursor=None,
+                timeout=None,
+                last_sensor_start_time=None,
+            )
+            # both evaluations are in flight at once, one in each process
+            with ThreadPoolExecutor(max_workers=2) as executor:
+                futures = [
+                    executor.submit(
+                        client.external_sensor_execution,
+                        sensor_execution_args=sensor_execution_args,
+                    )
+                    for _ in range(2)
+                ]
+                time.sleep(1)
+                per_worker_metrics = json.loads(
+                    client.ping("")["serialized_server_utilization_metrics"]
+                )["per_worker_metrics"]
+                assert [
+                    metrics["in_flight_evaluation_count"] for metrics in per_worker_metrics
+                ] == [1, 1]
+
+                for future in futures:
+                    assert isinstance(deserialize_value(future.result()), SensorExecutionData)
+    finally:
+        process.terminate()
+        process.wait()
@@ -23,8 +23,10 @@
     _whitelist_for_serdes,
     deserialize_value,
     get_storage_name,
+    is_binary_serialized_value,
     pack_value,
     serialize_value,
+    serialize_value_binary,
     unpack_value,
 )
 from dagster._serdes.utils import hash_str
@@ -1214,3 +1216,117 @@ class Wat: ...
 
     with pytest.raises(CheckError):
         get_storage_name(Wat, whitelist_map=test_env)
+
+
+def test_compiled_codecs_match_generic() -> None:
+    class GenericSerializer(NamedTupleSerializer):
+        def pack_items(self, *args):
+            return self._pack_items_generic(*args)
+
+        def unpack(self, *args):
+            return self._unpack_generic(*args)
+
+    compiled_env = WhitelistMap.create()
+    generic_env = WhitelistMap.create()
+
+    # fields shadowed by properties must be packed from the underlying tuple
+    class Inner(NamedTuple("_Inner", [("name", str)])):
+        @property
+        def name(self) -> str:
+            return self._asdict()["name"].upper()
+
+    @record_custom(field_to_new_mapping={"size_str": "size"})
+    class Remapped(IHaveNew):
+        size_str: str
+
+        def __new__(cls, size: int):
+            return super().__new__(cls, size_str=str(size))
+
+    class Foo(NamedTuple):
+        color: str
+        size: float
+        labels: AbstractSet[str]
+        children: Sequence[Remapped]
+        tags: Mapping[str, str] = {}
+        inner: Optional[Inner] = None
+
+    foo_options: Dict[str, Any] = dict(
+        storage_field_names={"color": "colour"},
+        old_fields={"shape": None},
+        skip_when_empty_fields={"tags"},
+        skip_when_none_fields={"inner"},
+        field_serializers={"labels": SetToSequenceFieldSerializer},
+    )
+    for test_env, serializer in [
+        (compiled_env, NamedTupleSerializer),
+        (generic_env, GenericSerializer),
+    ]:
+        _whitelist_for_serdes(test_env, serializer=serializer)(Inner)
+        _whitelist_for_serdes(test_env, serializer=serializer)(Remapped)
+        _whitelist_for_serdes(test_env, serializer=serializer, **foo_options)(Foo)
+
+    for val in [
+        Foo("red", 1.5, {"b", "a"}, []),
+        Foo("blue", 2, set(), [Remapped(size=1), Remapped(size=2)], {"k": "v"}, Inner("x")),
+    ]:
+        serialized = serialize_value(val, whitelist_map=compiled_env)
+        assert serialized == serialize_value(val, whitelist_map=generic_env)
+        assert deserialize_value(serialized, whitelist_map=compiled_env) == val
+        assert deserialize_value(serialized, whitelist_map=generic_env) == val
+
+    # unknown fields and values fall back to the generic handling
+    serialized = '{"__class__": "Inner", "name": "x", "removed": {"__class__": "Gone", "field": 1}}'
+    assert deserialize_value(serialized, whitelist_map=compiled_env) == Inner("x")
+
+
+def test_binary_format_roundtrip() -> None:
+    test_env = WhitelistMap.create()
+
+    @_whitelist_for_serdes(test_env)
+    class Color(Enum):
+        RED = "red"
+
+    @_whitelist_for_serdes(test_env, storage_field_names={"color": "colour"})
+    class Foo(NamedTuple):
+        color: Color
+        labels: AbstractSet[str]
+        children: Sequence["Foo"]
+        tags: Mapping[str, Any]
+
+    for val in [
+        None,
+        True,
+        -3,
+        98765432109876543210,
+        1.5,
+        float("inf"),
+        "\ud800 surrogate",
+        [1, "a", None, frozenset({2})],
+        {"a": {1: [2.5, False]}},
+        Foo(
+            Color.RED,
+            {"b", "a"},
+            [Foo(Color.RED, set(), [], {})],
+            {"nested": {"list": [1, 2], "none": None}},
+        ),
+    ]:
+        serialized = serialize_value_binary(val, whitelist_map=test_env)
+        assert is_binary_serialized_value(serialized)
+        assert not is_binary_serialized_value(serialize_value(val, whitelist_map=test_env))
+        assert deserialize_value(serialized, whitelist_map=test_env) == deserialize_value(
+            serialize_value(val, whitelist_map=test_env), whitelist_map=test_env
+        )
+
+    # repeated strings are stored once
+    foos = [Foo(Color.RED, {"shiny"}, [], {"key": "value"}) for _ in range(100)]
+    serialized = serialize_value_binary(foos, whitelist_map=test_env)
+    assert serialized.count(b"colour") == 1
+    assert serialized.count(b"shiny") == 1
+
+    # unknown classes are unpacked as UnknownSerdesValue and fail the same way as JSON does
+    unknown_env = WhitelistMap.create()
+    with pytest.raises(DeserializationError, match="Foo"):
+        deserialize_value(serialized, whitelist_map=unknown_env)
+
+    with pytest.raises(DeserializationError):
+        deserialize_value(serialized[:-10], whitelist_map=test_env)
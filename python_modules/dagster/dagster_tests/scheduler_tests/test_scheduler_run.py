@@ -49,7 +49,7 @@
 )
 from dagster._core.scheduler.scheduler import DEFAULT_MAX_CATCHUP_RUNS
 from dagster._core.storage.dagster_run import DagsterRunStatus, RunsFilter
-from dagster._core.storage.tags import PARTITION_NAME_TAG, SCHEDULED_EXECUTION_TIME_TAG
+from dagster._core.storage.tags import PARTITION_NAME_TAG, RUN_KEY_TAG, SCHEDULED_EXECUTION_TIME_TAG
 from dagster._core.test_utils import (
     BlockingThreadPoolExecutor,
     SingleThreadPoolExecutor,
@@ -325,6 +325,18 @@ def many_requests_schedule(context):
     ]
 
 
+@schedule(
+    job_name="the_job",
+    cron_schedule="0 0 * * *",
+    execution_timezone="UTC",
+)
+def duplicate_run_key_schedule(context):
+    return [
+        RunRequest(run_key=run_key, run_config=_op_config(context.scheduled_execution_time))
+        for run_key in ["A", "B", "A", "B", "A"]
+    ]
+
+
 @schedule(
     cron_schedule="@daily",
     job_name="the_job",
@@ -595,6 +607,7 @@ def the_repo():
         default_config_schedule,
         empty_schedule,
         many_requests_schedule,
+        duplicate_run_key_schedule,
         [asset1, asset2, source_asset],
         asset_selection_schedule,
         stale_asset_selection_schedule,
@@ -2806,6 +2819,38 @@ def test_many_requests_schedule(
                 [run.run_id for run in runs],
             )
 
+    @pytest.mark.parametrize("executor", get_schedule_executors())
+    @pytest.mark.parametrize("use_submit_threadpool", [False, True])
+    def test_duplicate_run_key_schedule(
+        self,
+        scheduler_instance: DagsterInstance,
+        workspace_context: WorkspaceProcessContext,
+        remote_repo: RemoteRepository,
+        executor: ThreadPoolExecutor,
+        use_submit_threadpool: bool,
+    ):
+        freeze_datetime = feb_27_2019_start_of_day()
+        with freeze_time(freeze_datetime), ThreadPoolExecutor(max_workers=4) as submit_executor:
+            schedule = remote_repo.get_schedule("duplicate_run_key_schedule")
+            schedule_origin = schedule.get_remote_origin()
+            scheduler_instance.start_schedule(schedule)
+
+            evaluate_schedules(
+                workspace_context,
+                executor,
+                get_current_datetime(),
+                submit_executor=submit_executor if use_submit_threadpool else None,
+            )
+
+            # run requests of a tick that share a run key share a single run
+            runs = scheduler_instance.get_runs()
+            assert sorted(run.tags[RUN_KEY_TAG] for run in runs) == ["A", "B"]
+
+            ticks = scheduler_instance.get_ticks(schedule_origin.get_id(), schedule.selector_id)
+            assert len(ticks) == 1
+            assert ticks[0].status == TickStatus.SUCCESS
+            assert set(ticks[0].run_ids) == {run.run_id for run in runs}
+
     @pytest.mark.parametrize("executor", get_schedule_executors())
     def test_asset_selection(
         self,
@@ -6,7 +6,7 @@
 from dagster._core.storage.runs.sql_run_storage import (
     defensively_unpack_execution_plan_snapshot_query,
 )
-from dagster._serdes import serialize_value
+from dagster._serdes import serialize_value, serialize_value_binary
 
 
 def test_defensive_job_not_a_string():
@@ -97,5 +97,12 @@ def noop_job():
         )
         == noop_job_snapshot
     )
+    assert (
+        defensively_unpack_execution_plan_snapshot_query(
+            mock_logger,
+            [zlib.compress(serialize_value_binary(noop_job_snapshot))],
+        )
+        == noop_job_snapshot
+    )
 
     assert mock_logger.warning.call_count == 0
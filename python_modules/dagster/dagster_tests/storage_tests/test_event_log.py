@@ -5,12 +5,16 @@
 import time
 import traceback
 from concurrent.futures import ThreadPoolExecutor
+from unittest import mock
 
 import pytest
 import sqlalchemy
 import sqlalchemy as db
 from dagster import DagsterInstance
 from dagster._core.errors import DagsterEventLogInvalidForRun
+from dagster._core.event_api import EventLogRecord, LazyEventLogRecord
+from dagster._core.events import DagsterEvent, DagsterEventType, EngineEventData
+from dagster._core.events.log import EventLogEntry
 from dagster._core.storage.event_log import (
     ConsolidatedSqliteEventLogStorage,
     SqlEventLogStorageMetadata,
@@ -24,6 +28,8 @@
 from dagster._core.storage.sqlite_storage import DagsterSqliteStorage
 from dagster._core.test_utils import instance_for_test
 from dagster._core.utils import make_new_run_id
+from dagster._serdes import deserialize_value, serialize_value
+from dagster._serdes.errors import DeserializationError
 from dagster._utils.test import ConcurrencyEnabledSqliteTestEventLogStorage
 from sqlalchemy import __version__ as sqlalchemy_version
 from sqlalchemy.engine import Connection
@@ -279,3 +285,54 @@ def test_concurrency_reconcile():
             assert _get_slot_count(conn, "bar") == 3
             assert _get_limit_row_num(conn, "foo") == 5
             assert _get_limit_row_num(conn, "bar") == 3
+
+
+def test_lazy_event_log_record():
+    event = EventLogEntry(
+        error_info=None,
+        level="debug",
+        user_message="",
+        run_id="foo",
+        timestamp=time.time(),
+        step_key="bar",
+        dagster_event=DagsterEvent(
+            event_type_value=DagsterEventType.ENGINE_EVENT.value,
+            job_name="baz",
+            event_specific_data=EngineEventData(metadata={"a": 1}),
+        ),
+    )
+    record = LazyEventLogRecord(storage_id=1, serialized_event_log_entry=serialize_value(event))
+
+    # the envelope is read without deserializing the entry
+    assert record.run_id == "foo"
+    assert record.timestamp == event.timestamp
+    assert record.step_key == "bar"
+    assert record.event_type == DagsterEventType.ENGINE_EVENT
+    assert "event_log_entry" not in record.__dict__
+
+    # the entry is built from the JSON representation parsed for the envelope, without parsing the
+    # serialized entry again
+    with mock.patch(
+        "dagster._core.event_api.deserialize_value", side_effect=Exception("parsed twice")
+    ):
+        assert record.event_log_entry == event
+    assert "_packed" not in record.__dict__
+
+    # the record is interchangeable with the equivalent eager record
+    eager_record = EventLogRecord(storage_id=1, event_log_entry=event)
+    assert record.event_log_entry == event
+    assert record == eager_record
+    assert eager_record == record
+    assert tuple(record) == tuple(eager_record)
+    assert record._asdict() == eager_record._asdict()
+    assert deserialize_value(serialize_value(record), EventLogRecord) == eager_record
+
+    # old event type values are migrated by deserializing the entry
+    old_event = serialize_value(event).replace('"ENGINE_EVENT"', '"PIPELINE_PROCESS_STARTED"')
+    assert (
+        LazyEventLogRecord(storage_id=1, serialized_event_log_entry=old_event).event_type
+        == DagsterEventType.ENGINE_EVENT
+    )
+
+    with pytest.raises(DeserializationError):
+        LazyEventLogRecord(storage_id=1, serialized_event_log_entry=serialize_value(eager_record))
@@ -1,5 +1,13 @@
+import logging
+from unittest import mock
+
 import pytest
+from dagster import AssetKey, DailyPartitionsDefinition, asset, define_asset_job
+from dagster._core.definitions.asset_graph import AssetGraph
+from dagster._core.storage.event_log.base import EventLogStorage
+from dagster._core.storage.partition_status_cache import get_and_update_asset_status_cache_value
 from dagster._core.test_utils import instance_for_test
+from dagster._utils import Counter, traced_counter
 
 from dagster_tests.storage_tests.utils.partition_status_cache import TestPartitionStatusCache
 
@@ -9,3 +17,167 @@ class TestSqlPartitionStatusCache(TestPartitionStatusCache):
     def instance(self):
         with instance_for_test() as the_instance:
             yield the_instance
+
+
+class TestSqlPartitionStatusCacheUpdateOnWrite(TestPartitionStatusCache):
+    @pytest.fixture
+    def instance(self):
+        with instance_for_test(
+            overrides={"asset_status_cache": {"update_on_write": True}}
+        ) as the_instance:
+            yield the_instance
+
+    def test_cached_status_updated_on_write(self, instance):
+        partitions_def = DailyPartitionsDefinition(start_date="2022-01-01")
+
+        @asset(partitions_def=partitions_def)
+        def asset1():
+            return 1
+
+        asset_key = AssetKey("asset1")
+        asset_graph = AssetGraph.from_assets([asset1])
+        asset_job = define_asset_job("asset_job").resolve(asset_graph=asset_graph)
+
+        asset_job.execute_in_process(instance=instance, partition_key="2022-02-01")
+        cached_status = get_and_update_asset_status_cache_value(instance, asset_key, partitions_def)
+        assert cached_status
+
+        asset_job.execute_in_process(instance=instance, partition_key="2022-02-02")
+        asset_job.execute_in_process(instance=instance, partition_key="2022-02-03")
+
+        # the stored cache value is brought up to date as the materializations are stored
+        asset_record = next(iter(instance.get_asset_records([asset_key])))
+        stored_cache_value = asset_record.asset_entry.cached_status
+        assert stored_cache_value
+        assert (
+            stored_cache_value.latest_storage_id
+            == asset_record.asset_entry.last_materialization_storage_id
+        )
+        assert stored_cache_value.unmerged_materialized_partition_keys == [
+            "2022-02-02",
+            "2022-02-03",
+        ]
+        # the planned materializations are checked on the next read, in case their runs failed
+        assert stored_cache_value.earliest_in_progress_materialization_event_id
+
+        # reading the cache merges the new partitions without querying the event log for them
+        traced_counter.set(Counter())
+        cached_status = get_and_update_asset_status_cache_value(instance, asset_key, partitions_def)
+        assert cached_status
+        assert cached_status.unmerged_materialized_partition_keys is None
+        assert cached_status.earliest_in_progress_materialization_event_id is None
+        assert set(
+            cached_status.deserialize_materialized_partition_subsets(
+                partitions_def
+            ).get_partition_keys()
+        ) == {"2022-02-01", "2022-02-02", "2022-02-03"}
+        counts = traced_counter.get().counts()
+        assert not counts.get("DagsterInstance.get_materialized_partitions")
+
+        asset_record = next(iter(instance.get_asset_records([asset_key])))
+        assert asset_record.asset_entry.cached_status == cached_status
+
+    def test_storage_without_compare_and_set(self, instance):
+        partitions_def = DailyPartitionsDefinition(start_date="2022-01-01")
+
+        @asset(partitions_def=partitions_def)
+        def asset1():
+            return 1
+
+        asset_key = AssetKey("asset1")
+        asset_graph = AssetGraph.from_assets([asset1])
+        asset_job = define_asset_job("asset_job").resolve(asset_graph=asset_graph)
+        asset_job.execute_in_process(instance=instance, partition_key="2022-02-01")
+
+        # storages that do not implement the compare-and-set do not update the cached status on
+        # write, so update it unconditionally on read
+        with mock.patch.object(
+            type(instance.event_log_storage),
+            "update_asset_cached_status_data_if_unchanged",
+            EventLogStorage.update_asset_cached_status_data_if_unchanged,
+        ), mock.patch(
+            "dagster._core.storage.event_log.base._STORAGES_WARNED_WITHOUT_COMPARE_AND_SET", set()
+        ), mock.patch.object(logging.getLogger("dagster"), "warning") as warning_mock:
+            cached_status = get_and_update_asset_status_cache_value(
+                instance, asset_key, partitions_def
+            )
+        assert cached_status
+        assert set(
+            cached_status.deserialize_materialized_partition_subsets(
+                partitions_def
+            ).get_partition_keys()
+        ) == {"2022-02-01"}
+        assert "does not support updating the cached status" in warning_mock.call_args[0][0]
+
+        asset_record = next(iter(instance.get_asset_records([asset_key])))
+        assert asset_record.asset_entry.cached_status == cached_status
+
+    def test_read_current_cached_status(self, instance):
+        partitions_def = DailyPartitionsDefinition(start_date="2022-01-01")
+
+        @asset(partitions_def=partitions_def)
+        def asset1():
+            return 1
+
+        asset_key = AssetKey("asset1")
+        asset_graph = AssetGraph.from_assets([asset1])
+        asset_job = define_asset_job("asset_job").resolve(asset_graph=asset_graph)
+        asset_job.execute_in_process(instance=instance, partition_key="2022-02-01")
+        cached_status = get_and_update_asset_status_cache_value(instance, asset_key, partitions_def)
+        assert cached_status
+
+        # the cached status is up to date, so it is returned without being rebuilt
+        with mock.patch(
+            "dagster._core.storage.partition_status_cache._build_status_cache",
+            side_effect=Exception("should not rebuild"),
+        ):
+            assert (
+                get_and_update_asset_status_cache_value(instance, asset_key, partitions_def)
+                == cached_status
+            )
+
+        # new materializations are merged on the next read
+        asset_job.execute_in_process(instance=instance, partition_key="2022-02-02")
+        cached_status = get_and_update_asset_status_cache_value(instance, asset_key, partitions_def)
+        assert cached_status
+        assert set(
+            cached_status.deserialize_materialized_partition_subsets(
+                partitions_def
+            ).get_partition_keys()
+        ) == {"2022-02-01", "2022-02-02"}
+
+    def test_unmerged_partition_keys_are_capped(self, instance):
+        partitions_def = DailyPartitionsDefinition(start_date="2022-01-01")
+
+        @asset(partitions_def=partitions_def)
+        def asset1():
+            return 1
+
+        asset_key = AssetKey("asset1")
+        asset_graph = AssetGraph.from_assets([asset1])
+        asset_job = define_asset_job("asset_job").resolve(asset_graph=asset_graph)
+        asset_job.execute_in_process(instance=instance, partition_key="2022-02-01")
+        assert get_and_update_asset_status_cache_value(instance, asset_key, partitions_def)
+
+        with mock.patch(
+            "dagster._core.storage.partition_status_cache.MAX_UNMERGED_MATERIALIZED_PARTITION_KEYS",
+            1,
+        ):
+            asset_job.execute_in_process(instance=instance, partition_key="2022-02-02")
+            asset_record = next(iter(instance.get_asset_records([asset_key])))
+            stored_cache_value = asset_record.asset_entry.cached_status
+            assert stored_cache_value
+            assert stored_cache_value.unmerged_materialized_partition_keys == ["2022-02-02"]
+
+            # instead of growing without a read merging the keys, the cached status is cleared
+            asset_job.execute_in_process(instance=instance, partition_key="2022-02-03")
+            asset_record = next(iter(instance.get_asset_records([asset_key])))
+            assert asset_record.asset_entry.cached_status is None
+
+        cached_status = get_and_update_asset_status_cache_value(instance, asset_key, partitions_def)
+        assert cached_status
+        assert set(
+            cached_status.deserialize_materialized_partition_subsets(
+                partitions_def
+            ).get_partition_keys()
+        ) == {"2022-02-01", "2022-02-02", "2022-02-03"}
@@ -1,13 +1,21 @@
 import tempfile
+import threading
 import time
 from contextlib import contextmanager
-from typing import Any, Callable, Mapping, Optional
+from typing import AbstractSet, Any, Callable, List, Mapping, Optional, Sequence, Set
 
 import dagster._check as check
+import pytest
 from dagster._core.events import DagsterEvent, DagsterEventType, EngineEventData
 from dagster._core.events.log import EventLogEntry
-from dagster._core.storage.event_log import SqliteEventLogStorage, SqlPollingEventWatcher
-from dagster._core.storage.event_log.base import EventLogCursor
+from dagster._core.storage.event_log import (
+    ConsolidatedSqliteEventLogStorage,
+    EventLogNotifier,
+    SqliteEventLogStorage,
+    SqlMultiplexedEventWatcher,
+    SqlPollingEventWatcher,
+)
+from dagster._core.storage.event_log.base import EventLogCursor, EventLogRecord
 from dagster._core.utils import make_new_run_id
 from dagster._serdes.config_class import ConfigurableClassData
 from typing_extensions import Self
@@ -61,6 +69,62 @@ def dispose(self) -> None:
             self._watcher = None
 
 
+class EmulatedEventLogNotifier(EventLogNotifier):
+    """Emulates LISTEN/NOTIFY in-process, by recording the runs that events are stored for."""
+
+    def __init__(self):
+        self._condition = threading.Condition()
+        self._run_ids: Set[str] = set()
+        self.notification_count = 0
+        self.should_fail = False
+
+    def notify(self, run_id: str) -> None:
+        with self._condition:
+            self._run_ids.add(run_id)
+            self._condition.notify_all()
+
+    def wait_for_notifications(self, timeout: float) -> AbstractSet[str]:
+        if self.should_fail:
+            raise Exception("lost connection")
+        with self._condition:
+            self._condition.wait_for(lambda: self._run_ids, timeout=timeout)
+            run_ids, self._run_ids = self._run_ids, set()
+            self.notification_count += len(run_ids)
+            return run_ids
+
+
+class NotifyingSqliteEventLogStorage(ConsolidatedSqliteEventLogStorage):
+    """Consolidated SQLite event log storage that watches runs with SqlMultiplexedEventWatcher,
+    notified by an EmulatedEventLogNotifier on every stored event.
+    """
+
+    def __init__(self, *args, use_notifier: bool = True, **kwargs) -> None:
+        super(NotifyingSqliteEventLogStorage, self).__init__(*args, **kwargs)
+        self.notifier = EmulatedEventLogNotifier() if use_notifier else None
+        self.queried_run_ids: List[AbstractSet[str]] = []
+
+    def store_event(self, event: EventLogEntry) -> None:
+        super().store_event(event)
+        if self.notifier:
+            self.notifier.notify(event.run_id)
+
+    def get_records_after_storage_ids(
+        self, storage_ids_by_run_id: Mapping[str, int], limit: Optional[int] = None
+    ) -> Sequence[EventLogRecord]:
+        self.queried_run_ids.append(set(storage_ids_by_run_id.keys()))
+        return super().get_records_after_storage_ids(storage_ids_by_run_id, limit)
+
+    def watch(
+        self,
+        run_id: str,
+        cursor: Optional[str],
+        callback: Callable[[EventLogEntry, str], None],
+    ):
+        if self._event_watcher is None:
+            self._event_watcher = SqlMultiplexedEventWatcher(self, self.notifier)
+        self._event_watcher.watch_run(run_id, cursor, callback)
+
+
 RUN_ID = make_new_run_id()
 
 
@@ -146,3 +210,117 @@ def watch_two(event, _cursor):
 
     # calling end_watch after dispose does not error
     storage.end_watch(RUN_ID, watch_two)
+
+
+def _wait_for(condition: Callable[[], bool], attempts: int = 50) -> None:
+    while not condition() and attempts > 0:
+        time.sleep(0.1)
+        attempts -= 1
+
+
+@pytest.mark.parametrize("use_notifier", [True, False])
+def test_multiplexed_watcher(use_notifier: bool):
+    with tempfile.TemporaryDirectory() as tmpdir_path:
+        storage = NotifyingSqliteEventLogStorage(tmpdir_path, use_notifier=use_notifier)
+        run_id_1, run_id_2 = make_new_run_id(), make_new_run_id()
+        watched_1 = []
+        watched_2 = []
+        watched_3 = []
+
+        def watch_one(event, _cursor):
+            watched_1.append(event)
+
+        def watch_two(event, _cursor):
+            watched_2.append(event)
+
+        def watch_three(event, cursor):
+            watched_3.append((event, cursor))
+
+        storage.store_event(create_event(1, run_id_1))
+        storage.watch(run_id_1, str(EventLogCursor.from_storage_id(1)), watch_one)
+        storage.watch(run_id_2, None, watch_three)
+
+        storage.store_event(create_event(2, run_id_1))
+        storage.store_event(create_event(3, run_id_2))
+        storage.store_event(create_event(4, run_id_1))
+        _wait_for(lambda: len(watched_1) == 2 and len(watched_3) == 1)
+
+        # a callback watching from an earlier cursor is caught up without replaying events to
+        # the existing callbacks of the run
+        storage.watch(run_id_1, None, watch_two)
+        _wait_for(lambda: len(watched_2) == 3)
+
+        storage.end_watch(run_id_1, watch_one)
+        storage.store_event(create_event(5, run_id_1))
+        _wait_for(lambda: len(watched_2) == 4)
+
+        assert [int(evt.message) for evt in watched_1] == [2, 4]
+        assert [int(evt.message) for evt in watched_2] == [1, 2, 4, 5]
+        assert [int(evt.message) for evt, _ in watched_3] == [3]
+        assert watched_3[0][1] == str(EventLogCursor.from_storage_id(3))
+
+        if storage.notifier:
+            assert storage.notifier.notification_count > 0
+
+        storage.dispose()
+
+    # calling end_watch after dispose does not error
+    storage.end_watch(run_id_2, watch_three)
+
+
+def test_multiplexed_watcher_notifier_failure():
+    with tempfile.TemporaryDirectory() as tmpdir_path:
+        storage = NotifyingSqliteEventLogStorage(tmpdir_path)
+        notifier = check.not_none(storage.notifier)
+        watched = []
+
+        storage.watch(RUN_ID, None, lambda event, _cursor: watched.append(event))
+        storage.store_event(create_event(1))
+        _wait_for(lambda: len(watched) == 1)
+
+        # the watcher falls back to polling once notifications are unavailable
+        notifier.should_fail = True
+        storage.store_event(create_event(2))
+        _wait_for(lambda: len(watched) == 2)
+        assert [int(evt.message) for evt in watched] == [1, 2]
+
+        storage.dispose()
+
+
+def test_multiplexed_watcher_backoff_and_metrics():
+    with tempfile.TemporaryDirectory() as tmpdir_path:
+        storage = NotifyingSqliteEventLogStorage(tmpdir_path, use_notifier=False)
+        active_run_id, idle_run_id = make_new_run_id(), make_new_run_id()
+        watched = []
+
+        storage.watch(active_run_id, None, lambda event, _cursor: watched.append(event))
+        storage.watch(active_run_id, None, lambda _event, _cursor: None)
+        storage.watch(idle_run_id, None, lambda _event, _cursor: None)
+
+        for i in range(25):
+            storage.store_event(create_event(i, active_run_id))
+            time.sleep(0.1)
+        _wait_for(lambda: len(watched) == 25)
+        assert len(watched) == 25
+
+        # every poll is a single query, and the idle run backs off while the active run is polled
+        # at the initial poll period
+        active_query_count = len(
+            [run_ids for run_ids in storage.queried_run_ids if active_run_id in run_ids]
+        )
+        idle_query_count = len(
+            [run_ids for run_ids in storage.queried_run_ids if idle_run_id in run_ids]
+        )
+        assert idle_query_count <= 6
+        assert active_query_count > idle_query_count
+
+        watcher = check.not_none(storage._event_watcher)  # noqa: SLF001
+        metrics = watcher.get_metrics()
+        assert metrics["watched_run_count"] == 2
+        assert metrics["subscription_count"] == 3
+        assert metrics["query_count"] == len(storage.queried_run_ids)
+        assert metrics["last_query_latency_seconds"] is not None
+        assert metrics["average_query_latency_seconds"] is not None
+        assert metrics["max_query_latency_seconds"] is not None
+
+        storage.dispose()
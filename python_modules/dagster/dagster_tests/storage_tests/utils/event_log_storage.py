@@ -67,7 +67,11 @@
     HourlyPartitionsDefinition,
 )
 from dagster._core.definitions.unresolved_asset_job_definition import define_asset_job
-from dagster._core.errors import DagsterInvalidInvocationError, DagsterInvariantViolationError
+from dagster._core.errors import (
+    DagsterEventBatchPartiallyStoredError,
+    DagsterInvalidInvocationError,
+    DagsterInvariantViolationError,
+)
 from dagster._core.event_api import EventLogCursor, EventRecordsResult, RunStatusChangeRecordsFilter
 from dagster._core.events import (
     EVENT_TYPE_TO_PIPELINE_RUN_STATUS,
@@ -114,6 +118,7 @@
 from dagster._core.types.loadable_target_origin import LoadableTargetOrigin
 from dagster._core.utils import make_new_run_id
 from dagster._loggers import colored_console_logger
+from dagster._serdes.errors import DeserializationError
 from dagster._serdes.serdes import deserialize_value
 from dagster._time import get_current_datetime
 from dagster._utils.concurrency import ConcurrencySlotStatus
@@ -902,6 +907,22 @@ def test_basic_get_logs_for_run(self, test_run_id, storage):
 
         assert _event_types(out_events) == _event_types(events)
 
+    def test_get_records_for_run_envelope(self, test_run_id, storage):
+        events, result = _synthesize_events(return_one_op_func, run_id=test_run_id)
+
+        for event in events:
+            storage.store_event(event)
+
+        records = storage.get_records_for_run(result.run_id).records
+        assert len(records) == len(events)
+        for record, event in zip(records, events):
+            assert record.run_id == event.run_id
+            assert record.timestamp == event.timestamp
+            assert record.step_key == event.step_key
+            if event.is_dagster_event:
+                assert record.event_type == event.dagster_event_type
+            assert record.event_log_entry == event
+
     def test_get_logs_for_run_cursor_limit(self, test_run_id, storage):
         events, result = _synthesize_events(return_one_op_func, run_id=test_run_id)
 
@@ -1266,6 +1287,137 @@ def foo():
         result = storage.fetch_materializations(foo.key, limit=100)
         assert len(result.records) == 2
 
+    def test_store_event_batch(self, storage, test_run_id):
+        asset_key = AssetKey(["path", "to", "asset_one"])
+        other_asset_key = AssetKey(["path", "to", "asset_two"])
+
+        @op
+        def materialize(_):
+            yield AssetMaterialization(asset_key=asset_key, metadata={"count": 1}, partition="1")
+            yield AssetObservation(asset_key=other_asset_key, metadata={"count": 1})
+            yield AssetMaterialization(asset_key=asset_key, metadata={"count": 2}, partition="2")
+            yield AssetMaterialization(asset_key=other_asset_key, metadata={"count": 2})
+            yield Output(1)
+
+        def _ops():
+            materialize()
+
+        events, _ = _synthesize_events(_ops, run_id=test_run_id)
+        events.append(
+            EventLogEntry(
+                error_info=None,
+                user_message="",
+                level="debug",
+                run_id=test_run_id,
+                timestamp=time.time(),
+                dagster_event=DagsterEvent(
+                    DagsterEventType.ASSET_CHECK_EVALUATION_PLANNED.value,
+                    "nonce",
+                    event_specific_data=AssetCheckEvaluationPlanned(
+                        asset_key=asset_key, check_name="my_check"
+                    ),
+                ),
+            )
+        )
+        events.append(
+            EventLogEntry(
+                error_info=None,
+                user_message="",
+                level="debug",
+                run_id=test_run_id,
+                timestamp=time.time(),
+                dagster_event=DagsterEvent(
+                    DagsterEventType.ASSET_CHECK_EVALUATION.value,
+                    "nonce",
+                    event_specific_data=AssetCheckEvaluation(
+                        asset_key=asset_key,
+                        check_name="my_check",
+                        passed=True,
+                        metadata={},
+                        severity=AssetCheckSeverity.ERROR,
+                    ),
+                ),
+            )
+        )
+
+        storage.store_event_batch(events)
+
+        stored_events = storage.get_logs_for_run(test_run_id)
+        assert [event.dagster_event_type for event in stored_events] == [
+            event.dagster_event_type for event in events
+        ]
+
+        materializations = storage.fetch_materializations(asset_key, limit=100).records
+        assert [record.asset_materialization.partition for record in materializations] == [
+            "2",
+            "1",
+        ]
+        asset_records = {
+            record.asset_entry.asset_key: record
+            for record in storage.get_asset_records([asset_key, other_asset_key])
+        }
+        assert len(asset_records) == 2
+        last_materialization = asset_records[asset_key].asset_entry.last_materialization_record
+        assert last_materialization
+        assert last_materialization.storage_id == materializations[0].storage_id
+        assert asset_records[asset_key].asset_entry.last_run_id == test_run_id
+
+        other_materialization = asset_records[
+            other_asset_key
+        ].asset_entry.last_materialization_record
+        assert other_materialization
+        assert (
+            other_materialization.storage_id
+            == storage.fetch_materializations(other_asset_key, limit=1).records[0].storage_id
+        )
+        assert len(storage.fetch_observations(other_asset_key, limit=100).records) == 1
+
+        if storage.supports_asset_checks:
+            checks = storage.get_asset_check_execution_history(
+                AssetCheckKey(asset_key, "my_check"), limit=10
+            )
+            assert len(checks) == 1
+            assert checks[0].status == AssetCheckExecutionRecordStatus.SUCCEEDED
+            assert checks[0].run_id == test_run_id
+
+    def test_store_event_batch_partially_stored(self, storage):
+        if not isinstance(storage, SqlEventLogStorage):
+            pytest.skip("This test is for SQL-backed Event Log behavior")
+
+        asset_key = AssetKey(["path", "to", "asset_one"])
+
+        @op
+        def materialize(_):
+            yield AssetMaterialization(asset_key=asset_key, partition="1")
+            yield Output(1)
+
+        def _ops():
+            materialize()
+
+        run_ids = [make_new_run_id(), make_new_run_id()]
+        events_by_run_id = {
+            run_id: _synthesize_events(_ops, run_id=run_id)[0] for run_id in run_ids
+        }
+        events = [event for run_id in run_ids for event in events_by_run_id[run_id]]
+
+        # the events of the first run are stored, but writing their index rows fails
+        store_event_batch_index_rows = storage._store_event_batch_index_rows  # noqa: SLF001
+        with mock.patch.object(
+            storage,
+            "_store_event_batch_index_rows",
+            side_effect=[Exception("index write failed"), store_event_batch_index_rows],
+        ):
+            with pytest.raises(DagsterEventBatchPartiallyStoredError) as exc_info:
+                storage.store_event_batch(events)
+
+        assert exc_info.value.unstored_events == events_by_run_id[run_ids[1]]
+        for event in exc_info.value.unstored_events:
+            storage.store_event(event)
+
+        # no event is stored twice
+        for run_id in run_ids:
+            assert len(storage.get_logs_for_run(run_id)) == len(events_by_run_id[run_id])
+
     def test_asset_materialization_fetch(self, storage, instance):
         asset_key = AssetKey(["path", "to", "asset_one"])
 
@@ -1611,15 +1763,15 @@ def _ops():
             # for generic sql-based event log storage
             stack.enter_context(
                 mock.patch(
-                    "dagster._core.storage.event_log.sql_event_log.deserialize_value",
-                    return_value="not_an_event_record",
+                    "dagster._core.storage.event_log.sql_event_log.LazyEventLogRecord",
+                    side_effect=DeserializationError("not an event record"),
                 )
             )
             # for sqlite event log storage, which overrides the record fetching implementation
             stack.enter_context(
                 mock.patch(
-                    "dagster._core.storage.event_log.sqlite.sqlite_event_log.deserialize_value",
-                    return_value="not_an_event_record",
+                    "dagster._core.storage.event_log.sqlite.sqlite_event_log.LazyEventLogRecord",
+                    side_effect=DeserializationError("not an event record"),
                 )
             )
 
@@ -1645,14 +1797,14 @@ def _ops():
             # for generic sql-based event log storage
             stack.enter_context(
                 mock.patch(
-                    "dagster._core.storage.event_log.sql_event_log.deserialize_value",
+                    "dagster._core.storage.event_log.sql_event_log.LazyEventLogRecord",
                     side_effect=seven.JSONDecodeError("error", "", 0),
                 )
             )
             # for sqlite event log storage, which overrides the record fetching implementation
             stack.enter_context(
                 mock.patch(
-                    "dagster._core.storage.event_log.sqlite.sqlite_event_log.deserialize_value",
+                    "dagster._core.storage.event_log.sqlite.sqlite_event_log.LazyEventLogRecord",
                     side_effect=seven.JSONDecodeError("error", "", 0),
                 )
             )
@@ -4690,6 +4842,7 @@ def yields_materialization():
                 serialized_failed_partition_subset="baz",
                 serialized_in_progress_partition_subset="qux",
                 earliest_in_progress_materialization_event_id=42,
+                unmerged_materialized_partition_keys=["quux"],
             )
 
             # Check that AssetStatusCacheValue has all fields set. This ensures that we test that the
@@ -600,6 +600,35 @@ def test_fetch_count_by_tag(self, storage: RunStorage):
             ("mytag2", {"world"}),
         ]
 
+    def test_fetch_tag_counts(self, storage: RunStorage):
+        assert storage
+        for tags, status in [
+            ({"mytag": "hello", "mytag2": "world"}, DagsterRunStatus.STARTED),
+            ({"mytag": "hello"}, DagsterRunStatus.STARTED),
+            ({"mytag": "goodbye", "mytag2": "world"}, DagsterRunStatus.STARTING),
+            ({"mytag": "hello", "othertag": "foo"}, DagsterRunStatus.SUCCESS),
+            (None, DagsterRunStatus.STARTED),
+        ]:
+            storage.add_run(
+                TestRunStorage.build_run(
+                    run_id=make_new_run_id(), job_name="some_pipeline", tags=tags, status=status
+                )
+            )
+
+        assert storage.get_run_tag_counts(tag_keys=["mytag", "mytag2"]) == {
+            ("mytag", "hello"): 3,
+            ("mytag", "goodbye"): 1,
+            ("mytag2", "world"): 2,
+        }
+        assert storage.get_run_tag_counts(
+            tag_keys=["mytag", "othertag"],
+            filters=RunsFilter(statuses=[DagsterRunStatus.STARTED, DagsterRunStatus.STARTING]),
+        ) == {
+            ("mytag", "hello"): 2,
+            ("mytag", "goodbye"): 1,
+        }
+        assert storage.get_run_tag_counts(tag_keys=[]) == {}
+
     def test_fetch_by_tags(self, storage):
         assert storage
         one = make_new_run_id()
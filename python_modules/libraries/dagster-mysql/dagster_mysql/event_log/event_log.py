@@ -1,4 +1,4 @@
-from typing import ContextManager, Optional, cast
+from typing import ContextManager, Optional, Sequence, cast
 
 import dagster._check as check
 import sqlalchemy as db
@@ -13,10 +13,11 @@
     AssetKeyTable,
     SqlEventLogStorage,
     SqlEventLogStorageMetadata,
-    SqlPollingEventWatcher,
+    SqlMultiplexedEventWatcher,
 )
 from dagster._core.storage.event_log.base import EventLogCursor
 from dagster._core.storage.event_log.migration import ASSET_KEY_INDEX_COLS
+from dagster._core.storage.event_log.sql_event_log import _group_rows_by_columns
 from dagster._core.storage.sql import (
     AlembicVersion,
     check_alembic_revision,
@@ -58,7 +59,7 @@ class MySQLEventLogStorage(SqlEventLogStorage, ConfigurableClass):
     def __init__(self, mysql_url: str, inst_data: Optional[ConfigurableClassData] = None):
         self._inst_data = check.opt_inst_param(inst_data, "inst_data", ConfigurableClassData)
         self.mysql_url = check.str_param(mysql_url, "mysql_url")
-        self._event_watcher: Optional[SqlPollingEventWatcher] = None
+        self._event_watcher: Optional[SqlMultiplexedEventWatcher] = None
 
         # Default to not holding any connections open to prevent accumulating connections per DagsterInstance
         self._engine = create_engine(
@@ -170,6 +171,34 @@ def store_asset_event(self, event: EventLogEntry, event_id: int) -> None:
                 except db_exc.IntegrityError:
                     pass
 
+    def store_asset_event_batch(
+        self, events: Sequence[EventLogEntry], event_ids: Sequence[int]
+    ) -> None:
+        check.sequence_param(events, "events", EventLogEntry)
+        check.sequence_param(event_ids, "event_ids", int)
+
+        # See SqlEventLogStorage.store_asset_event method for the semantics of each column
+        values_by_asset_key = self._get_asset_entry_values_by_asset_key(
+            events, event_ids, self.has_secondary_index(ASSET_KEY_INDEX_COLS)
+        )
+        if not values_by_asset_key:
+            return
+
+        with self.index_connection() as conn:
+            for rows in _group_rows_by_columns(
+                dict(asset_key=asset_key, **values)
+                for asset_key, values in values_by_asset_key.items()
+            ):
+                query = db_dialects.mysql.insert(AssetKeyTable).values(rows)
+                updated_columns = [column for column in rows[0].keys() if column != "asset_key"]
+                if updated_columns:
+                    query = query.on_duplicate_key_update(
+                        {column: query.inserted[column] for column in updated_columns}
+                    )
+                else:
+                    query = query.prefix_with("IGNORE")
+                conn.execute(query)
+
     def _connect(self) -> ContextManager[Connection]:
         return create_mysql_connection(self._engine, __file__, "event log")
 
@@ -200,7 +229,7 @@ def watch(self, run_id: str, cursor: Optional[str], callback: EventHandlerFn) ->
             check.failed("Cannot call `watch` with an offset cursor")
 
         if self._event_watcher is None:
-            self._event_watcher = SqlPollingEventWatcher(self)
+            self._event_watcher = SqlMultiplexedEventWatcher(self)
 
         self._event_watcher.watch_run(run_id, cursor, callback)
 
@@ -1,5 +1,6 @@
+import logging
 from contextlib import contextmanager
-from typing import Any, ContextManager, Iterator, Mapping, Optional, Sequence, cast
+from typing import Any, ContextManager, Dict, Iterator, Mapping, Optional, Sequence, cast
 
 import dagster._check as check
 import sqlalchemy as db
@@ -8,7 +9,7 @@
 from dagster._config.config_schema import UserConfigSchema
 from dagster._core.errors import DagsterInvariantViolationError
 from dagster._core.event_api import EventHandlerFn
-from dagster._core.events import ASSET_CHECK_EVENTS, ASSET_EVENTS, BATCH_WRITABLE_EVENTS
+from dagster._core.events import ASSET_CHECK_EVENTS, ASSET_EVENTS
 from dagster._core.events.log import EventLogEntry
 from dagster._core.storage.config import pg_config
 from dagster._core.storage.event_log import (
@@ -20,7 +21,8 @@
 )
 from dagster._core.storage.event_log.base import EventLogCursor
 from dagster._core.storage.event_log.migration import ASSET_KEY_INDEX_COLS
-from dagster._core.storage.event_log.polling_event_watcher import SqlPollingEventWatcher
+from dagster._core.storage.event_log.polling_event_watcher import SqlMultiplexedEventWatcher
+from dagster._core.storage.event_log.sql_event_log import _group_rows_by_columns
 from dagster._core.storage.sql import (
     AlembicVersion,
     check_alembic_revision,
@@ -33,6 +35,7 @@
 from sqlalchemy import event
 from sqlalchemy.engine import Connection
 
+from dagster_postgres.event_log.event_watcher import PostgresEventLogNotifier
 from dagster_postgres.utils import (
     create_pg_connection,
     pg_alembic_config,
@@ -90,7 +93,7 @@ def __init__(
         self._engine = create_engine(
             self.postgres_url, isolation_level="AUTOCOMMIT", poolclass=db_pool.NullPool
         )
-        self._event_watcher: Optional[SqlPollingEventWatcher] = None
+        self._event_watcher: Optional[SqlMultiplexedEventWatcher] = None
 
         self._secondary_index_cache = {}
 
@@ -183,7 +186,7 @@ def store_event(self, event: EventLogEntry) -> None:
             res = result.fetchone()
             result.close()
 
-            # LISTEN/NOTIFY no longer used for pg event watch - preserved here to support version skew
+            # notify the event watchers of the webserver and other processes of the new event
             conn.execute(
                 db.text(f"""NOTIFY {CHANNEL_NAME}, :notify_id; """),
                 {"notify_id": res[0] + "_" + str(res[1])},  # type: ignore
@@ -203,30 +206,61 @@ def store_event(self, event: EventLogEntry) -> None:
                 )
 
             self.store_asset_event_tags([event], [event_id])
+            self.update_asset_cached_status_data_for_events([event], [event_id])
 
         if event.is_dagster_event and event.dagster_event_type in ASSET_CHECK_EVENTS:
             self.store_asset_check_event(event, event_id)
 
-    def store_event_batch(self, events: Sequence[EventLogEntry]) -> None:
-        check.sequence_param(events, "event", of_type=EventLogEntry)
-
-        check.invariant(
-            all(event.get_dagster_event().event_type in BATCH_WRITABLE_EVENTS for event in events),
-            f"{BATCH_WRITABLE_EVENTS} are the only currently supported events for batch writes.",
+    def _insert_event_batch(
+        self, conn: Connection, events: Sequence[EventLogEntry]
+    ) -> Sequence[int]:
+        result = conn.execute(
+            self.prepare_insert_event_batch(events).returning(
+                SqlEventLogStorageTable.c.run_id, SqlEventLogStorageTable.c.id
+            )
         )
+        rows = result.fetchall()
 
-        insert_event_statement = self.prepare_insert_event_batch(events)
-        with self._connect() as conn:
-            result = conn.execute(insert_event_statement.returning(SqlEventLogStorageTable.c.id))
-            event_ids = [cast(int, row[0]) for row in result.fetchall()]
+        # notify the event watchers once per run in the batch, with the latest storage id of the run
+        last_event_id_by_run_id: Dict[str, int] = {}
+        for run_id, event_id in rows:
+            last_event_id_by_run_id[run_id] = max(event_id, last_event_id_by_run_id.get(run_id, 0))
+        for run_id, last_event_id in last_event_id_by_run_id.items():
+            conn.execute(
+                db.text(f"""NOTIFY {CHANNEL_NAME}, :notify_id; """),
+                {"notify_id": f"{run_id}_{last_event_id}"},
+            )
+
+        return sorted(cast(int, row[1]) for row in rows)
 
-        # We only update the asset table with the last event
-        self.store_asset_event(events[-1], event_ids[-1])
+    def store_asset_event_batch(
+        self, events: Sequence[EventLogEntry], event_ids: Sequence[int]
+    ) -> None:
+        check.sequence_param(events, "events", EventLogEntry)
+        check.sequence_param(event_ids, "event_ids", int)
 
-        if any((event_id is None for event_id in event_ids)):
-            raise DagsterInvariantViolationError("Cannot store asset event tags for null event id.")
+        # See store_asset_event for the semantics of each column
+        values_by_asset_key = self._get_asset_entry_values_by_asset_key(
+            events, event_ids, self.has_secondary_index(ASSET_KEY_INDEX_COLS)
+        )
+        if not values_by_asset_key:
+            return
 
-        self.store_asset_event_tags(events, event_ids)
+        with self.index_connection() as conn:
+            for rows in _group_rows_by_columns(
+                dict(asset_key=asset_key, **values)
+                for asset_key, values in values_by_asset_key.items()
+            ):
+                query = db_dialects.postgresql.insert(AssetKeyTable).values(rows)
+                updated_columns = [column for column in rows[0].keys() if column != "asset_key"]
+                if updated_columns:
+                    query = query.on_conflict_do_update(
+                        index_elements=[AssetKeyTable.c.asset_key],
+                        set_={column: query.excluded[column] for column in updated_columns},
+                    )
+                else:
+                    query = query.on_conflict_do_nothing()
+                conn.execute(query)
 
     def store_asset_event(self, event: EventLogEntry, event_id: int) -> None:
         check.inst_param(event, "event", EventLogEntry)
@@ -344,10 +378,21 @@ def watch(
         if cursor and EventLogCursor.parse(cursor).is_offset_cursor():
             check.failed("Cannot call `watch` with an offset cursor")
         if self._event_watcher is None:
-            self._event_watcher = SqlPollingEventWatcher(self)
+            self._event_watcher = SqlMultiplexedEventWatcher(self, self._create_event_notifier())
 
         self._event_watcher.watch_run(run_id, cursor, callback)
 
+    def _create_event_notifier(self) -> Optional[PostgresEventLogNotifier]:
+        try:
+            return PostgresEventLogNotifier(self.postgres_url, CHANNEL_NAME)
+        except Exception:
+            logging.getLogger("dagster").warning(
+                "Could not LISTEN for event log notifications, falling back to polling the event"
+                " log for watched runs.",
+                exc_info=True,
+            )
+            return None
+
     def _gen_event_log_entry_from_cursor(self, cursor) -> EventLogEntry:
         with self._engine.connect() as conn:
             cursor_res = conn.execute(
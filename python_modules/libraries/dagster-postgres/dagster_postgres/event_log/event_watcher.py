@@ -0,0 +1,45 @@
+import select
+from typing import AbstractSet, Set
+
+import psycopg2
+import psycopg2.extensions
+from dagster import _check as check
+from dagster._core.storage.event_log.polling_event_watcher import EventLogNotifier
+from sqlalchemy.engine import make_url
+
+
+class PostgresEventLogNotifier(EventLogNotifier):
+    """Receives the notifications sent on every event insert by PostgresEventLogStorage, over a
+    single dedicated connection that LISTENs on the notification channel.
+
+    Notification payloads have the form `<run_id>_<storage_id>`.
+    """
+
+    def __init__(self, postgres_url: str, channel: str):
+        check.str_param(postgres_url, "postgres_url")
+        self._channel = check.str_param(channel, "channel")
+
+        # connect with psycopg2 directly, since the connection is held open for the lifetime of
+        # the watcher and polled outside of any SQLAlchemy transaction
+        url = make_url(postgres_url).set(drivername="postgresql")
+        self._conn = psycopg2.connect(url.render_as_string(hide_password=False))
+        self._conn.set_isolation_level(psycopg2.extensions.ISOLATION_LEVEL_AUTOCOMMIT)
+        with self._conn.cursor() as cursor:
+            cursor.execute(f"LISTEN {self._channel};")
+
+    def wait_for_notifications(self, timeout: float) -> AbstractSet[str]:
+        if select.select([self._conn], [], [], timeout) == ([], [], []):
+            return set()
+
+        self._conn.poll()
+        run_ids: Set[str] = set()
+        while self._conn.notifies:
+            notify = self._conn.notifies.pop(0)
+            run_id, _, _storage_id = notify.payload.rpartition("_")
+            if run_id:
+                run_ids.add(run_id)
+        return run_ids
+
+    def close(self) -> None:
+        if not self._conn.closed:
+            self._conn.close()
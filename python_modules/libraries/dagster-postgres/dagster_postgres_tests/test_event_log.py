@@ -103,11 +103,11 @@ def watch_two(event, _cursor):
 
             assert [int(evt.message) for evt in watched_1] == [2, 3, 4]
             assert [int(evt.message) for evt in watched_2] == [4, 5]
-            assert len(objgraph.by_type("SqlPollingEventWatcher")) == 1
+            assert len(objgraph.by_type("SqlMultiplexedEventWatcher")) == 1
 
         # ensure we clean up poller on exit
         gc.collect()
-        assert len(objgraph.by_type("SqlPollingEventWatcher")) == 0
+        assert len(objgraph.by_type("SqlMultiplexedEventWatcher")) == 0
 
     def test_load_from_config(self, hostname):
         url_cfg = f"""